@@ -17,6 +17,18 @@ from .universal3D.universal3D_main import (
 )  # autogaita.universal3D(info, folderinfo, cfg)
 from .group.group_main import group  # autogaita.group(folderinfo, cfg)
 
+# rendering DLC/SLEAP figures from a Results folder (e.g. after compute-only runs)
+from .common2D.common2D_render import (
+    render_results,
+)  # autogaita.render_results(results_dir, cfg, names)
+
+# progress events of all pipelines (print_progress_bar is subscribed by default)
+from .resources.progress import (
+    subscribe_to_progress,
+    unsubscribe_from_progress,
+    print_progress_bar,
+)  # autogaita.subscribe_to_progress(callback) - callback(event) gets an event dict
+
 # 7 batchrun functions - call via e.g. autogaita.dlc_singlerun()
 from .batchrun_scripts.dlc_singlerun import dlc_singlerun
 from .batchrun_scripts.dlc_multirun import dlc_multirun
@@ -24,6 +24,14 @@ def dlc_singlerun():
     cfg["sampling_rate"] = 100  # base cfg
     cfg["subtract_beam"] = True
     cfg["dont_show_plots"] = True
+    cfg["plot_workers"] = 0  # > 1 renders figures in a process pool
+    cfg["export_profile"] = "default"  # "preview", "publication", "none"
+    cfg["compute_only"] = False  # True skips figures (see autogaita.render_results)
+    cfg["dry_run"] = False  # True only validates SCs (see Cycle Validation.csv)
+    cfg["sweep"] = {}  # e.g. {"bin_num": [25, 50]} runs each value (see common2D_sweep)
+    cfg["profile_stages"] = False  # True writes timings.json files
+    cfg["windowed_loading"] = False  # True only loads frames of annotated SCs
+    cfg["reduced_precision"] = False  # True processes data as float32
     cfg["convert_to_mm"] = True
     cfg["pixel_to_mm_ratio"] = 3.76
     cfg["x_sc_broken_threshold"] = 200  # optional cfg
@@ -48,6 +56,8 @@ def dlc_singlerun():
         "/Users/mahan/sciebo/PythonCode/gaita_repo/autogaita/resources/Coordinate Standardisation Table Template.xlsx"
     )
     cfg["sc_times_in_frames"] = False
+    cfg["detect_stepcycles"] = False  # True detects SCs instead of reading the table
+    cfg["sc_detection_joint"] = []  # defaults to the first hind joint
     cfg["hind_joints"] = ["Hind paw tao", "Ankle", "Knee", "Hip", "Iliac Crest"]
     cfg["fore_joints"] = [
         "Front paw tao ",
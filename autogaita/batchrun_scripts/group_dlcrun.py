@@ -59,11 +59,19 @@ def group_dlcrun():
     # cfg["PCA_custom_scatter_PCs"] = "4,5,6;4,5;2,4,6"
     cfg["PCA_custom_scatter_PCs"] = ""
     cfg["PCA_save_3D_video"] = False  # True
+    cfg["PCA_video_frame_number"] = 360
+    cfg["PCA_video_resolution"] = "1280x960"
     cfg["PCA_bins"] = ""  # "0-10,24,50-75"
+    cfg["PCA_solver"] = "auto"  # "randomized", "incremental"
+    cfg["PCA_PERMANOVA_seed"] = 0
     cfg["stats_threshold"] = 0.05
     cfg["plot_SE"] = True
     cfg["color_palette"] = "Set2"
     cfg["dont_show_plots"] = True
+    cfg["plot_workers"] = 0  # > 1 renders figures in a process pool
+    cfg["export_profile"] = "default"  # "preview", "publication", "none"
+    cfg["profile_stages"] = False  # True writes timings.json
+    cfg["reduced_precision"] = False  # True processes data as float32
     cfg["legend_outside"] = True
     cfg["which_leg"] = "left"
     cfg["PCA_variables"] = [
@@ -31,12 +31,20 @@ def group_universal3Drun():
         cfg["PCA_n_components"] = 3
         cfg["PCA_custom_scatter_PCs"] = ""
         cfg["PCA_bins"] = ""
+        cfg["PCA_solver"] = "auto"  # "randomized", "incremental"
+        cfg["PCA_PERMANOVA_seed"] = 0
         cfg["PCA_save_3D_video"] = False
+        cfg["PCA_video_frame_number"] = 360
+        cfg["PCA_video_resolution"] = "1280x960"
         cfg["stats_threshold"] = 0.05
         cfg["plot_SE"] = False
         cfg["color_palette"] = "viridis"
         cfg["legend_outside"] = True
         cfg["dont_show_plots"] = True
+        cfg["plot_workers"] = 0  # > 1 renders figures in a process pool
+        cfg["export_profile"] = "default"  # "preview", "publication", "none"
+        cfg["profile_stages"] = False  # True writes timings.json
+        cfg["reduced_precision"] = False  # True processes data as float32
         cfg["anova_design"] = "Mixed ANOVA"
         cfg["PCA_variables"] = [
             # "Midfoot, " + cfg["which_leg"] + " Z",
@@ -1,4 +1,13 @@
-from autogaita.common2D.common2D_utils import extract_info, run_singlerun_in_multirun
+from autogaita.common2D.common2D_utils import (
+    extract_info,
+    run_singlerun_in_multirun,
+    write_multirun_stage_timings,
+    write_multirun_watchdog_summary,
+    write_multirun_detected_annotation_table,
+    write_multirun_cycle_validation,
+)
+from autogaita.common2D.common2D_1_preparation import fan_out_multi_animal_recordings
+from autogaita.resources.progress import ProgressTracker
 
 # %% main function
 
@@ -24,6 +33,19 @@ def sleap_multirun():
     cfg["sampling_rate"] = 60
     cfg["subtract_beam"] = False
     cfg["dont_show_plots"] = True
+    cfg["plot_workers"] = 0  # > 1 renders figures in a process pool
+    cfg["export_profile"] = "default"  # "preview", "publication", "none"
+    cfg["compute_only"] = False  # True skips figures (see autogaita.render_results)
+    cfg["dry_run"] = False  # True only validates SCs (see Cycle Validation.csv)
+    cfg["sweep"] = {}  # e.g. {"bin_num": [25, 50]} runs each value (see common2D_sweep)
+    cfg["profile_stages"] = False  # True writes timings.json files
+    cfg["windowed_loading"] = False  # True only loads frames of annotated SCs
+    cfg["reduced_precision"] = False  # True processes data as float32
+    # True analyses each animal of multi-animal files - annotation tables then need
+    # IDs of recording & track joined by "_" (e.g. 1_track_0 for track_0 of ID 1)
+    cfg["multi_animal"] = False
+    cfg["run_timeout"] = 0  # seconds per run - 0 means no limit
+    cfg["run_memory_limit"] = 0  # MB per run - 0 means no limit (Linux/macOS only)
     cfg["convert_to_mm"] = False
     cfg["pixel_to_mm_ratio"] = 1
     cfg["x_sc_broken_threshold"] = 200  # optional cfg
@@ -46,6 +68,8 @@ def sleap_multirun():
     cfg["x_standardisation_joint"] = ["Midfoot"]
     cfg["coordinate_standardisation_xls"] = ""
     cfg["sc_times_in_frames"] = False
+    cfg["detect_stepcycles"] = False  # True detects SCs instead of reading the table
+    cfg["sc_detection_joint"] = []  # defaults to the first hind joint
     cfg["results_dir"] = ""
     cfg["hind_joints"] = [
         "Left_Foot",
@@ -65,8 +89,19 @@ def sleap_multirun():
     }
     # run a single gaita run for each entry of info
     info = extract_info("SLEAP", folderinfo)
+    info = fan_out_multi_animal_recordings("SLEAP", info, folderinfo, cfg)
+    run_progress = ProgressTracker("Runs", len(info["name"]))
+    terminated_runs = []
     for idx in range(len(info["name"])):
-        run_singlerun_in_multirun("SLEAP", idx, info, folderinfo, cfg)
+        terminated_runs.append(
+            run_singlerun_in_multirun("SLEAP", idx, info, folderinfo, cfg)
+        )
+        run_progress.advance(detail=info["name"][idx])
+    run_progress.finish()
+    write_multirun_watchdog_summary(terminated_runs, folderinfo, cfg)
+    write_multirun_stage_timings(info, folderinfo, cfg)
+    write_multirun_detected_annotation_table(info, folderinfo, cfg)
+    write_multirun_cycle_validation(info, folderinfo, cfg)
 
 
 # %% what happens if we just hit run
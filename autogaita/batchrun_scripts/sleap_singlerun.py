@@ -29,6 +29,14 @@ def sleap_singlerun():
     cfg["sampling_rate"] = 100
     cfg["subtract_beam"] = False
     cfg["dont_show_plots"] = True
+    cfg["plot_workers"] = 0  # > 1 renders figures in a process pool
+    cfg["export_profile"] = "default"  # "preview", "publication", "none"
+    cfg["compute_only"] = False  # True skips figures (see autogaita.render_results)
+    cfg["dry_run"] = False  # True only validates SCs (see Cycle Validation.csv)
+    cfg["sweep"] = {}  # e.g. {"bin_num": [25, 50]} runs each value (see common2D_sweep)
+    cfg["profile_stages"] = False  # True writes timings.json files
+    cfg["windowed_loading"] = False  # True only loads frames of annotated SCs
+    cfg["reduced_precision"] = False  # True processes data as float32
     cfg["convert_to_mm"] = False
     cfg["pixel_to_mm_ratio"] = 1
     cfg["x_sc_broken_threshold"] = 200  # optional cfg
@@ -51,6 +59,8 @@ def sleap_singlerun():
     cfg["x_standardisation_joint"] = ["Midfoot"]
     cfg["coordinate_standardisation_xls"] = ""
     cfg["sc_times_in_frames"] = False
+    cfg["detect_stepcycles"] = False  # True detects SCs instead of reading the table
+    cfg["sc_detection_joint"] = []  # defaults to the first hind joint
     cfg["hind_joints"] = ["Midfoot", "Ankle", "Knee", "Hip"]
     cfg["fore_joints"] = []
     cfg["beam_col_left"] = []  # list of len == 1
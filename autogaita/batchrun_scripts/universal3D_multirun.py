@@ -1,4 +1,9 @@
-from autogaita.resources.utils import try_to_run_gaita
+from autogaita.resources.watchdog import (
+    try_to_run_gaita_with_watchdog,
+    write_watchdog_summary,
+)
+from autogaita.resources.progress import ProgressTracker
+from autogaita.resources.profiling import write_stage_timings_report
 import os
 import copy
 
@@ -20,6 +25,13 @@ def universal3D_multirun():
     cfg = {}
     cfg["sampling_rate"] = 100  # base cfg
     cfg["dont_show_plots"] = True
+    cfg["plot_workers"] = 0  # > 1 renders figures in a process pool
+    cfg["export_profile"] = "default"  # "preview", "publication", "none"
+    cfg["compute_only"] = False  # True skips figures (see autogaita.render_results)
+    cfg["profile_stages"] = False  # True writes timings.json files
+    cfg["reduced_precision"] = False  # True processes data as float32
+    cfg["run_timeout"] = 0  # seconds per run - 0 means no limit
+    cfg["run_memory_limit"] = 0  # MB per run - 0 means no limit (Linux/macOS only)
     cfg["y_acceleration"] = True
     cfg["angular_acceleration"] = True
     cfg["bin_num"] = 25
@@ -44,8 +56,18 @@ def universal3D_multirun():
     }
     # run a single gaita run for each entry of info
     info = extract_info(folderinfo)
+    run_progress = ProgressTracker("Runs", len(info["name"]))
+    terminated_runs = []
     for idx, name in enumerate(info["name"]):
-        run_singlerun(idx, info, folderinfo, cfg)
+        terminated_run = run_singlerun(idx, info, folderinfo, cfg)
+        if terminated_run is not None:
+            terminated_runs.append(terminated_run)
+        run_progress.advance(detail=name)
+    run_progress.finish()
+    if info["results_dir"]:  # aggregate stage timings (if cfg["profile_stages"])
+        results_dir = os.path.dirname(info["results_dir"][0])
+        write_watchdog_summary(terminated_runs, results_dir)
+        write_stage_timings_report(info["results_dir"], results_dir, cfg)
 
 
 # %% local functions
@@ -64,7 +86,10 @@ def run_singlerun(idx, info, folderinfo, cfg):
     #         how-to-copy-a-dictionary-and-only-edit-the-copy
     this_cfg = copy.deepcopy(cfg)
     # important to only pass this_info to main script here (1 run at a time!)
-    try_to_run_gaita("Universal 3D", this_info, folderinfo, this_cfg, True)
+    # => returns why the run was terminated if it exceeded cfg's limits (else None)
+    return try_to_run_gaita_with_watchdog(
+        "Universal 3D", this_info, folderinfo, this_cfg
+    )
 
 
 def extract_info(folderinfo):
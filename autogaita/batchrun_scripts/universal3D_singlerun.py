@@ -21,6 +21,11 @@ def universal3D_singlerun():
     cfg = {}
     cfg["sampling_rate"] = 100  # base cfg
     cfg["dont_show_plots"] = True
+    cfg["plot_workers"] = 0  # > 1 renders figures in a process pool
+    cfg["export_profile"] = "default"  # "preview", "publication", "none"
+    cfg["compute_only"] = False  # True skips figures (see autogaita.render_results)
+    cfg["profile_stages"] = False  # True writes timings.json files
+    cfg["reduced_precision"] = False  # True processes data as float32
     cfg["y_acceleration"] = True
     cfg["angular_acceleration"] = True
     cfg["bin_num"] = 25
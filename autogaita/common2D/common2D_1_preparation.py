@@ -2,11 +2,19 @@
 from autogaita.resources.utils import (
     write_issues_to_textfile,
     standardise_primary_joint_coordinates,
+    check_export_profile,
+    cast_to_float_dtype,
+    preserved_float_dtype,
+    collect_issues,
 )
 from autogaita.common2D.common2D_constants import FILE_ID_STRING_ADDITIONS
+from autogaita.common2D.common2D_2_sc_extraction import read_annotated_frame_windows
+from autogaita.common2D.common2D_utils import multirun_results_dir
 import os
+import re
 from importlib.metadata import version
 import shutil
+import warnings
 import json
 import pandas as pd
 import numpy as np
@@ -15,18 +23,233 @@ import h5py
 # %% constants
 from autogaita.resources.constants import (
     ISSUES_TXT_FILENAME,
+    ISSUES_JSONL_FILENAME,
+    TIMINGS_JSON_FILENAME,
     TIME_COL,
     CONFIG_JSON_FILENAME,
 )
 from autogaita.common2D.common2D_constants import (
     DIRECTION_DLC_THRESHOLD,
+    DIRECTION_DLC_WINDOW,
+    WINDOWED_LOADING_MARGIN,
+    WINDOWED_LOADING_CHUNKSIZE,
+    MULTI_ANIMAL_FOLDERNAME,
+    MADLC_SHARED_INDIVIDUAL,
 )
 
 # %% workflow step #1 - preparation
 
 
-def some_prep(tracking_software, info, folderinfo, cfg):
-    """Preparation of the data & cfg file for dlc analyses"""
+def some_prep(tracking_software, info, folderinfo, cfg, loaded_data=None):
+    """Preparation of the data & cfg file for dlc analyses
+
+    Note
+    ----
+    Parameter sweeps pass the loaded_data (see load_tracking_data) of an earlier
+    variant so files are not copied & parsed again - they must pass a copy since we
+    transform it here.
+    """
+
+    # .........................  unpack & prep stuff  ..................................
+    # DON'T unpack (joint) cfg-keys that are tested later by check_and_expand_cfg
+    sampling_rate = cfg["sampling_rate"]
+    subtract_beam = cfg["subtract_beam"]
+    convert_to_mm = cfg["convert_to_mm"]
+    pixel_to_mm_ratio = cfg["pixel_to_mm_ratio"]
+    invert_y_axis = cfg["invert_y_axis"]
+    flip_gait_direction = cfg["flip_gait_direction"]
+    standardise_x_coordinates = cfg["standardise_x_coordinates"]
+    standardise_y_to_a_joint = cfg["standardise_y_to_a_joint"]
+    coordinate_standardisation_xls = cfg["coordinate_standardisation_xls"]
+
+    # ..................  move & import data (see load_tracking_data)  .................
+    if loaded_data is None:
+        loaded_data = load_tracking_data(tracking_software, info, folderinfo, cfg)
+        if loaded_data is None:  # some critical error occured
+            return
+    frame_windows = loaded_data["frame_windows"]
+    # reduced precision: everything from here on runs on float32 (see resources/utils)
+    data = cast_to_float_dtype(loaded_data["data"], cfg)
+    # windowed loading: extrema & number of frames of all frames (as if fully loaded)
+    if frame_windows is not None:
+        extrema = cast_to_float_dtype(loaded_data["extrema"], cfg)
+        frame_number = loaded_data["frame_number"]
+
+    # ................  final data checks, conversions & additions  ....................
+    # IMPORTANT - MAIN TESTS OF USER-INPUT VALIDITY OCCUR HERE!
+    # => UNPACK VARS FROM CFG THAT ARE TESTED BY check_and_expand HERE, NOT EARLIER!
+    cfg = check_and_expand_cfg(data, cfg, info)
+    if cfg is None:  # some critical error occured
+        return
+    hind_joints = cfg["hind_joints"]
+    fore_joints = cfg["fore_joints"]
+    angles = cfg["angles"]
+    beam_hind_jointadd = cfg["beam_hind_jointadd"]
+    beam_fore_jointadd = cfg["beam_fore_jointadd"]
+    direction_joint = cfg["direction_joint"]
+    # important to unpack to vars and not to cfg since cfg is overwritten in multiruns!
+    y_standardisation_joint = cfg["y_standardisation_joint"][0]
+    # store config json file @ group path
+    write_config_json(tracking_software, info, cfg)
+    # a little test to see if columns make sense, i.e., same number of x/y/likelihood
+    x_col_count = data.columns.str.endswith(" x").sum()
+    y_col_count = data.columns.str.endswith(" y").sum()
+    likelihood_col_count = "N/A because SLEAP"  # initialise so message doesnt break
+    if tracking_software == "DLC":
+        likelihood_col_count = data.columns.str.endswith(" likelihood").sum()
+        col_count_condition = x_col_count == y_col_count == likelihood_col_count
+    elif tracking_software == "SLEAP":
+        col_count_condition = x_col_count == y_col_count
+    if col_count_condition:
+        pass
+    else:
+        cols_are_weird_message = (
+            "\n***********\n! WARNING !\n***********\n"
+            + "We detected an unequal number of columns ending with x, y or "
+            + "likelihood!\nCounts were:\n"
+            + "x: "
+            + str(x_col_count)
+            + ", y: "
+            + str(y_col_count)
+            + ", likelihood: "
+            + str(likelihood_col_count)
+            + "!\n\n"
+            + "We continue with the analysis but we strongly suggest you have another "
+            + "look at your dataset, this should not happen.\n"
+        )
+        print(cols_are_weird_message)
+        write_issues_to_textfile(cols_are_weird_message, info)
+    # quick warning if cfg is set to not flip gait direction but to standardise x
+    if not flip_gait_direction and standardise_x_coordinates:
+        message = (
+            "\n***********\n! WARNING !\n***********\n"
+            + "You are standardising x-coordinates without standardising the direction "
+            + "of gait (e.g. all walking from right to left)."
+            + "\nThis can be correct if you are doing things like treadmill walking "
+            + "but can lead to unexpected behaviour otherwise!"
+            + "\nMake sure you know what you are doing!"
+        )
+        print(message)
+        write_issues_to_textfile(message, info)
+    # check gait direction & DLC file validity
+    # => flipping only changes x-coordinates, so it's fine to do this before the
+    #    y-transformations below
+    # => windowed loading: direction is checked on all frames of the direction joint &
+    #    we flip using the maximum x of all frames
+    direction_data = None
+    global_x_max = None
+    if frame_windows is not None:
+        direction_data = read_direction_joint_data(
+            tracking_software,
+            loaded_data["data_dir"],
+            loaded_data["data_filename"],
+            direction_joint,
+            frame_number,
+        )
+        direction_data = cast_to_float_dtype(direction_data, cfg)
+        global_x_max = extrema.loc["max", extrema.columns.str.endswith(" x")].max()
+    data = check_gait_direction(
+        tracking_software,
+        data,
+        direction_joint,
+        flip_gait_direction,
+        info,
+        direction_data=direction_data,
+        global_x_max=global_x_max,
+    )
+    if data is None:  # this means DLC file is broken
+        return
+    # y-transformations run on a (frames, joints, coords) array of all coordinates
+    # => each transformation is a single broadcasted operation on this array
+    # => joint_index holds joint names like cfg does (i.e. "Joint "), see below
+    coords, joint_index = tracking_df_to_array(data)
+    # if wanted: fix that deeplabcut & SLEAP inverse y
+    if invert_y_axis:
+        coords[:, :, 1] *= -1
+    # if we don't have a beam to subtract, standardise y to a joint's or global ymin = 0
+    # => windowed loading: use the extrema of all frames - since we inverted y after
+    #    computing them, the min of inverted y is -max
+    if not subtract_beam:
+        if frame_windows is not None:
+            if standardise_y_to_a_joint:
+                y_cols = [y_standardisation_joint + "y"]
+            else:
+                y_cols = extrema.columns[extrema.columns.str.endswith(" y")]
+            if invert_y_axis:
+                y_min = -extrema.loc["max", y_cols].max()
+            else:
+                y_min = extrema.loc["min", y_cols].min()
+        elif standardise_y_to_a_joint:
+            y_min = np.nanmin(
+                coords[:, joint_index.get_loc(y_standardisation_joint), 1]
+            )
+        else:
+            y_min = np.nanmin(coords[:, :, 1])
+        coords[:, :, 1] -= y_min
+    # subtract the beam from the joints to standardise y
+    # => bc. we simulate that all mice run from left to right, we can write:
+    #     (note that we also flip beam x columns, but never y-columns!)
+    # => & bc. we multiply y values by *-1 earlier, it's a neg_num - - neg_num
+    #    pushing it towards zero.
+    # => using list(set()) to ensure that we don't have duplicate values (if users
+    #    should have provided them in both cfg vars by misstake)
+    # => beam_col_left and right is provided by users
+    if subtract_beam:
+        # note beam_col_left/right are always lists in cfg!
+        beam_col_left = cfg["beam_col_left"][0]
+        beam_col_right = cfg["beam_col_right"][0]
+        for beam_joints, beam_col in [
+            (hind_joints + beam_hind_jointadd, beam_col_left),
+            (fore_joints + beam_fore_jointadd, beam_col_right),
+        ]:
+            joint_idxs = joint_index.get_indexer(list(set(beam_joints)))
+            beam_idx = joint_index.get_loc(beam_col)
+            coords[:, joint_idxs, 1] -= coords[:, [beam_idx], 1]
+    # back to our DataFrame layout - the remaining steps work on columns
+    data = array_to_tracking_df(data, coords, joint_index)
+    if subtract_beam:
+        # beam not needed anymore
+        data.drop(columns=loaded_data["beam_columns"], inplace=True)
+    # add Time
+    data[TIME_COL] = data.index * (1 / sampling_rate)
+    # reorder the columns we added
+    cols = [TIME_COL, "Flipped"]
+    data = data[cols + [c for c in data.columns if c not in cols]]
+    # ------------------------------------------------------------------------
+    #                             IMPORTANT
+    # Next two things must be the last that are done in this function, since
+    # joint-standardisation must be done after beam-subtraction & non-beam-height-stand
+    # and pixel-standardisation must be done after joint-standardisation!
+    # ------------------------------------------------------------------------
+    # 1) standardise all primary joint (!) coordinates
+    # => all dimensions are divided by a fixed user-provided value
+    # => note this function has proper errors raised if things should be wrongly
+    #    configured by user!
+    if len(coordinate_standardisation_xls) > 0:
+        data, cfg = standardise_primary_joint_coordinates(
+            data, tracking_software, info, cfg
+        )
+    # 2) convert pixels to millimeters
+    if convert_to_mm:
+        coord_cols = data.columns[data.columns.str.endswith((" x", " y"))]
+        data.loc[:, coord_cols] = data[coord_cols].to_numpy() / pixel_to_mm_ratio
+    return data
+
+
+def load_tracking_data(tracking_software, info, folderinfo, cfg):
+    """Move the files of this run to results_dir & load data (& beam) - or None"""
+    move_data_to_results_dir(tracking_software, info, folderinfo)
+    return read_tracking_data(tracking_software, info, folderinfo, cfg)
+
+
+def read_tracking_data(tracking_software, info, folderinfo, cfg):
+    """Load data (& beam) from the files in results_dir - or None
+
+    Note
+    ----
+    Returns a dict with data & what some_prep needs to know about how it was loaded.
+    Only the cfg-keys of SWEEP_LOADING_KEYS are used here.
+    """
 
     # .........................  unpack & prep stuff  ..................................
     # IMPORTANT
@@ -37,55 +260,19 @@ def some_prep(tracking_software, info, folderinfo, cfg):
         file_type_string = ".csv"
     elif tracking_software == "SLEAP":
         file_type_string = ".h5"
-    # DON'T unpack (joint) cfg-keys that are tested later by check_and_expand_cfg
     name = info["name"]
     results_dir = info["results_dir"]
     data_string = folderinfo["data_string"]
     beam_string = folderinfo["beam_string"]
-    sampling_rate = cfg["sampling_rate"]
     subtract_beam = cfg["subtract_beam"]
-    bin_num = cfg["bin_num"]
-    convert_to_mm = cfg["convert_to_mm"]
-    pixel_to_mm_ratio = cfg["pixel_to_mm_ratio"]
-    x_sc_broken_threshold = cfg["x_sc_broken_threshold"]
-    y_sc_broken_threshold = cfg["y_sc_broken_threshold"]
-    standardise_y_at_SC_level = cfg["standardise_y_at_SC_level"]
-    invert_y_axis = cfg["invert_y_axis"]
-    flip_gait_direction = cfg["flip_gait_direction"]
-    analyse_average_x = cfg["analyse_average_x"]
-    standardise_x_coordinates = cfg["standardise_x_coordinates"]
-    standardise_y_to_a_joint = cfg["standardise_y_to_a_joint"]
-    coordinate_standardisation_xls = cfg["coordinate_standardisation_xls"]
+    windowed_loading = False  # optional - only load frames of annotated SCs
+    if "windowed_loading" in cfg.keys():
+        windowed_loading = cfg["windowed_loading"]
+    # automatic SC detection needs all frames (& doesn't use the annotation table)
+    if "detect_stepcycles" in cfg.keys() and cfg["detect_stepcycles"]:
+        windowed_loading = False
 
-    # .............................  move data  ........................................
-    # => slightly different for DLC or SLEAP (see local functions below)
-    # => see if we can delete a previous runs results folder if existant. if not, it's a
-    #    bit ugly since we only update results if filenames match...
-    # => for example if angle acceleration not wanted in current run, but was stored in
-    #    previous run, the previous run's figure is in the folder
-    # => inform the user and leave this as is
-    if os.path.exists(results_dir):
-        try:
-            shutil.rmtree(results_dir)
-            move_data_to_folders(tracking_software, file_type_string, info, folderinfo)
-        except OSError:
-            move_data_to_folders(tracking_software, file_type_string, info, folderinfo)
-            unable_to_rm_resdir_error = (
-                "\n***********\n! WARNING !\n***********\n"
-                + "Unable to remove previous Results subfolder of ID: "
-                + name
-                + "!\n Results will only be updated if filenames match!"
-            )
-            print(unable_to_rm_resdir_error)
-            write_issues_to_textfile(unable_to_rm_resdir_error, info)
-    else:
-        move_data_to_folders(tracking_software, file_type_string, info, folderinfo)
-
-    # .......  initialise Issues.txt & quick check for file existence  .................
-    # Issues.txt - delete if saved in a previous run
-    issues_txt_path = os.path.join(results_dir, ISSUES_TXT_FILENAME)
-    if os.path.exists(issues_txt_path):
-        os.remove(issues_txt_path)
+    # ........................  quick check for file existence  .......................
     # read data & beam
     if not os.listdir(results_dir):
         no_files_error = (
@@ -100,6 +287,14 @@ def some_prep(tracking_software, info, folderinfo, cfg):
         return
 
     # ............................  import data  .......................................
+    # windowed loading: read the annotation table first & only load the frames of (and
+    # around) annotated SCs - the extrema of all frames are computed while streaming
+    # through files (see read_frame_windows)
+    # => if the table doesn't tell us which frames to load, we load everything and
+    #    extract_stepcycles reports the issue later
+    frame_windows = None
+    if windowed_loading:
+        frame_windows = read_annotated_frame_windows(info, folderinfo, cfg)
     datadf = pd.DataFrame(data=None)  # prep stuff for error handling
     datadf_duplicate_error = ""
     if subtract_beam:
@@ -118,7 +313,12 @@ def some_prep(tracking_software, info, folderinfo, cfg):
         if filename.endswith(file_type_string):
             if data_string in filename:
                 if datadf.empty:
-                    if tracking_software == "DLC":
+                    data_filename = filename
+                    if frame_windows is not None:
+                        datadf, data_extrema, data_frame_number = read_frame_windows(
+                            tracking_software, results_dir, filename, frame_windows
+                        )
+                    elif tracking_software == "DLC":
                         datadf = pd.read_csv(os.path.join(results_dir, filename))
                     elif tracking_software == "SLEAP":
                         datadf = h5_to_df(results_dir, filename)
@@ -132,7 +332,16 @@ def some_prep(tracking_software, info, folderinfo, cfg):
             if subtract_beam:
                 if beam_string in filename:
                     if beamdf.empty:
-                        if tracking_software == "DLC":
+                        if frame_windows is not None:
+                            beamdf, beam_extrema, beam_frame_number = (
+                                read_frame_windows(
+                                    tracking_software,
+                                    results_dir,
+                                    filename,
+                                    frame_windows,
+                                )
+                            )
+                        elif tracking_software == "DLC":
                             beamdf = pd.read_csv(os.path.join(results_dir, filename))
                         elif tracking_software == "SLEAP":
                             beamdf = h5_to_df(results_dir, filename)
@@ -168,181 +377,86 @@ def some_prep(tracking_software, info, folderinfo, cfg):
         write_issues_to_textfile(import_error_message, info)
         return
 
-    # ....  finalise import: rename cols, get rid of unnecessary elements, floatit  ....
-    if tracking_software == "DLC":  # need to prep DLC dfs
+    # ....  finalise import: rename cols, get rid of unnecessary elements  .............
+    # => windowed DLC dfs are prepared by read_frame_windows already
+    if (tracking_software == "DLC") & (frame_windows is None):  # need to prep DLC dfs
         datadf = prepare_DLC_df(datadf)
         if subtract_beam:  # beam df
             beamdf = prepare_DLC_df(beamdf)
+    loaded_data = {
+        "data_dir": results_dir,
+        "data_filename": data_filename,
+        "frame_windows": frame_windows,
+        "beam_columns": [],
+    }
     if subtract_beam:
-        data = pd.concat([datadf, beamdf], axis=1)
+        loaded_data["data"] = pd.concat([datadf, beamdf], axis=1)
+        loaded_data["beam_columns"] = list(beamdf.columns)
     else:
-        data = datadf.copy(deep=True)
+        loaded_data["data"] = datadf.copy(deep=True)
+    # windowed loading: extrema & number of frames of all frames (as if fully loaded)
+    if frame_windows is not None:
+        loaded_data["extrema"] = data_extrema
+        loaded_data["frame_number"] = data_frame_number
+        if subtract_beam:
+            loaded_data["extrema"] = pd.concat([data_extrema, beam_extrema], axis=1)
+            loaded_data["frame_number"] = max(data_frame_number, beam_frame_number)
+    return loaded_data
 
-    # ................  final data checks, conversions & additions  ....................
-    # IMPORTANT - MAIN TESTS OF USER-INPUT VALIDITY OCCUR HERE!
-    # => UNPACK VARS FROM CFG THAT ARE TESTED BY check_and_expand HERE, NOT EARLIER!
-    cfg = check_and_expand_cfg(data, cfg, info)
-    if cfg is None:  # some critical error occured
-        return
-    hind_joints = cfg["hind_joints"]
-    fore_joints = cfg["fore_joints"]
-    angles = cfg["angles"]
-    beam_hind_jointadd = cfg["beam_hind_jointadd"]
-    beam_fore_jointadd = cfg["beam_fore_jointadd"]
-    direction_joint = cfg["direction_joint"]
-    # important to unpack to vars and not to cfg since cfg is overwritten in multiruns!
-    x_standardisation_joint = cfg["x_standardisation_joint"][0]
-    y_standardisation_joint = cfg["y_standardisation_joint"][0]
-    # store config json file @ group path
+
+def write_config_json(tracking_software, info, cfg):
+    """Store the config json file of this run's (expanded) cfg @ group path"""
     # !!! NU - do this @ mouse path!
     try:
         autogaita_version = version("autogaita")
     except Exception:
         autogaita_version = "unknown"
-    group_path = results_dir.split(name)[0]
+    group_path = info["results_dir"].split(info["name"])[0]
     config_json_path = os.path.join(group_path, CONFIG_JSON_FILENAME)
     config_vars_to_json = {
         "autogaita_version": autogaita_version,
-        "sampling_rate": sampling_rate,
-        "bin_num": bin_num,
-        "convert_to_mm": convert_to_mm,
-        "pixel_to_mm_ratio": pixel_to_mm_ratio,
-        "x_sc_broken_threshold": x_sc_broken_threshold,
-        "y_sc_broken_threshold": y_sc_broken_threshold,
-        "invert_y_axis": invert_y_axis,
-        "standardise_y_at_SC_level": standardise_y_at_SC_level,
-        "flip_gait_direction": flip_gait_direction,
-        "analyse_average_x": analyse_average_x,
-        "standardise_x_coordinates": standardise_x_coordinates,
-        "x_standardisation_joint": x_standardisation_joint,
-        "standardise_y_to_a_joint": standardise_y_to_a_joint,
-        "y_standardisation_joint": y_standardisation_joint,
-        "coordinate_standardisation_xls": coordinate_standardisation_xls,
-        "hind_joints": hind_joints,
-        "fore_joints": fore_joints,
-        "angles": angles,
+        "sampling_rate": cfg["sampling_rate"],
+        "bin_num": cfg["bin_num"],
+        "convert_to_mm": cfg["convert_to_mm"],
+        "pixel_to_mm_ratio": cfg["pixel_to_mm_ratio"],
+        "x_sc_broken_threshold": cfg["x_sc_broken_threshold"],
+        "y_sc_broken_threshold": cfg["y_sc_broken_threshold"],
+        "invert_y_axis": cfg["invert_y_axis"],
+        "standardise_y_at_SC_level": cfg["standardise_y_at_SC_level"],
+        "flip_gait_direction": cfg["flip_gait_direction"],
+        "analyse_average_x": cfg["analyse_average_x"],
+        "standardise_x_coordinates": cfg["standardise_x_coordinates"],
+        "x_standardisation_joint": cfg["x_standardisation_joint"][0],
+        "standardise_y_to_a_joint": cfg["standardise_y_to_a_joint"],
+        "y_standardisation_joint": cfg["y_standardisation_joint"][0],
+        "coordinate_standardisation_xls": cfg["coordinate_standardisation_xls"],
+        "hind_joints": cfg["hind_joints"],
+        "fore_joints": cfg["fore_joints"],
+        "angles": cfg["angles"],
         "tracking_software": tracking_software,
     }
     # note - using "w" will overwrite/truncate file, thus no need to remove it if exists
     with open(config_json_path, "w") as config_json_file:
         json.dump(config_vars_to_json, config_json_file, indent=4)
-    # a little test to see if columns make sense, i.e., same number of x/y/likelihood
-    x_col_count = len([c for c in data.columns if c.endswith(" x")])
-    y_col_count = len([c for c in data.columns if c.endswith(" y")])
-    likelihood_col_count = "N/A because SLEAP"  # initialise so message doesnt break
-    if tracking_software == "DLC":
-        likelihood_col_count = len(
-            [c for c in data.columns if c.endswith(" likelihood")]
-        )
-        col_count_condition = x_col_count == y_col_count == likelihood_col_count
-    elif tracking_software == "SLEAP":
-        col_count_condition = x_col_count == y_col_count
-    if col_count_condition:
-        pass
-    else:
-        cols_are_weird_message = (
-            "\n***********\n! WARNING !\n***********\n"
-            + "We detected an unequal number of columns ending with x, y or "
-            + "likelihood!\nCounts were:\n"
-            + "x: "
-            + str(x_col_count)
-            + ", y: "
-            + str(y_col_count)
-            + ", likelihood: "
-            + str(likelihood_col_count)
-            + "!\n\n"
-            + "We continue with the analysis but we strongly suggest you have another "
-            + "look at your dataset, this should not happen.\n"
-        )
-        print(cols_are_weird_message)
-        write_issues_to_textfile(cols_are_weird_message, info)
-    # if wanted: fix that deeplabcut & SLEAP inverse y
-    if invert_y_axis:
-        for col in data.columns:
-            if col.endswith(" y"):
-                data[col] = data[col] * -1
-    # if we don't have a beam to subtract, standardise y to a joint's or global ymin = 0
-    if not subtract_beam:
-        y_min = float("inf")
-        y_cols = [col for col in data.columns if col.endswith("y")]
-        if standardise_y_to_a_joint:
-            y_min = data[y_standardisation_joint + "y"].min()
-        else:
-            y_min = data[y_cols].min().min()
-        data[y_cols] -= y_min
-    # quick warning if cfg is set to not flip gait direction but to standardise x
-    if not flip_gait_direction and standardise_x_coordinates:
-        message = (
-            "\n***********\n! WARNING !\n***********\n"
-            + "You are standardising x-coordinates without standardising the direction "
-            + "of gait (e.g. all walking from right to left)."
-            + "\nThis can be correct if you are doing things like treadmill walking "
-            + "but can lead to unexpected behaviour otherwise!"
-            + "\nMake sure you know what you are doing!"
-        )
-        print(message)
-        write_issues_to_textfile(message, info)
-    # check gait direction & DLC file validity
-    data = check_gait_direction(
-        tracking_software, data, direction_joint, flip_gait_direction, info
-    )
-    if data is None:  # this means DLC file is broken
-        return
-    # subtract the beam from the joints to standardise y
-    # => bc. we simulate that all mice run from left to right, we can write:
-    #     (note that we also flip beam x columns, but never y-columns!)
-    # => & bc. we multiply y values by *-1 earlier, it's a neg_num - - neg_num
-    #    pushing it towards zero.
-    # => using list(set()) to ensure that we don't have duplicate values (if users
-    #    should have provided them in both cfg vars by misstake)
-    # => beam_col_left and right is provided by users
-    if subtract_beam:
-        # note beam_col_left/right are always lists in cfg!
-        beam_col_left = cfg["beam_col_left"][0]
-        beam_col_right = cfg["beam_col_right"][0]
-        for joint in list(set(hind_joints + beam_hind_jointadd)):
-            data[joint + "y"] = data[joint + "y"] - data[beam_col_left + "y"]
-        for joint in list(set(fore_joints + beam_fore_jointadd)):
-            data[joint + "y"] = data[joint + "y"] - data[beam_col_right + "y"]
-        data.drop(columns=list(beamdf.columns), inplace=True)  # beam not needed anymore
-    # add Time
-    data[TIME_COL] = data.index * (1 / sampling_rate)
-    # reorder the columns we added
-    cols = [TIME_COL, "Flipped"]
-    data = data[cols + [c for c in data.columns if c not in cols]]
-    # ------------------------------------------------------------------------
-    #                             IMPORTANT
-    # Next two things must be the last that are done in this function, since
-    # joint-standardisation must be done after beam-subtraction & non-beam-height-stand
-    # and pixel-standardisation must be done after joint-standardisation!
-    # ------------------------------------------------------------------------
-    # 1) standardise all primary joint (!) coordinates
-    # => all dimensions are divided by a fixed user-provided value
-    # => note this function has proper errors raised if things should be wrongly
-    #    configured by user!
-    if len(coordinate_standardisation_xls) > 0:
-        data, cfg = standardise_primary_joint_coordinates(
-            data, tracking_software, info, cfg
-        )
-    # 2) convert pixels to millimeters
-    if convert_to_mm:
-        for column in data.columns:
-            if column.endswith((" x", " y")):  # if tuple: endswith any of these
-                data[column] = data[column] / pixel_to_mm_ratio
-    return data
 
 
 # ........................  tracking software specific helpers  ........................
 def h5_to_df(results_dir, filename):
     """Convert a SLEAP h5 file to the pandas dataframe used in gaita"""
-    df = pd.DataFrame(data=None)
     with h5py.File(os.path.join(results_dir, filename), "r") as f:
+        # locations are (frames, nodes, coords, tracks) - we use the first track
         locations = f["tracks"][:].T
         node_names = [n.decode() for n in f["node_names"][:]]
-        df.index = np.arange(np.shape(locations)[0])
-        for node_idx, node_name in enumerate(node_names):
-            for c, coord in enumerate(["x", "y"]):
-                df[node_name + " " + coord] = locations[:, node_idx, c, 0]
+        frame_number = np.shape(locations)[0]
+        df = pd.DataFrame(
+            data=locations[:, :, :2, 0].reshape(frame_number, -1),
+            index=np.arange(frame_number),
+            columns=[
+                node_name + " " + coord
+                for node_name in node_names
+                for coord in ["x", "y"]
+            ],
+        )
     return df
 
 
@@ -364,16 +478,324 @@ def prepare_DLC_df(df, separator=" "):
     return df
 
 
-# ...............................  generic helpers  ....................................
+# ..............................  windowed loading  ...................................
 
 
-def move_data_to_folders(tracking_software, file_type_string, info, folderinfo):
-    """Find files, copy data, video, beamdata & beamvideo to new results_dir"""
+def read_frame_windows(tracking_software, results_dir, filename, frame_windows):
+    """Read only frames of (& around) annotated SCs of a DLC csv or SLEAP h5 file
+
+    Note
+    ----
+    Streams through the file in chunks (csv) or reads hyperslabs (h5) so we never hold
+    all frames in memory. Returns:
+    1) the df of loaded frames - indexed by frame & prepared like a fully loaded df
+    2) a df of the min & max of all (!) frames of each column
+    3) the number of frames of the file
+    """
+    filepath = os.path.join(results_dir, filename)
+    # frames (& windows of consecutive frames) to load, including a margin
+    frames = np.unique(
+        np.concatenate(
+            [
+                np.arange(
+                    max(min(window) - WINDOWED_LOADING_MARGIN, 0),
+                    max(window) + WINDOWED_LOADING_MARGIN + 1,
+                )
+                for window in frame_windows
+            ]
+        )
+    )
+    if tracking_software == "DLC":
+        columns = prepare_DLC_df(pd.read_csv(filepath, nrows=2)).columns
+        # => round_trip parses floats like astype(float) does for fully loaded dfs
+        chunks = pd.read_csv(
+            filepath,
+            header=None,
+            skiprows=3,
+            chunksize=WINDOWED_LOADING_CHUNKSIZE,
+            float_precision="round_trip",
+        )
+        loaded_frames = []
+        chunk_extrema = []
+        frame_number = 0
+        for chunk in chunks:
+            # first column holds DLC's frame index (dropped like in prepare_DLC_df)
+            chunk = chunk.iloc[:, 1:].astype(float)
+            chunk.columns = columns
+            chunk.index = range(frame_number, frame_number + len(chunk))
+            chunk_extrema.append(pd.concat([chunk.min(), chunk.max()], axis=1))
+            loaded_frames.append(chunk.loc[chunk.index.intersection(frames)])
+            frame_number += len(chunk)
+        df = pd.concat(loaded_frames)
+    elif tracking_software == "SLEAP":
+        with h5py.File(filepath, "r") as f:
+            # tracks are (tracks, coords, nodes, frames) - we use the first track
+            tracks = f["tracks"]
+            node_names = [n.decode() for n in f["node_names"][:]]
+            columns = [
+                node_name + " " + coord
+                for node_name in node_names
+                for coord in ["x", "y"]
+            ]
+            frame_number = tracks.shape[-1]
+            chunk_extrema = []
+            for start in range(0, frame_number, WINDOWED_LOADING_CHUNKSIZE):
+                chunk = h5_hyperslab_to_df(
+                    tracks, start, start + WINDOWED_LOADING_CHUNKSIZE, columns
+                )
+                chunk_extrema.append(pd.concat([chunk.min(), chunk.max()], axis=1))
+            # consecutive frames are read as one hyperslab
+            window_starts = np.flatnonzero(np.diff(frames, prepend=-2) != 1)
+            window_ends = np.append(window_starts[1:], len(frames))
+            df = pd.concat(
+                [
+                    h5_hyperslab_to_df(
+                        tracks, frames[start], frames[end - 1] + 1, columns
+                    )
+                    for start, end in zip(window_starts, window_ends)
+                ]
+            )
+    extrema = pd.concat(chunk_extrema, axis=1)
+    extrema = pd.DataFrame(
+        {
+            "min": extrema.iloc[:, 0::2].min(axis=1),
+            "max": extrema.iloc[:, 1::2].max(axis=1),
+        }
+    ).T
+    return df, extrema, frame_number
+
+
+def h5_hyperslab_to_df(tracks, start, end, columns):
+    """Read frames start to end (exclusive) of a SLEAP h5's tracks into a df"""
+    locations = tracks[0, :2, :, start:end].T  # (frames, nodes, coords)
+    return pd.DataFrame(
+        data=locations.reshape(len(locations), -1),
+        index=np.arange(start, start + len(locations)),
+        columns=columns,
+    )
+
+
+def read_direction_joint_data(
+    tracking_software, results_dir, filename, direction_joint, frame_number
+):
+    """Read all frames of the direction joint's columns needed by check_gait_direction
+
+    Note
+    ----
+    Used by windowed loading - frame_number pads with NaNs like a fully loaded df would
+    be padded if the beam file has more frames than the data file
+    """
+    filepath = os.path.join(results_dir, filename)
+    if tracking_software == "DLC":
+        direction_cols = [direction_joint + "likelihood", direction_joint + "x"]
+        columns = prepare_DLC_df(pd.read_csv(filepath, nrows=2)).columns
+        # +1 because of the first column holding DLC's frame index
+        direction_data = pd.read_csv(
+            filepath,
+            header=None,
+            skiprows=3,
+            usecols=[columns.get_loc(col) + 1 for col in direction_cols],
+            float_precision="round_trip",
+        ).astype(float)
+        direction_data.columns = [
+            columns[col_idx - 1] for col_idx in direction_data.columns
+        ]
+    elif tracking_software == "SLEAP":
+        with h5py.File(filepath, "r") as f:
+            node_names = [n.decode() for n in f["node_names"][:]]
+            node_idx = node_names.index(direction_joint[:-1])  # no space in h5
+            direction_data = pd.DataFrame(
+                {direction_joint + "x": f["tracks"][0, 0, node_idx, :]}
+            )
+    return direction_data.reindex(range(frame_number))
+
+
+# .............................  multi-animal ingestion  ..............................
+
+
+def fan_out_multi_animal_recordings(tracking_software, info, folderinfo, cfg):
+    """Split the multi-animal recordings of a multirun into one dataset per animal
+
+    Note
+    ----
+    Opt-in via cfg["multi_animal"] - info is returned unchanged otherwise.
+    Reads the data (& beam) file of each recording once & writes one single-animal file
+    per SLEAP track or maDLC individual to the MULTI_ANIMAL_FOLDERNAME folder of the
+    multirun's results. The returned info has one entry per animal, so each animal is
+    analysed in a run of its own & gets its own Results folder.
+    Animals are named after their recording's ID & their track/individual, joined by
+    an underscore (e.g. "ID 1_track_0 - Run 3" for track_0 of Cage1_run3), since
+    default track names repeat across recordings. The annotation table's ID column
+    must use these combined IDs (e.g. 1_track_0). Whitespace in track names is
+    replaced by underscores because group analyses split names at spaces.
+    maDLC's unique bodyparts are added to each animal's data. Beam files that only
+    include one animal (or are single-animal files) are shared by all animals.
+    Labeled videos are not copied to the Results folders of animals.
+    """
+    if not ("multi_animal" in cfg.keys() and cfg["multi_animal"]):
+        return info
+
     # unpack
-    results_dir = info["results_dir"]
+    if tracking_software == "DLC":
+        file_type_string = ".csv"
+    elif tracking_software == "SLEAP":
+        file_type_string = ".h5"
+    root_dir = folderinfo["root_dir"]
+    data_string = folderinfo["data_string"]
+    beam_string = folderinfo["beam_string"]
+    subtract_beam = cfg["subtract_beam"]
+    data_dir = os.path.join(
+        multirun_results_dir(folderinfo, cfg), MULTI_ANIMAL_FOLDERNAME
+    )
+    os.makedirs(data_dir, exist_ok=True)
+    batch_info = {"results_dir": data_dir}  # issues are logged to data_dir
+    animal_info = {
+        "name": [],
+        "mouse_num": [],
+        "run_num": [],
+        "leading_run_num_zeros": [],
+        "data_dir": [],
+    }
+
+    # fan out each recording
+    for idx in range(len(info["name"])):
+        recording_filenames, file_id_strings = find_recording_filenames(
+            file_type_string, info, idx, folderinfo
+        )
+        data_filenames = [f for f in recording_filenames if data_string in f]
+        beam_filenames = []
+        if subtract_beam:
+            beam_filenames = [f for f in recording_filenames if beam_string in f]
+        if (len(data_filenames) != 1) | (subtract_beam & (len(beam_filenames) != 1)):
+            message = (
+                "\n*********\n! ERROR !\n*********\n"
+                + "Unable to find exactly one data"
+                + (" & one beam" if subtract_beam else "")
+                + f" {file_type_string}-file for {info['name'][idx]}!"
+                + "\nSkipping this recording!"
+            )
+            log_multi_animal_issue(message, batch_info)
+            continue
+        data_animals = read_multi_animal_file(
+            tracking_software, root_dir, data_filenames[0]
+        )
+        if None in data_animals.keys():
+            message = (
+                "\n*********\n! ERROR !\n*********\n"
+                + f"The data of {info['name'][idx]} is not a multi-animal file!"
+                + "\nSkipping this recording!"
+            )
+            log_multi_animal_issue(message, batch_info)
+            continue
+        beam_animals = {}
+        if subtract_beam:
+            beam_animals = read_multi_animal_file(
+                tracking_software, root_dir, beam_filenames[0]
+            )
+        recording_id = str(info["mouse_num"][idx])
+        if info["leading_mouse_num_zeros"][idx] is not False:
+            recording_id = info["leading_mouse_num_zeros"][idx] + recording_id
+        for animal, animal_data in data_animals.items():
+            mouse_num = multi_animal_ID(recording_id, animal)
+            name = "ID " + str(mouse_num) + " - Run " + str(info["run_num"][idx])
+            if name in animal_info["name"]:
+                message = (
+                    "\n*********\n! ERROR !\n*********\n"
+                    + f"Found {name} in more than one recording!"
+                    + "\nTrack/individual names must be unique per recording - skipping!"
+                )
+                log_multi_animal_issue(message, batch_info)
+                continue
+            if len(beam_animals) == 1:
+                animal_beam = list(beam_animals.values())[0]
+            elif animal in beam_animals.keys():
+                animal_beam = beam_animals[animal]
+            elif subtract_beam:
+                message = (
+                    "\n*********\n! ERROR !\n*********\n"
+                    + f"Unable to find the beam of {name}! Skipping!"
+                )
+                log_multi_animal_issue(message, batch_info)
+                continue
+            # replace the recording's ID with the animal's in our filenames
+            # => lets move_data_to_folders find this animal's files
+            old_id_string, new_id_string = file_id_strings
+            new_id_string = new_id_string.replace("{}", str(mouse_num))
+            write_single_animal_file(
+                tracking_software,
+                animal_data,
+                data_dir,
+                data_filenames[0].replace(old_id_string, new_id_string, 1),
+            )
+            if subtract_beam:
+                write_single_animal_file(
+                    tracking_software,
+                    animal_beam,
+                    data_dir,
+                    beam_filenames[0].replace(old_id_string, new_id_string, 1),
+                )
+            animal_info["name"].append(name)
+            animal_info["mouse_num"].append(mouse_num)
+            animal_info["run_num"].append(info["run_num"][idx])
+            animal_info["leading_run_num_zeros"].append(
+                info["leading_run_num_zeros"][idx]
+            )
+            animal_info["data_dir"].append(data_dir)
+    return animal_info
+
+
+def multi_animal_ID(recording_id, animal):
+    """Return the ID of a multi-animal recording's animal (e.g. 1_track_0)
+
+    Note
+    ----
+    Must not include spaces (& thus " - ") since our names are split at these and
+    must be usable in filenames.
+    """
+    animal = re.sub(r'[\\/:*?"<>|]', "", str(animal).strip())
+    return recording_id + "_" + re.sub(r"\s+", "_", animal)
+
+
+def find_recording_filenames(file_type_string, info, idx, folderinfo):
+    """Return the root_dir files of a multirun's recording & its ID's filename string
+
+    Note
+    ----
+    The ID string is returned as the string found in the filenames & as a template
+    with "{}" in place of the ID number (see fan_out_multi_animal_recordings)
+    """
+    # unpack
+    root_dir = folderinfo["root_dir"]
+    premouse_string = folderinfo["premouse_string"]
+    mouse_num = str(info["mouse_num"][idx])
+    if info["leading_mouse_num_zeros"][idx] is not False:
+        mouse_num = info["leading_mouse_num_zeros"][idx] + mouse_num
+    run_num = str(info["run_num"][idx])
+    if info["leading_run_num_zeros"][idx] is not False:
+        run_num = info["leading_run_num_zeros"][idx] + run_num
+    filenames, candidate_postmouse_string = find_run_filenames(
+        file_type_string, root_dir, mouse_num, run_num, folderinfo
+    )
+    if not filenames:
+        return [], None
+    id_string = premouse_string + mouse_num + candidate_postmouse_string
+    id_template = premouse_string + "{}" + candidate_postmouse_string
+    return filenames, (id_string, id_template)
+
+
+def find_run_filenames(file_type_string, root_dir, mouse_num, run_num, folderinfo):
+    """Return the files of a run in root_dir & the postmouse string they were found with
+
+    Note
+    ----
+    mouse_num & run_num are strings (incl. leading zeros). Returns [] and None if there
+    are no files.
+    """
+    # unpack
+    premouse_string = folderinfo["premouse_string"]
     postmouse_string = folderinfo["postmouse_string"]
+    prerun_string = folderinfo["prerun_string"]
     postrun_string = folderinfo["postrun_string"]
-    os.makedirs(results_dir)  # important to do this outside of loop!
     # check if user forgot some underscores or dashes in their filenames
     # => two levels of string additions for two post FILE-ID strings
     # => in theory if the user has some strange cases in which this double forloop
@@ -382,88 +804,257 @@ def move_data_to_folders(tracking_software, file_type_string, info, folderinfo):
     # one - keep this in mind if it should come up but it should be very unlikely
     for mouse_string_addition in FILE_ID_STRING_ADDITIONS:
         candidate_postmouse_string = mouse_string_addition + postmouse_string
+        id_string = premouse_string + mouse_num + candidate_postmouse_string
         for run_string_addition in FILE_ID_STRING_ADDITIONS:
-            candidate_postrun_string = run_string_addition + postrun_string
-            found_it = check_this_filename_configuration(
-                tracking_software,
-                file_type_string,
-                info,
-                folderinfo,
-                candidate_postmouse_string,
-                candidate_postrun_string,
-                results_dir,
+            run_string = prerun_string + run_num + run_string_addition + postrun_string
+            filenames = [
+                filename
+                for filename in os.listdir(root_dir)
+                if (id_string in filename)
+                and (run_string in filename)
+                and (filename.endswith(file_type_string))
+            ]
+            if filenames:  # if our search was successful, stop searching
+                return sorted(filenames), candidate_postmouse_string
+    return [], None
+
+
+def read_multi_animal_file(tracking_software, root_dir, filename):
+    """Read a SLEAP h5 or (ma)DLC csv once & return its data per animal
+
+    Note
+    ----
+    Returns a dict of animal names & their data in the format that is written by
+    write_single_animal_file. Single-animal DLC files are returned as is - with None as
+    their animal name.
+    We read DLC files as strings so that single-animal files have the exact values of
+    the original file.
+    """
+    filepath = os.path.join(root_dir, filename)
+    animals = {}
+    if tracking_software == "DLC":
+        # rows are scorer, individuals, bodyparts & coords (single-animal: no
+        # individuals) - column 0 holds the row labels & DLC's frame index
+        raw = pd.read_csv(filepath, header=None, dtype=str, keep_default_na=False)
+        if raw.iloc[1, 0] != "individuals":
+            return {None: raw}
+        individuals = raw.iloc[1, 1:]
+        shared_cols = individuals.index[individuals == MADLC_SHARED_INDIVIDUAL]
+        for animal in individuals.unique():
+            if animal == MADLC_SHARED_INDIVIDUAL:
+                continue
+            animal_cols = individuals.index[individuals == animal]
+            animals[animal] = raw.drop(index=1).loc[:, [0, *animal_cols, *shared_cols]]
+    elif tracking_software == "SLEAP":
+        with h5py.File(filepath, "r") as f:
+            tracks = f["tracks"][:]  # (tracks, coords, nodes, frames)
+            node_names = f["node_names"][:]
+            if "track_names" in f.keys() and len(f["track_names"]) == len(tracks):
+                track_names = [n.decode() for n in f["track_names"][:]]
+            else:  # untracked files - name tracks like our IDs (1, 2, ...)
+                track_names = [str(t + 1) for t in range(len(tracks))]
+        for t, animal in enumerate(track_names):
+            animals[animal] = (tracks[t : t + 1], node_names)
+    return animals
+
+
+def write_single_animal_file(tracking_software, animal_data, data_dir, filename):
+    """Write an animal's data (see read_multi_animal_file) as a single-animal file"""
+    filepath = os.path.join(data_dir, filename)
+    if tracking_software == "DLC":
+        animal_data.to_csv(filepath, header=False, index=False)
+    elif tracking_software == "SLEAP":
+        tracks, node_names = animal_data
+        with h5py.File(filepath, "w") as f:
+            f.create_dataset("tracks", data=tracks)
+            f.create_dataset("node_names", data=node_names)
+
+
+def log_multi_animal_issue(message, batch_info):
+    """Print an issue of our fan-out & log it to the Issues.txt of its folder"""
+    print(message)
+    with collect_issues(batch_info):
+        write_issues_to_textfile(message, batch_info)
+
+
+# ...............................  generic helpers  ....................................
+
+
+def rolling_window_means(values, window):
+    """Return the mean of each full window of consecutive values
+
+    Note
+    ----
+    Uses a (strided) view of all windows so that each window's mean is computed exactly
+    like np.mean(values[i : i + window]) would - i.e., without the rounding errors
+    that cumulative sums accumulate over long recordings.
+    NaNs are skipped like pandas' mean does (windows of only NaNs are NaN).
+    """
+    if len(values) < window:
+        return np.array([])
+    windows = np.lib.stride_tricks.sliding_window_view(values, window)
+    with warnings.catch_warnings():  # "mean of empty slice" of all-NaN windows
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        return np.nanmean(windows, axis=1)
+
+
+def tracking_df_to_array(data):
+    """Return all x & y columns of data as a (frames, joints, coords) float array
+
+    Note
+    ----
+    The joint index that is returned alongside the array names joints the way cfg does
+    (e.g. "Hind paw tip "), so joint_index.get_loc(joint) finds a joint's position
+    along the array's second axis.
+    Coordinates that are missing from data (e.g. a joint that only has a y-column) are
+    NaN in the array and are not written back by array_to_tracking_df.
+    """
+    coord_cols = data.columns[data.columns.str.endswith((" x", " y"))]
+    joint_index = pd.Index(coord_cols.str[:-1].unique())
+    # store each joint's coordinate contiguously (like pandas stores its columns) so
+    # copying between data & coords doesn't have to transpose anything
+    # => coords are float32 if data is (reduced precision), else float64
+    coords_dtype = preserved_float_dtype(*data[coord_cols].dtypes)
+    coords = np.full(
+        (2, len(joint_index), len(data)), np.nan, dtype=coords_dtype
+    ).transpose(2, 1, 0)
+    for c, coord in enumerate(["x", "y"]):
+        cols = coord_cols[coord_cols.str.endswith(" " + coord)]
+        joint_idxs = joint_index.get_indexer(cols.str[:-1])
+        coords[:, joint_idxs, c] = data[cols].to_numpy(dtype=coords_dtype)
+    return coords, joint_index
+
+
+def array_to_tracking_df(data, coords, joint_index):
+    """Write a (frames, joints, coords) array back to the x & y columns of data"""
+    for c, coord in enumerate(["x", "y"]):
+        cols = joint_index + coord
+        cols_in_data = cols.isin(data.columns)
+        # => .loc writes into existing columns & doesn't fragment data (unlike [])
+        data.loc[:, cols[cols_in_data]] = coords[:, cols_in_data, c]
+    return data
+
+
+def move_data_to_results_dir(tracking_software, info, folderinfo):
+    """Replace a previous run's results_dir with one that has this run's files
+
+    Note
+    ----
+    Parameter sweeps call this for each variant & read_tracking_data only if they
+    cannot reuse the data of an earlier variant, so that each variant's results_dir
+    has the files of a normal run.
+    """
+    # unpack
+    # IMPORTANT
+    # ---------
+    # file_type_string handles all places (like move_data_to_folders) where it makes a
+    # difference if we are processing DLC or SLEAP files
+    if tracking_software == "DLC":
+        file_type_string = ".csv"
+    elif tracking_software == "SLEAP":
+        file_type_string = ".h5"
+    name = info["name"]
+    results_dir = info["results_dir"]
+
+    # .............................  move data  ........................................
+    # => slightly different for DLC or SLEAP (see local functions below)
+    # => see if we can delete a previous runs results folder if existant. if not, it's a
+    #    bit ugly since we only update results if filenames match...
+    # => for example if angle acceleration not wanted in current run, but was stored in
+    #    previous run, the previous run's figure is in the folder
+    # => inform the user and leave this as is
+    if os.path.exists(results_dir):
+        try:
+            shutil.rmtree(results_dir)
+            move_data_to_folders(tracking_software, file_type_string, info, folderinfo)
+        except OSError:
+            move_data_to_folders(tracking_software, file_type_string, info, folderinfo)
+            unable_to_rm_resdir_error = (
+                "\n***********\n! WARNING !\n***********\n"
+                + "Unable to remove previous Results subfolder of ID: "
+                + name
+                + "!\n Results will only be updated if filenames match!"
             )
-            if found_it:  # if our search was successful, stop searching and continue
-                break
+            print(unable_to_rm_resdir_error)
+            write_issues_to_textfile(unable_to_rm_resdir_error, info)
+    else:
+        move_data_to_folders(tracking_software, file_type_string, info, folderinfo)
 
+    # ..........................  initialise Issues.txt  ...............................
+    # Issues.txt (& issues.jsonl & timings.json) - delete if saved in a previous run
+    # => timings.json would otherwise be reported as this run's if it failed early
+    for previous_filename in [
+        ISSUES_TXT_FILENAME,
+        ISSUES_JSONL_FILENAME,
+        TIMINGS_JSON_FILENAME,
+    ]:
+        previous_file_path = os.path.join(results_dir, previous_filename)
+        if os.path.exists(previous_file_path):
+            os.remove(previous_file_path)
 
-def check_this_filename_configuration(
-    tracking_software,
-    file_type_string,
-    info,
-    folderinfo,
-    postmouse_string,
-    postrun_string,
-    results_dir,
-):
+
+def move_data_to_folders(tracking_software, file_type_string, info, folderinfo):
+    """Find files, copy data, video, beamdata & beamvideo to new results_dir"""
     # unpack
     name = info["name"]
-    mouse_num = info["mouse_num"]
-    run_num = info["run_num"]
+    results_dir = info["results_dir"]
     root_dir = folderinfo["root_dir"]
+    if "data_dir" in info.keys():  # per-animal files (see fan_out_multi_animal...)
+        root_dir = info["data_dir"]
     data_string = folderinfo["data_string"]
     beam_string = folderinfo["beam_string"]
-    premouse_string = folderinfo["premouse_string"]
-    prerun_string = folderinfo["prerun_string"]
     whichvideo = ""  # initialise
-    found_it = False
+    os.makedirs(results_dir)  # important to do this outside of loop!
     # handle leading zeros that we identified previously - if none convert nums to str
     if "leading_mouse_num_zeros" in info.keys():
-        mouse_num = info["leading_mouse_num_zeros"] + str(mouse_num)
+        mouse_num = info["leading_mouse_num_zeros"] + str(info["mouse_num"])
     else:
-        mouse_num = str(mouse_num)
+        mouse_num = str(info["mouse_num"])
     if "leading_run_num_zeros" in info.keys():
-        run_num = info["leading_run_num_zeros"] + str(run_num)
+        run_num = info["leading_run_num_zeros"] + str(info["run_num"])
     else:
-        run_num = str(run_num)
-    for filename in os.listdir(root_dir):
-        # the following condition is True for data & beam csv
-        if (
-            (premouse_string + mouse_num + postmouse_string in filename)
-            and (prerun_string + run_num + postrun_string in filename)
-            and (filename.endswith(file_type_string))
-        ):
-            found_it = True
-            # Copy the csv/h5 file to the new subfolder
-            shutil.copy2(
-                os.path.join(root_dir, filename), os.path.join(results_dir, filename)
-            )
-            # Check if there is a video and if so copy it too (only for DLC atm)
-            if tracking_software == "DLC":
-                vidname = filename[:-4] + "_labeled.mp4"
-                vidpath = os.path.join(root_dir, vidname)
-                if os.path.exists(vidpath):
-                    shutil.copy2(vidpath, os.path.join(results_dir, vidname))
-                else:
-                    if data_string in vidname:
-                        whichvideo = "Data"
-                    elif beam_string in vidname:
-                        whichvideo = "Beam"
-                    this_message = (
-                        "\n***********\n! WARNING !\n***********\n"
-                        + "No "
-                        + whichvideo
-                        + "video for "
-                        + name
-                        + "!"
-                    )
-                    print(this_message)
-                    write_issues_to_textfile(this_message, info)
-    return found_it
+        run_num = str(info["run_num"])
+    # the files we find are data & beam csv/h5
+    filenames, _ = find_run_filenames(
+        file_type_string, root_dir, mouse_num, run_num, folderinfo
+    )
+    for filename in filenames:
+        # Copy the csv/h5 file to the new subfolder
+        shutil.copy2(
+            os.path.join(root_dir, filename), os.path.join(results_dir, filename)
+        )
+        # Check if there is a video and if so copy it too (only for DLC atm)
+        # => not for per-animal files since their videos show all animals
+        if (tracking_software == "DLC") & ("data_dir" not in info.keys()):
+            vidname = filename[:-4] + "_labeled.mp4"
+            vidpath = os.path.join(root_dir, vidname)
+            if os.path.exists(vidpath):
+                shutil.copy2(vidpath, os.path.join(results_dir, vidname))
+            else:
+                if data_string in vidname:
+                    whichvideo = "Data"
+                elif beam_string in vidname:
+                    whichvideo = "Beam"
+                this_message = (
+                    "\n***********\n! WARNING !\n***********\n"
+                    + "No "
+                    + whichvideo
+                    + "video for "
+                    + name
+                    + "!"
+                )
+                print(this_message)
+                write_issues_to_textfile(this_message, info)
 
 
 def check_gait_direction(
-    tracking_software, data, direction_joint, flip_gait_direction, info
+    tracking_software,
+    data,
+    direction_joint,
+    flip_gait_direction,
+    info,
+    direction_data=None,
+    global_x_max=None,
 ):
     """Check direction of gait - reverse it if needed
 
@@ -471,6 +1062,11 @@ def check_gait_direction(
     ------------
     Also using this check to check for DLC files being broken
     flip_gait_direction is only used after the check for DLC files being broken
+
+    Note for windowed loading
+    -------------------------
+    data only has some frames, so direction is checked on direction_data (all frames of
+    direction_joint) & global_x_max (of all frames) is used for flipping
     """
 
     # AN IMPORTANT NOTE
@@ -483,72 +1079,62 @@ def check_gait_direction(
 
     # INITIALISE FLIPPED COLUMN
     data["Flipped"] = False
+    if direction_data is None:
+        direction_data = data
 
     # DLC APPROACH
     if tracking_software == "DLC":
-        enterframe = 0
-        idx = 0
+        # first find out when mouse entered & left the video frame, i.e. the first &
+        # last windows of DIRECTION_DLC_WINDOW frames with a mean likelihood above our
+        # threshold (the window is used to increase confidence)
+        # => means of all windows are computed at once & searched as an array
+        # => enterframe is the frame after the first window, leaveframe is the start of
+        #    the last window (note that neither the very first nor the very last window
+        #    can be the last window, since the mouse would never have been visible)
+        window_means = rolling_window_means(
+            direction_data[direction_joint + "likelihood"].to_numpy(dtype=float),
+            DIRECTION_DLC_WINDOW,
+        )
+        confident_windows = np.flatnonzero(window_means > DIRECTION_DLC_THRESHOLD)
+        leave_windows = confident_windows[
+            (confident_windows > 0) & (confident_windows < len(window_means) - 1)
+        ]
         flip_error_message = ""
-        while enterframe == 0:  # first find out when mouse was in the video frame.
-            if (
-                np.mean(data[direction_joint + "likelihood"][idx : idx + 5])
-                > DIRECTION_DLC_THRESHOLD
-            ):  # +5 to increase conf.
-                enterframe = idx + 5
-            idx += 1
-            if (idx > len(data)) | (enterframe > len(data)):
-                flip_error_message += (
-                    "\n******************\n! CRITICAL ERROR !\n******************\n"
-                    + "Unable to determine gait direction!"
-                    + "\nThis hints a critical issue with DLC tracking, e.g., likelihood "
-                    + "\ncolumns being low everywhere or tables being suspiciously short!"
-                    + "\nTo be sure, we cancel everything here."
-                    + "\nPlease check your input DLC csv files for correctness & try again!"
-                )
-                break
-        leaveframe = 0
-        idx = 1
-        while leaveframe == 0:  # see where mouse left frame (same logic from back)
-            if (
-                np.mean(data[direction_joint + "likelihood"][-idx - 5 : -idx])
-                > DIRECTION_DLC_THRESHOLD
-            ):
-                leaveframe = len(data) - idx - 5
-            idx += 1
-            if idx > len(data):
-                if not flip_error_message:
-                    flip_error_message += (
-                        "\n******************\n! CRITICAL ERROR !\n******************\n"
-                        + "Unable to determine gait direction!"
-                        + "\nThis hints a critical issue with DLC tracking, e.g., "
-                        + "likelihood \ncolumns being low everywhere or tables being "
-                        + "suspiciously short!\nTo be sure, we cancel everything here."
-                        + "\nPlease check your input DLC csv files for correctness & try "
-                        + "again!"
-                    )
-                break
+        if (len(confident_windows) == 0) | (len(leave_windows) == 0):
+            flip_error_message += (
+                "\n******************\n! CRITICAL ERROR !\n******************\n"
+                + "Unable to determine gait direction!"
+                + "\nThis hints a critical issue with DLC tracking, e.g., likelihood "
+                + "\ncolumns being low everywhere or tables being suspiciously short!"
+                + "\nTo be sure, we cancel everything here."
+                + "\nPlease check your input DLC csv files for correctness & try again!"
+            )
+        else:
+            enterframe = confident_windows[0] + DIRECTION_DLC_WINDOW
+            leaveframe = leave_windows[-1]
         if flip_error_message:
             write_issues_to_textfile(flip_error_message, info)
             print(flip_error_message)
             return
         if (
-            data[direction_joint + "x"][enterframe]
-            > data[direction_joint + "x"][leaveframe]
+            direction_data[direction_joint + "x"][enterframe]
+            > direction_data[direction_joint + "x"][leaveframe]
         ):  # i.e.: right to left
             # simulate that mouse ran from left to right (only if user wants it)
             if flip_gait_direction:
-                data = flip_mouse_body(data, info)
+                data = flip_mouse_body(data, info, global_x_max)
                 data["Flipped"] = True
 
     # SLEAP APPROACH
     elif tracking_software == "SLEAP":
         # beloow if condition means that the mouse ran from right to left
         # => in this case we flip
-        if np.median(data[direction_joint + "x"][: len(data) // 2]) > np.median(
-            data[direction_joint + "x"][len(data) // 2 :]
+        half_length = len(direction_data) // 2
+        if np.median(direction_data[direction_joint + "x"][:half_length]) > np.median(
+            direction_data[direction_joint + "x"][half_length:]
         ):
             if flip_gait_direction:
-                data = flip_mouse_body(data, info)
+                data = flip_mouse_body(data, info, global_x_max)
                 data["Flipped"] = True
 
     # RETURN DATA
@@ -567,6 +1153,8 @@ def check_and_expand_cfg(data, cfg, info):
     Make sure to set dont_show_plots to True if Python is not in interactive mode
     If users subtract a beam, set normalise @ sc level to False
     String-checks for standardisation joints
+    String-check for the (optional) SC detection joint
+    Check the figure export profile
     """
 
     # run the tests first
@@ -672,6 +1260,28 @@ def check_and_expand_cfg(data, cfg, info):
         print(no_standardisation_joint_message)
         return
 
+    # test the (optional) joint of automatic SC detection - default: direction_joint
+    if "detect_stepcycles" in cfg.keys() and cfg["detect_stepcycles"]:
+        if "sc_detection_joint" in cfg.keys() and cfg["sc_detection_joint"]:
+            cfg["sc_detection_joint"] = check_and_fix_cfg_strings(
+                data, cfg, "sc_detection_joint", info
+            )
+        else:
+            cfg["sc_detection_joint"] = [cfg["direction_joint"]]
+        if not cfg["sc_detection_joint"]:
+            no_sc_detection_joint_message = (
+                "\n******************\n! CRITICAL ERROR !\n******************\n"
+                + "After testing your SC detection joint, no valid joint was left to "
+                + "detect SCs with.\n Cancelling AutoGaitA - please try again!"
+            )
+            write_issues_to_textfile(no_sc_detection_joint_message, info)
+            print(no_sc_detection_joint_message)
+            return
+
+    # test the (optional) figure export profile
+    if check_export_profile(cfg, info):
+        return
+
     return cfg
 
 
@@ -682,8 +1292,8 @@ def check_and_fix_cfg_strings(data, cfg, cfg_key, info):
        => Important note: strings should never have the coordinate in them (since we do
           string + "y" for example throughout this code)
     3) All strings are valid columns of the DLC dataset
-       => Note that x_standardisation_joint is tested against ending with "x" - rest
-          against "y"
+       => Note that x_standardisation_joint & sc_detection_joint are tested against
+          ending with "x" - rest against "y"
     """
 
     # work on this variable (we return to cfg[key] outside of here)
@@ -696,7 +1306,7 @@ def check_and_fix_cfg_strings(data, cfg, cfg_key, info):
         clean_string_list = []
         invalid_strings_message = ""
         for string in string_variable:
-            if cfg_key == "x_standardisation_joint":
+            if cfg_key in ["x_standardisation_joint", "sc_detection_joint"]:
                 if string + "x" in data.columns:
                     clean_string_list.append(string)
                 else:
@@ -811,7 +1421,7 @@ def check_and_fix_cfg_strings(data, cfg, cfg_key, info):
     return string_variable
 
 
-def flip_mouse_body(data, info):
+def flip_mouse_body(data, info, global_x_max=None):
     """If the mouse ran through the video frame from right to left simulate
     that it ran from left to right. For this just subtract all x-values of
     all x-columns from their respective maxima.
@@ -819,6 +1429,7 @@ def flip_mouse_body(data, info):
     ==> This preserves y-information too
     ==> All analyses & plots are therefore comparable to mice that did really
         run from left to right
+    ==> global_x_max is provided by windowed loading (data only has some frames)
     """
 
     # 0) Tell the user that we are flipping their mouse
@@ -831,8 +1442,8 @@ def flip_mouse_body(data, info):
 
     # 1) Flip all rows in x columns only and subtract max from all vals
     flipped_data = data.copy()
-    x_cols = [col for col in flipped_data.columns if col.endswith(" x")]
-    global_x_max = flipped_data[x_cols].max().max()
-    for col in x_cols:
-        flipped_data[col] = global_x_max - flipped_data[col]
+    x_cols = flipped_data.columns[flipped_data.columns.str.endswith(" x")]
+    if global_x_max is None:
+        global_x_max = flipped_data[x_cols].max().max()
+    flipped_data.loc[:, x_cols] = global_x_max - flipped_data[x_cols]
     return flipped_data
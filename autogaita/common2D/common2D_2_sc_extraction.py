@@ -19,108 +19,81 @@ from autogaita.common2D.common2D_constants import (
     SCXLS_RUNCOLS,
     SCXLS_SCCOLS,
     SWINGSTART_COL,
+    SWINGEND_COL,
     STANCEEND_COL,
+    DETECTED_SCTABLE_FILENAME,
+    SC_DETECTION_SMOOTHING_WINDOW,
+    SC_DETECTION_NOISE_MADS,
+    SC_DETECTION_PEAK_FRACTION,
+    SC_DETECTION_MIN_SWING_FRAMES,
+    SC_DETECTION_MAX_CYCLE_RATIO,
+    CYCLE_VALIDATION_FILENAME,
+    CYCLE_VALIDATION_COLS,
 )
 
 # %% workflow step #2 - SC extraction (reading user-provided SC Table)
 
 
-def extract_stepcycles(tracking_software, data, info, folderinfo, cfg):
-    """Read XLS file with SC annotations, find correct row & return all_cycles"""
+def extract_stepcycles(
+    tracking_software,
+    data,
+    info,
+    folderinfo,
+    cfg,
+    cycle_log=None,
+    annotation_table=None,
+    detected_swing_ends=None,
+):
+    """Read XLS file with SC annotations, find correct row & return all_cycles
+
+    Note
+    ----
+    If a cycle_log list is given (dry runs), kept & excluded SCs are added to it (see
+    write_cycle_validation)
+    Parameter sweeps pass the annotation_table (see load_annotation_table) so it is
+    only read once & a detected_swing_ends dict that is updated with the swing ends of
+    detected SCs, so that variants reusing these SCs can export their table too
+    """
 
     # ...............................  preparation  ....................................
     # unpack
     mouse_num = info["mouse_num"]
     run_num = info["run_num"]
-    root_dir = folderinfo["root_dir"]
-    sctable_filename = folderinfo["sctable_filename"]
     sampling_rate = cfg["sampling_rate"]
     sc_times_in_frames = cfg["sc_times_in_frames"]
 
-    # load the table - try some filename & ending options
-    if os.path.exists(os.path.join(root_dir, sctable_filename)):
-        SCdf_full_filename = os.path.join(root_dir, sctable_filename)
-    elif os.path.exists(os.path.join(root_dir, sctable_filename) + ".xlsx"):
-        SCdf_full_filename = os.path.join(root_dir, sctable_filename) + ".xlsx"
-    elif os.path.exists(os.path.join(root_dir, sctable_filename) + ".xls"):
-        SCdf_full_filename = os.path.join(root_dir, sctable_filename) + ".xls"
-    else:
-        no_sc_table_message = (
-            "No Annotation Table found! sctable_filename has to be @ root_dir"
+    # automatic SC detection (optional) - replaces the annotation table
+    # => detected SCs are validated like annotated ones & exported as a table
+    if "detect_stepcycles" in cfg.keys() and cfg["detect_stepcycles"]:
+        all_cycles, swing_ends = detect_stepcycles(data, cfg)
+        if not all_cycles:
+            handle_issues("no_detected_scs", info)
+            return
+        all_cycles = clean_all_cycles(
+            tracking_software, all_cycles, data, info, cfg, cycle_log
         )
-        raise FileNotFoundError(no_sc_table_message)
-        # check if we need to specify engine (required for xlsx)
-    try:
-        SCdf = pd.read_excel(SCdf_full_filename)
-    except:
-        SCdf = pd.read_excel(SCdf_full_filename, engine="openpyxl")
-
-    # coerce all SC latency cols to numeric (in case Excel cols were text-type)
-    for col in SCdf.columns:
-        if SWINGSTART_COL in col or STANCEEND_COL in col:
-            SCdf[col] = SCdf[col].apply(coerce_to_float)
+        if all_cycles:
+            export_detected_annotation_table(all_cycles, swing_ends, info, cfg)
+            if detected_swing_ends is not None:
+                detected_swing_ends.update(swing_ends)
+        return all_cycles
 
-    # see if table columns are labelled correctly (try a couple to allow user typos)
-    valid_col_flags = [False, False, False]
-    header_columns = ["", "", ""]
-    for h, header in enumerate([SCXLS_MOUSECOLS, SCXLS_RUNCOLS, SCXLS_SCCOLS]):
-        for header_col in header:
-            if header_col in SCdf.columns:
-                valid_col_flags[h] = True
-                header_columns[h] = header_col
-                break
-    if not all(valid_col_flags):
-        handle_issues("wrong_scxls_colnames", info)
-        return
-    # find our info columns & rows
-    mouse_col = SCdf.columns.get_loc(header_columns[0])  # INDEXING! (see list above)
-    run_col = SCdf.columns.get_loc(header_columns[1])
-    sc_col = SCdf.columns.get_loc(header_columns[2])
-    # mouse_row will always be start of this mouse's runs
-    mouse_row = SCdf.index[SCdf[header_columns[0]] == mouse_num]
-    # this mouse was not included in sc xls
-    if len(mouse_row) == 0:
-        handle_issues("no_mouse", info)
-        return
-    # this mouse was included more than once
-    if len(mouse_row) > 1:
-        handle_issues("double_mouse", info)
+    # load the table & find this run's row (see local functions below)
+    if annotation_table is None:
+        SCdf = load_annotation_table(folderinfo)
+    else:
+        SCdf = annotation_table
+    header_columns, info_row, issue = find_annotation_table_row(
+        SCdf, mouse_num, run_num
+    )
+    if issue:
+        handle_issues(issue, info)
         return
-
-    next_mouse_idx = mouse_row  # search idx of first row of next mouse
+    sc_col = SCdf.columns.get_loc(header_columns[2])  # INDEXING!
 
     # ..............................  main xls read  ...................................
-    # if while is False, we arrived at the next mouse/end & dont update next_mouse_idx
-    # 3 conditions (continue if true):
-    # 1) First row of this mouse
-    # 2) None means a different run of this mouse or an empty row
-    # 3) Last line of SC Table
-    # ==> Important that there are parentheses around mouse & runs cond!!!
-    while (
-        (SCdf.iloc[next_mouse_idx, mouse_col].values[0] == mouse_num)
-        | (pd.isna(SCdf.iloc[next_mouse_idx, mouse_col].values[0]))
-    ) & (next_mouse_idx[0] != len(SCdf) - 1):
-        next_mouse_idx += 1  # this becomes first idx of next mouse's runs
-    # slicing is exclusive, so indexing the first row of next mouse means we
-    # include (!) the last row of correct mouse
-    if next_mouse_idx[0] != (len(SCdf) - 1):
-        mouse_runs = SCdf.iloc[int(mouse_row[0]) : int(next_mouse_idx[0]), run_col]
-    else:
-        # SPECIAL CASE: the last row of SCdf is a mouse with only one run!!!
-        # ==> E.g.: SCdf's last idx is 25.
-        #     SCdf.iloc[25:25, run_col] == Empty Series (slicing exclusive)
-        # NOTE THAT: if this mouse should have two runs, e.g. 24 & 25:
-        #     SCdf.iloc[24:25, run_col] == Correct series because 25 is treated
-        #     as SCdf.iloc[24:, run_col]
-        # TO BE SURE: if our while loop broke out bc. we arrived at SCdf's end,
-        #     just index with a colon iloc[mouse_row:]
-        mouse_runs = SCdf.iloc[int(mouse_row[0]) :, run_col]
-    if run_num not in mouse_runs.values:
-        handle_issues("no_scs", info)
-        return  # return None and stop everything
     # find out the total number of scs & see if it matches user-provided values
     # => also exclude run if no scs found
-    info_row = mouse_runs[mouse_runs == run_num].index  # where is this run
     sc_num = 0
     for column in SCdf.columns:
         if STANCEEND_COL in column:
@@ -212,6 +185,9 @@ def extract_stepcycles(tracking_software, data, info, folderinfo, cfg):
         if (all_cycles[s][0] in data.index) & (all_cycles[s][1] in data.index):
             pass
         else:
+            log_excluded_cycles(
+                [all_cycles[s]], None, "not in data/video range", info, cycle_log
+            )
             all_cycles[s] = [None, None]  # so they can be cleaned later
             this_message = (
                 "\n***********\n! WARNING !\n***********\n"
@@ -222,6 +198,17 @@ def extract_stepcycles(tracking_software, data, info, folderinfo, cfg):
             write_issues_to_textfile(this_message, info)
 
     # ............................  clean all_cycles  ..................................
+    return clean_all_cycles(tracking_software, all_cycles, data, info, cfg, cycle_log)
+
+
+def clean_all_cycles(tracking_software, all_cycles, data, info, cfg, cycle_log=None):
+    """Validate SCs (annotated or detected) & return the clean ones - or None
+
+    Note
+    ----
+    SCs that our checks exclude are logged to cycle_log (if given) with the reason of
+    their exclusion - the remaining ones as kept
+    """
     # check if we skipped latencies because they were out of data-bounds
     all_cycles = check_cycle_out_of_bounds(all_cycles)
     if not all_cycles:  # returns None if no clean cycles found
@@ -229,20 +216,297 @@ def extract_stepcycles(tracking_software, data, info, folderinfo, cfg):
     # check if there are any duplicates (e.g., SC2's start-lat == SC1's end-lat)
     all_cycles = check_cycle_duplicates(all_cycles)  # doesnt return None!
     # check if user input progressively later latencies
-    all_cycles = check_cycle_order(all_cycles, info)
+    checked_cycles = check_cycle_order(all_cycles, info)
+    log_excluded_cycles(all_cycles, checked_cycles, "latency order", info, cycle_log)
+    all_cycles = checked_cycles
     if not all_cycles:  # returns empty list if no clean cycles found
         return None
     # check that joints used in angle computations have different coords at all tps
-    all_cycles = check_differing_angle_joint_coords(all_cycles, data, info, cfg)
+    checked_cycles = check_differing_angle_joint_coords(all_cycles, data, info, cfg)
+    log_excluded_cycles(
+        all_cycles, checked_cycles, "equal angle joint coordinates", info, cycle_log
+    )
+    all_cycles = checked_cycles
     if not all_cycles:
         return None
     # check if tracking broke for any SCs using user-provided x and y thresholds
-    all_cycles = check_tracking_xy_thresholds(all_cycles, data, info, cfg)
+    checked_cycles = check_tracking_xy_thresholds(all_cycles, data, info, cfg)
+    log_excluded_cycles(all_cycles, checked_cycles, "x/y threshold", info, cycle_log)
+    all_cycles = checked_cycles
     if not all_cycles:
         return None
     # for SLEAP - check if there were any NaNs in any joints/angle-joints in SCs
     if tracking_software == "SLEAP":
-        all_cycles = check_tracking_SLEAP_nans(all_cycles, data, info, cfg)
+        checked_cycles = check_tracking_SLEAP_nans(all_cycles, data, info, cfg)
+        log_excluded_cycles(all_cycles, checked_cycles, "NaNs", info, cycle_log)
+        all_cycles = checked_cycles
         if not all_cycles:
             return None
+    if cycle_log is not None:
+        for cycle in all_cycles:
+            cycle_log.append([info["name"], cycle[0], cycle[1], "kept", ""])
     return all_cycles
+
+
+# .................................  dry runs  .......................................
+
+
+def log_excluded_cycles(all_cycles, checked_cycles, reason, info, cycle_log):
+    """Add SCs of all_cycles that a check excluded to cycle_log (if we keep one)"""
+    if cycle_log is None:
+        return
+    for cycle in all_cycles:
+        if (checked_cycles is None) or (cycle not in checked_cycles):
+            cycle_log.append([info["name"], cycle[0], cycle[1], "excluded", reason])
+
+
+def write_cycle_validation(cycle_log, info):
+    """Write the kept & excluded SCs of a dry run to a csv file & return them"""
+    cycle_validation = pd.DataFrame(cycle_log, columns=CYCLE_VALIDATION_COLS)
+    cycle_validation = cycle_validation.sort_values(
+        CYCLE_VALIDATION_COLS[1], kind="stable"
+    )
+    cycle_validation.to_csv(
+        os.path.join(
+            info["results_dir"],
+            info["name"] + " - " + CYCLE_VALIDATION_FILENAME + ".csv",
+        ),
+        index=False,
+    )
+    return cycle_validation
+
+
+# ..........................  automatic SC detection  .................................
+
+
+def detect_stepcycles(data, cfg):
+    """Detect SCs from the x-speed of a (paw/foot) joint
+
+    Note
+    ----
+    A swing is a run of frames in which the joint's smoothed x-speed exceeds its median
+    by SC_DETECTION_NOISE_MADS median absolute deviations (i.e., is not just tracking
+    noise of a standing joint). Swings that are too short or whose peak speed is small
+    compared to the median swing's are skipped.
+    Each SC spans from one swing's onset to the frame before the next swing's onset,
+    unless it is much longer than the median SC (i.e., the animal paused).
+    Returns all_cycles (like the annotation table would) & a dict of each SC's swing
+    end (keys are SC end latencies, which are not changed by clean_all_cycles) - or
+    None, None if there were less than two swings.
+    """
+    # unpack
+    sc_detection_joint = cfg["sc_detection_joint"][0]
+    # smoothed x-speed (in pixels/mm per frame - thresholds are relative anyway)
+    speed = (
+        data[sc_detection_joint + "x"]
+        .diff()
+        .abs()
+        .rolling(SC_DETECTION_SMOOTHING_WINDOW, center=True, min_periods=1)
+        .mean()
+        .to_numpy()
+    )
+    speed = np.nan_to_num(speed)  # untracked frames (SLEAP NaNs) count as standing
+    median_speed = np.median(speed)
+    swing_threshold = median_speed + SC_DETECTION_NOISE_MADS * np.median(
+        np.abs(speed - median_speed)
+    )
+    # threshold crossings: +1 at swing onsets, -1 at the frame after swing ends
+    crossings = np.diff((speed > swing_threshold).astype(np.int8), prepend=0, append=0)
+    onsets = np.flatnonzero(crossings == 1)
+    offsets = np.flatnonzero(crossings == -1)
+    if len(onsets) < 2:
+        return None, None
+    # peak speed of each swing (offsets can be len(speed), thus pad with a 0)
+    peaks = np.maximum.reduceat(
+        np.append(speed, 0), np.column_stack([onsets, offsets]).ravel()
+    )[::2]
+    valid_swings = (offsets - onsets >= SC_DETECTION_MIN_SWING_FRAMES) & (
+        peaks >= SC_DETECTION_PEAK_FRACTION * np.median(peaks)
+    )
+    onsets = onsets[valid_swings]
+    offsets = offsets[valid_swings]
+    if len(onsets) < 2:
+        return None, None
+    # SCs from swing onset to the frame before the next onset (indexing data!)
+    starts = onsets[:-1]
+    ends = onsets[1:] - 1
+    durations = ends - starts
+    no_pause = durations <= SC_DETECTION_MAX_CYCLE_RATIO * np.median(durations)
+    frames = data.index.to_numpy()
+    all_cycles = [
+        [int(frames[start]), int(frames[end])]
+        for start, end in zip(starts[no_pause], ends[no_pause])
+    ]
+    swing_ends = {
+        int(frames[end]): int(frames[offset - 1])
+        for end, offset in zip(ends[no_pause], offsets[:-1][no_pause])
+    }
+    return all_cycles, swing_ends
+
+
+def export_detected_annotation_table(all_cycles, swing_ends, info, cfg):
+    """Export detected SCs as an annotation table (the format of our template)
+
+    Note
+    ----
+    Latencies are in seconds or frames as cfg["sc_times_in_frames"] says, so the table
+    can be reviewed & used as the annotation table of future runs.
+    """
+    # unpack
+    sampling_rate = cfg["sampling_rate"]
+    sc_times_in_frames = cfg["sc_times_in_frames"]
+    row = [info["mouse_num"], info["run_num"], len(all_cycles)]
+    columns = [SCXLS_MOUSECOLS[0], SCXLS_RUNCOLS[0], SCXLS_SCCOLS[0]]
+    for cycle in all_cycles:
+        latencies = [cycle[0], swing_ends[cycle[1]], cycle[1]]
+        if not sc_times_in_frames:
+            latencies = [latency / sampling_rate for latency in latencies]
+        row.extend(latencies)
+        columns.extend([SWINGSTART_COL, SWINGEND_COL, STANCEEND_COL])
+    pd.DataFrame([row], columns=columns).to_excel(
+        os.path.join(
+            info["results_dir"],
+            info["name"] + " - " + DETECTED_SCTABLE_FILENAME + ".xlsx",
+        ),
+        index=False,
+    )
+
+
+# ..........................  annotation table helpers  ...............................
+
+
+def load_annotation_table(folderinfo):
+    """Load the annotation (SC) table - try some filename & ending options"""
+    # unpack
+    root_dir = folderinfo["root_dir"]
+    sctable_filename = folderinfo["sctable_filename"]
+    # load the table
+    if os.path.exists(os.path.join(root_dir, sctable_filename)):
+        SCdf_full_filename = os.path.join(root_dir, sctable_filename)
+    elif os.path.exists(os.path.join(root_dir, sctable_filename) + ".xlsx"):
+        SCdf_full_filename = os.path.join(root_dir, sctable_filename) + ".xlsx"
+    elif os.path.exists(os.path.join(root_dir, sctable_filename) + ".xls"):
+        SCdf_full_filename = os.path.join(root_dir, sctable_filename) + ".xls"
+    else:
+        no_sc_table_message = (
+            "No Annotation Table found! sctable_filename has to be @ root_dir"
+        )
+        raise FileNotFoundError(no_sc_table_message)
+        # check if we need to specify engine (required for xlsx)
+    try:
+        SCdf = pd.read_excel(SCdf_full_filename)
+    except:
+        SCdf = pd.read_excel(SCdf_full_filename, engine="openpyxl")
+    # coerce all SC latency cols to numeric (in case Excel cols were text-type)
+    for col in SCdf.columns:
+        if SWINGSTART_COL in col or STANCEEND_COL in col:
+            SCdf[col] = SCdf[col].apply(coerce_to_float)
+    return SCdf
+
+
+def find_annotation_table_row(SCdf, mouse_num, run_num):
+    """Find the row of this mouse's run in the annotation table
+
+    Note
+    ----
+    Returns the table's header columns (mouse, run & SC number), the run's row index &
+    an issue-key for handle_issues if the row could not be found (else None)
+    """
+    # see if table columns are labelled correctly (try a couple to allow user typos)
+    valid_col_flags = [False, False, False]
+    header_columns = ["", "", ""]
+    for h, header in enumerate([SCXLS_MOUSECOLS, SCXLS_RUNCOLS, SCXLS_SCCOLS]):
+        for header_col in header:
+            if header_col in SCdf.columns:
+                valid_col_flags[h] = True
+                header_columns[h] = header_col
+                break
+    if not all(valid_col_flags):
+        return header_columns, None, "wrong_scxls_colnames"
+    # find our info columns & rows
+    mouse_col = SCdf.columns.get_loc(header_columns[0])  # INDEXING! (see list above)
+    run_col = SCdf.columns.get_loc(header_columns[1])
+    # mouse_row will always be start of this mouse's runs
+    mouse_row = SCdf.index[SCdf[header_columns[0]] == mouse_num]
+    # this mouse was not included in sc xls
+    if len(mouse_row) == 0:
+        return header_columns, None, "no_mouse"
+    # this mouse was included more than once
+    if len(mouse_row) > 1:
+        return header_columns, None, "double_mouse"
+
+    next_mouse_idx = mouse_row  # search idx of first row of next mouse
+
+    # if while is False, we arrived at the next mouse/end & dont update next_mouse_idx
+    # 3 conditions (continue if true):
+    # 1) First row of this mouse
+    # 2) None means a different run of this mouse or an empty row
+    # 3) Last line of SC Table
+    # ==> Important that there are parentheses around mouse & runs cond!!!
+    while (
+        (SCdf.iloc[next_mouse_idx, mouse_col].values[0] == mouse_num)
+        | (pd.isna(SCdf.iloc[next_mouse_idx, mouse_col].values[0]))
+    ) & (next_mouse_idx[0] != len(SCdf) - 1):
+        next_mouse_idx += 1  # this becomes first idx of next mouse's runs
+    # slicing is exclusive, so indexing the first row of next mouse means we
+    # include (!) the last row of correct mouse
+    if next_mouse_idx[0] != (len(SCdf) - 1):
+        mouse_runs = SCdf.iloc[int(mouse_row[0]) : int(next_mouse_idx[0]), run_col]
+    else:
+        # SPECIAL CASE: the last row of SCdf is a mouse with only one run!!!
+        # ==> E.g.: SCdf's last idx is 25.
+        #     SCdf.iloc[25:25, run_col] == Empty Series (slicing exclusive)
+        # NOTE THAT: if this mouse should have two runs, e.g. 24 & 25:
+        #     SCdf.iloc[24:25, run_col] == Correct series because 25 is treated
+        #     as SCdf.iloc[24:, run_col]
+        # TO BE SURE: if our while loop broke out bc. we arrived at SCdf's end,
+        #     just index with a colon iloc[mouse_row:]
+        mouse_runs = SCdf.iloc[int(mouse_row[0]) :, run_col]
+    if run_num not in mouse_runs.values:
+        return header_columns, None, "no_scs"
+    info_row = mouse_runs[mouse_runs == run_num].index  # where is this run
+    return header_columns, info_row, None
+
+
+def read_annotated_frame_windows(info, folderinfo, cfg):
+    """Return the (start, end) frames of all SCs annotated for this run - or None
+
+    Note
+    ----
+    Used by windowed loading (see load_tracking_data) before any data is loaded, so
+    this does not report any issues - extract_stepcycles does that once it's loaded
+    Windows are only a guide to what needs to be loaded, invalid latencies are skipped
+    """
+    # unpack
+    sampling_rate = cfg["sampling_rate"]
+    sc_times_in_frames = cfg["sc_times_in_frames"]
+    try:
+        SCdf = load_annotation_table(folderinfo)
+    except FileNotFoundError:
+        return
+    _, info_row, issue = find_annotation_table_row(
+        SCdf, info["mouse_num"], info["run_num"]
+    )
+    if issue:
+        return
+    frame_windows = []
+    for start_col in [col for col in SCdf.columns if col.startswith(SWINGSTART_COL)]:
+        end_col = start_col.replace(SWINGSTART_COL, STANCEEND_COL)
+        if end_col not in SCdf.columns:
+            continue
+        latencies = [
+            SCdf.loc[info_row, start_col].values[0],
+            SCdf.loc[info_row, end_col].values[0],
+        ]
+        try:
+            if sc_times_in_frames:
+                frame_windows.append([int(latency) for latency in latencies])
+            else:
+                frame_windows.append(
+                    [int(round(latency * sampling_rate)) for latency in latencies]
+                )
+        except (ValueError, TypeError):  # e.g. NaNs of runs with fewer SCs
+            continue
+    if not frame_windows:
+        return
+    return frame_windows
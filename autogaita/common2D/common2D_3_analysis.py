@@ -2,7 +2,10 @@
 from autogaita.resources.utils import (
     bin_num_to_percentages,
     compute_angle,
+    add_gradient_features,
     normalise_one_steps_data,
+    preserved_float_dtype,
+    extract_float_dtype,
     write_angle_warning,
 )
 import os
@@ -85,14 +88,15 @@ def analyse_and_export_stepcycles(data, all_cycles, info, cfg):
             normalised_steps_data = normalise_one_steps_data(all_steps_data, bin_num)
         # some prep for addition of further steps
         sc_num = len(all_cycles)
-        nanvector = data_copy.loc[[1]]
+        # => iloc because windowed loading's data doesn't start at frame 0
+        nanvector = data_copy.iloc[[1]]
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
             nanvector[:] = np.nan
         # ..............................  step-loop  ...................................
         for s in range(1, sc_num, 1):
             # get step separators
-            numvector = data_copy.loc[[1]]
+            numvector = data_copy.iloc[[1]]
             # we are ignoring this because we wont work with the incompatible dtypes ourselves much anymore (just export as xlsx and plot) - so its fine
             # https://docs.python.org/3/library/warnings.html#temporarily-suppressing-warnings
             with warnings.catch_warnings():
@@ -188,21 +192,22 @@ def standardise_x_y_and_add_features_to_one_step(step, info, cfg):
         else:
             this_y_min = step_copy[y_cols].min().min()
         step_copy[y_cols] -= this_y_min
-    # if no x-standardisation, just add features & return non-(x-)normalised step
+    # add features - if no x-standardisation, just return non-(x-)normalised step
+    non_stand_step = add_features(step_copy, info, cfg)
     if cfg["standardise_x_coordinates"] is False:
-        non_stand_step = add_features(step_copy, info, cfg)
         return non_stand_step
-        # else standardise x (horizontal dimension) at step-cycle level too
+    # else standardise x (horizontal dimension) at step-cycle level too
+    # => features don't change if we subtract a constant from all x coordinates
+    #    (angles & x velocities/accelerations are based on differences) so we only
+    #    shift the x columns of the step we just added features to
     else:
-        non_stand_step = add_features(step_copy, info, cfg)
-        x_stand_step = step_copy.copy()
+        x_stand_step = non_stand_step.copy()
         x_cols = [col for col in x_stand_step.columns if col.endswith("x")]
         # note the [0] here is important because it's still a list of len=1!!
         min_x_standardisation_joint = x_stand_step[
             cfg["x_standardisation_joint"][0] + "x"
         ].min()
         x_stand_step[x_cols] -= min_x_standardisation_joint
-        x_stand_step = add_features(x_stand_step, info, cfg)
         return non_stand_step, x_stand_step
 
 
@@ -239,7 +244,8 @@ def add_angles(step, info, cfg):
         joint3[:, 0] = step[upper_joint + "x"]
         joint3[:, 1] = step[upper_joint + "y"]
         # initialise the angle vector and assign looping over timepoints
-        this_angle = np.zeros(len(joint_angle))
+        # => angles are computed in float64 & stored as float32 if reduced precision
+        this_angle = np.zeros(len(joint_angle), dtype=extract_float_dtype(cfg))
         broken_angle_idxs = []  # initialise broken idxs-list for each angle anew
         for t in range(len(joint_angle)):
             this_angle[t], broken = compute_angle(
@@ -260,16 +266,12 @@ def add_x_velocities(step, cfg):
     hind_joints = cfg["hind_joints"]
     x_acceleration = cfg["x_acceleration"]
 
-    for joint in hind_joints:
-        step[joint + "Velocity"] = 0.0
-        if x_acceleration:
-            step[joint + "Acceleration"] = 0.0
-    for joint in hind_joints:
-        step.loc[:, joint + "Velocity"] = np.gradient(step.loc[:, joint + "x"])
-        if x_acceleration:
-            step.loc[:, joint + "Acceleration"] = np.gradient(
-                step.loc[:, joint + "Velocity"]
-            )
+    step = add_gradient_features(
+        step,
+        [joint + "x" for joint in hind_joints],
+        [joint + "Velocity" for joint in hind_joints],
+        [joint + "Acceleration" if x_acceleration else None for joint in hind_joints],
+    )
     return step
 
 
@@ -279,16 +281,15 @@ def add_angular_velocities(step, cfg):
     angular_acceleration = cfg["angular_acceleration"]
 
     angle_cols = [c for c in step.columns if c.endswith("Angle")]
-    for angle in angle_cols:
-        step[angle + " Velocity"] = 0.0  # space is correct here
-        if angular_acceleration:
-            step[angle + " Acceleration"] = 0.0
-    for angle in angle_cols:
-        step.loc[:, angle + " Velocity"] = np.gradient(step.loc[:, angle])
-        if angular_acceleration:
-            step.loc[:, angle + " Acceleration"] = np.gradient(
-                step.loc[:, angle + " Velocity"]
-            )
+    step = add_gradient_features(
+        step,
+        angle_cols,
+        [angle + " Velocity" for angle in angle_cols],  # space is correct here
+        [
+            angle + " Acceleration" if angular_acceleration else None
+            for angle in angle_cols
+        ],
+    )
     return step
 
 
@@ -323,7 +324,10 @@ def compute_average_and_std_data(normalised_steps_data, bin_num, analyse_average
                 & (col != "Flipped")
             )
         if condition:
-            this_data = np.zeros([bin_num, sc_num])
+            this_data = np.zeros(
+                [bin_num, sc_num],
+                dtype=preserved_float_dtype(normalised_steps_data[col].dtype),
+            )
             for s in range(sc_num):
                 # with this_end it's bin_num & not bin_num -1 because iloc
                 # does not include last index
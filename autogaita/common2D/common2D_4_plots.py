@@ -1,9 +1,11 @@
 # %% imports
+from autogaita.resources.utils import save_figure_files, render_plot_jobs
 import os
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+from matplotlib.collections import LineCollection
 
 # %% constants
 from autogaita.resources.constants import TIME_COL
@@ -69,69 +71,58 @@ def plot_results(info, results, cfg, plot_panel_instance):
     sc_idxs = extract_sc_idxs(all_steps_data)
     cfg["sc_num"] = len(sc_idxs)  # add number of scs for plotting SE if wanted
 
+    # collect independent plot jobs - see render_plot_jobs
+    plot_jobs = []
+    step_args = (all_steps_data, sc_idxs, info)
+    average_args = (average_data, std_data, info)
+
     # .........................1 - y coords by x coords.................................
-    plot_joint_y_by_x(all_steps_data, sc_idxs, info, cfg, plot_panel_instance)
+    plot_jobs.append((plot_joint_y_by_x, step_args))
 
     # .....................2 - x coords by time (optional!).............................
     if analyse_average_x:
-        plot_x_by_time(all_steps_data, sc_idxs, info, cfg, plot_panel_instance)
+        plot_jobs.append((plot_x_by_time, step_args))
 
     # ...............................3 - angles by time.................................
     if angles["name"]:
-        plot_angles_by_time(all_steps_data, sc_idxs, info, cfg, plot_panel_instance)
-    # regularly closing figures to save memory
-    # => no problem to do this since we pass figure-vars to save-functions and PlotPanel
-    plt.close("all")
+        plot_jobs.append((plot_angles_by_time, step_args))
 
     # ..........................4 - hindlimb stick diagram..............................
-    plot_hindlimb_stickdiagram(all_steps_data, sc_idxs, info, cfg, plot_panel_instance)
+    plot_jobs.append((plot_hindlimb_stickdiagram, step_args))
 
     # ...........................5 - forelimb stick diagram.............................
     if fore_joints:
-        plot_forelimb_stickdiagram(
-            all_steps_data, sc_idxs, info, cfg, plot_panel_instance
-        )
+        plot_jobs.append((plot_forelimb_stickdiagram, step_args))
 
     # .....................6 - average joints' y over SC percentage.....................
-    plot_joint_y_by_average_SC(average_data, std_data, info, cfg, plot_panel_instance)
+    plot_jobs.append((plot_joint_y_by_average_SC, average_args))
 
     # ...............7 - average joints' x over SC percentage (optional!)...............
     if analyse_average_x:
-        plot_joint_x_by_average_SC(
-            average_data, std_data, info, cfg, plot_panel_instance
-        )
-    plt.close("all")
+        plot_jobs.append((plot_joint_x_by_average_SC, average_args))
 
     # ........................8 - average angles over SC percentage.....................
     if angles["name"]:
-        plot_angles_by_average_SC(
-            average_data, std_data, info, cfg, plot_panel_instance
-        )
+        plot_jobs.append((plot_angles_by_average_SC, average_args))
 
     # .................9 - average x velocities over SC percentage......................
-    plot_x_velocities_by_average_SC(
-        average_data, std_data, info, cfg, plot_panel_instance
-    )
+    plot_jobs.append((plot_x_velocities_by_average_SC, average_args))
 
     # .............10 - average angular velocities over SC percentage...................
     if angles["name"]:
-        plot_angular_velocities_by_average_SC(
-            average_data, std_data, info, cfg, plot_panel_instance
-        )
+        plot_jobs.append((plot_angular_velocities_by_average_SC, average_args))
 
     # ............optional - 11 - average x acceleration over SC percentage.............
     if x_acceleration:
-        plot_x_acceleration_by_average_SC(
-            average_data, std_data, info, cfg, plot_panel_instance
-        )
+        plot_jobs.append((plot_x_acceleration_by_average_SC, average_args))
 
     # .........optional - 12 - average angular acceleration over SC percentage..........
     if angles["name"]:
         if angular_acceleration:
-            plot_angular_acceleration_by_average_SC(
-                average_data, std_data, info, cfg, plot_panel_instance
-            )
-    plt.close("all")
+            plot_jobs.append((plot_angular_acceleration_by_average_SC, average_args))
+
+    # run jobs (in parallel if cfg["plot_workers"] > 1)
+    figure_paths = render_plot_jobs(plot_jobs, cfg, plot_panel_instance)
 
     # ........................optional - 13 - build plot panel..........................
     if dont_show_plots is True:
@@ -141,6 +132,8 @@ def plot_results(info, results, cfg, plot_panel_instance):
         plot_panel_instance.destroy_plot_panel_loading_screen()
         plot_panel_instance.build_plot_panel()
 
+    return figure_paths
+
 
 # ..................................  inner functions  .................................
 
@@ -241,13 +234,13 @@ def plot_joint_y_by_x(all_steps_data, sc_idxs, info, cfg, plot_panel_instance):
             ax[j].set_xlabel("x (pixels)")
             ax[j].set_ylabel("y (pixels)")
         figure_file_string = " - " + joint + "Y by X coordinates"
-        save_figures(f[j], results_dir, name, figure_file_string)
+        save_figures(f[j], results_dir, name, figure_file_string, cfg)
         if dont_show_plots:
             plt.close(f[j])
 
         # add figure to plot panel figures list
         if dont_show_plots is False:  # -> show plot panel
-            plot_panel_instance.figures.append(f[j])
+            plot_panel_instance.add_figure(f[j])
 
 
 def plot_x_by_time(all_steps_data, sc_idxs, info, cfg, plot_panel_instance):
@@ -301,13 +294,13 @@ def plot_x_by_time(all_steps_data, sc_idxs, info, cfg, plot_panel_instance):
         else:
             ax[j].set_ylabel("x (pixels)")
         figure_file_string = " - " + joint + "X coordinate by Time"
-        save_figures(f[j], results_dir, name, figure_file_string)
+        save_figures(f[j], results_dir, name, figure_file_string, cfg)
         if dont_show_plots:
             plt.close(f[j])
 
         # add figure to plot panel figures list
         if dont_show_plots is False:  # -> show plot panel
-            plot_panel_instance.figures.append(f[j])
+            plot_panel_instance.add_figure(f[j])
 
 
 def plot_angles_by_time(all_steps_data, sc_idxs, info, cfg, plot_panel_instance):
@@ -356,13 +349,13 @@ def plot_angles_by_time(all_steps_data, sc_idxs, info, cfg, plot_panel_instance)
         elif legend_outside is False:
             ax[a].legend(fontsize=SC_LAT_LEGEND_FONTSIZE)
         figure_file_string = " - " + angle + "Angle by Time"
-        save_figures(f[a], results_dir, name, figure_file_string)
+        save_figures(f[a], results_dir, name, figure_file_string, cfg)
         if dont_show_plots:
             plt.close(f[a])
 
         # add figure to plot panel figures list
         if dont_show_plots is False:  # -> show plot panel
-            plot_panel_instance.figures.append(f[a])
+            plot_panel_instance.add_figure(f[a])
 
 
 def plot_hindlimb_stickdiagram(all_steps_data, sc_idxs, info, cfg, plot_panel_instance):
@@ -386,24 +379,22 @@ def plot_hindlimb_stickdiagram(all_steps_data, sc_idxs, info, cfg, plot_panel_in
     time_col_idx = all_steps_data.columns.get_loc(TIME_COL)
 
     # plot
-    # => for timepoints from SC1 to SCend - plot(joint1x, joint1y)
+    # => each timepoint of an SC is one stick-segment (joint1xy to jointNxy) & each SC is
+    #    one LineCollection (i.e., one artist & legend entry per SC colour)
+    x_data, y_data = extract_stick_coordinates(all_steps_data, plot_joints)
     for s, this_color_dict in zip(range(sc_num), color_cycle):  # SC loop (colors)
         this_color = this_color_dict["color"][:3]
         this_label = generate_sc_latency_label(
             all_steps_data, sc_idxs[s], sampling_rate, time_col_idx
         )
-        for i in sc_idxs[s]:  # loop over timepoints of current SC
-            this_xs = list()  # for each timepoint, define joints' xy coord new
-            this_ys = list()
-            for joint in plot_joints:
-                x_col_idx = all_steps_data.columns.get_loc(joint + "x")
-                y_col_idx = all_steps_data.columns.get_loc(joint + "y")
-                this_xs.append(all_steps_data.iloc[i, x_col_idx])
-                this_ys.append(all_steps_data.iloc[i, y_col_idx])
-            if i == sc_idxs[s][0]:
-                ax.plot(this_xs, this_ys, color=this_color, label=this_label)
-            else:
-                ax.plot(this_xs, this_ys, color=this_color)
+        this_sc_idxs = np.asarray(sc_idxs[s])
+        these_sticks = np.stack(
+            (x_data[this_sc_idxs], y_data[this_sc_idxs]), axis=-1
+        )  # timepoints x joints x 2
+        ax.add_collection(
+            LineCollection(these_sticks, colors=[this_color], label=this_label)
+        )
+    ax.autoscale_view()
     ax.set_title(name + " - Primary Stick Diagram")
     # legend adjustments
     if legend_outside is True:
@@ -421,13 +412,13 @@ def plot_hindlimb_stickdiagram(all_steps_data, sc_idxs, info, cfg, plot_panel_in
         ax.set_xlabel("x (pixels)")
         ax.set_ylabel("y (pixels)")
     figure_file_string = " - Primary Stick Diagram"
-    save_figures(f, results_dir, name, figure_file_string)
+    save_figures(f, results_dir, name, figure_file_string, cfg)
     if dont_show_plots:
         plt.close(f)
 
     # add figure to plot panel figures list
     if dont_show_plots is False:  # -> show plot panel
-        plot_panel_instance.figures.append(f)
+        plot_panel_instance.add_figure(f)
 
 
 def plot_forelimb_stickdiagram(all_steps_data, sc_idxs, info, cfg, plot_panel_instance):
@@ -451,23 +442,22 @@ def plot_forelimb_stickdiagram(all_steps_data, sc_idxs, info, cfg, plot_panel_in
     time_col_idx = all_steps_data.columns.get_loc(TIME_COL)
 
     # plot
-    for s, this_color in zip(range(sc_num), color_cycle):  # SC loop (colors)
-        this_color = this_color["color"][:3]
+    # => each timepoint of an SC is one stick-segment (joint1xy to jointNxy) & each SC is
+    #    one LineCollection (i.e., one artist & legend entry per SC colour)
+    x_data, y_data = extract_stick_coordinates(all_steps_data, fore_joints)
+    for s, this_color_dict in zip(range(sc_num), color_cycle):  # SC loop (colors)
+        this_color = this_color_dict["color"][:3]
         this_label = generate_sc_latency_label(
             all_steps_data, sc_idxs[s], sampling_rate, time_col_idx
         )
-        for i in sc_idxs[s]:
-            this_xs = list()
-            this_ys = list()
-            for joint in fore_joints:
-                x_col_idx = all_steps_data.columns.get_loc(joint + "x")
-                y_col_idx = all_steps_data.columns.get_loc(joint + "y")
-                this_xs.append(all_steps_data.iloc[i, x_col_idx])
-                this_ys.append(all_steps_data.iloc[i, y_col_idx])
-            if i == sc_idxs[s][0]:
-                ax.plot(this_xs, this_ys, color=this_color, label=this_label)
-            else:
-                ax.plot(this_xs, this_ys, color=this_color)
+        this_sc_idxs = np.asarray(sc_idxs[s])
+        these_sticks = np.stack(
+            (x_data[this_sc_idxs], y_data[this_sc_idxs]), axis=-1
+        )  # timepoints x joints x 2
+        ax.add_collection(
+            LineCollection(these_sticks, colors=[this_color], label=this_label)
+        )
+    ax.autoscale_view()
     ax.set_title(name + " - Secondary Stick Diagram")
     if convert_to_mm:
         tickconvert_mm_to_cm(ax, "both")
@@ -487,13 +477,22 @@ def plot_forelimb_stickdiagram(all_steps_data, sc_idxs, info, cfg, plot_panel_in
         ax.set_xlabel("x (pixels)")
         ax.set_ylabel("y (pixels)")
     figure_file_string = " - Secondary Stick Diagram"
-    save_figures(f, results_dir, name, figure_file_string)
+    save_figures(f, results_dir, name, figure_file_string, cfg)
     if dont_show_plots:
         plt.close(f)
 
     # add figure to plot panel figures list
     if dont_show_plots is False:  # -> show plot panel
-        plot_panel_instance.figures.append(f)
+        plot_panel_instance.add_figure(f)
+
+
+def extract_stick_coordinates(all_steps_data, joints):
+    """Extract x & y coordinates of joints as timepoints x joints arrays"""
+    x_col_idxs = [all_steps_data.columns.get_loc(joint + "x") for joint in joints]
+    y_col_idxs = [all_steps_data.columns.get_loc(joint + "y") for joint in joints]
+    x_data = all_steps_data.iloc[:, x_col_idxs].to_numpy(dtype=float)
+    y_data = all_steps_data.iloc[:, y_col_idxs].to_numpy(dtype=float)
+    return x_data, y_data
 
 
 def plot_joint_y_by_average_SC(average_data, std_data, info, cfg, plot_panel_instance):
@@ -540,13 +539,13 @@ def plot_joint_y_by_average_SC(average_data, std_data, info, cfg, plot_panel_ins
     else:
         ax.set_ylabel("y (pixels)")
     figure_file_string = " - Joint Y-coord.s over average step cycle"
-    save_figures(f, results_dir, name, figure_file_string)
+    save_figures(f, results_dir, name, figure_file_string, cfg)
     if dont_show_plots:
         plt.close(f)
 
     # add figure to plot panel figures list
     if dont_show_plots is False:  # -> show plot panel
-        plot_panel_instance.figures.append(f)
+        plot_panel_instance.add_figure(f)
 
 
 def plot_joint_x_by_average_SC(average_data, std_data, info, cfg, plot_panel_instance):
@@ -593,13 +592,13 @@ def plot_joint_x_by_average_SC(average_data, std_data, info, cfg, plot_panel_ins
     else:
         ax.set_ylabel("x (pixels)")
     figure_file_string = " - Joint X-coord.s over average step cycle"
-    save_figures(f, results_dir, name, figure_file_string)
+    save_figures(f, results_dir, name, figure_file_string, cfg)
     if dont_show_plots:
         plt.close(f)
 
     # add figure to plot panel figures list
     if dont_show_plots is False:  # -> show plot panel
-        plot_panel_instance.figures.append(f)
+        plot_panel_instance.add_figure(f)
 
 
 def plot_angles_by_average_SC(average_data, std_data, info, cfg, plot_panel_instance):
@@ -640,13 +639,13 @@ def plot_angles_by_average_SC(average_data, std_data, info, cfg, plot_panel_inst
     elif legend_outside is False:
         ax.legend()
     figure_file_string = " - Joint angles over average step cycle"
-    save_figures(f, results_dir, name, figure_file_string)
+    save_figures(f, results_dir, name, figure_file_string, cfg)
     if dont_show_plots:
         plt.close(f)
 
     # add figure to plot panel figures list
     if dont_show_plots is False:  # -> show plot panel
-        plot_panel_instance.figures.append(f)
+        plot_panel_instance.add_figure(f)
 
 
 def plot_x_velocities_by_average_SC(
@@ -698,13 +697,13 @@ def plot_x_velocities_by_average_SC(
             "Velocity (x in cm / " + str(int((1 / sampling_rate) * 1000)) + "ms)"
         )
     figure_file_string = " - Joint velocities over average step cycle"
-    save_figures(f, results_dir, name, figure_file_string)
+    save_figures(f, results_dir, name, figure_file_string, cfg)
     if dont_show_plots:
         plt.close(f)
 
     # add figure to plot panel figures list
     if dont_show_plots is False:  # -> show plot panel
-        plot_panel_instance.figures.append(f)
+        plot_panel_instance.add_figure(f)
 
 
 def plot_angular_velocities_by_average_SC(
@@ -748,13 +747,13 @@ def plot_angular_velocities_by_average_SC(
     elif legend_outside is False:
         ax.legend()
     figure_file_string = " - Angular velocities over average step cycle"
-    save_figures(f, results_dir, name, figure_file_string)
+    save_figures(f, results_dir, name, figure_file_string, cfg)
     if dont_show_plots:
         plt.close(f)
 
     # add figure to plot panel figures list
     if dont_show_plots is False:  # -> show plot panel
-        plot_panel_instance.figures.append(f)
+        plot_panel_instance.add_figure(f)
 
 
 def plot_x_acceleration_by_average_SC(
@@ -806,13 +805,13 @@ def plot_x_acceleration_by_average_SC(
             "Acceleration (x in cm / " + str(int((1 / sampling_rate) * 1000)) + "ms)"
         )
     figure_file_string = " - Joint acceleration over average step cycle"
-    save_figures(f, results_dir, name, figure_file_string)
+    save_figures(f, results_dir, name, figure_file_string, cfg)
     if dont_show_plots:
         plt.close(f)
 
     # add figure to plot panel figures list
     if dont_show_plots is False:  # -> show plot panel
-        plot_panel_instance.figures.append(f)
+        plot_panel_instance.add_figure(f)
 
 
 def plot_angular_acceleration_by_average_SC(
@@ -860,29 +859,19 @@ def plot_angular_acceleration_by_average_SC(
     elif legend_outside is False:
         ax.legend()
     figure_file_string = " - Angular acceleration over average step cycle"
-    save_figures(f, results_dir, name, figure_file_string)
+    save_figures(f, results_dir, name, figure_file_string, cfg)
     if dont_show_plots:
         plt.close(f)
 
     # add figure to plot panel figures list
     if dont_show_plots is False:  # -> show plot panel
-        plot_panel_instance.figures.append(f)
+        plot_panel_instance.add_figure(f)
 
 
-def save_figures(figure, results_dir, name, figure_file_string):
-    """Save figures as pngs to results_dir and as svgs to separate subfolders"""
-    # pngs to results_dir
-    figure.savefig(
-        os.path.join(results_dir, name + figure_file_string + ".png"),
-        bbox_inches="tight",
-    )
-    # svgs to subfolders
-    svg_dir = os.path.join(results_dir, "SVG Figures")
-    if not os.path.exists(svg_dir):
-        os.makedirs(svg_dir)
-    figure.savefig(
-        os.path.join(svg_dir, name + figure_file_string + ".svg"), bbox_inches="tight"
-    )
+def save_figures(figure, results_dir, name, figure_file_string, cfg):
+    """Save figures according to the export profile (by default pngs to results_dir
+    and svgs to a separate subfolder)"""
+    save_figure_files(figure, results_dir, name + figure_file_string, cfg)
 
 
 def tickconvert_mm_to_cm(axis, whichlabel):
@@ -2,7 +2,12 @@
 
 # 1 - preparation
 DIRECTION_DLC_THRESHOLD = 0.95  # (dlc) confidence used for direction-detection
+DIRECTION_DLC_WINDOW = 5  # (dlc) frames averaged for direction-detection's confidence
 FILE_ID_STRING_ADDITIONS = ["", "-", "_"]  # (dlc) postrun/postnum string additions
+WINDOWED_LOADING_MARGIN = 10  # frames loaded before & after each annotated SC
+WINDOWED_LOADING_CHUNKSIZE = 100000  # frames per chunk when streaming through files
+MULTI_ANIMAL_FOLDERNAME = "Multi-Animal Datasets"  # per-animal files of multiruns
+MADLC_SHARED_INDIVIDUAL = "single"  # (dlc) maDLC's individual of unique bodyparts
 
 # 2 - sc extraction
 SCXLS_MOUSECOLS = [
@@ -20,7 +25,16 @@ SCXLS_MOUSECOLS = [
 SCXLS_RUNCOLS = ["Run", "run", "Runs", "runs", "Trial", "trial", "Trials", "trials"]
 SCXLS_SCCOLS = ["SC Number", "SC number", "sc number", "SC Num", "sc num", "SC num"]
 SWINGSTART_COL = "Swing (ti)"
+SWINGEND_COL = "Swing (te)"  # only used when exporting detected SCs
 STANCEEND_COL = "Stance (te)"
+DETECTED_SCTABLE_FILENAME = "Detected Annotation Table"  # (automatic SC detection)
+SC_DETECTION_SMOOTHING_WINDOW = 3  # frames of rolling mean of the joint's x-speed
+SC_DETECTION_NOISE_MADS = 5  # swing if x-speed > its median + this many MADs
+SC_DETECTION_PEAK_FRACTION = 0.5  # min. peak x-speed of swings (x median swing peak)
+SC_DETECTION_MIN_SWING_FRAMES = 3  # shorter swings are noise
+SC_DETECTION_MAX_CYCLE_RATIO = 2.5  # longer SCs (x median SC) are pauses
+CYCLE_VALIDATION_FILENAME = "Cycle Validation"  # kept/excluded SCs of dry runs
+CYCLE_VALIDATION_COLS = ["Name", "Start Frame", "End Frame", "Status", "Reason"]
 
 # 3 - analysis
 ORIGINAL_XLS_FILENAME = " - Original Stepcycles"  # filenames of sheet exports
@@ -31,3 +45,36 @@ X_STANDARDISED_XLS_FILENAME = " - X-Standardised Stepcycles"
 
 # 4 - plots
 SC_LAT_LEGEND_FONTSIZE = 8
+
+# 5 - rendering figures from exported results
+# => plot-only cfg keys that are not stored in config.json (GUI defaults)
+RENDER_CFG_DEFAULTS = {
+    "plot_joint_number": 3,
+    "plot_SE": True,
+    "color_palette": "Set2",
+    "legend_outside": True,
+}
+
+# 6 - parameter sweeps (cfg["sweep"])
+# => variants are cached per stage & only the stages after the first one using a
+#    changed key are recomputed - keys not listed here re-run the preparation
+SWEEP_FOLDERNAME_PREFIX = "Sweep"
+SWEEP_LOADING_KEYS = [
+    "subtract_beam",
+    "windowed_loading",
+    "detect_stepcycles",
+    "sc_times_in_frames",
+    "sampling_rate",
+]
+SWEEP_EXTRACTION_KEYS = ["x_sc_broken_threshold", "y_sc_broken_threshold"]
+SWEEP_ANALYSIS_KEYS = [
+    "bin_num",
+    "x_acceleration",
+    "angular_acceleration",
+    "analyse_average_x",
+    "save_to_xls",
+    "plot_SE",
+    "color_palette",
+    "legend_outside",
+    "compute_only",
+]
@@ -0,0 +1,120 @@
+# %% imports
+from autogaita.common2D.common2D_4_plots import plot_results
+from autogaita.resources.utils import write_issues_to_textfile
+import os
+import json
+import pandas as pd
+import matplotlib
+import matplotlib.pyplot as plt
+
+# %% constants
+from autogaita.resources.constants import CONFIG_JSON_FILENAME
+from autogaita.common2D.common2D_constants import (
+    ORIGINAL_XLS_FILENAME,
+    AVERAGE_XLS_FILENAME,
+    STD_XLS_FILENAME,
+    RENDER_CFG_DEFAULTS,
+)
+
+matplotlib.use("agg")
+plt.rcParams["figure.dpi"] = 300  # same resolution as in our main modules
+
+
+# %% ....................  render figures from exported results  .......................
+
+
+def render_results(results_dir, cfg=None, names=None):
+    """Regenerate the figures of DLC/SLEAP runs from a Results folder
+
+    Note
+    ----
+    results_dir is the folder that includes config.json and one subfolder per ID/run,
+    i.e. what single- and multiruns write (also in compute-only mode). We render
+    figures for all subfolders with exported results or only for those in names
+    (e.g. ["ID 15 - Run 3"]).
+    cfg is optional and can include plot-only keys that are not part of config.json
+    (plot_joint_number, plot_SE, color_palette, legend_outside, x_acceleration,
+    angular_acceleration, plot_workers or export_profile). RENDER_CFG_DEFAULTS are used
+    for missing ones & accelerations are plotted if they were exported.
+    Returns the paths of all figure files that were saved.
+    """
+    # prepare cfg of all runs
+    if cfg is None:
+        cfg = {}
+    with open(os.path.join(results_dir, CONFIG_JSON_FILENAME), "r") as config_file:
+        config_vars_from_json = json.load(config_file)
+    if "tracking_software" in config_vars_from_json.keys():
+        if config_vars_from_json["tracking_software"] not in ["DLC", "SLEAP"]:
+            raise ValueError(
+                "Rendering from exported results is only possible for DLC & SLEAP!"
+            )
+    render_cfg = {**RENDER_CFG_DEFAULTS, **config_vars_from_json, **cfg}
+    render_cfg["dont_show_plots"] = True  # never build a plot panel from here
+    render_cfg["plot_joint_number"] = int(render_cfg["plot_joint_number"])
+    render_cfg["plot_joints"] = render_cfg["hind_joints"][
+        : render_cfg["plot_joint_number"]
+    ]
+
+    # render all (or given) runs
+    if names is None:
+        names = sorted(
+            name
+            for name in os.listdir(results_dir)
+            if find_results_sheet(results_dir, name, AVERAGE_XLS_FILENAME)
+        )
+    figure_paths = []
+    for name in names:
+        figure_paths.extend(render_one_run(results_dir, name, render_cfg))
+    return figure_paths
+
+
+def render_one_run(results_dir, name, render_cfg):
+    """Load a run's exported sheets & plot them"""
+    info = {"name": name, "results_dir": os.path.join(results_dir, name)}
+    results = {}
+    for key, sheet_filename in [
+        ("all_steps_data", ORIGINAL_XLS_FILENAME),
+        ("average_data", AVERAGE_XLS_FILENAME),
+        ("std_data", STD_XLS_FILENAME),
+    ]:
+        sheet_path = find_results_sheet(results_dir, name, sheet_filename)
+        if not sheet_path:
+            no_sheet_message = (
+                "\n***********\n! WARNING !\n***********\n"
+                + "Unable to render figures of "
+                + name
+                + " because we could not find its"
+                + sheet_filename.replace(" - ", " ")
+                + " file!"
+            )
+            print(no_sheet_message)
+            if os.path.isdir(info["results_dir"]):
+                write_issues_to_textfile(no_sheet_message, info)
+            return []
+        if sheet_path.endswith(".xlsx"):
+            results[key] = pd.read_excel(sheet_path)
+        else:
+            results[key] = pd.read_csv(sheet_path)
+    # plot accelerations if they were computed (unless users told us otherwise)
+    # => copy cfg because plot_results adds run-specific keys (sc_num)
+    this_cfg = render_cfg.copy()
+    average_columns = results["average_data"].columns
+    if "x_acceleration" not in this_cfg.keys():
+        this_cfg["x_acceleration"] = any(
+            joint + "Acceleration" in average_columns
+            for joint in this_cfg["hind_joints"]
+        )
+    if "angular_acceleration" not in this_cfg.keys():
+        this_cfg["angular_acceleration"] = any(
+            column.endswith("Angle Acceleration") for column in average_columns
+        )
+    return plot_results(info, results, this_cfg, None)
+
+
+def find_results_sheet(results_dir, name, sheet_filename):
+    """Return the path of an exported xlsx or csv sheet (empty string if not found)"""
+    for file_type in [".xlsx", ".csv"]:
+        sheet_path = os.path.join(results_dir, name, name + sheet_filename + file_type)
+        if os.path.exists(sheet_path):
+            return sheet_path
+    return ""
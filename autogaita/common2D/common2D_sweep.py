@@ -0,0 +1,245 @@
+# %% imports
+from autogaita.common2D.common2D_1_preparation import (
+    some_prep,
+    move_data_to_results_dir,
+    read_tracking_data,
+    write_config_json,
+)
+from autogaita.common2D.common2D_2_sc_extraction import (
+    extract_stepcycles,
+    load_annotation_table,
+    export_detected_annotation_table,
+    write_cycle_validation,
+)
+from autogaita.common2D.common2D_3_analysis import analyse_and_export_stepcycles
+from autogaita.common2D.common2D_4_plots import plot_results
+from autogaita.common2D.common2D_utils import (
+    handle_issues,
+    sweep_variants,
+    sweep_variant_name,
+)
+from autogaita.resources.utils import (
+    collect_issues,
+    print_finish,
+    write_issues_to_textfile,
+)
+from autogaita.resources.profiling import (
+    pipeline_stage,
+    profile_stages,
+)
+import os
+import copy
+
+# %% constants
+from autogaita.common2D.common2D_constants import (
+    SWEEP_LOADING_KEYS,
+    SWEEP_EXTRACTION_KEYS,
+    SWEEP_ANALYSIS_KEYS,
+)
+
+# %% parameter sweeps
+
+
+def run_parameter_sweep(tracking_software, info, folderinfo, cfg):
+    """Run every variant of cfg["sweep"]'s grid of cfg overrides for a given run
+
+    Note
+    ----
+    cfg["sweep"] maps cfg keys to lists of values (e.g. {"bin_num": [25, 50]}) & each
+    combination of values is a variant. Variants are stored @ results_dir's parent
+    folder / variant name / name, so that each variant folder is a group directory.
+    Outputs of stages are reused by all variants that do not change a key the stage
+    (or an earlier one) uses - see SWEEP_..._KEYS in common2D_constants. Files are
+    parsed once unless a key of SWEEP_LOADING_KEYS is swept - they are still copied to
+    each variant folder & issues of reused stages are written to each variant, so that
+    every variant folder is a complete run.
+    """
+    # unpack
+    variants = expand_sweep_grid(cfg["sweep"], info)
+    if variants is None:
+        return
+    base_cfg = copy.deepcopy(cfg)
+    del base_cfg["sweep"]
+    base_cfg["dont_show_plots"] = True  # we don't want a plot panel per variant
+    # outputs of stages - keyed by the overrides of the keys they depend on
+    caches = {"loaded": {}, "prepared": {}, "extracted": {}, "annotation_table": None}
+    for overrides in variants:
+        variant_name = sweep_variant_name(overrides)
+        variant_info = copy.deepcopy(info)
+        variant_info["results_dir"] = os.path.join(
+            os.path.dirname(info["results_dir"]), variant_name, info["name"]
+        )
+        variant_cfg = copy.deepcopy(base_cfg)
+        variant_cfg.update(copy.deepcopy(overrides))
+        with collect_issues(variant_info) as collector:
+            run_sweep_variant(
+                variant_info,
+                tracking_software,
+                folderinfo,
+                overrides,
+                caches,
+                collector,
+                variant_cfg,
+            )
+
+
+@profile_stages
+def run_sweep_variant(
+    info, tracking_software, folderinfo, overrides, caches, collector, cfg
+):
+    """Run the stages of one variant that we did not run for an earlier one
+
+    Note
+    ----
+    Caches store the issues that a stage logged next to its outputs, so that they can
+    be replayed to the collector of each variant that reuses the stage.
+    Each variant is profiled on its own (if cfg["profile_stages"]) - its timings only
+    include the stages it did not reuse.
+    """
+
+    # .........................  preparation (& loading)  ..............................
+    variant_name = os.path.basename(os.path.dirname(info["results_dir"]))
+    later_stage_keys = SWEEP_EXTRACTION_KEYS + SWEEP_ANALYSIS_KEYS
+    loading_key = sweep_cache_key(overrides, SWEEP_LOADING_KEYS)
+    prep_key = sweep_cache_key(
+        overrides, [key for key in overrides if key not in later_stage_keys]
+    )
+    extraction_key = sweep_cache_key(
+        overrides, [key for key in overrides if key not in SWEEP_ANALYSIS_KEYS]
+    )
+    # every variant gets its own copy of the files (incl. issues of moving them)
+    move_data_to_results_dir(tracking_software, info, folderinfo)
+    if prep_key not in caches["prepared"]:
+        first_issue = len(collector.issues)
+        with pipeline_stage("preparation", detail=variant_name):
+            if loading_key not in caches["loaded"]:
+                loaded_data = read_tracking_data(
+                    tracking_software, info, folderinfo, cfg
+                )
+                caches["loaded"][loading_key] = (
+                    loaded_data,
+                    stage_issues(collector, first_issue),
+                )
+            else:
+                loaded_data, loading_issues = caches["loaded"][loading_key]
+                replay_stage_issues(collector, loading_issues)
+            data = None
+            if loaded_data is not None:
+                # copy since some_prep transforms the data & read direction data (if
+                # windowed loading) from this variant's copy of the files
+                loaded_data = copy.deepcopy(loaded_data)
+                loaded_data["data_dir"] = info["results_dir"]
+                data = some_prep(tracking_software, info, folderinfo, cfg, loaded_data)
+        # cfg was expanded by some_prep
+        caches["prepared"][prep_key] = (
+            data,
+            cfg,
+            stage_issues(collector, first_issue),
+        )
+    else:
+        data, prepared_cfg, prep_issues = caches["prepared"][prep_key]
+        replay_stage_issues(collector, prep_issues)
+        cfg = copy.deepcopy(prepared_cfg)
+        for key in overrides:
+            if key in later_stage_keys:
+                cfg[key] = copy.deepcopy(overrides[key])
+        if data is None:  # some_prep failed for an earlier variant
+            handle_issues("sweep_prep_failed", info)
+        else:
+            write_config_json(tracking_software, info, cfg)
+    if data is None:
+        return
+
+    # .........................  step-cycle extraction  ................................
+    dry_run = "dry_run" in cfg.keys() and cfg["dry_run"]
+    detect_scs = "detect_stepcycles" in cfg.keys() and cfg["detect_stepcycles"]
+    if extraction_key not in caches["extracted"]:
+        cycle_log = [] if dry_run else None
+        swing_ends = {}
+        annotation_table = None
+        if not detect_scs:
+            if caches["annotation_table"] is None:  # only read it once
+                caches["annotation_table"] = load_annotation_table(folderinfo)
+            annotation_table = caches["annotation_table"]
+        first_issue = len(collector.issues)
+        with pipeline_stage("step-cycle extraction", detail=variant_name):
+            all_cycles = extract_stepcycles(
+                tracking_software,
+                data,
+                info,
+                folderinfo,
+                cfg,
+                cycle_log,
+                annotation_table,
+                swing_ends,
+            )
+        caches["extracted"][extraction_key] = (
+            all_cycles,
+            cycle_log,
+            swing_ends,
+            stage_issues(collector, first_issue),
+        )
+    else:
+        all_cycles, cycle_log, swing_ends, extraction_issues = caches["extracted"][
+            extraction_key
+        ]
+        replay_stage_issues(collector, extraction_issues)
+        # detected SCs are exported as an annotation table to each variant's folder
+        if detect_scs and all_cycles:
+            export_detected_annotation_table(all_cycles, swing_ends, info, cfg)
+    if dry_run:
+        write_cycle_validation(cycle_log, info)
+    if all_cycles is None:
+        handle_issues("scs_invalid", info)
+        return
+    if dry_run:
+        print_finish(info)
+        return
+
+    # .........  main analysis: sc-lvl y-norm, features, df-creation & export ..........
+    # => always recomputed, copies since data & SCs are reused by other variants
+    with pipeline_stage("analysis & export", detail=variant_name):
+        results = analyse_and_export_stepcycles(
+            data.copy(), copy.deepcopy(all_cycles), info, cfg
+        )
+
+    # ................................  plots  .........................................
+    if not ("compute_only" in cfg.keys() and cfg["compute_only"]):
+        with pipeline_stage("plots", detail=variant_name):
+            plot_results(info, results, cfg, None)  # no plot panel in sweeps
+    print_finish(info)
+
+
+# %% local functions
+
+
+def expand_sweep_grid(sweep, info):
+    """Return a list of dicts of cfg overrides (one per variant) - or None"""
+    variants = sweep_variants(sweep)
+    if variants is None:
+        sweep_error = (
+            "\n*********\n! ERROR !\n*********\n"
+            + 'cfg["sweep"] must be a dict of cfg keys & lists of their values, '
+            + 'e.g. {"bin_num": [25, 50]}!\nTry again!'
+        )
+        print(sweep_error)
+        write_issues_to_textfile(sweep_error, info)
+    return variants
+
+
+def sweep_cache_key(overrides, stage_keys):
+    """Hashable key of a variant's overrides of the cfg keys a stage depends on"""
+    return tuple(
+        (key, repr(value)) for key, value in overrides.items() if key in stage_keys
+    )
+
+
+def stage_issues(collector, first_issue):
+    """Issues (& their headers) that were logged since the stage started"""
+    return copy.deepcopy(collector.issues[first_issue:]), set(collector.headers)
+
+
+def replay_stage_issues(collector, issues_and_headers):
+    """Log a reused stage's issues to this variant"""
+    issues, headers = issues_and_headers
+    collector.extend(copy.deepcopy(issues), headers)
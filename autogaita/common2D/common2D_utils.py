@@ -1,9 +1,24 @@
 # %% imports
-from autogaita.common2D.common2D_constants import FILE_ID_STRING_ADDITIONS
-from autogaita.resources.utils import try_to_run_gaita, write_issues_to_textfile
+from autogaita.common2D.common2D_constants import (
+    FILE_ID_STRING_ADDITIONS,
+    DETECTED_SCTABLE_FILENAME,
+    SCXLS_MOUSECOLS,
+    SCXLS_RUNCOLS,
+    CYCLE_VALIDATION_FILENAME,
+    SWEEP_FOLDERNAME_PREFIX,
+)
+from autogaita.resources.utils import write_issues_to_textfile
+from autogaita.resources.watchdog import (
+    try_to_run_gaita_with_watchdog,
+    write_watchdog_summary,
+)
+from autogaita.resources.profiling import write_stage_timings_report
 import os
+import re
 import copy
+import itertools
 import numpy as np
+import pandas as pd
 import tkinter as tk
 
 # %% constants
@@ -24,21 +39,163 @@ def run_singlerun_in_multirun(tracking_software, idx, info, folderinfo, cfg):
                 this_info[keyname] = info[keyname][idx]
         else:  # pass as is for all other keys
             this_info[keyname] = info[keyname][idx]
-        if cfg["results_dir"]:
-            this_info["results_dir"] = os.path.join(
-                cfg["results_dir"], this_info["name"]
-            )
-        else:
-            this_info["results_dir"] = os.path.join(
-                folderinfo["root_dir"], "Results", this_info["name"]
-            )
+        this_info["results_dir"] = os.path.join(
+            multirun_results_dir(folderinfo, cfg), this_info["name"]
+        )
     # make a deep copy of cfg that used in each run, otherwise changes to the cfg dict
     # would translate to subsequent runs
     # ==> see https://stackoverflow.com/questions/2465921/
     #         how-to-copy-a-dictionary-and-only-edit-the-copy
     this_cfg = copy.deepcopy(cfg)
     # important to only pass this_info to main script here (1 run at a time!)
-    try_to_run_gaita(tracking_software, this_info, folderinfo, this_cfg, True)
+    # => returns why the run was terminated if it exceeded cfg's limits (else None)
+    return try_to_run_gaita_with_watchdog(
+        tracking_software, this_info, folderinfo, this_cfg
+    )
+
+
+def multirun_results_dir(folderinfo, cfg):
+    """Return the folder that includes the Results subfolders of a multirun's runs"""
+    if cfg["results_dir"]:
+        return cfg["results_dir"]
+    else:
+        return os.path.join(folderinfo["root_dir"], "Results")
+
+
+def multirun_results_dirs(folderinfo, cfg):
+    """Return the folders of a multirun that include Results subfolders of runs
+
+    Note
+    ----
+    That's one folder per variant if cfg["sweep"] (see run_parameter_sweep) - our
+    multirun tables & reports are written to each of them.
+    """
+    results_dir = multirun_results_dir(folderinfo, cfg)
+    if "sweep" in cfg.keys() and cfg["sweep"]:
+        variants = sweep_variants(cfg["sweep"])
+        if variants is not None:  # else no run did anything
+            return [
+                os.path.join(results_dir, sweep_variant_name(overrides))
+                for overrides in variants
+            ]
+    return [results_dir]
+
+
+def sweep_variants(sweep):
+    """Return a list of dicts of cfg overrides (one per variant) - or None if invalid"""
+    if (
+        not isinstance(sweep, dict)
+        or not sweep
+        or not all(isinstance(values, list) and values for values in sweep.values())
+    ):
+        return
+    return [
+        dict(zip(sweep.keys(), values)) for values in itertools.product(*sweep.values())
+    ]
+
+
+def sweep_variant_name(overrides):
+    """Name of a variant's folder, e.g. Sweep - bin_num 25 - x_sc_broken_threshold 100"""
+    name_parts = [SWEEP_FOLDERNAME_PREFIX]
+    for key, value in overrides.items():
+        if isinstance(value, list):  # e.g. joint cfg keys
+            value = ", ".join(str(element) for element in value)
+        name_parts.append(f"{key} {str(value).strip()}")
+    # make sure our name can be a folder name on all OSs
+    return re.sub(r'[\\/:*?"<>|]', "", " - ".join(name_parts))
+
+
+def write_multirun_watchdog_summary(terminated_runs, folderinfo, cfg):
+    """Log runs of a multirun that our watchdog terminated (see run_singlerun...)"""
+    terminated_runs = [run for run in terminated_runs if run is not None]
+    write_watchdog_summary(terminated_runs, multirun_results_dir(folderinfo, cfg))
+
+
+def write_multirun_stage_timings(info, folderinfo, cfg):
+    """Aggregate the stage timings of a multirun's runs (if cfg["profile_stages"])"""
+    for results_dir in multirun_results_dirs(folderinfo, cfg):
+        run_results_dirs = [os.path.join(results_dir, name) for name in info["name"]]
+        write_stage_timings_report(run_results_dirs, results_dir, cfg)
+
+
+def write_multirun_detected_annotation_table(info, folderinfo, cfg):
+    """Combine the detected annotation tables of a multirun's runs into one table
+
+    Note
+    ----
+    Only if cfg["detect_stepcycles"]. Like our template, a row's ID is only given in
+    the first row of each ID's runs - so the table can be used as is in future runs.
+    """
+    if not ("detect_stepcycles" in cfg.keys() and cfg["detect_stepcycles"]):
+        return
+    for results_dir in multirun_results_dirs(folderinfo, cfg):
+        write_detected_annotation_table(info, results_dir)
+
+
+def write_detected_annotation_table(info, results_dir):
+    """Combine the detected annotation tables of the runs in results_dir"""
+    header = []
+    rows = []
+    for name in info["name"]:
+        run_table_path = os.path.join(
+            results_dir, name, name + " - " + DETECTED_SCTABLE_FILENAME + ".xlsx"
+        )
+        if not os.path.exists(run_table_path):  # run failed or had no valid SCs
+            continue
+        # header=None keeps repeated latency column names as they are
+        run_table = pd.read_excel(run_table_path, header=None)
+        if run_table.shape[1] > len(header):
+            header = run_table.iloc[0].tolist()
+        rows.append(run_table.iloc[1].tolist())
+    if not rows:
+        return
+    table = pd.DataFrame(rows)  # runs with fewer SCs are padded with NaNs
+    table.columns = header
+    # sort runs by ID (in order of appearance) & run, then only keep first IDs
+    id_col = SCXLS_MOUSECOLS[0]
+    run_col = SCXLS_RUNCOLS[0]
+    id_order = {mouse_num: i for i, mouse_num in enumerate(table[id_col].unique())}
+    table["id_order"] = table[id_col].map(id_order)
+    table = table.sort_values(["id_order", run_col], kind="stable")
+    table = table.drop(columns="id_order")
+    table[id_col] = table[id_col].where(~table[id_col].duplicated())
+    table.to_excel(
+        os.path.join(results_dir, DETECTED_SCTABLE_FILENAME + ".xlsx"), index=False
+    )
+
+
+def write_multirun_cycle_validation(info, folderinfo, cfg):
+    """Combine the kept & excluded SCs of a dry multirun's runs into one csv file
+
+    Note
+    ----
+    Only if cfg["dry_run"]. Returns a list of the combined tables (or None if a folder
+    had no tables) - one per folder of multirun_results_dirs.
+    """
+    if not ("dry_run" in cfg.keys() and cfg["dry_run"]):
+        return
+    return [
+        write_cycle_validation_table(info, results_dir)
+        for results_dir in multirun_results_dirs(folderinfo, cfg)
+    ]
+
+
+def write_cycle_validation_table(info, results_dir):
+    """Combine the cycle validation tables of the runs in results_dir - or None"""
+    run_tables = []
+    for name in info["name"]:
+        run_table_path = os.path.join(
+            results_dir, name, name + " - " + CYCLE_VALIDATION_FILENAME + ".csv"
+        )
+        if os.path.exists(run_table_path):  # not if run failed before SC extraction
+            run_tables.append(pd.read_csv(run_table_path, keep_default_na=False))
+    if not run_tables:
+        return
+    cycle_validation = pd.concat(run_tables, ignore_index=True)
+    cycle_validation.to_csv(
+        os.path.join(results_dir, CYCLE_VALIDATION_FILENAME + ".csv"), index=False
+    )
+    return cycle_validation
 
 
 def extract_info(tracking_software, folderinfo, in_GUI=False):
@@ -270,7 +427,10 @@ def check_a_single_cycle_for_joint_coords(cycle, angles, data, c, info):
                 [data[this_joint + "x"], data[this_joint + "y"]]
             )
         # now check if any of the joints have the same coord at any idx
-        for idx in range(cycle[0], cycle[1]):
+        # => positions of the SC's frames since windowed loading's data doesn't start
+        #    at frame 0
+        start_idx, end_idx = data.index.get_indexer([cycle[0], cycle[1]])
+        for idx in range(start_idx, end_idx):
             if (
                 np.array_equal(
                     this_angle_data["name"][:, idx],
@@ -288,7 +448,7 @@ def check_a_single_cycle_for_joint_coords(cycle, angles, data, c, info):
                 this_message = (
                     "\n***********\n! WARNING !\n***********\n"
                     + f"SC #{c + 1} has equal joint coordinates at "
-                    + f"{round(data[TIME_COL][idx],4)}s:"
+                    + f"{round(data[TIME_COL].iloc[idx],4)}s:"
                     + "\n\nAngle - [x y]:\n"
                     + angles["name"][a]
                     + " - "
@@ -334,12 +494,13 @@ def check_tracking_xy_thresholds(all_cycles, data, info, cfg):
                 this_threshold = x_sc_broken_threshold
             elif col.endswith("y"):
                 this_threshold = y_sc_broken_threshold
-            this_data = data.loc[cycle[0] : cycle[1], col]
-            for i in range(len(this_data) - 1):
-                if (this_data.iloc[i + 1] > (this_data.iloc[i] + this_threshold)) | (
-                    this_data.iloc[i + 1] < (this_data.iloc[i] - this_threshold)
-                ):
-                    exclude_this_cycle = True
+            this_data = data.loc[cycle[0] : cycle[1], col].to_numpy()
+            # compare each datapoint to its predecessor (vectorised)
+            if np.any(
+                (this_data[1:] > (this_data[:-1] + this_threshold))
+                | (this_data[1:] < (this_data[:-1] - this_threshold))
+            ):
+                exclude_this_cycle = True
         if exclude_this_cycle == True:
             this_message = (
                 "\n...excluding SC #"
@@ -414,6 +575,14 @@ def handle_issues(condition, info):
         )
         print(this_message)
         write_issues_to_textfile(this_message, info)
+    # 2b: automatic SC detection found no SCs
+    elif condition == "no_detected_scs":
+        this_message = (
+            "\n***********\n! WARNING !\n***********\n"
+            + "Skipped since we were unable to detect any SCs!"
+        )
+        print(this_message)
+        write_issues_to_textfile(this_message, info)
     # 3: the mouse was not included in XLS table
     elif condition == "no_mouse":
         this_message = (
@@ -441,4 +610,13 @@ def handle_issues(condition, info):
         )
         print(this_message)
         write_issues_to_textfile(this_message, info)
+    # 6: parameter sweeps - preparation failed for an earlier variant
+    elif condition == "sweep_prep_failed":
+        this_message = (
+            "\n***********\n! WARNING !\n***********\n"
+            + "Skipped since the preparation failed for an earlier sweep variant "
+            + "with the same settings - see its Issues!"
+        )
+        print(this_message)
+        write_issues_to_textfile(this_message, info)
     return
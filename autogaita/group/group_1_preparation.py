@@ -1,12 +1,17 @@
 # %% imports
-from autogaita.resources.utils import write_issues_to_textfile
+from autogaita.resources.utils import write_issues_to_textfile, check_export_profile
 import os
 import json
 import matplotlib.pyplot as plt
 import seaborn as sns
 
 # %% constants
-from autogaita.resources.constants import ISSUES_TXT_FILENAME, CONFIG_JSON_FILENAME
+from autogaita.resources.constants import (
+    ISSUES_TXT_FILENAME,
+    ISSUES_JSONL_FILENAME,
+    TIMINGS_JSON_FILENAME,
+    CONFIG_JSON_FILENAME,
+)
 from autogaita.group.group_constants import (
     FIRST_LEVEL_CFG_VARS_TO_NOT_CHECK,
     GROUP_CONFIG_TXT_FILENAME,
@@ -15,6 +20,7 @@ from autogaita.group.group_constants import (
     MULTCOMP_EXCEL_FILENAME_2,
     ORIG_SHEET_NAME,
     CONTRAST_SPLIT_STR,
+    PCA_SOLVERS,
 )
 
 # %% .................  workflow step #1 - unpack & prepare vars  ....................
@@ -64,6 +70,8 @@ def some_prep(folderinfo, cfg):
     for info_file_name in [
         GROUP_CONFIG_TXT_FILENAME,
         ISSUES_TXT_FILENAME,
+        ISSUES_JSONL_FILENAME,
+        TIMINGS_JSON_FILENAME,
         STATS_TXT_FILENAME,
         MULTCOMP_EXCEL_FILENAME_1,
         MULTCOMP_EXCEL_FILENAME_2,
@@ -79,6 +87,11 @@ def some_prep(folderinfo, cfg):
     # define save_to_xls and test PCA
     cfg = extract_save_to_xls_and_test_PCA_config(folderinfo, cfg)
 
+    # test the (optional) figure export profile
+    export_profile_error_message = check_export_profile(cfg, folderinfo)
+    if export_profile_error_message:
+        raise ValueError(export_profile_error_message)
+
     # if not loading previous results, ensure cfg-keys are equivalent across groups
     # then add them to cfg dict
     if len(folderinfo["load_dir"]) == 0:
@@ -209,6 +222,52 @@ def extract_save_to_xls_and_test_PCA_config(folderinfo, cfg):
                 + "just don't choose any variables for it."
             )
             cfg["PCA_n_components"] = 2  # make sure to update in cfg dict
+    # PCA solver is optional (cfgs of older versions don't have it) - test if valid
+    if "PCA_solver" in cfg.keys() and cfg["PCA_solver"] not in PCA_SOLVERS:
+        PCA_solver_error_message = (
+            "\n*********\n! ERROR !\n*********\n"
+            + "\nPCA solver invalid: "
+            + str(cfg["PCA_solver"])
+            + "\nPlease use one of: "
+            + ", ".join(PCA_SOLVERS)
+            + "\nFix & re-run!"
+        )
+        print(PCA_solver_error_message)
+        write_issues_to_textfile(PCA_solver_error_message, folderinfo)
+        raise ValueError(PCA_solver_error_message)
+    # same for the 3D video's resolution ("WIDTHxHEIGHT") & number of frames
+    if "PCA_video_resolution" in cfg.keys():
+        resolution = str(cfg["PCA_video_resolution"]).lower().split("x")
+        if (
+            len(resolution) != 2
+            or not all(pixels.strip().isdigit() for pixels in resolution)
+            or min(int(pixels) for pixels in resolution) < 2
+        ):
+            PCA_video_resolution_error_message = (
+                "\n*********\n! ERROR !\n*********\n"
+                + "\nPCA video resolution invalid: "
+                + str(cfg["PCA_video_resolution"])
+                + "\nPlease use WIDTHxHEIGHT in pixels, e.g. 1280x960"
+                + "\nFix & re-run!"
+            )
+            print(PCA_video_resolution_error_message)
+            write_issues_to_textfile(PCA_video_resolution_error_message, folderinfo)
+            raise ValueError(PCA_video_resolution_error_message)
+    if "PCA_video_frame_number" in cfg.keys():
+        if (
+            not str(cfg["PCA_video_frame_number"]).isdigit()
+            or int(cfg["PCA_video_frame_number"]) < 1
+        ):
+            PCA_video_frames_error_message = (
+                "\n*********\n! ERROR !\n*********\n"
+                + "\nPCA video frame number invalid: "
+                + str(cfg["PCA_video_frame_number"])
+                + "\nPlease use a positive integer!"
+                + "\nFix & re-run!"
+            )
+            print(PCA_video_frames_error_message)
+            write_issues_to_textfile(PCA_video_frames_error_message, folderinfo)
+            raise ValueError(PCA_video_frames_error_message)
     # small fix to ensure that PCA vars don't have duplicates (this would have severe
     # consequences for run_PCA since features of PCA_model output and "my" features var
     # would not match)
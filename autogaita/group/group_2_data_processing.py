@@ -1,5 +1,10 @@
 # %% imports
-from autogaita.resources.utils import bin_num_to_percentages, write_issues_to_textfile
+from autogaita.resources.utils import (
+    bin_num_to_percentages,
+    write_issues_to_textfile,
+    cast_to_float_dtype,
+    preserved_float_dtype,
+)
 import os
 import pandas as pd
 import numpy as np
@@ -57,8 +62,8 @@ def import_data(folderinfo, cfg):
         df_dict["X-Standardised"] = [pd.DataFrame(data=None)] * len(group_names)
 
     # loop over each subfolder in each group-dir (i.e. "Results")
-    for g, group_dir in enumerate(group_dirs):
-        group_name = group_names[g]  # for import and combine function
+    all_valid_results_folders = []
+    for group_dir in group_dirs:
         # valid_results_folders is the subset of all_results_folders in which valid
         # results were found (i.e., at least 1 valid SC was extracted & analysed)
         all_results_folders = os.listdir(group_dir)
@@ -82,6 +87,26 @@ def import_data(folderinfo, cfg):
                 )
             ):
                 valid_results_folders.append(folder)
+        all_valid_results_folders.append(valid_results_folders)
+    # IDs must be of one type in all groups - if any ID is a name (e.g. the track name
+    # of a multi-animal file), all IDs are treated as strings
+    string_IDs = False
+    if tracking_software in ["DLC", "SLEAP"]:
+        string_IDs = not all(
+            extract_mouse_num_string(name).isdigit()
+            for valid_results_folders in all_valid_results_folders
+            for name in valid_results_folders
+        )
+    if string_IDs:
+        string_IDs_message = (
+            "\nSome IDs are not numbers (e.g. track names of multi-animal files) - "
+            + "treating all IDs as strings!"
+        )
+        print(string_IDs_message)
+        write_issues_to_textfile(string_IDs_message, folderinfo)
+    for g, group_dir in enumerate(group_dirs):
+        group_name = group_names[g]  # for import and combine function
+        valid_results_folders = all_valid_results_folders[g]
         # loop over all valid results folders and add to the different types
         # of group-dfs (which_df can be Original, Normalised or X-Standardised)
         for which_df in df_dict.keys():
@@ -94,6 +119,7 @@ def import_data(folderinfo, cfg):
                     tracking_software,
                     name,
                     which_leg,
+                    string_IDs,
                     folderinfo,
                     cfg,
                 )
@@ -246,10 +272,16 @@ def import_and_combine_dfs(
     tracking_software,
     name,
     which_leg,
+    string_IDs,
     folderinfo,
     cfg,
 ):
-    """Import one run's df at a time and combine to group-level df"""
+    """Import one run's df at a time and combine to group-level df
+
+    Note
+    ----
+    DLC/SLEAP IDs are ints unless string_IDs (see import_data).
+    """
     if which_df == "Normalised":
         this_sheet_name = NORM_SHEET_NAME
     elif which_df == "Original":
@@ -291,7 +323,8 @@ def import_and_combine_dfs(
         print(this_message)
         write_issues_to_textfile(this_message, folderinfo)
     else:
-        df_copy = df.copy()
+        # reduced precision: group dfs hold float32 values (see resources/utils)
+        df_copy = cast_to_float_dtype(df.copy(), cfg)
         # test: are our PCA & stats variables present in this ID's dataset?
         check_PCA_and_stats_variables(df_copy, group_name, name, folderinfo, cfg)
         # add some final info & append to group_df
@@ -300,7 +333,9 @@ def import_and_combine_dfs(
             # => I call DLC stuff ID NUM - RUN NUM, so we can use temp_split & idxing
             #    as done below
             temp_split = name.split(SPLIT_STRING)
-            mouse_num = int(temp_split[0].split(" ")[1])  # temp_split[0] == ID X
+            mouse_num = extract_mouse_num_string(name)
+            if not string_IDs:  # multi-animal IDs can be track names
+                mouse_num = int(mouse_num)
             run_num = int(temp_split[1].split(" ")[1])  # temp_split[1] == RUN X
             df_copy["Run"] = run_num
             df_copy[ID_COL] = mouse_num
@@ -327,6 +362,8 @@ def import_and_combine_dfs(
                 with warnings.catch_warnings():
                     warnings.simplefilter("ignore")
                     nanvector[:] = np.nan
+                # reduced precision: e.g. bool columns are float64 after nan-assignment
+                nanvector = cast_to_float_dtype(nanvector, cfg)
                 group_df = pd.concat([group_df, nanvector], axis=0)
                 group_df = pd.concat([group_df, df_copy.iloc[sc_idxs[sc]]], axis=0)
     # if there was no valid sheet file for this name, we are returning group_df without
@@ -337,6 +374,11 @@ def import_and_combine_dfs(
 # ................................  helper functions  ..................................
 
 
+def extract_mouse_num_string(name):
+    """Return the ID of a DLC/SLEAP run's name (ID X - Run Y) as a string"""
+    return name.split(SPLIT_STRING)[0].split(" ")[1]  # [0] == ID X
+
+
 def save_results_sheet(dataframe, save_to_xls, fullfilepath):
     """Save a csv or xls of results"""
     if save_to_xls:
@@ -476,7 +518,10 @@ def avg_and_std(dfs, folderinfo, cfg):
             # of current ID
             for c, col in enumerate(this_df.columns):
                 if col not in cols_to_exclude:
-                    this_data = np.zeros([len(this_SC_idxs[0]), SC_num])
+                    this_data = np.zeros(
+                        [len(this_SC_idxs[0]), SC_num],
+                        dtype=preserved_float_dtype(this_df[col].dtype),
+                    )
                     for SC, SC_idx in enumerate(this_SC_idxs):
                         # NOTE - because SC_idx is a list of integers, iloc
                         #        includes all of the indices values. This is
@@ -577,7 +622,9 @@ def grand_avg_and_std(avg_dfs, folderinfo, cfg):
         ID_num = len(IDs)  # also: for an "N" column later
         for c, col in enumerate(this_df.columns):
             if col != ID_COL:
-                this_data = np.zeros([bin_num, ID_num])
+                this_data = np.zeros(
+                    [bin_num, ID_num], dtype=preserved_float_dtype(this_df[col].dtype)
+                )
                 for i, ID in enumerate(IDs):
                     this_idxs = np.where(this_df[ID_COL] == ID)[0]
                     this_data[:, i] = this_df.iloc[this_idxs, c]
@@ -648,6 +695,11 @@ def load_previous_runs_dataframes(folderinfo, cfg):
             print(error_msg)
             write_issues_to_textfile(error_msg, folderinfo)
             raise FileNotFoundError
+    # reduced precision: cast loaded dfs like we do when creating them
+    for g in range(len(avg_dfs)):
+        avg_dfs[g] = cast_to_float_dtype(avg_dfs[g], cfg)
+        g_avg_dfs[g] = cast_to_float_dtype(g_avg_dfs[g], cfg)
+        g_std_dfs[g] = cast_to_float_dtype(g_std_dfs[g], cfg)
     # re-index avg_dfs based on unique SC Percentages
     array_of_idxs = np.arange(len(avg_dfs[0][SC_PERCENTAGE_COL].unique()))
     for g in range(len(avg_dfs)):
@@ -2,26 +2,23 @@
 from autogaita.resources.utils import bin_num_to_percentages, write_issues_to_textfile
 from autogaita.group.group_utils import save_figures
 import os
-import sys
+import time
+import subprocess
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
+from sklearn.decomposition import PCA, IncrementalPCA
 from scipy.spatial.distance import pdist, squareform
 from statsmodels.stats.multitest import multipletests
 import openpyxl
 import seaborn as sns
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation, FFMpegWriter
-
-# skbio throws some error on windows during build
-# => skbio_available is False on Windows - & not imported
-skbio_available = sys.platform == "darwin"
-if skbio_available:
-    try:
-        from skbio.stats.distance import DistanceMatrix, permanova
-    except ImportError:
-        skbio_available = False
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import ffmpeg
 
 # %% constants
 from autogaita.resources.constants import (
@@ -32,6 +29,18 @@ from autogaita.group.group_constants import (
     GROUP_COL,
     CONTRAST_SPLIT_STR,
     PCA_PERMANOVA_TXT_FILENAME,
+    PCA_PERMANOVA_PERMUTATION_NUMBER,
+    PCA_PERMANOVA_BATCH_SIZE,
+    PCA_PERMANOVA_SEED,
+    PCA_INCREMENTAL_BATCH_SIZE,
+    PCA_RANDOM_STATE,
+    PCA_VIDEO_FRAME_NUMBER,
+    PCA_VIDEO_RESOLUTION,
+    PCA_VIDEO_FPS,
+    PCA_VIDEO_DPI,
+    PCA_VIDEO_FRAMES_PER_JOB,
+    PCA_VIDEO_ELEVATION,
+    PCA_VIDEO_ERROR_CHARACTERS,
     PCA_BARPLOT_BARCOLOR,
     PCA_BARPLOT_LINECOLOR,
     PCA_CUSTOM_SCATTER_OUTER_SEPARATOR,
@@ -59,13 +68,8 @@ def PCA_main(avg_dfs, folderinfo, cfg, plot_panel_instance):
     PCA_df, features = create_PCA_df(avg_dfs, folderinfo, cfg)
     # run the PCA
     PCA_df, PCA_info = run_PCA(PCA_df, features, folderinfo, cfg)
-    # run the PERMANOVA - only on mac
-    if skbio_available:
-        run_PCA_PERMANOVA(PCA_df, folderinfo, cfg)
-    else:
-        write_issues_to_textfile(
-            "\nSkipping PCA PERMANOVA (skbio is broken on Windows).", folderinfo
-        )
+    # run the PERMANOVA
+    run_PCA_PERMANOVA(PCA_df, folderinfo, cfg)
     # save PCA info to xlsx files
     PCA_info_to_xlsx(PCA_df, PCA_info, folderinfo, cfg)
     if PCA_info["number_of_PCs"] < 2:
@@ -106,11 +110,12 @@ def run_PCA_PERMANOVA(PCA_df, folderinfo, cfg):
     contrasts = folderinfo["contrasts"]
     results_dir = folderinfo["results_dir"]
     # PCA_permutation_number = cfg["permutation_number"]
-    PCA_permutation_number = 10000
+    PCA_permutation_number = PCA_PERMANOVA_PERMUTATION_NUMBER
+    PCA_PERMANOVA_seed = extract_PCA_PERMANOVA_seed(cfg)
 
     # extract data array (PC_scores) and group/ID arrays
     PC_cols = [col for col in PCA_df.columns if "PC " in col]
-    PC_scores = PCA_df[PC_cols].values
+    PC_scores = PCA_df[PC_cols].values.astype(float)
     groups = PCA_df[GROUP_COL].values
     IDs = PCA_df[ID_COL].values
 
@@ -125,61 +130,44 @@ def run_PCA_PERMANOVA(PCA_df, folderinfo, cfg):
         write_issues_to_textfile(PERMANOVA_ID_warning_message, folderinfo)
         return
 
-    # create a distance matrix from PC_scores
-    distances = pdist(PC_scores, metric="euclidean")
-    dist_matrix = squareform(distances)
-    skbio_dist_matrix = DistanceMatrix(dist_matrix, IDs)
-
-    # # ... QUICK HACK .....
-    # # => for human and cross-species PCA we have duplicate IDs but it is different
-    # #    people/animals so we just hack it
-    # # => note for cross-species the multiple comparison approach is currently broken
-    # #    because of ID reasons
-    # hacked_IDs = list(range(len(IDs)))
-    # skbio_dist_matrix = DistanceMatrix(dist_matrix, hacked_IDs)
-    # # ...... END HACK ......
-
-    # run PERMANOVA
-    global_result = permanova(
-        skbio_dist_matrix, groups, permutations=PCA_permutation_number
+    # create the squared distance matrix from PC_scores once - it is used by all tests
+    sq_dist_matrix = squareform(pdist(PC_scores, metric="euclidean")) ** 2
+
+    # define all tests (global & pairwise) as subsets of our samples
+    # => if we have at least three groups, do pairwise PERMANOVA as well
+    # => note this is in line with the implementation used in Qiime2, see
+    #    https://forum.qiime2.org/t/permanova-analysis-for-distances/18649
+    test_idxs = [np.arange(len(groups))]
+    if len(contrasts) > 1:
+        for contrast in contrasts:
+            group1 = contrast.split(CONTRAST_SPLIT_STR)[0]
+            group2 = contrast.split(CONTRAST_SPLIT_STR)[1]
+            test_idxs.append(np.where(np.isin(groups, [group1, group2]))[0])
+
+    # run PERMANOVA - all tests share the same permutations
+    F_stats, p_values = permanova_with_shared_permutations(
+        sq_dist_matrix, groups, test_idxs, PCA_permutation_number, PCA_PERMANOVA_seed
     )
 
     # print and store results to textfile
-    global_text_result = f"\n-------------\nPCA PERMANOVA\n-------------\n\nGlobal test - F = {global_result['test statistic']:.4f}, p = {global_result['p-value']:.4f}\n"
+    global_text_result = f"\n-------------\nPCA PERMANOVA\n-------------\n\n{PCA_permutation_number} permutations, seed = {PCA_PERMANOVA_seed}\n\nGlobal test - F = {F_stats[0]:.4f}, p = {p_values[0]:.4f}\n"
     print(global_text_result)
     permanova_textfile = os.path.join(results_dir, PCA_PERMANOVA_TXT_FILENAME)
     with open(permanova_textfile, "a") as f:
         f.write(global_text_result)
 
-    # if we have at least three groups, do pairwise PERMANOVA as well
-    # => note this is in line with the implementation used in Qiime2, see
-    #    https://forum.qiime2.org/t/permanova-analysis-for-distances/18649
+    # pairwise results (uncorrected) are corrected with benjamini-hochberg correction
     if len(contrasts) > 1:
         pairwise_text_result = "\n\nPairwise Tests\n\n"
         pairwise_results = []
-        for contrast in contrasts:
+        for c, contrast in enumerate(contrasts):
             group1 = contrast.split(CONTRAST_SPLIT_STR)[0]
             group2 = contrast.split(CONTRAST_SPLIT_STR)[1]
-            # filter the data
-            pair_mask = np.isin(groups, [group1, group2])
-            pair_indices = np.where(pair_mask)[0]
-            pair_dist_matrix = skbio_dist_matrix.filter(IDs[pair_indices], strict=True)
-            # ....... HACK AGAIN .......
-            # hacked_IDs = np.array(hacked_IDs)  # else type error
-            # pair_dist_matrix = skbio_dist_matrix.filter(
-            #     hacked_IDs[pair_indices], strict=True
-            # )
-            # ...... END HACK ......
-            pair_groups = groups[pair_mask]
-            # run PERMANOVA for given pair, gives uncorrected results, append to list
-            this_pairs_results = permanova(
-                pair_dist_matrix, pair_groups, permutations=PCA_permutation_number
-            )
             pairwise_results.append(
                 {
                     "Comparison": f"{group1} vs {group2}",
-                    "F_statistic": this_pairs_results["test statistic"],
-                    "p_value": this_pairs_results["p-value"],
+                    "F_statistic": F_stats[c + 1],
+                    "p_value": p_values[c + 1],
                 }
             )
         # now correct results with benjamini-hochberg correction and store to textfile
@@ -200,6 +188,71 @@ def run_PCA_PERMANOVA(PCA_df, folderinfo, cfg):
             f.write(pairwise_text_result)
 
 
+def extract_PCA_PERMANOVA_seed(cfg):
+    """Return the seed of PERMANOVA permutations (cfg["PCA_PERMANOVA_seed"] is optional)"""
+    if "PCA_PERMANOVA_seed" in cfg.keys():
+        return int(cfg["PCA_PERMANOVA_seed"])
+    return PCA_PERMANOVA_SEED
+
+
+def permanova_with_shared_permutations(
+    sq_dist_matrix, groups, test_idxs, permutation_number, seed
+):
+    """Compute pseudo-F & p values of PERMANOVAs on subsets of samples
+
+    Note
+    ----
+    => Each element of test_idxs holds the sample indices of one test (e.g. all
+       samples for the global test or two groups' samples for pairwise tests)
+    => Permutations are drawn in batches as random keys per sample. Ranking the keys
+       of a test's samples gives a valid permutation of that subset, so all tests
+       reuse the same random draws
+    => p values are computed as scikit-bio does: (#(F_perm >= F) + 1) / (perm. + 1)
+    => Permutations are drawn with the given seed so p values are reproducible
+    """
+    rng = np.random.default_rng(seed)
+    F_stats = np.zeros(len(test_idxs))
+    exceed_counts = np.zeros(len(test_idxs))
+    test_inputs = []
+    for t, idxs in enumerate(test_idxs):
+        # factorize group labels of this test so we can one-hot encode them
+        group_codes = pd.factorize(groups[idxs])[0]
+        test_sq_dist_matrix = sq_dist_matrix[np.ix_(idxs, idxs)]
+        F_stats[t] = compute_pseudo_F(test_sq_dist_matrix, group_codes[None, :])[0]
+        test_inputs.append((test_sq_dist_matrix, group_codes))
+    for batch_start in range(0, permutation_number, PCA_PERMANOVA_BATCH_SIZE):
+        batch_size = min(PCA_PERMANOVA_BATCH_SIZE, permutation_number - batch_start)
+        random_keys = rng.random((batch_size, len(groups)))
+        for t, idxs in enumerate(test_idxs):
+            test_sq_dist_matrix, group_codes = test_inputs[t]
+            permuted_codes = group_codes[np.argsort(random_keys[:, idxs], axis=1)]
+            permuted_F = compute_pseudo_F(test_sq_dist_matrix, permuted_codes)
+            exceed_counts[t] += np.sum(
+                (permuted_F >= F_stats[t]) | np.isclose(permuted_F, F_stats[t])
+            )
+    p_values = (exceed_counts + 1) / (permutation_number + 1)
+    return F_stats, p_values
+
+
+def compute_pseudo_F(sq_dist_matrix, group_codes):
+    """Compute PERMANOVA's pseudo-F for a batch of label vectors (permutations x n)
+
+    Note
+    ----
+    Within-group sums of squares are obtained via matrix products of the squared
+    distance matrix with one-hot encoded labels (see Anderson 2001).
+    """
+    n = sq_dist_matrix.shape[0]
+    group_num = group_codes.max() + 1
+    group_sizes = np.bincount(group_codes[0], minlength=group_num)
+    one_hot = (group_codes[:, :, None] == np.arange(group_num)).astype(float)
+    within_sums = np.einsum("pia,pia->pa", one_hot, sq_dist_matrix @ one_hot)
+    s_W = (within_sums / group_sizes).sum(axis=1) / 2
+    s_T = sq_dist_matrix.sum() / n / 2
+    s_A = s_T - s_W
+    return (s_A / (group_num - 1)) / (s_W / (n - group_num))
+
+
 def convert_PCA_bins_to_list(folderinfo, cfg):
     """Create PCA bin variable (list of to-be-included bin_num ints) from user input
     (string).
@@ -265,7 +318,6 @@ def create_PCA_df(avg_dfs, folderinfo, cfg):
     bin_num = cfg["bin_num"]
     PCA_bins = cfg["PCA_bins"]
 
-    PCA_df = pd.DataFrame(data=None)
     # create a list of features for series & dfs (features are vars @ each SC % bin)
     features = []
     for var in PCA_vars:
@@ -277,72 +329,72 @@ def create_PCA_df(avg_dfs, folderinfo, cfg):
                 bin_in_percent = int(((1 + b) / bin_num) * 100)
                 features.append(var + " " + str(bin_in_percent))
 
-    # for each mouse, create a series to concat to PCA_df
+    # reshape each group's average df to an ID x (variable, bin) float array
+    # => rows of avg_dfs are ID-wise blocks of SC % bins, so for each row we get the
+    #    ID's index (in order of appearance) & the bin's position inside its block
+    # => features are variable-major, i.e. all bins of var 1, then all of var 2, ...
+    group_col_values = []
+    ID_col_values = []
+    feature_arrays = []
     for g, group_name in enumerate(group_names):
-        for ID in pd.unique(avg_dfs[g][ID_COL]):
-            this_list = [group_name, ID]
-            if len(PCA_bins) > 0:  # empty strings are len = 0
-                # first line gives True and False but we need indexes so it's
-                # compatible with my (previous) approach of using iloc and lists
-                row_idxs = (avg_dfs[g][ID_COL] == ID) & (
-                    avg_dfs[g][SC_PERCENTAGE_COL].isin(PCA_bins)
-                )
-                row_idxs = np.where(row_idxs == True)[0]
-            else:
-                row_idxs = np.where(avg_dfs[g][ID_COL] == ID)[0]
-            for var in PCA_vars:
-                joint_col_idx = avg_dfs[g].columns.get_loc(var)
-                # this data is of current ID or IDxSC% combo and current feature
-                this_data = list(avg_dfs[g].iloc[row_idxs, joint_col_idx].values)
-                this_list.extend(this_data)  # so we have ID_COL as 1st value
-            this_series = pd.Series(this_list)
-            if PCA_df.empty:
-                PCA_df = pd.DataFrame(this_series).transpose()
-            else:
-                # transpose series, transform to df and concat to row-axis
-                PCA_df = pd.concat([PCA_df, this_series.to_frame().T], axis=0)
-    # this check is me being paranoid but whatever let's just leave it in
-    if len(PCA_df.columns) != len(features) + 2:
-        critical_PCA_df_error_message = (
-            "\n*********\n! ERROR !\n*********\n"
-            + "PCA_df creation failed since columns did not match features!\n"
-            + "This should never happen, please contact me!"
-        )
-        print(critical_PCA_df_error_message)
-        write_issues_to_textfile(critical_PCA_df_error_message, folderinfo)
-        raise ValueError(critical_PCA_df_error_message)
-    # add colnames after the last mouse (makes concat'ing series 2 df easier)
-    PCA_df.columns = [GROUP_COL] + [ID_COL] + features
+        avg_df = avg_dfs[g]
+        if len(PCA_bins) > 0:  # empty strings are len = 0
+            avg_df = avg_df[avg_df[SC_PERCENTAGE_COL].isin(PCA_bins)]
+        ID_codes, IDs = pd.factorize(avg_df[ID_COL])
+        bin_positions = avg_df.groupby(ID_COL, sort=False).cumcount().to_numpy()
+        bins_per_ID = len(features) // len(PCA_vars)
+        # this check is me being paranoid but whatever let's just leave it in
+        if (np.bincount(ID_codes, minlength=len(IDs)) != bins_per_ID).any():
+            critical_PCA_df_error_message = (
+                "\n*********\n! ERROR !\n*********\n"
+                + "PCA_df creation failed since columns did not match features!\n"
+                + "This should never happen, please contact me!"
+            )
+            print(critical_PCA_df_error_message)
+            write_issues_to_textfile(critical_PCA_df_error_message, folderinfo)
+            raise ValueError(critical_PCA_df_error_message)
+        this_array = np.empty((len(IDs), bins_per_ID, len(PCA_vars)))
+        this_array[ID_codes, bin_positions, :] = avg_df[PCA_vars].to_numpy(dtype=float)
+        feature_arrays.append(this_array.transpose(0, 2, 1).reshape(len(IDs), -1))
+        group_col_values.extend([group_name] * len(IDs))
+        ID_col_values.extend(IDs)
+    PCA_df = pd.DataFrame(np.concatenate(feature_arrays, axis=0), columns=features)
+    PCA_df.insert(0, ID_COL, ID_col_values)
+    PCA_df.insert(0, GROUP_COL, group_col_values)
     return PCA_df, features
 
 
 def run_PCA(PCA_df, features, folderinfo, cfg):
-    """Runs the PCA on a limb's feature (e.g. y or z coordinates)"""
+    """Runs the PCA on a limb's feature (e.g. y or z coordinates)
+
+    Note
+    ----
+    cfg["PCA_solver"] (optional, defaults to "auto") can be:
+    => "auto" - sklearn's default PCA (full SVD for the var-explained approach)
+    => "randomized" - randomised SVD, fast if we only want a few PCs of many features
+    => "incremental" - scaler & IncrementalPCA fitted on batches of IDs so that the
+       full feature matrix is never materialised
+    The var-explained approach (0 < PCA_n_components < 1) always uses a full SVD.
+    """
 
     # unpack
     PCA_n_components = cfg["PCA_n_components"]
+    if "PCA_solver" in cfg.keys():
+        PCA_solver = cfg["PCA_solver"]
+    else:
+        PCA_solver = "auto"
 
     # run
+    # => note we time the (standardisation &) fit so we can store it in PCA info
+    start_time = time.perf_counter()
     if 0 < PCA_n_components < 1:  # n_components until % explained var.
-        PCA_model = PCA(n_components=PCA_n_components, svd_solver="full")
-    else:
-        PCA_model = PCA(n_components=int(PCA_n_components))
-    x = PCA_df.loc[:, features]
-    # standardise here so that EACH FEATURE has mean=0 & std=1
-    # => you can check this with np.mean/std
-    # => you can also check that this operates on columns (features) and not rows (IDs)
-    x = StandardScaler().fit_transform(x)
-    # now create a df with the standardised features to add features to it (this gives
-    # us the feature_names_in attribute of PCA_model which we will use for PCA info
-    # excel files)
-    x = pd.DataFrame(x, columns=features)
-    # NOTE that this next line changes the PCA_model variable!
+        PCA_solver = "full"
     try:
-        PCs = PCA_model.fit_transform(x)
+        PCA_model, PCs = fit_PCA_model(PCA_df, features, PCA_n_components, PCA_solver)
     except ValueError:
         # n_components was larger than min(n_samples, n_features)
-        PCA_model = PCA(n_components=0.95)
-        PCs = PCA_model.fit_transform(x)
+        PCA_solver = "full"
+        PCA_model, PCs = fit_PCA_model(PCA_df, features, 0.95, PCA_solver)
         PCA_fixed_message = (
             "\n***********\n! WARNING !\n***********\n"
             + "\nNumber of PCA components was larger than min(n_samples, n_features)."
@@ -350,20 +402,82 @@ def run_PCA(PCA_df, features, folderinfo, cfg):
         )
         print(PCA_fixed_message)
         write_issues_to_textfile(PCA_fixed_message, folderinfo)
+    fit_time = time.perf_counter() - start_time
     # NOTE! we use number_of_PCs from here onwards (in info/plots/etc) to differentiate
     #       between n_components which can be smaller than 1!
     number_of_PCs = np.shape(PCs)[1]
     for i in range(number_of_PCs):
         PCA_df["PC " + str(i + 1)] = PCs[:, i]
     PCA_info = {
-        "features": PCA_model.feature_names_in_,
+        "features": np.array(features, dtype=object),
         "number_of_PCs": number_of_PCs,
         "explained_vars": PCA_model.explained_variance_ratio_,
         "eigenvectors": PCA_model.components_,
+        "solver": PCA_solver,
+        "fit_time": fit_time,
     }
     return PCA_df, PCA_info
 
 
+def fit_PCA_model(PCA_df, features, PCA_n_components, PCA_solver):
+    """Standardise features & fit the PCA model with the given solver.
+    Returns the fitted model and the PC scores of all IDs.
+
+    Note
+    ----
+    The incremental solver streams batches of rows through the scaler & the model
+    (both use partial_fit), so the full feature matrix is never built.
+    """
+    if PCA_solver == "incremental":
+        # split rows into batches of at least PCA_INCREMENTAL_BATCH_SIZE rows (a batch
+        # must not have fewer rows than PCs) - each batch is converted & standardised
+        # on its own in three passes: fit scaler, fit PCA, transform
+        n_components = int(PCA_n_components)
+        if n_components > min(len(PCA_df), len(features)):
+            raise ValueError("n_components must be <= min(n_samples, n_features)")
+        batch_size = max(PCA_INCREMENTAL_BATCH_SIZE, n_components)
+        row_batches = np.array_split(
+            np.arange(len(PCA_df)), max(1, len(PCA_df) // batch_size)
+        )
+        feature_idxs = PCA_df.columns.get_indexer(features)
+
+        def batch_to_numpy(rows):
+            return PCA_df.iloc[rows, feature_idxs].to_numpy(dtype=float)
+
+        scaler = StandardScaler()
+        for rows in row_batches:
+            scaler.partial_fit(batch_to_numpy(rows))
+        PCA_model = IncrementalPCA(n_components=n_components)
+        for rows in row_batches:
+            PCA_model.partial_fit(scaler.transform(batch_to_numpy(rows)))
+        PCs = np.concatenate(
+            [
+                PCA_model.transform(scaler.transform(batch_to_numpy(rows)))
+                for rows in row_batches
+            ]
+        )
+    else:
+        x = PCA_df.loc[:, features].to_numpy(dtype=float)
+        # standardise here so that EACH FEATURE has mean=0 & std=1
+        # => you can check this with np.mean/std
+        # => you can also check that this operates on columns (features) and not rows
+        #    (IDs)
+        scaler = StandardScaler().fit(x)
+        if PCA_solver == "full":
+            PCA_model = PCA(n_components=PCA_n_components, svd_solver="full")
+        elif PCA_solver == "randomized":
+            PCA_model = PCA(
+                n_components=int(PCA_n_components),
+                svd_solver="randomized",
+                random_state=PCA_RANDOM_STATE,
+            )
+        else:
+            PCA_model = PCA(n_components=int(PCA_n_components))
+        # NOTE that this next line changes the PCA_model variable!
+        PCs = PCA_model.fit_transform(scaler.transform(x))
+    return PCA_model, PCs
+
+
 def PCA_info_to_xlsx(PCA_df, PCA_info, folderinfo, cfg):
     """Save three PCA info excel files:
     1) explained_var & eigenvectors of PCs
@@ -402,6 +516,14 @@ def PCA_info_to_xlsx(PCA_df, PCA_info, folderinfo, cfg):
         for pc in range(number_of_PCs):
             # column is pc+2 because we want pc=0 to be in xlsx column 2 etc.
             sheet.cell(row=i + 5, column=pc + 2, value=eigenvectors[pc, i])
+    # add a second sheet with the solver we used & how long fitting took
+    solver_sheet = workbook.create_sheet(title="PCA Solver")
+    solver_sheet.cell(row=1, column=1, value="Solver")
+    solver_sheet.cell(row=1, column=2, value=PCA_info["solver"])
+    solver_sheet.cell(row=2, column=1, value="Fit Time (s)")
+    solver_sheet.cell(row=2, column=2, value=round(PCA_info["fit_time"], 4))
+    solver_sheet.cell(row=3, column=1, value="PERMANOVA Seed")
+    solver_sheet.cell(row=3, column=2, value=extract_PCA_PERMANOVA_seed(cfg))
     # save
     workbook.save(os.path.join(results_dir, "PCA Info.xlsx"))
 
@@ -456,10 +578,10 @@ def plot_PCA_barplot(PCA_info, folderinfo, cfg, plot_panel_instance):
         label="Cumulative Explained Variance",
     )
     info_string = "PCA Explained Variance"
-    save_figures(f, results_dir, info_string)
+    save_figures(f, results_dir, info_string, cfg)
     # add figure to plot panel figures list
     if dont_show_plots is False:  # -> show plot panel
-        plot_panel_instance.figures.append(f)
+        plot_panel_instance.add_figure(f)
 
 
 def plot_PCA_scatterplots(
@@ -560,32 +682,172 @@ def plot_PCA_scatterplots(
         ax_3d.set_zlabel(PC3_str)
         info_string_3d = which_plot + " 3D PCA Scatterplot"
         ax_3d.set_title(info_string_3d)
-    save_figures(f, results_dir, info_string)
+    save_figures(f, results_dir, info_string, cfg)
     # add figure to plot panel figures list
     if dont_show_plots is False:  # -> show plot panel
-        plot_panel_instance.figures.append(f)
+        plot_panel_instance.add_figure(f)
 
     # 3d scatterplot image file
     if number_of_PCs > 2:
-        save_figures(f_3d, results_dir, info_string_3d)
+        save_figures(f_3d, results_dir, info_string_3d, cfg)
         # add figure to plot panel figures list
         if dont_show_plots is False:  # -> show plot panel
-            plot_panel_instance.figures.append(f_3d)
+            plot_panel_instance.add_figure(f_3d)
 
         # 3d scatterplot rotating video file
         if PCA_save_3D_video:
+            scatter_data = []
+            for group_name in group_names:
+                row_idxs = np.where(PCA_df[GROUP_COL] == group_name)[0]
+                scatter_data.append(
+                    (
+                        PCA_df.iloc[row_idxs, PC1_col_idx].values,
+                        PCA_df.iloc[row_idxs, PC2_col_idx].values,
+                        PCA_df.iloc[row_idxs, PC3_col_idx].values,
+                        group_color_dict[group_name],
+                        group_name,
+                    )
+                )
+            axis_labels = (PC1_str, PC2_str, PC3_str)
+            save_PCA_3D_video(
+                scatter_data, axis_labels, info_string_3d, folderinfo, cfg
+            )
 
-            def init():  # create the animation
-                return (f_3d,)
 
-            def animate(frame):
-                ax_3d.view_init(elev=10, azim=frame)
-                return (f_3d,)
+def save_PCA_3D_video(scatter_data, axis_labels, info_string_3d, folderinfo, cfg):
+    """Render the rotating 3D scatterplot in parallel & pipe frames to ffmpeg
 
-            anim = FuncAnimation(
-                f_3d, animate, frames=np.arange(0, 360, 1), interval=20, blit=True
-            )
-            writervideo = FFMpegWriter(fps=30)  # save to m4 using ffmpeg writer
-            anim.save(
-                os.path.join(results_dir, info_string_3d + ".mp4"), writer=writervideo
-            )
+    Note
+    ----
+    Frames are drawn by a pool of workers on their own Agg canvases (at
+    PCA_VIDEO_DPI, so the global figure.dpi does not matter) and returned as raw RGB
+    bytes. These are written in order to the stdin of a single ffmpeg process. To keep
+    memory bounded, only a couple of jobs per worker are in flight at any time.
+    If ffmpeg fails (or exits early), we write its error to Issues.txt.
+    """
+
+    # unpack
+    results_dir = folderinfo["results_dir"]
+    legend_outside = cfg["legend_outside"]
+    frame_number = PCA_VIDEO_FRAME_NUMBER
+    if "PCA_video_frame_number" in cfg.keys():
+        frame_number = int(cfg["PCA_video_frame_number"])
+    resolution = PCA_VIDEO_RESOLUTION
+    if "PCA_video_resolution" in cfg.keys():
+        resolution = str(cfg["PCA_video_resolution"])
+    # libx264 with yuv420p requires even width & height
+    width, height = [int(pixels) for pixels in resolution.lower().split("x")]
+    width, height = width - width % 2, height - height % 2
+
+    # split rotation angles into jobs
+    azims = np.linspace(0, 360, frame_number, endpoint=False)
+    azim_jobs = [
+        azims[i : i + PCA_VIDEO_FRAMES_PER_JOB]
+        for i in range(0, frame_number, PCA_VIDEO_FRAMES_PER_JOB)
+    ]
+    plot_kwargs = {
+        "scatter_data": scatter_data,
+        "axis_labels": axis_labels,
+        "title": info_string_3d,
+        "legend_outside": legend_outside,
+        "width": width,
+        "height": height,
+    }
+
+    # start ffmpeg & feed it
+    # => ffmpeg's stderr goes to a temporary file (a pipe nobody reads would fill up
+    #    & block ffmpeg during long encodes) so we can report why it failed
+    video_path = os.path.join(results_dir, info_string_3d + ".mp4")
+    ffmpeg_args = (
+        ffmpeg.input(
+            "pipe:",
+            format="rawvideo",
+            pix_fmt="rgb24",
+            s=f"{width}x{height}",
+            framerate=PCA_VIDEO_FPS,
+        )
+        .output(video_path, vcodec="libx264", pix_fmt="yuv420p")
+        .global_args("-hide_banner", "-loglevel", "error")
+        .overwrite_output()
+        .compile()
+    )
+    ffmpeg_log = tempfile.TemporaryFile()
+    try:
+        ffmpeg_process = subprocess.Popen(
+            ffmpeg_args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=ffmpeg_log,
+        )
+    except FileNotFoundError:
+        ffmpeg_log.close()
+        no_ffmpeg_message = (
+            "\n*********\n! WARNING !\n*********\n"
+            + "\nCould not find ffmpeg - 3D PCA video was not saved!"
+            + "\nInstall ffmpeg & make sure it is on your PATH if you want the video."
+        )
+        print(no_ffmpeg_message)
+        write_issues_to_textfile(no_ffmpeg_message, folderinfo)
+        return
+    max_workers = min(os.cpu_count() or 1, len(azim_jobs))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending_jobs = deque()
+        try:
+            for azim_job in azim_jobs:
+                pending_jobs.append(
+                    executor.submit(render_PCA_3D_frames, azim_job, **plot_kwargs)
+                )
+                if len(pending_jobs) >= 2 * max_workers:
+                    ffmpeg_process.stdin.write(pending_jobs.popleft().result())
+            while pending_jobs:
+                ffmpeg_process.stdin.write(pending_jobs.popleft().result())
+            ffmpeg_process.stdin.close()
+        except BrokenPipeError:  # ffmpeg exited early - its return code tells us why
+            for pending_job in pending_jobs:
+                pending_job.cancel()
+            try:
+                ffmpeg_process.stdin.close()
+            except BrokenPipeError:
+                pass
+    if ffmpeg_process.wait() != 0:
+        ffmpeg_log.seek(0)
+        ffmpeg_error = ffmpeg_log.read().decode(errors="replace").strip()
+        ffmpeg_failed_message = (
+            "\n*********\n! WARNING !\n*********\n"
+            + f"\nffmpeg failed (exit code {ffmpeg_process.returncode}) - 3D PCA "
+            + "video was not saved!"
+            + "\nffmpeg's error was:\n"
+            + ffmpeg_error[-PCA_VIDEO_ERROR_CHARACTERS:]
+        )
+        print(ffmpeg_failed_message)
+        write_issues_to_textfile(ffmpeg_failed_message, folderinfo)
+    ffmpeg_log.close()
+
+
+def render_PCA_3D_frames(
+    azims, scatter_data, axis_labels, title, legend_outside, width, height
+):
+    """Draw the 3D scatterplot once & return raw RGB bytes of all given azimuths"""
+    f_3d = Figure(figsize=(width / PCA_VIDEO_DPI, height / PCA_VIDEO_DPI))
+    f_3d.set_dpi(PCA_VIDEO_DPI)
+    canvas = FigureCanvasAgg(f_3d)
+    ax_3d = f_3d.add_subplot(111, projection="3d")
+    group_names = []
+    for x, y, z, color, group_name in scatter_data:
+        ax_3d.scatter(x, y, z, color=color, s=60, label=group_name)
+        group_names.append(group_name)
+    if legend_outside is True:
+        ax_3d.legend(group_names, loc="center right", bbox_to_anchor=(0, 0.5))
+    elif legend_outside is False:
+        ax_3d.legend(group_names)
+    ax_3d.set_xlabel(axis_labels[0])
+    ax_3d.set_ylabel(axis_labels[1])
+    ax_3d.set_zlabel(axis_labels[2])
+    ax_3d.set_title(title)
+    frames = []
+    for azim in azims:
+        ax_3d.view_init(elev=PCA_VIDEO_ELEVATION, azim=azim)
+        canvas.draw()
+        rgba = np.asarray(canvas.buffer_rgba())
+        frames.append(rgba[:height, :width, :3].tobytes())
+    return b"".join(frames)
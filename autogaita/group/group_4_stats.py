@@ -1,5 +1,9 @@
 # %% imports
-from autogaita.resources.utils import bin_num_to_percentages, write_issues_to_textfile
+from autogaita.resources.utils import (
+    bin_num_to_percentages,
+    write_issues_to_textfile,
+)
+from autogaita.resources.progress import ProgressTracker
 from autogaita.group.group_utils import (
     check_mouse_conversion,
     save_figures,
@@ -9,7 +13,6 @@ from autogaita.group.group_utils import (
     setup_stats_plots_vars,
 )
 import os
-import sys
 import pandas as pd
 import numpy as np
 import string
@@ -101,6 +104,9 @@ def cluster_extent_test(
     )
     # permutation
     max_tmass = np.zeros(permutation_number)  # tmass
+    permutation_progress = ProgressTracker(
+        "Permuting " + stats_var, permutation_number, redraw=True
+    )
     for p in range(permutation_number):
         permuted_df = permute_true_observed_df(trueobs_df, cfg)
         permuted_results_df = initialise_results_df(folderinfo, cfg)
@@ -109,16 +115,8 @@ def cluster_extent_test(
         )
         # max tmass
         max_tmass[p] = max(permuted_results_df[CLUSTER_TMASS_COL])
-        sys.stdout.write(
-            "\r*************** Permuting "
-            + stats_var
-            + ": "
-            + str(p + 1)
-            + "/"
-            + str(permutation_number)
-            + " ***************"
-        )
-        sys.stdout.flush()
+        permutation_progress.advance()
+    permutation_progress.finish()
     # assign final p values of true observed cluster sizes
     trueobs_results_df = test_trueobs_clusters(
         trueobs_results_df, max_tmass, permutation_number, stats_threshold
@@ -382,10 +380,10 @@ def plot_permutation_test_results(
         stats_plots_suplabel_size,
         sampling_rate,
     )
-    save_figures(f, results_dir, figure_file_string)
+    save_figures(f, results_dir, figure_file_string, cfg)
     # add figure to plot panel figures list
     if dont_show_plots is False:  # -> show plot panel
-        plot_panel_instance.figures.append(f)
+        plot_panel_instance.add_figure(f)
 
 
 def extract_all_clusters(trueobs_results_df, contrast):
@@ -493,13 +491,18 @@ def ANOVA_main(
     g_avg_dfs,
     g_std_dfs,
     stats_var,
-    just_do_tukeys,
+    ANOVA_result,
     folderinfo,
     cfg,
     plot_panel_instance,
 ):
     """Perform a two-way RM-ANOVA with the factors group (between or within) & SC
     percentage (within) on a given dependent variable
+
+    Note
+    ----
+    ANOVA_result is the (already computed) ANOVA table of this stats_var - see
+    run_all_ANOVAs. If it is None, we only run Tukey's multiple comparison test.
     """
 
     # unpack
@@ -508,13 +511,6 @@ def ANOVA_main(
     # initialise text file
     initial_stats_textfile(stats_var, anova_design, folderinfo)
 
-    # run the fully RM or Mixed ANOVA
-    # => note pingouin checks both or sphericity by default
-    if just_do_tukeys is False:
-        ANOVA_result = run_ANOVA(stats_df, stats_var, cfg)
-    else:
-        ANOVA_result = None
-
     # run Tukeys for pairwise comparisons
     # => always running multiple comparison tests as well. see Prism's doc for why
     # => https://www.graphpad.com/guides/prism/latest/statistics/
@@ -584,6 +580,355 @@ def run_ANOVA(stats_df, stats_var, cfg):
     return result
 
 
+# ......................  closed-form ANOVAs for balanced designs  .....................
+def run_all_ANOVAs(stats_df, stats_variables, cfg):
+    """Run the ANOVA of all stats_variables & return a dict of stats_var: result
+
+    Note
+    ----
+    For the 1-way RM and Mixed designs we first try to compute the tables of all
+    variables at once using closed-form sums of squares. If the design is not
+    balanced (duplicate rows or missing values) we fall back to pingouin.
+    """
+    ANOVA_results = None
+    if cfg["anova_design"] in ["RM ANOVA", "Mixed ANOVA"]:
+        ANOVA_results = run_balanced_ANOVAs(stats_df, stats_variables, cfg)
+    if ANOVA_results is None:
+        ANOVA_results = {}
+        for stats_var in stats_variables:
+            ANOVA_results[stats_var] = run_ANOVA(stats_df, stats_var, cfg)
+    return ANOVA_results
+
+
+def create_balanced_ANOVA_array(stats_df, stats_variables):
+    """Transform stats_df to an array of shape: variables x IDs x SC % x groups
+
+    Note
+    ----
+    Returns None if an ID x SC % x group cell is duplicated or if a variable has
+    missing values since the closed-form approach requires a balanced design.
+    IDs that do not have data in all cells are removed (complete-case analysis, as
+    pingouin does).
+    """
+    if stats_df[stats_variables].isna().any(axis=None):
+        return None
+    ID_codes, IDs = pd.factorize(stats_df[ID_COL])
+    sc_codes, sc_percentages = pd.factorize(stats_df[SC_PERCENTAGE_COL])
+    group_codes, groups = pd.factorize(stats_df[GROUP_COL])
+    shape = (len(IDs), len(sc_percentages), len(groups))
+    cell_idxs = np.ravel_multi_index((ID_codes, sc_codes, group_codes), shape)
+    if len(np.unique(cell_idxs)) != len(cell_idxs):
+        return None
+    ANOVA_array = np.full((len(stats_variables), np.prod(shape)), np.nan)
+    ANOVA_array[:, cell_idxs] = stats_df[stats_variables].to_numpy(dtype=float).T
+    ANOVA_array = ANOVA_array.reshape((len(stats_variables),) + shape)
+    return ANOVA_array, groups
+
+
+def run_balanced_ANOVAs(stats_df, stats_variables, cfg):
+    """Run a closed-form RM or Mixed ANOVA of all stats_variables in one go
+
+    Note
+    ----
+    Sums of squares, degrees of freedom, effect sizes and Greenhouse-Geisser
+    corrections follow pingouin's rm_anova (two within factors) & mixed_anova
+    implementations so that our results tables are identical to those.
+    Returns None if the design is not balanced, see create_balanced_ANOVA_array.
+    """
+    # unpack
+    anova_design = cfg["anova_design"]
+
+    balanced_array = create_balanced_ANOVA_array(stats_df, stats_variables)
+    if balanced_array is None:
+        return None
+    ANOVA_array, groups = balanced_array
+    if anova_design == "RM ANOVA":
+        # complete-case: IDs must have data at all SC % bins of all groups
+        complete_IDs = ~np.isnan(ANOVA_array).any(axis=(0, 2, 3))
+        ANOVA_array = ANOVA_array[:, complete_IDs]
+        if ANOVA_array.shape[1] < 2:
+            return None
+        result_dfs = compute_balanced_RM_ANOVA(ANOVA_array)
+    elif anova_design == "Mixed ANOVA":
+        # collapse the group axis - each ID has data in exactly one group
+        has_data = ~np.isnan(ANOVA_array[0])  # IDs x SC % x groups
+        group_counts = has_data.any(axis=1).sum(axis=1)
+        if (group_counts != 1).any():
+            return None
+        group_idxs = has_data.any(axis=1).argmax(axis=1)
+        ANOVA_array = np.take_along_axis(
+            ANOVA_array, group_idxs[None, :, None, None], axis=3
+        )[:, :, :, 0]
+        complete_IDs = ~np.isnan(ANOVA_array).any(axis=(0, 2))
+        ANOVA_array = ANOVA_array[:, complete_IDs]
+        group_idxs = group_idxs[complete_IDs]
+        if len(np.unique(group_idxs)) < 2 or len(group_idxs) <= len(
+            np.unique(group_idxs)
+        ):
+            return None
+        result_dfs = compute_balanced_Mixed_ANOVA(ANOVA_array, group_idxs)
+    return dict(zip(stats_variables, result_dfs))
+
+
+def compute_balanced_RM_ANOVA(Y):
+    """Closed-form RM ANOVA with SC % (a) & group (b) as within factors
+
+    Y has shape variables x IDs x SC % x groups. Returns one results df per variable.
+    """
+    n_s, n_a, n_b = Y.shape[1:]
+    mu = Y.mean(axis=(1, 2, 3))[:, None]
+    # means
+    grp_s = Y.mean(axis=(2, 3))
+    grp_a = Y.mean(axis=(1, 3))
+    grp_b = Y.mean(axis=(1, 2))
+    grp_ab = Y.mean(axis=1).reshape(len(Y), -1)
+    grp_as = Y.mean(axis=3).reshape(len(Y), -1)
+    grp_bs = Y.mean(axis=2).reshape(len(Y), -1)
+    # sums of squares (same subtractive order as pingouin)
+    ss_tot = ((Y.reshape(len(Y), -1) - mu) ** 2).sum(axis=1)
+    ss_s = (n_a * n_b) * ((grp_s - mu) ** 2).sum(axis=1)
+    ss_a = (n_b * n_s) * ((grp_a - mu) ** 2).sum(axis=1)
+    ss_b = (n_a * n_s) * ((grp_b - mu) ** 2).sum(axis=1)
+    ss_ab = n_s * ((grp_ab - mu) ** 2).sum(axis=1) - ss_a - ss_b
+    ss_as = n_b * ((grp_as - mu) ** 2).sum(axis=1) - ss_s - ss_a
+    ss_bs = n_a * ((grp_bs - mu) ** 2).sum(axis=1) - ss_s - ss_b
+    ss_abs = ss_tot - ss_a - ss_b - ss_s - ss_ab - ss_as - ss_bs
+    # degrees of freedom
+    df_a = n_a - 1
+    df_b = n_b - 1
+    df_s = n_s - 1
+    df_ab = (n_a * n_b - 1) - df_a - df_b
+    df_as = (n_a * n_s - 1) - df_s - df_a
+    df_bs = (n_b * n_s - 1) - df_s - df_b
+    df_abs = (n_a * n_b * n_s - 1) - df_a - df_b - df_s - df_ab - df_as - df_bs
+    # mean squares, F & p
+    ms_a, ms_b, ms_ab = ss_a / df_a, ss_b / df_b, ss_ab / df_ab
+    f_a = ms_a / (ss_as / df_as)
+    f_b = ms_b / (ss_bs / df_bs)
+    f_ab = ms_ab / (ss_abs / df_abs)
+    p_a = stats.f(df_a, df_as).sf(f_a)
+    p_b = stats.f(df_b, df_bs).sf(f_b)
+    p_ab = stats.f(df_ab, df_abs).sf(f_ab)
+    # generalised eta-squared
+    ss_error = ss_s + ss_as + ss_bs + ss_abs
+    ef_a, ef_b, ef_ab = (
+        ss_a / (ss_a + ss_error),
+        ss_b / (ss_b + ss_error),
+        ss_ab / (ss_ab + ss_error),
+    )
+    # Greenhouse-Geisser epsilons & corrected p values
+    eps_a = greenhouse_geisser_epsilon(Y.mean(axis=3))
+    eps_b = greenhouse_geisser_epsilon(Y.mean(axis=2))
+    eps_ab = greenhouse_geisser_epsilon(two_way_epsilon_matrix(Y))
+    p_a_corr = stats.f(
+        np.maximum(df_a * eps_a, 1.0), np.maximum(df_as * eps_a, 1.0)
+    ).sf(f_a)
+    p_b_corr = stats.f(
+        np.maximum(df_b * eps_b, 1.0), np.maximum(df_bs * eps_b, 1.0)
+    ).sf(f_b)
+    p_ab_corr = stats.f(
+        np.maximum(df_ab * eps_ab, 1.0), np.maximum(df_abs * eps_ab, 1.0)
+    ).sf(f_ab)
+    result_dfs = []
+    for v in range(len(Y)):
+        result_dfs.append(
+            pd.DataFrame(
+                {
+                    "Source": [
+                        SC_PERCENTAGE_COL,
+                        GROUP_COL,
+                        SC_PERCENTAGE_COL + " * " + GROUP_COL,
+                    ],
+                    "SS": [ss_a[v], ss_b[v], ss_ab[v]],
+                    "ddof1": [df_a, df_b, df_ab],
+                    "ddof2": [df_as, df_bs, df_abs],
+                    "MS": [ms_a[v], ms_b[v], ms_ab[v]],
+                    "F": [f_a[v], f_b[v], f_ab[v]],
+                    "p-unc": [p_a[v], p_b[v], p_ab[v]],
+                    "p-GG-corr": [p_a_corr[v], p_b_corr[v], p_ab_corr[v]],
+                    "ng2": [ef_a[v], ef_b[v], ef_ab[v]],
+                    "eps": [eps_a[v], eps_b[v], eps_ab[v]],
+                }
+            )
+        )
+    return result_dfs
+
+
+def compute_balanced_Mixed_ANOVA(Y, group_idxs):
+    """Closed-form Mixed ANOVA with SC % (within) & group (between) as factors
+
+    Y has shape variables x IDs x SC %, group_idxs assigns each ID to its group.
+    Returns one results df per variable.
+    """
+    n_vars, n_s, n_b = Y.shape
+    group_list, group_sizes = np.unique(group_idxs, return_counts=True)
+    n_groups = len(group_list)
+    mu = Y.mean(axis=(1, 2))[:, None]
+    flat_Y = Y.reshape(n_vars, -1)
+    ss_total = ((flat_Y - mu) ** 2).sum(axis=1)
+    # within (SC %) - pingouin's one-way rm_anova
+    bin_means = Y.mean(axis=1)
+    ss_with = (((bin_means - mu) ** 2) * n_s).sum(axis=1)
+    ss_resall_with = ((Y - bin_means[:, None, :]) ** 2).sum(axis=(1, 2))
+    ss_resbetw_with = n_b * ((Y.mean(axis=2) - mu) ** 2).sum(axis=1)
+    ss_reswith_rm = ss_resall_with - ss_resbetw_with
+    df_with = n_b - 1
+    df_reswith_rm = df_with * (n_s - 1)
+    ms_with = ss_with / df_with
+    f_with_rm = ms_with / (ss_reswith_rm / df_reswith_rm)
+    eps = greenhouse_geisser_epsilon(Y)
+    spher, W_spher, p_spher = mauchly_sphericity(Y)
+    p_corr = stats.f(
+        np.maximum(df_with * eps, 1.0), np.maximum(df_reswith_rm * eps, 1.0)
+    ).sf(f_with_rm)
+    # between (group) - pingouin's one-way anova
+    group_means = np.stack(
+        [Y[:, group_idxs == g].mean(axis=(1, 2)) for g in group_list], axis=1
+    )
+    ss_betw = (((group_means - mu) ** 2) * (group_sizes * n_b)).sum(axis=1)
+    df_betw = n_groups - 1
+    ms_betw = ss_betw / df_betw
+    # residuals of group x SC % cells & interaction
+    ss_resall = np.zeros(n_vars)
+    for g in group_list:
+        this_Y = Y[:, group_idxs == g]
+        ss_resall += ((this_Y - this_Y.mean(axis=1, keepdims=True)) ** 2).sum(
+            axis=(1, 2)
+        )
+    ss_inter = ss_total - (ss_resall + ss_with + ss_betw)
+    ss_reswith = ss_reswith_rm - ss_inter
+    ss_resbetw = ss_total - (ss_with + ss_betw + ss_reswith + ss_inter)
+    df_resbetw = n_s - n_groups
+    df_reswith = df_with * df_resbetw
+    df_inter = df_with * df_betw
+    ms_inter = ss_inter / df_inter
+    ms_reswith = ss_reswith / df_reswith
+    f_betw = ms_betw / (ss_resbetw / df_resbetw)
+    f_with = ms_with / ms_reswith
+    f_inter = ms_inter / ms_reswith
+    p_betw = stats.f(df_betw, df_resbetw).sf(f_betw)
+    p_with = stats.f(df_with, df_reswith).sf(f_with)
+    p_inter = stats.f(df_inter, df_reswith).sf(f_inter)
+    # partial eta-squared
+    ef_betw = ss_betw / (ss_betw + ss_resbetw)
+    ef_with = ss_with / (ss_with + ss_reswith)
+    ef_inter = ss_inter / (ss_inter + ss_reswith)
+    result_dfs = []
+    for v in range(n_vars):
+        result = pd.DataFrame(
+            {
+                "Source": [GROUP_COL, SC_PERCENTAGE_COL, "Interaction"],
+                "SS": [ss_betw[v], ss_with[v], ss_inter[v]],
+                "DF1": [df_betw, df_with, df_inter],
+                "DF2": [df_resbetw, df_reswith, df_reswith],
+                "MS": [ms_betw[v], ms_with[v], ms_inter[v]],
+                "F": [f_betw[v], f_with[v], f_inter[v]],
+                "p-unc": [p_betw[v], p_with[v], p_inter[v]],
+                "np2": [ef_betw[v], ef_with[v], ef_inter[v]],
+                "eps": [np.nan, eps[v], np.nan],
+            }
+        )
+        # as pingouin, only add GG correction & Mauchly's test if sphericity is
+        # violated (correction="auto")
+        if not spher[v]:
+            result.insert(7, "p-GG-corr", [np.nan, p_corr[v], np.nan])
+            result["sphericity"] = pd.Series([np.nan, False, np.nan], dtype=object)
+            result["W-spher"] = [np.nan, W_spher[v], np.nan]
+            result["p-spher"] = [np.nan, p_spher[v], np.nan]
+        result_dfs.append(result)
+    return result_dfs
+
+
+def two_way_epsilon_matrix(Y):
+    """Prepare the IDs x (SC % x groups) data of each variable to compute the
+    interaction's epsilon the same way pingouin does
+
+    Note
+    ----
+    Like pingouin: if the smaller factor has 2 levels we use the difference between
+    those, if it has 1 level, we drop it & otherwise we use all columns.
+    """
+    n_vars, n_s, n_a, n_b = Y.shape
+    if n_a < n_b:  # pingouin sorts the factors so that the first has fewer levels
+        Y = np.swapaxes(Y, 2, 3)
+        n_a, n_b = n_b, n_a
+    if n_b == 1:
+        return Y[:, :, :, 0]
+    elif n_b == 2:
+        return Y[:, :, :, 1] - Y[:, :, :, 0]
+    else:
+        return Y.reshape(n_vars, n_s, n_a * n_b)
+
+
+def covariance_matrices(X):
+    """Compute covariance matrices of X (variables x IDs x columns) per variable"""
+    X_centred = X - X.mean(axis=1, keepdims=True)
+    return np.einsum("vsi,vsj->vij", X_centred, X_centred) / (X.shape[1] - 1)
+
+
+def greenhouse_geisser_epsilon(X):
+    """Greenhouse-Geisser epsilon of X (variables x IDs x columns) per variable
+
+    Note
+    ----
+    Follows the sums of squares method used by pingouin (see real-statistics.com).
+    """
+    n_vars, _, k = X.shape
+    if k <= 2:  # epsilon is always 1 with only two repeated measures
+        return np.ones(n_vars)
+    S = covariance_matrices(X)
+    mean_var = np.diagonal(S, axis1=1, axis2=2).mean(axis=1)
+    S_mean = S.mean(axis=(1, 2))
+    ss_mat = (S**2).sum(axis=(1, 2))
+    ss_rows = (S.mean(axis=2) ** 2).sum(axis=1)
+    num = (k * (mean_var - S_mean)) ** 2
+    den = (k - 1) * (ss_mat - 2 * k * ss_rows + k**2 * S_mean**2)
+    return np.minimum(num / den, 1)
+
+
+def mauchly_sphericity(X):
+    """Mauchly's test of sphericity of X (variables x IDs x columns) per variable
+
+    Note
+    ----
+    Uses the same eigenvalue approach (with tiny eigenvalues removed) as pingouin.
+    Returns boolean sphericity, W & p values.
+    """
+    n_vars, n, k = X.shape
+    d = k - 1
+    if k <= 2:  # sphericity is always met with only two repeated measures
+        return np.ones(n_vars, dtype=bool), np.full(n_vars, np.nan), np.ones(n_vars)
+    ddof = (d * (d + 1)) / 2 - 1
+    ddof = 1 if ddof == 0 else ddof
+    S = covariance_matrices(X)
+    S_pop = (
+        S
+        - S.mean(axis=1)[:, :, None]
+        - S.mean(axis=2)[:, None, :]
+        + S.mean(axis=(1, 2))[:, None, None]
+    )
+    eig = np.linalg.eigvalsh(S_pop)[:, 1:]
+    valid_eig = eig > 0.001  # additional check to remove very low eigenvalues
+    W = (
+        np.prod(np.where(valid_eig, eig, 1.0), axis=1)
+        / (np.where(valid_eig, eig, 0.0).sum(axis=1) / d) ** d
+    )
+    # chi-square and p-value (adapted from the ezANOVA R package)
+    f = 1 - (2 * d**2 + d + 2) / (6 * d * (n - 1))
+    w2 = (
+        (d + 2)
+        * (d - 1)
+        * (d - 2)
+        * (2 * d**3 + 6 * d**2 + 3 * k + 2)
+        / (288 * ((n - 1) * d * f) ** 2)
+    )
+    chi_sq = -(n - 1) * f * np.log(W)
+    p1 = stats.chi2.sf(chi_sq, ddof)
+    p2 = stats.chi2.sf(chi_sq, ddof + 4)
+    p_spher = p1 + w2 * (p2 - p1)
+    return p_spher > 0.05, W, p_spher
+
+
 # .............................  multiple comparison test  .............................
 def multcompare_SC_Percentages(stats_df, stats_var, folderinfo, cfg):
     """Perform multiple comparison test if the ANOVA's interaction was significant.
@@ -751,10 +1096,10 @@ def plot_multcomp_results(
         stats_plots_suplabel_size,
         sampling_rate,
     )
-    save_figures(f, results_dir, figure_file_string)
+    save_figures(f, results_dir, figure_file_string, cfg)
     # add figure to plot panel figures list
     if dont_show_plots is False:  # -> show plot panel
-        plot_panel_instance.figures.append(f)
+        plot_panel_instance.add_figure(f)
 
 
 def extract_multcomp_significance_clusters(multcomp_df, contrast, stats_threshold):
@@ -6,6 +6,7 @@ from autogaita.group.group_utils import (
     ylabel_velocity_and_acceleration,
 )
 from autogaita.universal3D.universal3D_utils import extract_feature_column
+from autogaita.resources.utils import render_plot_jobs
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -26,11 +27,12 @@ def plot_results(g_avg_dfs, g_std_dfs, folderinfo, cfg, plot_panel_instance):
     # prep
     plot_horizontal_coord = False
 
+    # collect independent plot jobs - see render_plot_jobs
+    plot_jobs = []
+    plot_args = (g_avg_dfs, g_std_dfs, folderinfo)
+
     # ........................1 - y coords over average SC..............................
-    plot_joint_y_by_average_SC(
-        g_avg_dfs, g_std_dfs, folderinfo, cfg, plot_panel_instance
-    )
-    plt.close("all")
+    plot_jobs.append((plot_joint_y_by_average_SC, plot_args))
 
     # .......................2 - x coords over average SC (optional)....................
     if tracking_software in ["DLC", "SLEAP"]:
@@ -40,30 +42,21 @@ def plot_results(g_avg_dfs, g_std_dfs, folderinfo, cfg, plot_panel_instance):
         if cfg["analyse_average_y"] is True:
             plot_horizontal_coord = True
     if plot_horizontal_coord:
-        plot_joint_x_by_average_SC(
-            g_avg_dfs, g_std_dfs, folderinfo, cfg, plot_panel_instance
-        )
-        plt.close("all")
+        plot_jobs.append((plot_joint_x_by_average_SC, plot_args))
 
     # ........................3 - angles over average SC................................
     if angles["name"]:
-        plot_angles_by_average_SC(
-            g_avg_dfs, g_std_dfs, folderinfo, cfg, plot_panel_instance
-        )
-        plt.close("all")
+        plot_jobs.append((plot_angles_by_average_SC, plot_args))
 
     # .................4 - average x velocities over SC percentage......................
-    plot_x_velocities_by_average_SC(
-        g_avg_dfs, g_std_dfs, folderinfo, cfg, plot_panel_instance
-    )
-    plt.close("all")
+    plot_jobs.append((plot_x_velocities_by_average_SC, plot_args))
 
     # ..............5 - average angular velocities over SC percentage...................
     if angles["name"]:
-        plot_angular_velocities_by_average_SC(
-            g_avg_dfs, g_std_dfs, folderinfo, cfg, plot_panel_instance
-        )
-        plt.close("all")
+        plot_jobs.append((plot_angular_velocities_by_average_SC, plot_args))
+
+    # run jobs (in parallel if cfg["plot_workers"] > 1)
+    figure_paths = render_plot_jobs(plot_jobs, cfg, plot_panel_instance)
 
     # ........................optional - 6 - build plot panel..........................
     if cfg["dont_show_plots"] is True:
@@ -73,6 +66,8 @@ def plot_results(g_avg_dfs, g_std_dfs, folderinfo, cfg, plot_panel_instance):
         plot_panel_instance.destroy_plot_panel_loading_screen()
         plot_panel_instance.build_plot_panel()
 
+    return figure_paths
+
 
 def plot_joint_y_by_average_SC(
     g_avg_dfs, g_std_dfs, folderinfo, cfg, plot_panel_instance
@@ -132,11 +127,11 @@ def plot_joint_y_by_average_SC(
             )
             ax.set_ylabel("Z")
             figure_file_string = " - Joint Z-coord.s over average step cycle"
-        save_figures(f, results_dir, group_name + figure_file_string)
+        save_figures(f, results_dir, group_name + figure_file_string, cfg)
 
         # add figure to plot panel figures list
         if dont_show_plots is False:  # -> show plot panel
-            plot_panel_instance.figures.append(f)
+            plot_panel_instance.add_figure(f)
 
     # B - lines = groups & figures = joints
     for j, joint in enumerate(joints):
@@ -181,11 +176,11 @@ def plot_joint_y_by_average_SC(
             ax.set_title(title_leg + " " + joint + " Z over average step cycle")
             ax.set_ylabel("Z")
             figure_file_string = "- Z-coord.s over average step cycle"
-        save_figures(f, results_dir, joint + figure_file_string)
+        save_figures(f, results_dir, joint + figure_file_string, cfg)
 
         # add figure to plot panel figures list
         if dont_show_plots is False:  # -> show plot panel
-            plot_panel_instance.figures.append(f)
+            plot_panel_instance.add_figure(f)
 
 
 def plot_joint_x_by_average_SC(
@@ -246,11 +241,11 @@ def plot_joint_x_by_average_SC(
             )
             ax.set_ylabel("Y")
             figure_file_string = " - Joint Y-coord.s over average step cycle"
-        save_figures(f, results_dir, group_name + figure_file_string)
+        save_figures(f, results_dir, group_name + figure_file_string, cfg)
 
         # add figure to plot panel figures list
         if dont_show_plots is False:  # -> show plot panel
-            plot_panel_instance.figures.append(f)
+            plot_panel_instance.add_figure(f)
 
     # B - lines = groups & figures = joints
     for j, joint in enumerate(joints):
@@ -295,11 +290,11 @@ def plot_joint_x_by_average_SC(
             ax.set_title(title_leg + " " + joint + " Y over average step cycle")
             ax.set_ylabel("Y")
             figure_file_string = "- Y-coord.s over average step cycle"
-        save_figures(f, results_dir, joint + figure_file_string)
+        save_figures(f, results_dir, joint + figure_file_string, cfg)
 
         # add figure to plot panel figures list
         if dont_show_plots is False:  # -> show plot panel
-            plot_panel_instance.figures.append(f)
+            plot_panel_instance.add_figure(f)
 
 
 def plot_angles_by_average_SC(
@@ -353,11 +348,11 @@ def plot_angles_by_average_SC(
                 group_name + " - " + which_leg + " joint angles over average step cycle"
             )
         figure_file_string = " - Joint angles over average step cycle"
-        save_figures(f, results_dir, group_name + figure_file_string)
+        save_figures(f, results_dir, group_name + figure_file_string, cfg)
 
         # add figure to plot panel figures list
         if dont_show_plots is False:  # -> show plot panel
-            plot_panel_instance.figures.append(f)
+            plot_panel_instance.add_figure(f)
 
     # B - lines = groups & figures = angles
     for a, angle in enumerate(angles["name"]):
@@ -394,11 +389,11 @@ def plot_angles_by_average_SC(
                 title_leg = which_leg
             ax.set_title(title_leg + " " + angle + " angle over average step cycle")
         figure_file_string = " - Angle over average step cycle"
-        save_figures(f, results_dir, angle + figure_file_string)
+        save_figures(f, results_dir, angle + figure_file_string, cfg)
 
         # add figure to plot panel figures list
         if dont_show_plots is False:  # -> show plot panel
-            plot_panel_instance.figures.append(f)
+            plot_panel_instance.add_figure(f)
 
 
 def plot_x_velocities_by_average_SC(
@@ -463,11 +458,11 @@ def plot_x_velocities_by_average_SC(
         # note unit-input-argument is depending on conditional statements above
         ax.set_ylabel(ylabel_velocity_and_acceleration("Velocity", unit, sampling_rate))
         figure_file_string = " - Joint velocities over average step cycle"
-        save_figures(f, results_dir, group_name + figure_file_string)
+        save_figures(f, results_dir, group_name + figure_file_string, cfg)
 
         # add figure to plot panel figures list
         if dont_show_plots is False:  # -> show plot panel
-            plot_panel_instance.figures.append(f)
+            plot_panel_instance.add_figure(f)
 
     # B - lines = groups & figures = joints
     for j, joint in enumerate(joints):
@@ -513,11 +508,11 @@ def plot_x_velocities_by_average_SC(
         # note unit-input-argument is depending on conditional statements above
         ax.set_ylabel(ylabel_velocity_and_acceleration("Velocity", unit, sampling_rate))
         figure_file_string = "- Velocities over average step cycle"
-        save_figures(f, results_dir, joint + figure_file_string)
+        save_figures(f, results_dir, joint + figure_file_string, cfg)
 
         # add figure to plot panel figures list
         if dont_show_plots is False:  # -> show plot panel
-            plot_panel_instance.figures.append(f)
+            plot_panel_instance.add_figure(f)
 
 
 def plot_angular_velocities_by_average_SC(
@@ -576,11 +571,11 @@ def plot_angular_velocities_by_average_SC(
                 + " angular velocities over average step cycle"
             )
         figure_file_string = " - Angular velocities over average step cycle"
-        save_figures(f, results_dir, group_name + figure_file_string)
+        save_figures(f, results_dir, group_name + figure_file_string, cfg)
 
         # add figure to plot panel figures list
         if dont_show_plots is False:  # -> show plot panel
-            plot_panel_instance.figures.append(f)
+            plot_panel_instance.add_figure(f)
 
     # B - lines = groups & figures = joints
     for a, angle in enumerate(angles["name"]):
@@ -624,8 +619,8 @@ def plot_angular_velocities_by_average_SC(
                 + " - Angular velocities over average step cycle"
             )
         figure_file_string = " - Angular Velocities over average step cycle"
-        save_figures(f, results_dir, angle + figure_file_string)
+        save_figures(f, results_dir, angle + figure_file_string, cfg)
 
         # add figure to plot panel figures list
         if dont_show_plots is False:  # -> show plot panel
-            plot_panel_instance.figures.append(f)
+            plot_panel_instance.add_figure(f)
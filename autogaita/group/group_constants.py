@@ -49,6 +49,25 @@ MULTCOMP_EXCEL_COLS = [
     "sig. level",
 ]
 
+# PCA
+PCA_SOLVERS = ["auto", "randomized", "incremental"]
+PCA_INCREMENTAL_BATCH_SIZE = 500  # minimum number of IDs per IncrementalPCA batch
+PCA_RANDOM_STATE = 0  # so that randomised PCA solutions are reproducible
+
+# PCA 3D video
+PCA_VIDEO_FRAME_NUMBER = 360  # one frame per degree of a full rotation
+PCA_VIDEO_RESOLUTION = "1280x960"  # width x height in pixels
+PCA_VIDEO_FPS = 30
+PCA_VIDEO_DPI = 100  # independent of the global figure.dpi of our plots
+PCA_VIDEO_FRAMES_PER_JOB = 30  # frames a worker renders per job
+PCA_VIDEO_ELEVATION = 10
+PCA_VIDEO_ERROR_CHARACTERS = 1000  # of ffmpeg's error output we write to Issues.txt
+
+# PCA PERMANOVA
+PCA_PERMANOVA_PERMUTATION_NUMBER = 10000
+PCA_PERMANOVA_BATCH_SIZE = 500  # permutations whose pseudo-F is computed at once
+PCA_PERMANOVA_SEED = 0  # default of cfg["PCA_PERMANOVA_seed"] - reproducible p values
+
 # PLOTS
 PCA_BARPLOT_BARCOLOR = "#c74767"  # deep rose
 PCA_BARPLOT_LINECOLOR = "#005f6a"  # petrol
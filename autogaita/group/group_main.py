@@ -11,11 +11,20 @@ from autogaita.group.group_4_stats import (
     create_stats_df,
     cluster_extent_test,
     anova_design_sanity_check,
+    run_all_ANOVAs,
     ANOVA_main,
 )
 from autogaita.group.group_5_plots import plot_results
 from autogaita.group.group_utils import print_start, tukeys_only_info_message
-from autogaita.resources.utils import print_finish, PlotPanel
+from autogaita.resources.utils import (
+    print_finish,
+    PlotPanel,
+    collect_issues,
+)
+from autogaita.resources.profiling import (
+    profile_stages,
+    pipeline_stage,
+)
 import matplotlib
 import matplotlib.pyplot as plt
 
@@ -30,6 +39,7 @@ from autogaita.gui.gui_constants import GROUP_FG_COLOR, GROUP_HOVER_COLOR
 
 
 # .................................  main program  .....................................
+@profile_stages
 def group(folderinfo, cfg):
     """Runs the main program for a group-level analysis comparing 2-5 groups
 
@@ -44,98 +54,113 @@ def group(folderinfo, cfg):
     7) perform the RM-/Mixed-ANOVA
     8) plots
     """
-    # .............. initiate plot panel class and build loading screen ................
-    # create class instance independently of "dont_show_plots" to not break the code
-    plot_panel_instance = PlotPanel(GROUP_FG_COLOR, GROUP_HOVER_COLOR)
-
-    if cfg["dont_show_plots"] is True:
-        pass  # going on without building the loading screen
-
-    elif cfg["dont_show_plots"] is False:  # -> show plot panel
-        # build loading screen
-        plot_panel_instance.build_plot_panel_loading_screen()
-
-    # ................................  preparation  ...................................
-    # => either creates and sanity-checks folderinfo & cfg or loads it from a previous
-    #    run's config.json file (if load_dir)
-    # => there is an IMPORTANT NOTE about this in some_prep!
-    folderinfo, cfg = some_prep(folderinfo, cfg)
-
-    # ..............................  print start  ....................................
-    # => print start after some_prep since we do some stuff to cfg["PCA_bins"] there
-    print_start(folderinfo, cfg)
-
-    # .....................  import & transform (a) or load (b)  .......................
-
-    # approach a - import & transform (i.e. no previous results to load from)
-    if not folderinfo["load_dir"]:
-        # "dfs" are x-/Y-standardised automatically if 1st-level standardised x/Y
-        # => if this is the case, it translates to all average & std dfs as well
-        dfs, raw_dfs, cfg = import_data(folderinfo, cfg)
-        avg_dfs, std_dfs = avg_and_std(dfs, folderinfo, cfg)
-        g_avg_dfs, g_std_dfs = grand_avg_and_std(avg_dfs, folderinfo, cfg)
-
-    # approach b - load previous run's dfs (avg, g_avg & g_std_dfs)
-    else:
-        try:
-            # creating cfg["bin_num"] here too (since done in import_data in (a)!)
-            avg_dfs, g_avg_dfs, g_std_dfs, cfg = load_previous_runs_dataframes(
-                folderinfo, cfg
-            )
-        except (FileNotFoundError, ValueError):
-            return
-
-    # ...................................  PCA  ........................................
-    if cfg["PCA_variables"]:  # empty lists are falsey!
-        PCA_main(avg_dfs, folderinfo, cfg, plot_panel_instance)
-    plt.close("all")  # OK since all figures passed to save-funcs & PlotPanel
-
-    # ..............................  prepare statistics  ..............................
-    stats_df = create_stats_df(avg_dfs, folderinfo, cfg)
-
-    # ......................  cluster-extent permutation test  .........................
-    if cfg["stats_variables"]:  # empty lists are falsey!
-        if cfg["do_permtest"]:
-            for stats_var in cfg["stats_variables"]:
-                cluster_extent_test(
-                    stats_df,
-                    g_avg_dfs,
-                    g_std_dfs,
-                    stats_var,
-                    folderinfo,
-                    cfg,
-                    plot_panel_instance,
-                )
-        plt.close("all")
-
-        # ..................................  ANOVA  ...................................
-        if cfg["do_anova"]:  # indentation since we check for stats-vars here too!
-            if anova_design_sanity_check(stats_df, folderinfo, cfg) is not True:
-                just_do_tukeys = True
-                tukeys_only_info_message(folderinfo)
-            else:
-                just_do_tukeys = False
-            # this function is called ANOVA_main even though we might just run Tukeys
-            # with it and not exactly an ANOVA as well
-            # => see conditions in sanity check setting just_do_tukeys
-            for stats_var in cfg["stats_variables"]:
-                ANOVA_main(
-                    stats_df,
-                    g_avg_dfs,
-                    g_std_dfs,
-                    stats_var,
-                    just_do_tukeys,
-                    folderinfo,
-                    cfg,
-                    plot_panel_instance,
-                )
-        plt.close("all")
-
-    # ..................................  plots  .......................................
-    plot_results(g_avg_dfs, g_std_dfs, folderinfo, cfg, plot_panel_instance)
-
-    # ..............................  print finish  ....................................
-    print_finish(folderinfo)
+    # issues are collected & written to Issues.txt once we finished (or failed)
+    with collect_issues(folderinfo):
+        # ............ initiate plot panel class and build loading screen ..............
+        # create class instance independently of "dont_show_plots" to not break the code
+        plot_panel_instance = PlotPanel(GROUP_FG_COLOR, GROUP_HOVER_COLOR)
+
+        if cfg["dont_show_plots"] is True:
+            pass  # going on without building the loading screen
+
+        elif cfg["dont_show_plots"] is False:  # -> show plot panel
+            # build loading screen
+            plot_panel_instance.build_plot_panel_loading_screen()
+
+        # ..............................  preparation  .................................
+        # => either creates and sanity-checks folderinfo & cfg or loads it from a
+        #    previous run's config.json file (if load_dir)
+        # => there is an IMPORTANT NOTE about this in some_prep!
+        with pipeline_stage("preparation"):
+            folderinfo, cfg = some_prep(folderinfo, cfg)
+
+        # .............................  print start  ..................................
+        # => print start after some_prep since we do some stuff to cfg["PCA_bins"] there
+        print_start(folderinfo, cfg)
+
+        # ...................  import & transform (a) or load (b)  .....................
+
+        # approach a - import & transform (i.e. no previous results to load from)
+        if not folderinfo["load_dir"]:
+            # "dfs" are x-/Y-standardised automatically if 1st-level standardised x/Y
+            # => if this is the case, it translates to all average & std dfs as well
+            with pipeline_stage("import & transform"):
+                dfs, raw_dfs, cfg = import_data(folderinfo, cfg)
+                avg_dfs, std_dfs = avg_and_std(dfs, folderinfo, cfg)
+                g_avg_dfs, g_std_dfs = grand_avg_and_std(avg_dfs, folderinfo, cfg)
+
+        # approach b - load previous run's dfs (avg, g_avg & g_std_dfs)
+        else:
+            try:
+                # creating cfg["bin_num"] here too (since done in import_data in (a)!)
+                with pipeline_stage("load previous results"):
+                    avg_dfs, g_avg_dfs, g_std_dfs, cfg = load_previous_runs_dataframes(
+                        folderinfo, cfg
+                    )
+            except (FileNotFoundError, ValueError):
+                return
+
+        # .................................  PCA  ......................................
+        if cfg["PCA_variables"]:  # empty lists are falsey!
+            with pipeline_stage("PCA"):
+                PCA_main(avg_dfs, folderinfo, cfg, plot_panel_instance)
+        plt.close("all")  # OK since all figures passed to save-funcs & PlotPanel
+
+        # ............................  prepare statistics  ............................
+        with pipeline_stage("prepare statistics"):
+            stats_df = create_stats_df(avg_dfs, folderinfo, cfg)
+
+        # ....................  cluster-extent permutation test  .......................
+        if cfg["stats_variables"]:  # empty lists are falsey!
+            if cfg["do_permtest"]:
+                for stats_var in cfg["stats_variables"]:
+                    with pipeline_stage("cluster-extent permutation test", stats_var):
+                        cluster_extent_test(
+                            stats_df,
+                            g_avg_dfs,
+                            g_std_dfs,
+                            stats_var,
+                            folderinfo,
+                            cfg,
+                            plot_panel_instance,
+                        )
+            plt.close("all")
+
+            # ................................  ANOVA  .................................
+            if cfg["do_anova"]:  # indentation since we check for stats-vars here too!
+                # run the ANOVAs of all stats variables at once (closed-form if
+                # balanced)
+                if anova_design_sanity_check(stats_df, folderinfo, cfg) is not True:
+                    ANOVA_results = dict.fromkeys(cfg["stats_variables"])
+                    tukeys_only_info_message(folderinfo)
+                else:
+                    with pipeline_stage("ANOVA"):
+                        ANOVA_results = run_all_ANOVAs(
+                            stats_df, cfg["stats_variables"], cfg
+                        )
+                # this function is called ANOVA_main even though we might just run
+                # Tukeys with it and not exactly an ANOVA as well
+                # => see conditions in sanity check setting ANOVA_results to None
+                for stats_var in cfg["stats_variables"]:
+                    with pipeline_stage("multiple comparison tests", stats_var):
+                        ANOVA_main(
+                            stats_df,
+                            g_avg_dfs,
+                            g_std_dfs,
+                            stats_var,
+                            ANOVA_results[stats_var],
+                            folderinfo,
+                            cfg,
+                            plot_panel_instance,
+                        )
+            plt.close("all")
+
+        # ................................  plots  .....................................
+        with pipeline_stage("plots"):
+            plot_results(g_avg_dfs, g_std_dfs, folderinfo, cfg, plot_panel_instance)
+
+        # ............................  print finish  ..................................
+        print_finish(folderinfo)
 
 
 # ..................................  if we hit run  ...................................
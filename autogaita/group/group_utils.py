@@ -1,5 +1,5 @@
 import os
-from autogaita.resources.utils import write_issues_to_textfile
+from autogaita.resources.utils import write_issues_to_textfile, save_figure_files
 from autogaita.resources.constants import INFO_TEXT_WIDTH
 from autogaita.group.group_constants import (
     BOX_COLOR,
@@ -135,20 +135,10 @@ def print_start(folderinfo, cfg):
 
 
 # %% ......................  plotting helper functions  ...........................
-def save_figures(figure, results_dir, figure_file_string):
-    """Save figures as pngs to results_dir and as svgs to separate subfolders"""
-    # pngs to results_dir
-    figure.savefig(
-        os.path.join(results_dir, figure_file_string + ".png"),
-        bbox_inches="tight",
-    )
-    # svgs to subfolders
-    svg_dir = os.path.join(results_dir, "SVG Figures")
-    if not os.path.exists(svg_dir):
-        os.makedirs(svg_dir)
-    figure.savefig(
-        os.path.join(svg_dir, figure_file_string + ".svg"), bbox_inches="tight"
-    )
+def save_figures(figure, results_dir, figure_file_string, cfg):
+    """Save figures according to the export profile (by default pngs to results_dir
+    and svgs to a separate subfolder)"""
+    save_figure_files(figure, results_dir, figure_file_string, cfg)
 
 
 def ytickconvert_mm_to_cm(axis):
@@ -1,8 +1,19 @@
 import os
 import tkinter as tk
 from threading import Thread
-from autogaita.common2D.common2D_utils import run_singlerun_in_multirun, extract_info
+from autogaita.common2D.common2D_utils import (
+    run_singlerun_in_multirun,
+    extract_info,
+    write_multirun_stage_timings,
+    write_multirun_watchdog_summary,
+    write_multirun_detected_annotation_table,
+    write_multirun_cycle_validation,
+)
+from autogaita.common2D.common2D_1_preparation import fan_out_multi_animal_recordings
 from autogaita.resources.utils import try_to_run_gaita
+from autogaita.resources.progress import ProgressTracker
+from autogaita.gui.gui_utils import ProgressWindow
+from autogaita.gui.gui_constants import DLC_FG_COLOR, SLEAP_FG_COLOR
 
 # %%..........  functions preparing and calling runs of 2D autogaita  ..................
 
@@ -19,6 +30,10 @@ def runanalysis(tracking_software, analysis, this_runs_results, this_runs_cfg):
             target=analyse_multi_run,
             args=(tracking_software, this_runs_results, this_runs_cfg),
         )
+    if tracking_software == "DLC":
+        ProgressWindow(run_thread, DLC_FG_COLOR)
+    elif tracking_software == "SLEAP":
+        ProgressWindow(run_thread, SLEAP_FG_COLOR)
     run_thread.start()
 
 
@@ -65,11 +80,25 @@ def analyse_multi_run(tracking_software, this_runs_results, this_runs_cfg):
     # stop execution
     if info is None:
         return
+    # multi-animal files are analysed per animal if cfg says so
+    info = fan_out_multi_animal_recordings(
+        tracking_software, info, folderinfo, this_runs_cfg
+    )
     # if there was no error, loop through individual runs
+    run_progress = ProgressTracker("Runs", len(info["name"]))
+    terminated_runs = []
     for idx in range(len(info["name"])):
-        run_singlerun_in_multirun(
-            tracking_software, idx, info, folderinfo, this_runs_cfg
+        terminated_runs.append(
+            run_singlerun_in_multirun(
+                tracking_software, idx, info, folderinfo, this_runs_cfg
+            )
         )
+        run_progress.advance(detail=info["name"][idx])
+    run_progress.finish()
+    write_multirun_watchdog_summary(terminated_runs, folderinfo, this_runs_cfg)
+    write_multirun_stage_timings(info, folderinfo, this_runs_cfg)
+    write_multirun_detected_annotation_table(info, folderinfo, this_runs_cfg)
+    write_multirun_cycle_validation(info, folderinfo, this_runs_cfg)
 
 
 def prepare_folderinfo(this_runs_results):
@@ -28,7 +28,11 @@ from autogaita.gui.gui_constants import (
     AUTOGAITA_FOLDER_PATH,
     get_widget_cfg_dict,  # function!
 )
-from autogaita.group.group_constants import NORM_SHEET_NAME, AVG_GROUP_SHEET_NAME
+from autogaita.group.group_constants import (
+    NORM_SHEET_NAME,
+    AVG_GROUP_SHEET_NAME,
+    PCA_SOLVERS,
+)
 
 # these colors are GUI-specific - add to common widget cfg
 FG_COLOR = GROUP_FG_COLOR
@@ -67,6 +71,7 @@ TK_STR_VARS = [
     "PCA_n_components",
     "PCA_custom_scatter_PCs",
     "PCA_bins",
+    "PCA_solver",
     "which_leg",
     "results_dir",
     "load_dir",
@@ -533,12 +538,29 @@ def advanced_cfgwindow(mainwindow):
     )
     save_PCA_video_checkbox.grid(row=10, column=0)
 
+    # PCA solver
+    PCA_solver_string = "PCA solver (randomized/incremental for many features/IDs)"
+    PCA_solver_label = ctk.CTkLabel(
+        cfgwindow, text=PCA_solver_string, font=(TEXT_FONT_NAME, TEXT_FONT_SIZE)
+    )
+    PCA_solver_label.grid(row=11, column=0)
+    PCA_solver_optionmenu = ctk.CTkOptionMenu(
+        cfgwindow,
+        values=PCA_SOLVERS,
+        variable=cfg["PCA_solver"],
+        fg_color=FG_COLOR,
+        button_color=FG_COLOR,
+        button_hover_color=HOVER_COLOR,
+        font=(TEXT_FONT_NAME, TEXT_FONT_SIZE),
+    )
+    PCA_solver_optionmenu.grid(row=12, column=0, sticky="n")
+
     # color palette
     color_palette_string = "Choose figures' color palette"
     color_palette_label = ctk.CTkLabel(
         cfgwindow, text=color_palette_string, font=(TEXT_FONT_NAME, TEXT_FONT_SIZE)
     )
-    color_palette_label.grid(row=11, column=0)
+    color_palette_label.grid(row=13, column=0)
     color_palette_entry = ctk.CTkOptionMenu(
         cfgwindow,
         values=COLOR_PALETTES_LIST,
@@ -548,7 +570,7 @@ def advanced_cfgwindow(mainwindow):
         button_hover_color=HOVER_COLOR,
         font=(TEXT_FONT_NAME, TEXT_FONT_SIZE),
     )
-    color_palette_entry.grid(row=12, column=0, sticky="n")
+    color_palette_entry.grid(row=14, column=0, sticky="n")
 
     # plot SE
     plot_SE_box = gaita_widgets.checkbox(
@@ -557,7 +579,7 @@ def advanced_cfgwindow(mainwindow):
         cfg["plot_SE"],
         WIDGET_CFG,
     )
-    plot_SE_box.grid(row=13, column=0)
+    plot_SE_box.grid(row=15, column=0)
 
     # legend outside
     legend_outside_checkbox = gaita_widgets.checkbox(
@@ -566,7 +588,7 @@ def advanced_cfgwindow(mainwindow):
         cfg["legend_outside"],
         WIDGET_CFG,
     )
-    legend_outside_checkbox.grid(row=14, column=0)
+    legend_outside_checkbox.grid(row=16, column=0)
 
     # dont show plots
     dont_show_plots_checkbox = gaita_widgets.checkbox(
@@ -575,7 +597,7 @@ def advanced_cfgwindow(mainwindow):
         cfg["dont_show_plots"],
         WIDGET_CFG,
     )
-    dont_show_plots_checkbox.grid(row=15, column=0)
+    dont_show_plots_checkbox.grid(row=17, column=0)
 
     # which leg of human data to analyse
     which_leg_string = (
@@ -584,7 +606,7 @@ def advanced_cfgwindow(mainwindow):
     which_leg_label = ctk.CTkLabel(
         cfgwindow, text=which_leg_string, font=(TEXT_FONT_NAME, TEXT_FONT_SIZE)
     )
-    which_leg_label.grid(row=16, column=0)
+    which_leg_label.grid(row=18, column=0)
     which_leg_options = ["left", "right"]  # !!! NU - "both" functionality
     which_leg_optionmenu = ctk.CTkOptionMenu(
         cfgwindow,
@@ -595,7 +617,7 @@ def advanced_cfgwindow(mainwindow):
         button_hover_color=HOVER_COLOR,
         font=(TEXT_FONT_NAME, TEXT_FONT_SIZE),
     )
-    which_leg_optionmenu.grid(row=17, column=0, sticky="n")
+    which_leg_optionmenu.grid(row=19, column=0, sticky="n")
 
     # done button
     adv_cfg_done_button = ctk.CTkButton(
@@ -606,7 +628,7 @@ def advanced_cfgwindow(mainwindow):
         font=(HEADER_FONT_NAME, HEADER_FONT_SIZE),
         command=lambda: cfgwindow.destroy(),
     )
-    adv_cfg_done_button.grid(row=18, column=0, sticky="nsew", pady=20, padx=80)
+    adv_cfg_done_button.grid(row=20, column=0, sticky="nsew", pady=20, padx=80)
 
     # maximise widgets to fit fullscreen
     maximise_widgets(cfgwindow)
@@ -1030,6 +1052,7 @@ def run_analysis(folderinfo, cfg):
     run_thread = Thread(
         target=autogaita.group, args=(this_runs_folderinfo, this_runs_cfg)
     )
+    gui_utils.ProgressWindow(run_thread, FG_COLOR)
     run_thread.start()
 
 
@@ -17,6 +17,7 @@ TEXT_FONT_SIZE = 20
 ADV_CFG_TEXT_FONT_SIZE = TEXT_FONT_SIZE - 4
 CLOSE_COLOR = "#840000"  # dark red
 CLOSE_HOVER_COLOR = "#650021"  # maroon
+PROGRESS_WINDOW_UPDATE_MS = 250  # how often progress windows show the latest events
 
 # For how the look like refer to https://r02b.github.io/seaborn_palettes/
 COLOR_PALETTES_LIST = [
@@ -4,6 +4,12 @@ from PIL import Image
 import tkinter as tk
 from tkinter.font import Font, nametofont
 from customtkinter import CTkImage
+import customtkinter as ctk
+from autogaita.resources.progress import (
+    subscribe_to_progress,
+    unsubscribe_from_progress,
+)
+from autogaita.gui.gui_constants import PROGRESS_WINDOW_UPDATE_MS
 
 
 # ...............................  general gui stuff  ..................................
@@ -44,6 +50,72 @@ def maximise_widgets(window):
         window.grid_columnconfigure(c, weight=1)
 
 
+# ...............................  progress window  ....................................
+class ProgressWindow:
+    """Shows the progress of an analysis that runs in a thread
+
+    Note
+    ----
+    Build this before starting run_thread so we receive all of its progress events.
+    Events are emitted from run_thread, so we only store the latest ones there & the
+    window is updated from tkinter's main loop (via after). It closes itself once
+    run_thread is done.
+    """
+
+    def __init__(self, run_thread, fg_color):
+        self.run_thread = run_thread
+        self.latest_stage_event = None  # stages have no counts
+        self.latest_count_event = None  # runs of multiruns & permutations
+        subscribe_to_progress(self.receive_event)
+        self.window = ctk.CTkToplevel()
+        self.window.title("Progress")
+        self.window.geometry("500x160")
+        self.stage_label = ctk.CTkLabel(self.window, text="Starting...")
+        self.stage_label.pack(pady=(20, 5), padx=20, anchor="w")
+        self.count_label = ctk.CTkLabel(self.window, text="")
+        self.count_label.pack(pady=5, padx=20, anchor="w")
+        self.progress_bar = ctk.CTkProgressBar(self.window, progress_color=fg_color)
+        self.progress_bar.set(0)
+        self.progress_bar.pack(pady=5, padx=20, fill="x")
+        self.window.after(PROGRESS_WINDOW_UPDATE_MS, self.update_window)
+
+    def receive_event(self, event):
+        if event["thread_id"] != self.run_thread.ident:  # another analysis
+            return
+        if event["total"] is None:
+            self.latest_stage_event = event
+        else:
+            self.latest_count_event = event
+
+    def update_window(self):
+        if not self.run_thread.is_alive():
+            unsubscribe_from_progress(self.receive_event)
+            self.window.destroy()
+            return
+        stage_event = self.latest_stage_event
+        if stage_event is not None:
+            stage_string = "Current stage: " + stage_event["task"]
+            if stage_event["detail"]:
+                stage_string += " (" + stage_event["detail"] + ")"
+            self.stage_label.configure(text=stage_string)
+        count_event = self.latest_count_event
+        if count_event is not None:
+            count_string = (
+                count_event["task"]
+                + ": "
+                + str(count_event["done"])
+                + "/"
+                + str(count_event["total"])
+            )
+            if count_event["eta_s"] is not None:
+                count_string += (
+                    " - about " + str(round(count_event["eta_s"])) + " s left"
+                )
+            self.count_label.configure(text=count_string)
+            self.progress_bar.set(count_event["done"] / max(count_event["total"], 1))
+        self.window.after(PROGRESS_WINDOW_UPDATE_MS, self.update_window)
+
+
 # ..............................  change widget states  ................................
 
 
@@ -7,6 +7,12 @@ from autogaita.gui.first_level_gui_utils import (
     extract_results_from_json_file,
 )
 from autogaita.resources.utils import try_to_run_gaita
+from autogaita.resources.watchdog import (
+    try_to_run_gaita_with_watchdog,
+    write_watchdog_summary,
+)
+from autogaita.resources.progress import ProgressTracker
+from autogaita.resources.profiling import write_stage_timings_report
 from autogaita.universal3D.universal3D_datafile_preparation import prepare_3D
 import tkinter as tk
 import customtkinter as ctk
@@ -1136,6 +1142,7 @@ def run_analysis(this_runs_results, this_runs_cfg):
         run_thread = Thread(
             target=analyse_multi_run, args=(this_runs_results, this_runs_cfg)
         )
+    gui_utils.ProgressWindow(run_thread, FG_COLOR)
     run_thread.start()
 
 
@@ -1177,10 +1184,22 @@ def analyse_multi_run(this_runs_results, this_runs_cfg):
         print(error_msg)
         return
     multirun_info = multirun_extract_info(this_folderinfo)
+    run_progress = ProgressTracker("Runs", len(multirun_info["name"]))
+    terminated_runs = []
     for idx, name in enumerate(multirun_info["name"]):
-        multirun_run_a_single_dataset(
+        terminated_run = multirun_run_a_single_dataset(
             idx, multirun_info, this_folderinfo, this_runs_cfg
         )
+        if terminated_run is not None:
+            terminated_runs.append(terminated_run)
+        run_progress.advance(detail=name)
+    run_progress.finish()
+    if multirun_info["results_dir"]:  # aggregate stage timings (if profile_stages)
+        results_dir = os.path.dirname(multirun_info["results_dir"][0])
+        write_watchdog_summary(terminated_runs, results_dir)
+        write_stage_timings_report(
+            multirun_info["results_dir"], results_dir, this_runs_cfg
+        )
 
 
 def multirun_run_a_single_dataset(idx, multirun_info, this_folderinfo, this_runs_cfg):
@@ -1192,7 +1211,10 @@ def multirun_run_a_single_dataset(idx, multirun_info, this_folderinfo, this_runs
     for keyname in keynames:
         this_info[keyname] = multirun_info[keyname][idx]
     # important to only pass this_info here (1 run at a time - prints error if needed)
-    try_to_run_gaita("Universal 3D", this_info, this_folderinfo, this_runs_cfg, True)
+    # => returns why the run was terminated if it exceeded cfg's limits (else None)
+    return try_to_run_gaita_with_watchdog(
+        "Universal 3D", this_info, this_folderinfo, this_runs_cfg
+    )
 
 
 # %%..............  LOCAL FUNCTION(S) #6 - VARIOUS HELPER FUNCTIONS  ...................
@@ -1,8 +1,30 @@
 # some constants used throughout autogaita
 
 ISSUES_TXT_FILENAME = "Issues.txt"
+ISSUES_JSONL_FILENAME = "issues.jsonl"
+TIMINGS_JSON_FILENAME = "timings.json"
+TIMINGS_REPORT_JSON_FILENAME = "timings report.json"
 CONFIG_JSON_FILENAME = "config.json"
 INFO_TEXT_WIDTH = 64
 TIME_COL = "Time"
 SC_PERCENTAGE_COL = "SC Percentage"
 ID_COL = "ID"
+
+# figure export profiles - cfg["export_profile"] is the name of one of these or a dict
+# => dpi of "figure" means rcParams' figure.dpi (300 in our main modules)
+EXPORT_PROFILES = {
+    "default": {"formats": ["png", "svg"], "dpi": "figure", "bbox_inches": "tight"},
+    "preview": {"formats": ["png"], "dpi": 100, "bbox_inches": None},
+    "publication": {
+        "formats": ["png", "svg", "pdf"],
+        "dpi": 300,
+        "bbox_inches": "tight",
+    },
+    "none": {"formats": [], "dpi": "figure", "bbox_inches": "tight"},
+}
+EXPORT_FORMAT_SUBFOLDERS = {"png": "", "svg": "SVG Figures", "pdf": "PDF Figures"}
+PLOT_PANEL_LIVE_CANVASES = 3  # figures of the plot panel that are kept drawn
+PROGRESS_BAR_WIDTH = 30  # characters of progress bars printed to the terminal
+PROGRESS_UPDATES_PER_TASK = 100  # at most, so that long loops are not slowed down
+WATCHDOG_MEMORY_EXIT_CODE = 3  # of watched runs that exceeded their memory limit
+WATCHDOG_MEMORY_CHECK_INTERVAL = 0.1  # seconds between memory checks of watched runs
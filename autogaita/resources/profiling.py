@@ -0,0 +1,158 @@
+# ...................................  imports  ........................................
+from autogaita.resources.progress import emit_progress
+import os
+import json
+import time
+import tracemalloc
+import functools
+from contextlib import contextmanager
+
+# .................................  constants  ........................................
+from autogaita.resources.constants import (
+    TIMINGS_JSON_FILENAME,
+    TIMINGS_REPORT_JSON_FILENAME,
+)
+
+
+# ...............................  stage profiling  ....................................
+# records of the run that is currently profiled (None if we are not profiling)
+active_stage_records = None
+
+
+def profile_stages(main_function):
+    """Decorator for our main functions that profiles their pipeline_stages
+
+    Note
+    ----
+    Opt-in via cfg["profile_stages"] = True. The first argument of main_function must
+    be the (folder)info dict with results_dir and the last one must be cfg.
+    Memory is traced with tracemalloc (which slows runs down a bit) and CPU time is
+    that of this process only (i.e., not of render workers).
+    Stages & their summary are written to timings.json in results_dir. Parameter
+    sweeps write one per variant (see run_sweep_variant).
+    """
+
+    @functools.wraps(main_function)
+    def profiled_main_function(*args):
+        global active_stage_records
+        info, cfg = args[0], args[-1]
+        if (
+            "profile_stages" not in cfg.keys()
+            or cfg["profile_stages"] is not True
+            or active_stage_records is not None  # nested - the outer one profiles
+            or ("sweep" in cfg.keys() and cfg["sweep"])  # each variant is profiled
+        ):
+            return main_function(*args)
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        active_stage_records = []
+        start_wall_time = time.perf_counter()
+        start_cpu_time = time.process_time()
+        try:
+            return main_function(*args)
+        finally:
+            timings = {
+                "stages": active_stage_records,
+                "summary": summarise_stage_records(active_stage_records),
+                "total": {
+                    "wall_time_s": time.perf_counter() - start_wall_time,
+                    "cpu_time_s": time.process_time() - start_cpu_time,
+                    "peak_memory_mb": tracemalloc.get_traced_memory()[1] / 1e6,
+                },
+            }
+            active_stage_records = None
+            if started_tracing:
+                tracemalloc.stop()
+            if os.path.isdir(info["results_dir"]):  # not there if prep failed early
+                timings_path = os.path.join(info["results_dir"], TIMINGS_JSON_FILENAME)
+                with open(timings_path, "w") as timings_file:
+                    json.dump(timings, timings_file, indent=4)
+
+    return profiled_main_function
+
+
+@contextmanager
+def pipeline_stage(stage, detail=""):
+    """Emit progress events at the start & end of a stage and record its wall time,
+    CPU time & peak memory if the run is profiled
+
+    Note
+    ----
+    Records are only kept if we are profiling (see profile_stages). Stages should not
+    be nested since the peak of traced memory is reset at the start of each stage.
+    """
+    start_wall_time = time.perf_counter()
+    emit_progress("started", stage, start_time=start_wall_time, detail=detail)
+    if active_stage_records is None:
+        try:
+            yield
+        finally:
+            emit_progress("finished", stage, start_time=start_wall_time, detail=detail)
+        return
+    tracemalloc.reset_peak()
+    start_cpu_time = time.process_time()
+    try:
+        yield
+    finally:
+        record = {
+            "stage": stage,
+            "wall_time_s": time.perf_counter() - start_wall_time,
+            "cpu_time_s": time.process_time() - start_cpu_time,
+            "peak_memory_mb": tracemalloc.get_traced_memory()[1] / 1e6,
+        }
+        if detail:
+            record["detail"] = detail
+        active_stage_records.append(record)
+        emit_progress("finished", stage, start_time=start_wall_time, detail=detail)
+
+
+def summarise_stage_records(stage_records):
+    """Aggregate stage records by stage (total, mean & max times and max memory)"""
+    summary = {}
+    for record in stage_records:
+        if record["stage"] not in summary.keys():
+            summary[record["stage"]] = []
+        summary[record["stage"]].append(record)
+    for stage, records in summary.items():
+        summary[stage] = {"calls": len(records)}
+        for key in ["wall_time_s", "cpu_time_s"]:
+            values = [record[key] for record in records]
+            summary[stage][key] = {
+                "total": sum(values),
+                "mean": sum(values) / len(values),
+                "max": max(values),
+            }
+        summary[stage]["peak_memory_mb"] = max(
+            record["peak_memory_mb"] for record in records
+        )
+    return summary
+
+
+def write_stage_timings_report(run_results_dirs, report_dir, cfg):
+    """Aggregate the timings.json files of a multirun's runs into one report
+
+    Note
+    ----
+    Does nothing unless cfg["profile_stages"] is True. Runs without timings.json
+    (e.g. because they failed during preparation) are listed as such.
+    """
+    if "profile_stages" not in cfg.keys() or cfg["profile_stages"] is not True:
+        return
+    report = {"runs": {}, "runs_without_timings": []}
+    all_stage_records = []
+    for run_results_dir in run_results_dirs:
+        run_name = os.path.basename(os.path.normpath(run_results_dir))
+        timings_path = os.path.join(run_results_dir, TIMINGS_JSON_FILENAME)
+        if not os.path.exists(timings_path):
+            report["runs_without_timings"].append(run_name)
+            continue
+        with open(timings_path, "r") as timings_file:
+            timings = json.load(timings_file)
+        report["runs"][run_name] = timings["total"]
+        all_stage_records.extend(timings["stages"])
+    report["summary"] = summarise_stage_records(all_stage_records)
+    if not os.path.isdir(report_dir):
+        os.makedirs(report_dir)
+    with open(os.path.join(report_dir, TIMINGS_REPORT_JSON_FILENAME), "w") as f:
+        json.dump(report, f, indent=4)
@@ -0,0 +1,138 @@
+# ...................................  imports  ........................................
+import time
+import threading
+import sys
+import math
+
+# .................................  constants  ........................................
+from autogaita.resources.constants import (
+    PROGRESS_BAR_WIDTH,
+    PROGRESS_UPDATES_PER_TASK,
+)
+
+
+# ...............................  progress events  ....................................
+# callbacks receiving all progress events - by default we print progress bars
+progress_subscribers = []
+
+
+def emit_progress(
+    kind, task, done=None, total=None, start_time=None, detail="", redraw=False
+):
+    """Send a progress event to all subscribers
+
+    Note
+    ----
+    kind is "started", "advanced" or "finished" & task is what we are working on (a
+    pipeline stage, "Runs" of a multirun or the permutations of a stats variable).
+    done & total are counts (None for stages) and start_time is the perf_counter time
+    at which the task started. redraw tells CLI subscribers whether they can redraw a
+    progress bar in place (i.e. nothing else is printed while the task runs).
+    Besides these, events include elapsed_s, throughput_per_s & eta_s (None if
+    unknown) as well as the id of the thread that emitted them (GUIs run analyses in
+    threads).
+    """
+    elapsed = None if start_time is None else time.perf_counter() - start_time
+    throughput = None
+    eta = None
+    if elapsed and done:
+        throughput = done / elapsed
+        if total is not None:
+            eta = (total - done) / throughput
+    event = {
+        "kind": kind,
+        "task": task,
+        "detail": detail,
+        "done": done,
+        "total": total,
+        "elapsed_s": elapsed,
+        "throughput_per_s": throughput,
+        "eta_s": eta,
+        "redraw": redraw,
+        "thread_id": threading.get_ident(),
+    }
+    for callback in list(progress_subscribers):
+        callback(event)
+    return event
+
+
+def subscribe_to_progress(callback):
+    if callback not in progress_subscribers:
+        progress_subscribers.append(callback)
+
+
+def unsubscribe_from_progress(callback):
+    if callback in progress_subscribers:
+        progress_subscribers.remove(callback)
+
+
+class ProgressTracker:
+    """Emits the progress events of a task with a known number of steps
+
+    Note
+    ----
+    To not slow down long loops (e.g. permutations), we emit at most
+    PROGRESS_UPDATES_PER_TASK "advanced" events, i.e. one per batch of steps.
+    """
+
+    def __init__(self, task, total, detail="", redraw=False):
+        self.task = task
+        self.total = total
+        self.detail = detail
+        self.redraw = redraw
+        self.done = 0
+        self.batch_size = max(1, math.ceil(total / PROGRESS_UPDATES_PER_TASK))
+        self.start_time = time.perf_counter()
+        self.emit("started", detail)
+
+    def advance(self, steps=1, detail=""):
+        previous_batch = self.done // self.batch_size
+        self.done += steps
+        if self.done // self.batch_size > previous_batch or self.done >= self.total:
+            self.emit("advanced", detail if detail else self.detail)
+
+    def finish(self):
+        self.emit("finished", self.detail)
+
+    def emit(self, kind, detail):
+        emit_progress(
+            kind,
+            self.task,
+            self.done,
+            self.total,
+            self.start_time,
+            detail,
+            self.redraw,
+        )
+
+
+def print_progress_bar(event):
+    """CLI subscriber printing a progress bar of tasks with counts (not stages)"""
+    if event["total"] is None or event["kind"] == "started":
+        return
+    total = max(event["total"], 1)
+    filled = int(PROGRESS_BAR_WIDTH * min(event["done"], total) / total)
+    progress_string = (
+        ("\r" if event["redraw"] else "")
+        + event["task"]
+        + " ["
+        + "#" * filled
+        + "-" * (PROGRESS_BAR_WIDTH - filled)
+        + "] "
+        + str(event["done"])
+        + "/"
+        + str(event["total"])
+    )
+    if event["throughput_per_s"]:
+        progress_string += " | " + str(round(event["throughput_per_s"], 2)) + "/s"
+    if event["eta_s"] is not None and event["kind"] == "advanced":
+        progress_string += " | ETA " + str(round(event["eta_s"])) + " s"
+    if event["kind"] == "finished":
+        progress_string += " | " + str(round(event["elapsed_s"], 1)) + " s"
+    if event["kind"] == "finished" or not event["redraw"]:
+        progress_string += "\n"
+    sys.stdout.write(progress_string)
+    sys.stdout.flush()
+
+
+subscribe_to_progress(print_progress_bar)
@@ -4,13 +4,30 @@ import pandas as pd
 import numpy as np
 import os
 import traceback
+import json
 import math
+import pickle
+import zlib
+import warnings
+from collections import OrderedDict, Counter
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib
+import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 import tkinter as tk
 import customtkinter as ctk
 
 # .................................  constants  ........................................
-from autogaita.resources.constants import ISSUES_TXT_FILENAME, INFO_TEXT_WIDTH, TIME_COL
+from autogaita.resources.constants import (
+    ISSUES_TXT_FILENAME,
+    ISSUES_JSONL_FILENAME,
+    INFO_TEXT_WIDTH,
+    TIME_COL,
+    EXPORT_PROFILES,
+    EXPORT_FORMAT_SUBFOLDERS,
+    PLOT_PANEL_LIVE_CANVASES,
+)
 from autogaita.universal3D.universal3D_constants import LEGS_COLFORMAT
 
 
@@ -49,70 +66,174 @@ def try_to_run_gaita(tracking_software, info, folderinfo, cfg, multirun_flag):
     print(message)
 
     # try to run gaita
-    try:
-        if tracking_software == "DLC":
-            autogaita.dlc(info, folderinfo, cfg)
-        elif tracking_software == "SLEAP":
-            autogaita.sleap(info, folderinfo, cfg)
-        elif tracking_software == "Universal 3D":
-            autogaita.universal3D(info, folderinfo, cfg)
-        else:
-            print("tracking_software has to be DLC, SLEAP or Universal 3D - try again.")
-    # catch these errors (don't catch all possbile errors - bad practice!)
-    except (
-        KeyError,
-        IndexError,
-        TypeError,
-        ValueError,
-        FileNotFoundError,
-        IOError,
-        OSError,
-        PermissionError,
-        MemoryError,
-        OverflowError,
-        FloatingPointError,
-        pd.errors.ParserError,
-        pd.errors.DtypeWarning,
-        np.linalg.LinAlgError,
-    ):
-        error_traceback = traceback.format_exc()  # capture traceback of error
-        # modify and print message
-        skip_message = (
-            "* ! ! ! ! ! ! ATTENTION  PLEASE ! ! ! ! ! ! *"
-            + "\n* Whoopsie - Something unexpected is wrong! *"
-            + "\n* See below & check Issues.txt for details. *"
-        )
-        if multirun_flag:
-            skip_message += (
-                "\n*   We'll continue with the next dataset!   *"
-                + "\n\n*********************************************"
-                + "\n*               Error Details               *"
-                + "\n*********************************************"
-                + f"\n{error_traceback}"
-            )
-        else:
-            skip_message += (
-                "\n\n*********************************************"
-                + "\n*               Error Details               *"
-                + "\n*********************************************\n"
-                + f"\n{error_traceback}"
+    # => issues of this run are collected & written once it finished
+    with collect_issues(info):
+        try:
+            if tracking_software == "DLC":
+                autogaita.dlc(info, folderinfo, cfg)
+            elif tracking_software == "SLEAP":
+                autogaita.sleap(info, folderinfo, cfg)
+            elif tracking_software == "Universal 3D":
+                autogaita.universal3D(info, folderinfo, cfg)
+            else:
+                print(
+                    "tracking_software has to be DLC, SLEAP or Universal 3D - try again."
+                )
+        # catch these errors (don't catch all possbile errors - bad practice!)
+        except (
+            KeyError,
+            IndexError,
+            TypeError,
+            ValueError,
+            FileNotFoundError,
+            IOError,
+            OSError,
+            PermissionError,
+            MemoryError,
+            OverflowError,
+            FloatingPointError,
+            pd.errors.ParserError,
+            pd.errors.DtypeWarning,
+            np.linalg.LinAlgError,
+        ):
+            error_traceback = traceback.format_exc()  # capture traceback of error
+            # modify and print message
+            skip_message = (
+                "* ! ! ! ! ! ! ATTENTION  PLEASE ! ! ! ! ! ! *"
+                + "\n* Whoopsie - Something unexpected is wrong! *"
+                + "\n* See below & check Issues.txt for details. *"
             )
-        print(skip_message)
-        # store message
-        if not os.path.exists(info["results_dir"]):
-            os.makedirs(info["results_dir"])
-        textfile = os.path.join(info["results_dir"], ISSUES_TXT_FILENAME)
-        with open(textfile, "a") as f:
-            f.write(skip_message)
+            if multirun_flag:
+                skip_message += (
+                    "\n*   We'll continue with the next dataset!   *"
+                    + "\n\n*********************************************"
+                    + "\n*               Error Details               *"
+                    + "\n*********************************************"
+                    + f"\n{error_traceback}"
+                )
+            else:
+                skip_message += (
+                    "\n\n*********************************************"
+                    + "\n*               Error Details               *"
+                    + "\n*********************************************\n"
+                    + f"\n{error_traceback}"
+                )
+            print(skip_message)
+            # store message (Results folder is created when issues are flushed)
+            write_issues_to_textfile(skip_message, info, category="unexpected error")
     return
 
 
 # ...........................  generic helper functions  ...............................
-def write_issues_to_textfile(message, info):
-    """If there are any issues with this data, inform the user in this file"""
+def write_issues_to_textfile(message, info, category=None, header=None):
+    """If there are any issues with this data, inform the user in this file
+
+    Note
+    ----
+    If a run's issues are collected (see collect_issues), the message is only buffered
+    and written once the run finished - otherwise it is appended to Issues.txt
+    directly.
+    category is used to count issues & defaults to the message's banner (e.g.
+    "warning"). header is written just once per run, before the first message that
+    comes with it.
+    Returns the text that was logged (i.e. including the header if it was new).
+    """
+    if category is None:
+        category = issue_category(message)
+    collector = issue_collectors.get(os.path.abspath(info["results_dir"]))
+    if collector is not None:
+        return collector.add(message, category, header)
+    # not collecting - header needs to be checked in the file itself
     textfile = os.path.join(info["results_dir"], ISSUES_TXT_FILENAME)
+    if header is not None:
+        issues = ""
+        if os.path.exists(textfile):
+            with open(textfile, "r") as f:
+                issues = f.read()
+        if header not in issues:
+            message = header + message
     with open(textfile, "a") as f:
         f.write(message)
+    return message
+
+
+def issue_category(message):
+    """Return the category of an issue message based on its banner"""
+    if "! CRITICAL ERROR !" in message:
+        return "critical error"
+    elif "! ERROR !" in message:
+        return "error"
+    elif "! WARNING !" in message:
+        return "warning"
+    else:
+        return "note"
+
+
+# collectors of runs currently in progress - keys are absolute results_dir paths
+issue_collectors = {}
+
+
+class IssueCollector:
+    """Keeps the issues of one run in memory until they are flushed to its Results"""
+
+    def __init__(self, results_dir):
+        self.results_dir = results_dir
+        self.issues = []  # dicts of category & message, in the order they occurred
+        self.headers = set()
+
+    def add(self, message, category, header=None):
+        if header is not None and header not in self.headers:
+            self.headers.add(header)
+            message = header + message
+        self.issues.append({"category": category, "message": message})
+        return message
+
+    def extend(self, issues, headers):
+        """Add issues that were collected elsewhere, e.g. by a render worker"""
+        for issue in issues:
+            self.issues.append(issue)
+        self.headers.update(headers)
+
+    def count(self):
+        return Counter(issue["category"] for issue in self.issues)
+
+    def flush(self):
+        """Write Issues.txt (incl. counts per category) & issues.jsonl"""
+        if not self.issues:
+            return
+        if not os.path.exists(self.results_dir):
+            os.makedirs(self.results_dir)
+        counts = self.count()
+        count_message = "\n\n*****************\n! ISSUE SUMMARY !\n*****************\n"
+        for category, category_count in counts.items():
+            count_message += f"{category}: {category_count}\n"
+        with open(os.path.join(self.results_dir, ISSUES_TXT_FILENAME), "a") as f:
+            f.write("".join(issue["message"] for issue in self.issues) + count_message)
+        with open(os.path.join(self.results_dir, ISSUES_JSONL_FILENAME), "a") as f:
+            for issue in self.issues:
+                f.write(
+                    json.dumps(
+                        {"category": issue["category"], "message": issue["message"]}
+                    )
+                    + "\n"
+                )
+        self.issues = []
+
+
+@contextmanager
+def collect_issues(info):
+    """Buffer all issues of a run & write them once when it finished (or failed)"""
+    results_dir = os.path.abspath(info["results_dir"])
+    if results_dir in issue_collectors:  # nested - the outer one flushes
+        yield issue_collectors[results_dir]
+        return
+    collector = IssueCollector(results_dir)
+    issue_collectors[results_dir] = collector
+    try:
+        yield collector
+    finally:
+        del issue_collectors[results_dir]
+        collector.flush()
 
 
 def print_finish(info):
@@ -144,6 +265,38 @@ def print_finish(info):
     print(message)
 
 
+def add_gradient_features(step, source_cols, velocity_cols, acceleration_cols):
+    """Add velocities (& accelerations) of a step's coordinate or angle columns
+
+    Note
+    ----
+    np.gradient is applied once to the block of all source_cols (along time) for
+    velocities & once more to velocities for accelerations. acceleration_cols has one
+    entry per source column that is None if we don't want its acceleration.
+    New columns are attached with a single concat, ordered as velocity & acceleration
+    of the first source column, then the second one and so on. Columns that exist
+    already are overwritten in place.
+    """
+    if not source_cols:
+        return step
+    source_dtype = preserved_float_dtype(*step[source_cols].dtypes)
+    velocities = np.gradient(step[source_cols].to_numpy(dtype=source_dtype), axis=0)
+    if any(acceleration_cols):
+        accelerations = np.gradient(velocities, axis=0)
+    features = {}
+    for i in range(len(source_cols)):
+        features[velocity_cols[i]] = velocities[:, i]
+        if acceleration_cols[i] is not None:
+            features[acceleration_cols[i]] = accelerations[:, i]
+    new_features = {}
+    for col, values in features.items():
+        if col in step.columns:
+            step[col] = values
+        else:
+            new_features[col] = values
+    return pd.concat([step, pd.DataFrame(new_features, index=step.index)], axis=1)
+
+
 def compute_angle(joint_angle, joint2, joint3):
     """Compute a given angle at a joint & a given timepoint"""
     # prep our boolean to check if angle was broken
@@ -172,23 +325,15 @@ def compute_angle(joint_angle, joint2, joint3):
 
 def write_angle_warning(step, a, angles, broken_angle_idxs, info, **kwargs):
     """Write a warning to the Issues.txt file if angles were broken"""
-    # Make sure you write the first WARNING message just once
-    issues_file = os.path.join(info["results_dir"], ISSUES_TXT_FILENAME)
-    # the file always exists in /autogaita, but not with all /tests - handling that here
-    if os.path.exists(issues_file):
-        with open(issues_file, "r") as f:
-            issues = f.read()
-    else:
-        issues = ""
-    if "arc cosine to -1" not in issues:
-        message = (
-            "\n\n***********\n! WARNING !\n***********\n"
-            + "\nWe had to limit the input of the arc cosine to -1 to +1 when "
-            + "computing some angles.\nThis likely is just a rounding issue with Python"
-            + " but could hint at problems with your tracking, check to be sure.\n\n"
-        )
+    # the first WARNING message is written just once (see write_issues_to_textfile)
+    header = (
+        "\n\n***********\n! WARNING !\n***********\n"
+        + "\nWe had to limit the input of the arc cosine to -1 to +1 when "
+        + "computing some angles.\nThis likely is just a rounding issue with Python"
+        + " but could hint at problems with your tracking, check to be sure.\n\n"
+    )
     # write the which-config broke angle - message always
-    message += "\n\nArc-cosine of angle fixed for this configuration:"
+    message = "\n\nArc-cosine of angle fixed for this configuration:"
     if "legname" in kwargs:  # handle Universal 3D legname
         message += f"\nLeg: {kwargs['legname']}"
     time_col_idx = step.columns.get_loc(TIME_COL)
@@ -200,8 +345,9 @@ def write_angle_warning(step, a, angles, broken_angle_idxs, info, **kwargs):
         + f"\nUpper Joint: {angles['upper_joint'][a]}"
         + f"\nCycle-time: {start_time}-{end_time}s"
     )
-    print(message)
-    write_issues_to_textfile(message, info)
+    print(
+        write_issues_to_textfile(message, info, category="broken angle", header=header)
+    )
 
 
 def normalise_one_steps_data(step, bin_num):
@@ -220,7 +366,7 @@ def normalise_one_steps_data(step, bin_num):
         thistrial = step[col]
         if c == 0:  # if first column, define bins anew
             bins = define_bins(int(len(thistrial)), bin_num)
-        normtrial = np.zeros(bin_num)
+        normtrial = np.zeros(bin_num, dtype=preserved_float_dtype(thistrial.dtype))
         if isinstance(bins[0], list):  # we need to average
             for i in range(bin_num):
                 normtrial[i] = np.mean(thistrial.iloc[bins[i]])
@@ -445,10 +591,259 @@ def coerce_to_float(x):
         return np.nan
 
 
+# ...............................  float precision  ....................................
+def extract_float_dtype(cfg):
+    """Return the float dtype that tracking data & features are processed with
+
+    Note
+    ----
+    cfg["reduced_precision"] is optional. If truthy, float columns of imported data
+    are cast to float32 once (see cast_to_float_dtype) & all arrays we create from them
+    later keep that dtype (see preserved_float_dtype), which halves memory of all dfs.
+    Tracking precision is far below float32's ~7 significant digits.
+    """
+    if "reduced_precision" in cfg.keys() and cfg["reduced_precision"]:
+        return np.float32
+    return np.float64
+
+
+def cast_to_float_dtype(df, cfg):
+    """Cast float64 columns of df (except Time) to cfg's float dtype
+
+    Note
+    ----
+    Time stays float64 so that cycle latencies in seconds still match their frames.
+    """
+    float_dtype = extract_float_dtype(cfg)
+    if float_dtype == np.float64:
+        return df
+    cols_to_cast = df.columns[(df.dtypes == np.float64) & (df.columns != TIME_COL)]
+    return df.astype(dict.fromkeys(cols_to_cast, float_dtype))
+
+
+def preserved_float_dtype(*dtypes):
+    """Return float32 if all dtypes are float32 (reduced precision) & float otherwise"""
+    if dtypes and all(dtype == np.float32 for dtype in dtypes):
+        return np.float32
+    return float
+
+
+# ..............................  figure rendering  ....................................
+# paths of figure files saved while a plot job runs (None if no job is running)
+# => this is per process, so every render worker has its own list
+rendered_figure_paths = None
+
+
+def record_rendered_figure(figure_path):
+    """Remember a saved figure file if we are currently running a plot job"""
+    if rendered_figure_paths is not None:
+        rendered_figure_paths.append(figure_path)
+
+
+def extract_export_profile(cfg):
+    """Return the figure export profile of this run - None if it is invalid
+
+    Note
+    ----
+    cfg["export_profile"] is optional & can either be the name of one of
+    EXPORT_PROFILES or a dict with "formats", "dpi" and/or "bbox_inches" keys (missing
+    keys are taken from the default profile).
+    """
+    if "export_profile" not in cfg.keys():
+        return EXPORT_PROFILES["default"]
+    export_profile = cfg["export_profile"]
+    if isinstance(export_profile, str):
+        if export_profile not in EXPORT_PROFILES.keys():
+            return None
+        return EXPORT_PROFILES[export_profile]
+    if not isinstance(export_profile, dict):
+        return None
+    if any(key not in EXPORT_PROFILES["default"].keys() for key in export_profile):
+        return None
+    export_profile = {**EXPORT_PROFILES["default"], **export_profile}
+    if any(
+        figure_format not in EXPORT_FORMAT_SUBFOLDERS.keys()
+        for figure_format in export_profile["formats"]
+    ):
+        return None
+    if export_profile["bbox_inches"] not in ["tight", None]:
+        return None
+    if export_profile["dpi"] != "figure" and (
+        not isinstance(export_profile["dpi"], (int, float))
+        or export_profile["dpi"] <= 0
+    ):
+        return None
+    return export_profile
+
+
+def check_export_profile(cfg, info):
+    """Print, log & return an error message if the export profile is invalid"""
+    export_profile_error_message = ""
+    if extract_export_profile(cfg) is None:
+        export_profile_error_message = (
+            "\n******************\n! CRITICAL ERROR !\n******************\n"
+            + "Your figure export profile is invalid: "
+            + str(cfg["export_profile"])
+            + "\nPlease use one of: "
+            + ", ".join(EXPORT_PROFILES.keys())
+            + "\nor a dict with formats (png, svg, pdf), dpi & bbox_inches (tight or "
+            + "None) & try again!"
+        )
+        write_issues_to_textfile(export_profile_error_message, info)
+        print(export_profile_error_message)
+    return export_profile_error_message
+
+
+def save_figure_files(figure, results_dir, figure_file_string, cfg):
+    """Save a figure in all formats of the export profile (pngs to results_dir and
+    other formats to their subfolders)"""
+    export_profile = extract_export_profile(cfg)
+    for figure_format in export_profile["formats"]:
+        figure_dir = os.path.join(results_dir, EXPORT_FORMAT_SUBFOLDERS[figure_format])
+        if not os.path.exists(figure_dir):
+            os.makedirs(figure_dir)
+        figure_path = os.path.join(figure_dir, figure_file_string + "." + figure_format)
+        figure.savefig(
+            figure_path,
+            dpi=export_profile["dpi"],
+            bbox_inches=export_profile["bbox_inches"],
+        )
+        record_rendered_figure(figure_path)
+
+
+class FigureCollector:
+    """Stands in for PlotPanel in render workers & just collects the figures"""
+
+    def __init__(self):
+        self.figures = []
+
+    def add_figure(self, figure):
+        self.figures.append(figure)
+
+    def add_pickled_figure(self, pickled_figure):
+        self.figures.append(pickle.loads(pickled_figure))
+
+
+def render_plot_jobs(plot_jobs, cfg, plot_panel_instance):
+    """Run independent plot jobs & return the paths of all figure files they saved
+
+    Note
+    ----
+    A plot job is a (plot_function, args) tuple that is called as
+    plot_function(*args, cfg, plot_panel_instance) - i.e. the signature all of our
+    plot functions share.
+    If cfg["plot_workers"] is larger than 1, jobs are run by a process pool using the
+    Agg backend and the rcParams of this process. Workers save figures themselves and
+    only return file paths - plus pickled figures if they are needed for the plot panel,
+    which are added to the panel (as they are, see PlotPanel) in the order of plot_jobs.
+    """
+    global rendered_figure_paths
+
+    # unpack
+    dont_show_plots = cfg["dont_show_plots"]
+    plot_workers = 0
+    if "plot_workers" in cfg.keys():
+        plot_workers = min(int(cfg["plot_workers"]), len(plot_jobs))
+
+    # serial - just run jobs here
+    figure_paths = []
+    if plot_workers < 2:
+        for plot_function, args in plot_jobs:
+            rendered_figure_paths = []
+            try:
+                plot_function(*args, cfg, plot_panel_instance)
+                figure_paths.extend(rendered_figure_paths)
+            finally:
+                rendered_figure_paths = None
+            # regularly closing figures to save memory
+            # => no problem to do this since we pass figure-vars to save-functions and
+            #    PlotPanel
+            plt.close("all")
+        return figure_paths
+
+    # parallel
+    rc_params = {
+        key: value for key, value in matplotlib.rcParams.items() if key != "backend"
+    }
+    with ProcessPoolExecutor(max_workers=plot_workers) as executor:
+        futures = [
+            executor.submit(
+                run_plot_job,
+                plot_function,
+                args,
+                cfg,
+                rc_params,
+                not dont_show_plots,
+                {
+                    results_dir: collector.headers
+                    for results_dir, collector in issue_collectors.items()
+                },
+            )
+            for plot_function, args in plot_jobs
+        ]
+        for future in futures:  # keep the order of plot_jobs
+            job_figure_paths, pickled_figures, job_issues = future.result()
+            figure_paths.extend(job_figure_paths)
+            for pickled_figure in pickled_figures:
+                plot_panel_instance.add_pickled_figure(pickled_figure)
+            for results_dir, (issues, headers) in job_issues.items():
+                issue_collectors[results_dir].extend(issues, headers)
+    return figure_paths
+
+
+def run_plot_job(plot_function, args, cfg, rc_params, return_figures, issue_headers):
+    """Run one plot job in a render worker - see render_plot_jobs
+
+    Note
+    ----
+    Issues of results_dirs that are collected by the main process (issue_headers has
+    their headers so far) are collected here too & returned so that they end up in
+    the run's Issues.txt.
+    """
+    global rendered_figure_paths
+    plt.switch_backend("Agg")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        matplotlib.rcParams.update(rc_params)
+    figure_collector = FigureCollector()
+    issue_collectors.clear()  # forked workers inherit the main process' collectors
+    for results_dir, headers in issue_headers.items():
+        issue_collectors[results_dir] = IssueCollector(results_dir)
+        issue_collectors[results_dir].headers.update(headers)
+    rendered_figure_paths = []
+    try:
+        plot_function(*args, cfg, figure_collector)
+        job_figure_paths = rendered_figure_paths
+    finally:
+        rendered_figure_paths = None
+    job_issues = {
+        results_dir: (collector.issues, collector.headers)
+        for results_dir, collector in issue_collectors.items()
+    }
+    issue_collectors.clear()
+    # close before pickling so that figures are not restored to pyplot when loaded
+    plt.close("all")
+    pickled_figures = []
+    if return_figures:
+        pickled_figures = [pickle.dumps(figure) for figure in figure_collector.figures]
+    return job_figure_paths, pickled_figures, job_issues
+
+
 # ................................  plot panel  ........................................
 class PlotPanel:
+    """Shows the figures of a run after it completed
+
+    Note
+    ----
+    Figures are closed & stored as compressed pickles when they are added, so that
+    memory does not grow with the number of figures of a run. A figure is only loaded
+    and drawn onto a canvas when it is shown & we keep the canvases of the last
+    PLOT_PANEL_LIVE_CANVASES figures so that going back and forth stays fast.
+    """
+
     def __init__(self, fg_color, hover_color):
-        self.figures = []
+        self.figures = []  # zlib-compressed pickles
+        self.live_canvases = OrderedDict()  # fig_index: canvas, least recent first
         self.current_fig_index = 0
         self.fg_color = fg_color
         self.hover_color = hover_color
@@ -501,19 +896,8 @@ class PlotPanel:
         window_height = window_width * 0.75 * 1.05
         self.plotwindow.geometry(f"{window_width}x{window_height}")
 
-        # Adjust figures for the plot panel
-        for fig in self.figures:
-            # dpi adjusted to increase visibilty/readability
-            fig.set_dpi(100)
-            # constrained layout to adjust margins within the figure
-            # => note: in case there are a lot of steps in one run (-> the legend is
-            #          super long) the figure won't be displayed properly.
-            fig.set_constrained_layout(True)
-
         # Initialize the plot panel with the first figure
-        self.plot_panel = FigureCanvasTkAgg(
-            self.figures[self.current_fig_index], master=self.plotwindow
-        )  # index used for buttons
+        self.plot_panel = self.get_canvas(self.current_fig_index)  # index for buttons
         self.plot_panel.get_tk_widget().grid(
             row=0, column=0, padx=10, pady=10, sticky="nsew"
         )
@@ -570,11 +954,8 @@ class PlotPanel:
         self.plot_panel.get_tk_widget().grid_forget()
 
         # Update the plot panel with the new figure
-        self.plot_panel = FigureCanvasTkAgg(
-            self.figures[self.current_fig_index], master=self.plotwindow
-        )
+        self.plot_panel = self.get_canvas(self.current_fig_index)
         self.plot_panel.get_tk_widget().grid(row=0, column=0, sticky="nsew")
-        self.plot_panel.draw()
 
         # Destroy toolbar and create a new one
         # (This has to be done, otherwise the toolbar won't function for a new plot)
@@ -587,6 +968,41 @@ class PlotPanel:
             f"AutoGaitA Plot Panel {self.current_fig_index + 1}/{len(self.figures)}"
         )
 
+    # .........................  figure storage   ................................
+    def add_figure(self, figure):
+        """Close a figure & keep it as a compressed pickle until it is shown"""
+        plt.close(figure)  # first, so it's not restored to pyplot when it is loaded
+        self.figures.append(zlib.compress(pickle.dumps(figure)))
+
+    def add_pickled_figure(self, pickled_figure):
+        """Keep a figure that a render worker pickled (see render_plot_jobs)"""
+        self.figures.append(zlib.compress(pickled_figure))
+
+    def load_figure(self, fig_index):
+        """Unpickle a figure & adjust it for the plot panel"""
+        fig = pickle.loads(zlib.decompress(self.figures[fig_index]))
+        # dpi adjusted to increase visibilty/readability
+        fig.set_dpi(100)
+        # constrained layout to adjust margins within the figure
+        # => note: in case there are a lot of steps in one run (-> the legend is
+        #          super long) the figure won't be displayed properly.
+        fig.set_constrained_layout(True)
+        return fig
+
+    def get_canvas(self, fig_index):
+        """Return the (drawn) canvas of a figure & destroy the least recently shown
+        canvas if there are more than PLOT_PANEL_LIVE_CANVASES"""
+        if fig_index in self.live_canvases:
+            self.live_canvases.move_to_end(fig_index)
+            return self.live_canvases[fig_index]
+        canvas = FigureCanvasTkAgg(self.load_figure(fig_index), master=self.plotwindow)
+        canvas.draw()
+        self.live_canvases[fig_index] = canvas
+        while len(self.live_canvases) > PLOT_PANEL_LIVE_CANVASES:
+            _, old_canvas = self.live_canvases.popitem(last=False)
+            old_canvas.get_tk_widget().destroy()
+        return canvas
+
     def destroy_plot_panel(self):
         # Needed if no SCs after checks
         self.loading_screen.destroy()
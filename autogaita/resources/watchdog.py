@@ -0,0 +1,132 @@
+# ...................................  imports  ........................................
+from autogaita.resources.utils import (
+    try_to_run_gaita,
+    write_issues_to_textfile,
+    collect_issues,
+)
+import os
+import time
+import threading
+import multiprocessing
+import platform
+
+# .................................  constants  ........................................
+from autogaita.resources.constants import (
+    WATCHDOG_MEMORY_EXIT_CODE,
+    WATCHDOG_MEMORY_CHECK_INTERVAL,
+)
+
+
+# ..................................  watchdog  ........................................
+def try_to_run_gaita_with_watchdog(tracking_software, info, folderinfo, cfg):
+    """Run a dataset of a multirun & terminate it if it exceeds its time or memory limit
+
+    Note
+    ----
+    Limits are opt-in via cfg["run_timeout"] (seconds) and cfg["run_memory_limit"]
+    (MB). Without them we simply call try_to_run_gaita. With them, the run is executed
+    in a child process that we terminate after run_timeout & that exits itself once
+    its peak resident memory (incl. Python & loaded libraries) exceeds
+    run_memory_limit. Memory limits are only supported on Linux/macOS.
+    Issues the run collected before it was terminated are lost, but we log why it was
+    terminated to its Issues.txt.
+    Returns None if the run completed or a short description of why it did not (see
+    write_watchdog_summary).
+    """
+    run_timeout = extract_watchdog_limit(cfg, "run_timeout")
+    run_memory_limit = extract_watchdog_limit(cfg, "run_memory_limit")
+    if run_timeout is None and run_memory_limit is None:
+        try_to_run_gaita(tracking_software, info, folderinfo, cfg, True)
+        return None
+    # spawn (rather than fork) since GUIs call this from a thread
+    context = multiprocessing.get_context("spawn")
+    process = context.Process(
+        target=run_watched_gaita,
+        args=(tracking_software, info, folderinfo, cfg, run_memory_limit),
+    )
+    process.start()
+    process.join(run_timeout)
+    if process.is_alive():
+        process.terminate()
+        process.join()
+        reason = "exceeded its time limit of " + str(run_timeout) + " s"
+    elif process.exitcode == WATCHDOG_MEMORY_EXIT_CODE:
+        reason = "exceeded its memory limit of " + str(run_memory_limit) + " MB"
+    elif process.exitcode != 0:
+        reason = "crashed (exit code " + str(process.exitcode) + ")"
+    else:
+        return None
+    watchdog_message = (
+        "\n*********\n! ERROR !\n*********\n"
+        + info["name"]
+        + " "
+        + reason
+        + " & was terminated by our watchdog!"
+        + "\nWe continued with the next dataset."
+    )
+    print(watchdog_message)
+    with collect_issues(info):  # also creates results_dir if it does not exist
+        write_issues_to_textfile(watchdog_message, info, category="watchdog")
+    return info["name"] + " " + reason
+
+
+def run_watched_gaita(tracking_software, info, folderinfo, cfg, run_memory_limit):
+    """Target of the child process of try_to_run_gaita_with_watchdog"""
+    if run_memory_limit is not None:
+        start_memory_watchdog(run_memory_limit, info)
+    try_to_run_gaita(tracking_software, info, folderinfo, cfg, True)
+
+
+def start_memory_watchdog(run_memory_limit, info):
+    """Exit this (child) process once its peak resident memory exceeds
+    run_memory_limit (MB)
+
+    Note
+    ----
+    A daemon thread checks this every WATCHDOG_MEMORY_CHECK_INTERVAL seconds.
+    ru_maxrss is in kB on Linux but in bytes on macOS & not available on Windows.
+    """
+    try:
+        import resource
+    except ImportError:
+        print(
+            "\n***********\n! WARNING !\n***********\n"
+            + "Unable to limit the memory of "
+            + info["name"]
+            + " on this system - running it without memory limit!"
+        )
+        return
+    bytes_per_unit = 1 if platform.system() == "Darwin" else 1024
+
+    def watch_memory():
+        while True:
+            peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            if peak_memory * bytes_per_unit / 1e6 > run_memory_limit:
+                os._exit(WATCHDOG_MEMORY_EXIT_CODE)
+            time.sleep(WATCHDOG_MEMORY_CHECK_INTERVAL)
+
+    threading.Thread(target=watch_memory, daemon=True).start()
+
+
+def extract_watchdog_limit(cfg, key):
+    """Return a watchdog limit of cfg as a float (None if not given or 0)"""
+    if key not in cfg.keys() or not cfg[key]:
+        return None
+    return float(cfg[key])
+
+
+def write_watchdog_summary(terminated_runs, results_dir):
+    """Log the runs of a multirun that were terminated by our watchdog to the
+    multirun's Issues.txt (i.e. in the folder of all Results subfolders)"""
+    if not terminated_runs:
+        return
+    summary_message = (
+        "\n***********\n! WARNING !\n***********\n"
+        + str(len(terminated_runs))
+        + " run(s) of this batch were terminated by our watchdog:\n"
+        + "\n".join(terminated_runs)
+    )
+    print(summary_message)
+    batch_info = {"results_dir": results_dir}
+    with collect_issues(batch_info):
+        write_issues_to_textfile(summary_message, batch_info, category="watchdog")
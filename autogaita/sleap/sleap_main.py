@@ -1,10 +1,21 @@
 # %% imports
 from autogaita.common2D.common2D_1_preparation import some_prep
-from autogaita.common2D.common2D_2_sc_extraction import extract_stepcycles
+from autogaita.common2D.common2D_2_sc_extraction import (
+    extract_stepcycles,
+    write_cycle_validation,
+)
 from autogaita.common2D.common2D_utils import handle_issues
+from autogaita.common2D.common2D_sweep import run_parameter_sweep
 from autogaita.common2D.common2D_3_analysis import analyse_and_export_stepcycles
 from autogaita.common2D.common2D_4_plots import plot_results
-from autogaita.resources.utils import print_finish, PlotPanel
+from autogaita.resources.utils import (
+    print_finish,
+    PlotPanel,
+)
+from autogaita.resources.profiling import (
+    profile_stages,
+    pipeline_stage,
+)
 import matplotlib
 import matplotlib.pyplot as plt
 
@@ -20,17 +31,24 @@ from autogaita.gui.gui_constants import SLEAP_FG_COLOR, SLEAP_HOVER_COLOR
 # .................................  main program  .....................................
 
 
+@profile_stages
 def sleap(info, folderinfo, cfg):
     """Runs the main program for a given ID's run
 
     Procedure
     ---------
     1) import & preparation
-    2) step cycle extraction
+    2) step cycle extraction (dry runs stop here)
     3) x/y-standardisation & feature computation for individual step cycles
     4) step cycle normalisation, dataframe creation & XLS-exportation
-    5) plots
+    5) plots (skipped in compute-only mode)
+    Parameter sweeps (cfg["sweep"]) run these for each variant (see common2D_sweep)
     """
+    # ..................  parameter sweeps (see common2D_sweep)  .......................
+    if "sweep" in cfg.keys() and cfg["sweep"]:
+        run_parameter_sweep("SLEAP", info, folderinfo, cfg)
+        return
+
     # .............. initiate plot panel class and build loading screen ................
     # create class instance independently of "dont_show_plots" to not break the code
     plot_panel_instance = PlotPanel(SLEAP_FG_COLOR, SLEAP_HOVER_COLOR)
@@ -44,23 +62,44 @@ def sleap(info, folderinfo, cfg):
 
     # ................................  preparation  ...................................
     tracking_software = "SLEAP"  # IMPORTANT var for some_prep!
-    data = some_prep(tracking_software, info, folderinfo, cfg)
+    with pipeline_stage("preparation"):
+        data = some_prep(tracking_software, info, folderinfo, cfg)
     if data is None:
         return
 
     # .........................  step-cycle extraction  ................................
-    all_cycles = extract_stepcycles(tracking_software, data, info, folderinfo, cfg)
+    # => dry runs stop after this & only write which SCs were kept or excluded (& why)
+    dry_run = "dry_run" in cfg.keys() and cfg["dry_run"]
+    cycle_log = [] if dry_run else None
+    with pipeline_stage("step-cycle extraction"):
+        all_cycles = extract_stepcycles(
+            tracking_software, data, info, folderinfo, cfg, cycle_log
+        )
+    if dry_run:
+        write_cycle_validation(cycle_log, info)
     if all_cycles is None:
         handle_issues("scs_invalid", info)
         if cfg["dont_show_plots"] is False:  # otherwise stuck at loading
             plot_panel_instance.destroy_plot_panel()
         return
+    if dry_run:
+        if cfg["dont_show_plots"] is False:  # otherwise stuck at loading
+            plot_panel_instance.destroy_plot_panel()
+        print_finish(info)
+        return
 
     # .........  main analysis: sc-lvl y-norm, features, df-creation & export ..........
-    results = analyse_and_export_stepcycles(data, all_cycles, info, cfg)
+    with pipeline_stage("analysis & export"):
+        results = analyse_and_export_stepcycles(data, all_cycles, info, cfg)
 
     # ................................  plots  .........................................
-    plot_results(info, results, cfg, plot_panel_instance)
+    # => skipped in compute-only mode (figures can be rendered later from the results)
+    if "compute_only" in cfg.keys() and cfg["compute_only"]:
+        if cfg["dont_show_plots"] is False:  # otherwise stuck at loading
+            plot_panel_instance.destroy_plot_panel()
+    else:
+        with pipeline_stage("plots"):
+            plot_results(info, results, cfg, plot_panel_instance)
 
     # ............................  print finish  ......................................
     print_finish(info)
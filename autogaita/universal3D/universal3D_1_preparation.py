@@ -2,6 +2,8 @@
 from autogaita.resources.utils import (
     write_issues_to_textfile,
     standardise_primary_joint_coordinates,
+    check_export_profile,
+    cast_to_float_dtype,
 )
 import os
 from importlib.metadata import version
@@ -13,6 +15,8 @@ import numpy as np
 # %% constants
 from autogaita.resources.constants import (
     ISSUES_TXT_FILENAME,
+    ISSUES_JSONL_FILENAME,
+    TIMINGS_JSON_FILENAME,
     CONFIG_JSON_FILENAME,
     TIME_COL,
 )
@@ -64,9 +68,15 @@ def some_prep(info, folderinfo, cfg):
         move_data_to_folders(info, folderinfo)
 
     # .......  initialise Issues.txt & quick check for file existence  .................
-    issue_txt_path = os.path.join(results_dir, ISSUES_TXT_FILENAME)
-    if os.path.exists(issue_txt_path):
-        os.remove(issue_txt_path)
+    # => timings.json would otherwise be reported as this run's if it failed early
+    for previous_filename in [
+        ISSUES_TXT_FILENAME,
+        ISSUES_JSONL_FILENAME,
+        TIMINGS_JSON_FILENAME,
+    ]:
+        previous_file_path = os.path.join(results_dir, previous_filename)
+        if os.path.exists(previous_file_path):
+            os.remove(previous_file_path)
     # read data
     # => note that this catches xls and xlsx files. can do this since we previously
     #    handle cases of both being @ root_dir in move_data_to_folders function
@@ -184,6 +194,8 @@ def some_prep(info, folderinfo, cfg):
         print(unable_to_convert_message)
         write_issues_to_textfile(unable_to_convert_message, info)
         raise ValueError(unable_to_convert_message)
+    # reduced precision: everything from here on runs on float32 (see resources/utils)
+    data = cast_to_float_dtype(data, cfg)
 
     # Standardise y columns to be positive & afterwards save global y_max for flipping
     y_cols = [col for col in data.columns if col.endswith("Y")]
@@ -274,6 +286,7 @@ def test_and_expand_cfg(data, cfg, info):
     Check that all features are present in the dataset
     Add plot_joints & direction_joint
     Make sure to set dont_show_plots to True if Python is not in interactive mode
+    Check the figure export profile
     """
 
     # run the 3 tests first
@@ -344,6 +357,10 @@ def test_and_expand_cfg(data, cfg, info):
         print(no_standardisation_joint_message)
         return (None, None)  # returning tuple bc. some_prep returns 2 variables
 
+    # test the (optional) figure export profile
+    if check_export_profile(cfg, info):
+        return (None, None)
+
     return cfg
 
 
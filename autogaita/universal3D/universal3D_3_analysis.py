@@ -3,7 +3,10 @@ from autogaita.resources.utils import (
     write_issues_to_textfile,
     bin_num_to_percentages,
     compute_angle,
+    add_gradient_features,
     normalise_one_steps_data,
+    preserved_float_dtype,
+    extract_float_dtype,
     write_angle_warning,
 )
 import os
@@ -365,15 +368,15 @@ def standardise_y_z_flip_gait_add_features_to_one_step(step, global_Y_max, info,
     #    - OTHERWISE the way global_Y_max is used to flip gait direction BREAKS IT!
     else:
         non_stand_step = step_copy.copy()
-        y_stand_step = step_copy.copy()
         # first flip gait direction
         if flip_gait_direction:
             non_stand_step = flip_a_steps_gait_direction(
                 non_stand_step, direction_joint, global_Y_max
             )
-            y_stand_step = flip_a_steps_gait_direction(
-                y_stand_step, direction_joint, global_Y_max
-            )
+        # add features once - they don't change if we subtract a constant from all y
+        # coordinates (angles & y velocities/accelerations are based on differences)
+        non_stand_step = add_features(non_stand_step, info, cfg)
+        y_stand_step = non_stand_step.copy()
         # now y-standardise
         # => standardising to the minimum of the joint is correct because flipping
         #    ensures that all steps' y values are increasing as the step progresses
@@ -383,9 +386,6 @@ def standardise_y_z_flip_gait_add_features_to_one_step(step, global_Y_max, info,
         y_cols = [col for col in y_stand_step.columns if col.endswith("Y")]
         y_minimum = y_stand_step[y_standardisation_joint[0] + "Y"].min()
         y_stand_step[y_cols] -= y_minimum
-        # add features & return
-        non_stand_step = add_features(non_stand_step, info, cfg)
-        y_stand_step = add_features(y_stand_step, info, cfg)
         return non_stand_step, y_stand_step
 
 
@@ -492,7 +492,8 @@ def add_angles(step, legname, info, cfg):
             joint3[:, 0] = step[upper_joint + legname + "Y"]
             joint3[:, 1] = step[upper_joint + legname + "Z"]
         # initialise the angle vector and assign looping over timepoints
-        this_angle = np.zeros(len(joint_angle))
+        # => angles are computed in float64 & stored as float32 if reduced precision
+        this_angle = np.zeros(len(joint_angle), dtype=extract_float_dtype(cfg))
         broken_angle_idxs = []  # initialise broken idxs-list for each angle anew
         for t in range(len(joint_angle)):
             this_angle[t], broken = compute_angle(
@@ -523,37 +524,36 @@ def add_velocities(step, legname, cfg):
     angular_acceleration = cfg["angular_acceleration"]
     original_legname = legname  # in case we overwrite legname to be an empty string
 
-    # compute velocities (& acceleration if wanted) for joints
+    # collect the columns of velocities (& acceleration if wanted) for joints
+    source_cols = []
+    velocity_cols = []
+    acceleration_cols = []
     for joint in joints:
         if joint + "Y" in step.columns:
             legname = ""
         else:
             legname = original_legname
-        step[joint + legname + "Velocity"] = 0.0
-        step.loc[:, joint + legname + "Velocity"] = np.gradient(
-            step.loc[:, joint + legname + "Y"]
-        )
+        source_cols.append(joint + legname + "Y")
+        velocity_cols.append(joint + legname + "Velocity")
         if y_acceleration:
-            step[joint + legname + "Acceleration"] = 0.0
-            step.loc[:, joint + legname + "Acceleration"] = np.gradient(
-                step.loc[:, joint + legname + "Velocity"]
-            )
-    # compute velocities (& acceleration) for the angles too
+            acceleration_cols.append(joint + legname + "Acceleration")
+        else:
+            acceleration_cols.append(None)
+    # ... and for the angles too
     for angle in angles["name"]:
         if angle + "Angle" in step.columns:
             legname = ""
         else:
             legname = original_legname
         angle_colname = angle + legname + "Angle"
-        step[angle_colname + " Velocity"] = 0.0  # spaces in colnames here!
-        step.loc[:, angle_colname + " Velocity"] = np.gradient(
-            step.loc[:, angle_colname]
-        )
+        source_cols.append(angle_colname)
+        velocity_cols.append(angle_colname + " Velocity")  # spaces in colnames here!
         if angular_acceleration:
-            step[angle_colname + " Acceleration"] = 0.0
-            step.loc[:, angle_colname + " Acceleration"] = np.gradient(
-                step.loc[:, angle_colname + " Velocity"]
-            )
+            acceleration_cols.append(angle_colname + " Acceleration")
+        else:
+            acceleration_cols.append(None)
+    # compute all of them at once
+    step = add_gradient_features(step, source_cols, velocity_cols, acceleration_cols)
     return step
 
 
@@ -606,7 +606,10 @@ def compute_average_and_std_data(normalised_steps_data, bin_num, analyse_average
         normalised_steps_data.columns
     ):  # caution! c => normalised_steps_data!!
         if col in cols_to_include:
-            this_data = np.zeros([bin_num, sc_num])
+            this_data = np.zeros(
+                [bin_num, sc_num],
+                dtype=preserved_float_dtype(normalised_steps_data[col].dtype),
+            )
             for s in range(sc_num):
                 # with this_end it's bin_num & not bin_num -1 because iloc
                 # does not include last index
@@ -690,7 +693,12 @@ def combine_legs(dataframe_list, combination_procedure):
                 columns=dataframe_list[0].columns,
             )
             for col in dataframe_list[0].columns:
-                this_data = np.zeros([len(dataframe_list[0].index), 2])
+                this_data = np.zeros(
+                    [len(dataframe_list[0].index), 2],
+                    dtype=preserved_float_dtype(
+                        dataframe_list[0][col].dtype, dataframe_list[1][col].dtype
+                    ),
+                )
                 this_data[:, 0] = np.asarray(dataframe_list[0][col])
                 this_data[:, 1] = np.asarray(dataframe_list[1][col])
                 dataframe_list[-1][col] = np.mean(this_data, axis=1)
@@ -3,11 +3,16 @@ from autogaita.universal3D.universal3D_utils import (
     extract_feature_column,
     transform_joint_and_leg_to_colname,
 )
-from autogaita.resources.utils import write_issues_to_textfile
+from autogaita.resources.utils import (
+    write_issues_to_textfile,
+    save_figure_files,
+    render_plot_jobs,
+)
 import os
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+from matplotlib.collections import LineCollection
 
 # %% constants
 from autogaita.resources.constants import TIME_COL
@@ -76,6 +81,9 @@ def plot_results(results, all_cycles, info, cfg, plot_panel_instance):
     if dont_show_plots:
         plt.switch_backend("Agg")
 
+    # collect independent plot jobs of both legs - see render_plot_jobs
+    plot_jobs = []
+
     # unpack - output specific vars (results to be plotted)
     for legname in LEGS:  # !!! NU - output...
         all_steps_data = results[legname]["all_steps_data"]
@@ -84,104 +92,51 @@ def plot_results(results, all_cycles, info, cfg, plot_panel_instance):
         sc_num = results[legname]["sc_num"]
 
         if all_cycles[legname]:
+            step_args = (legname, all_steps_data, all_cycles, info)
+            average_args = (legname, average_data, std_data, sc_num, info)
 
             # ....................  1 - z coords by y coords  ..........................
-            plot_joint_z_by_y(
-                legname, all_steps_data, all_cycles, info, cfg, plot_panel_instance
-            )
+            plot_jobs.append((plot_joint_z_by_y, step_args))
 
             # ........................  2 - y coords by time  ..........................
             if analyse_average_y:
-                plot_joint_y_by_time(
-                    legname, all_steps_data, all_cycles, info, cfg, plot_panel_instance
-                )
+                plot_jobs.append((plot_joint_y_by_time, step_args))
 
             # ..................  3 - angle by time for each SC  .......................
             if angles["name"]:
-                plot_angles_by_time(
-                    legname, all_steps_data, all_cycles, info, cfg, plot_panel_instance
-                )
-            # regularly closing figures to save memory
-            # => no problem to do this since we pass figure-vars to save-functions and Panel
-            plt.close("all")
+                plot_jobs.append((plot_angles_by_time, step_args))
 
             # ............................  4 - stick diagram  .........................
-            plot_stickdiagram(
-                legname, all_steps_data, all_cycles, info, cfg, plot_panel_instance
-            )
+            plot_jobs.append((plot_stickdiagram, step_args))
 
             # .................  5 - average 5-joints' z over SC percentage  ...........
-            plot_joint_z_by_average_SC(
-                legname, average_data, std_data, sc_num, info, cfg, plot_panel_instance
-            )
+            plot_jobs.append((plot_joint_z_by_average_SC, average_args))
 
             # .................  6 - average 5-joints' y over SC percentage  ...........
             if analyse_average_y:
-                plot_joint_y_by_average_SC(
-                    legname,
-                    average_data,
-                    std_data,
-                    sc_num,
-                    info,
-                    cfg,
-                    plot_panel_instance,
-                )
+                plot_jobs.append((plot_joint_y_by_average_SC, average_args))
 
             # ...................  7 - average angles over SC percentage  ..............
             if angles["name"]:
-                plot_angles_by_average_SC(
-                    legname,
-                    average_data,
-                    std_data,
-                    sc_num,
-                    info,
-                    cfg,
-                    plot_panel_instance,
-                )
-            plt.close("all")
+                plot_jobs.append((plot_angles_by_average_SC, average_args))
 
             # .............  8 - average y velocities over SC percentage   .............
-            plot_y_velocities_by_average_SC(
-                legname, average_data, std_data, sc_num, info, cfg, plot_panel_instance
-            )
+            plot_jobs.append((plot_y_velocities_by_average_SC, average_args))
 
             # ..........  9 - average angular velocities over SC percentage  ...........
             if angles["name"]:
-                plot_angular_velocities_by_average_SC(
-                    legname,
-                    average_data,
-                    std_data,
-                    sc_num,
-                    info,
-                    cfg,
-                    plot_panel_instance,
-                )
+                plot_jobs.append((plot_angular_velocities_by_average_SC, average_args))
 
             # .......  optional - 10 - average x acceleration over SC percentage  ......
             if y_acceleration:
-                plot_y_acceleration_by_average_SC(
-                    legname,
-                    average_data,
-                    std_data,
-                    sc_num,
-                    info,
-                    cfg,
-                    plot_panel_instance,
-                )
+                plot_jobs.append((plot_y_acceleration_by_average_SC, average_args))
 
             # ....  optional - 11 - average angular acceleration over SC percentage  ...
             if angles["name"]:
                 if angular_acceleration:
-                    plot_angular_acceleration_by_average_SC(
-                        legname,
-                        average_data,
-                        std_data,
-                        sc_num,
-                        info,
-                        cfg,
-                        plot_panel_instance,
+                    plot_jobs.append(
+                        (plot_angular_acceleration_by_average_SC, average_args)
                     )
-            plt.close("all")
         else:
             no_plots_message = (
                 "\n***********\n! WARNING !\n***********\n"
@@ -193,6 +148,9 @@ def plot_results(results, all_cycles, info, cfg, plot_panel_instance):
             print(no_plots_message)
             write_issues_to_textfile(no_plots_message, info)
 
+    # run jobs (in parallel if cfg["plot_workers"] > 1)
+    figure_paths = render_plot_jobs(plot_jobs, cfg, plot_panel_instance)
+
     # ........................optional - 12 - build plot panel..........................
     if dont_show_plots is True:
         pass  # going on without building the plot window
@@ -201,6 +159,8 @@ def plot_results(results, all_cycles, info, cfg, plot_panel_instance):
         plot_panel_instance.destroy_plot_panel_loading_screen()
         plot_panel_instance.build_plot_panel()
 
+    return figure_paths
+
 
 # ................................  inner functions  ...................................
 
@@ -302,13 +262,13 @@ def plot_joint_z_by_y(
         # figure stuff
         f[j].supxlabel("y")
         f[j].supylabel("z")
-        save_figures(f[j], results_dir, figure_file_string)
+        save_figures(f[j], results_dir, figure_file_string, cfg)
         if dont_show_plots:
             plt.close(f[j])
 
         # add figure to plot panel figures list
         if dont_show_plots is False:  # -> show plot panel
-            plot_panel_instance.figures.append(f[j])
+            plot_panel_instance.add_figure(f[j])
 
 
 def plot_joint_y_by_time(
@@ -406,13 +366,13 @@ def plot_joint_y_by_time(
         # figure stuff
         f[j].supxlabel("Time (s)")
         f[j].supylabel("y")
-        save_figures(f[j], results_dir, figure_file_string)
+        save_figures(f[j], results_dir, figure_file_string, cfg)
         if dont_show_plots:
             plt.close(f[j])
 
         # add figure to plot panel figures list
         if dont_show_plots is False:  # -> show plot panel
-            plot_panel_instance.figures.append(f[j])
+            plot_panel_instance.add_figure(f[j])
 
 
 def plot_angles_by_time(
@@ -479,13 +439,13 @@ def plot_angles_by_time(
         # figure stuff
         f[a].supxlabel("Time (s)")
         f[a].supylabel("Angle (degree)")
-        save_figures(f[a], results_dir, figure_file_string)
+        save_figures(f[a], results_dir, figure_file_string, cfg)
         if dont_show_plots:
             plt.close(f[a])
 
         # add figure to plot panel figures list
         if dont_show_plots is False:  # -> show plot panel
-            plot_panel_instance.figures.append(f[a])
+            plot_panel_instance.add_figure(f[a])
 
 
 def plot_stickdiagram(
@@ -515,6 +475,20 @@ def plot_stickdiagram(
         gridspec_kw={"hspace": 0},
     )
     color_cycle = plt.cycler("color", sns.color_palette(color_palette, max_cycle_num))
+    # check for bodyside-specificity of joints' columns
+    y_col_strings = []
+    z_col_strings = []
+    for joint in plot_joints:
+        if joint + "Y" in all_steps_data.columns:
+            y_col_strings.append(joint + "Y")
+            z_col_strings.append(joint + "Z")
+        else:
+            y_col_strings.append(
+                transform_joint_and_leg_to_colname(joint, legname, "Y")
+            )
+            z_col_strings.append(
+                transform_joint_and_leg_to_colname(joint, legname, "Z")
+            )
 
     # plot
     for r, run_cycles in enumerate(all_cycles[legname]):  # run loop (axis)
@@ -527,50 +501,27 @@ def plot_stickdiagram(
             this_sc_idx = run_cycles[c]
             this_color = this_color_dict["color"][:3]
             this_label = generate_sc_latency_label(this_sc_idx, sampling_rate)
-            # for tps from SC1 to SCend - plot(joint1x, joint1y)
-            for i in range(
-                this_sc_idx[0], this_sc_idx[1] + 1
-            ):  # timepoint loop (of this SC)
-                this_ys = list()  # for each timepoint, define joints' xy coord new
-                this_zs = list()
-                for joint in plot_joints:
-                    # check for bodyside-specificity
-                    if joint + "Y" in all_steps_data.columns:
-                        y_col_string = joint + "Y"
-                        z_col_string = joint + "Z"
-                    else:
-                        y_col_string = transform_joint_and_leg_to_colname(
-                            joint, legname, "Y"
-                        )
-                        z_col_string = transform_joint_and_leg_to_colname(
-                            joint, legname, "Z"
-                        )
-                    this_ys.append(all_steps_data.loc[i, y_col_string])
-                    this_zs.append(all_steps_data.loc[i, z_col_string])
-                if i == range(this_sc_idx[0], this_sc_idx[1] + 1)[0]:
-                    try:
-                        ax[r].plot(
-                            this_ys,
-                            this_zs,
-                            color=this_color,
-                            lw=STICK_LINEWIDTH,
-                            label=this_label,
-                        )
-                    except:
-                        ax.plot(
-                            this_ys,
-                            this_zs,
-                            color=this_color,
-                            lw=STICK_LINEWIDTH,
-                            label=this_label,
-                        )
-                else:  # no label
-                    try:
-                        ax[r].plot(
-                            this_ys, this_zs, color=this_color, lw=STICK_LINEWIDTH
-                        )
-                    except:
-                        ax.plot(this_ys, this_zs, color=this_color, lw=STICK_LINEWIDTH)
+            # each timepoint of this SC is one stick-segment (joint1yz to jointNyz) &
+            # each SC is one LineCollection (one artist & legend entry per SC colour)
+            this_timepoints = range(this_sc_idx[0], this_sc_idx[1] + 1)
+            these_sticks = np.stack(
+                (
+                    all_steps_data.loc[this_timepoints, y_col_strings].to_numpy(float),
+                    all_steps_data.loc[this_timepoints, z_col_strings].to_numpy(float),
+                ),
+                axis=-1,
+            )  # timepoints x joints x 2
+            this_collection = LineCollection(
+                these_sticks, colors=[this_color], lw=STICK_LINEWIDTH, label=this_label
+            )
+            try:
+                ax[r].add_collection(this_collection)
+            except:
+                ax.add_collection(this_collection)
+        try:
+            ax[r].autoscale_view()
+        except:
+            ax.autoscale_view()
         # axis stuff
         try:
             if legend_outside is True:
@@ -604,13 +555,13 @@ def plot_stickdiagram(
             ax.set_title(figure_file_string)
     f.supxlabel("y")
     f.supylabel("z")
-    save_figures(f, results_dir, figure_file_string)
+    save_figures(f, results_dir, figure_file_string, cfg)
     if dont_show_plots:
         plt.close(f)
 
     # add figure to plot panel figures list
     if dont_show_plots is False:  # -> show plot panel
-        plot_panel_instance.figures.append(f)
+        plot_panel_instance.add_figure(f)
 
 
 def plot_joint_z_by_average_SC(
@@ -655,13 +606,13 @@ def plot_joint_z_by_average_SC(
         name + " - " + legname + " - Joint z-coord.s over average step cycle"
     )
     ax.set_title(figure_file_string)
-    save_figures(f, results_dir, figure_file_string)
+    save_figures(f, results_dir, figure_file_string, cfg)
     if dont_show_plots:
         plt.close(f)
 
     # add figure to plot panel figures list
     if dont_show_plots is False:  # -> show plot panel
-        plot_panel_instance.figures.append(f)
+        plot_panel_instance.add_figure(f)
 
 
 def plot_joint_y_by_average_SC(
@@ -706,13 +657,13 @@ def plot_joint_y_by_average_SC(
         name + " - " + legname + " - Joint y-coord.s over average step cycle"
     )
     ax.set_title(figure_file_string)
-    save_figures(f, results_dir, figure_file_string)
+    save_figures(f, results_dir, figure_file_string, cfg)
     if dont_show_plots:
         plt.close(f)
 
     # add figure to plot panel figures list
     if dont_show_plots is False:  # -> show plot panel
-        plot_panel_instance.figures.append(f)
+        plot_panel_instance.add_figure(f)
 
 
 def plot_angles_by_average_SC(
@@ -761,13 +712,13 @@ def plot_angles_by_average_SC(
         name + " - " + legname + " - Joint angles over average step cycle"
     )
     ax.set_title(figure_file_string)
-    save_figures(f, results_dir, figure_file_string)
+    save_figures(f, results_dir, figure_file_string, cfg)
     if dont_show_plots:
         plt.close(f)
 
     # add figure to plot panel figures list
     if dont_show_plots is False:  # -> show plot panel
-        plot_panel_instance.figures.append(f)
+        plot_panel_instance.add_figure(f)
 
 
 def plot_y_velocities_by_average_SC(
@@ -816,13 +767,13 @@ def plot_y_velocities_by_average_SC(
         name + " - " + legname + " - Joint y-velocities over average step cycle"
     )
     ax.set_title(figure_file_string)
-    save_figures(f, results_dir, figure_file_string)
+    save_figures(f, results_dir, figure_file_string, cfg)
     if dont_show_plots:
         plt.close(f)
 
     # add figure to plot panel figures list
     if dont_show_plots is False:  # -> show plot panel
-        plot_panel_instance.figures.append(f)
+        plot_panel_instance.add_figure(f)
 
 
 def plot_angular_velocities_by_average_SC(
@@ -869,13 +820,13 @@ def plot_angular_velocities_by_average_SC(
         name + " - " + legname + " - Angular velocities over average step cycle"
     )
     ax.set_title(figure_file_string)
-    save_figures(f, results_dir, figure_file_string)
+    save_figures(f, results_dir, figure_file_string, cfg)
     if dont_show_plots:
         plt.close(f)
 
     # add figure to plot panel figures list
     if dont_show_plots is False:  # -> show plot panel
-        plot_panel_instance.figures.append(f)
+        plot_panel_instance.add_figure(f)
 
 
 def plot_y_acceleration_by_average_SC(
@@ -925,13 +876,13 @@ def plot_y_acceleration_by_average_SC(
         name + " - " + legname + " - Joint y-accelerations over average step cycle"
     )
     ax.set_title(figure_file_string)
-    save_figures(f, results_dir, figure_file_string)
+    save_figures(f, results_dir, figure_file_string, cfg)
     if dont_show_plots:
         plt.close(f)
 
     # add figure to plot panel figures list
     if dont_show_plots is False:  # -> show plot panel
-        plot_panel_instance.figures.append(f)
+        plot_panel_instance.add_figure(f)
 
 
 def plot_angular_acceleration_by_average_SC(
@@ -981,30 +932,20 @@ def plot_angular_acceleration_by_average_SC(
         name + " - " + legname + " - Angular accelerations over average step cycle"
     )
     ax.set_title(figure_file_string)
-    save_figures(f, results_dir, figure_file_string)
+    save_figures(f, results_dir, figure_file_string, cfg)
     if dont_show_plots:
         plt.close(f)
 
     # add figure to plot panel figures list
     if dont_show_plots is False:  # -> show plot panel
-        plot_panel_instance.figures.append(f)
+        plot_panel_instance.add_figure(f)
 
 
 # ..............................  helper functions  ....................................
-def save_figures(figure, results_dir, figure_file_string):
-    """Save figures as pngs to results_dir and as svgs to separate subfolders"""
-    # pngs to results_dir
-    figure.savefig(
-        os.path.join(results_dir, figure_file_string + ".png"),
-        bbox_inches="tight",
-    )
-    # svgs to subfolders
-    svg_dir = os.path.join(results_dir, "SVG Figures")
-    if not os.path.exists(svg_dir):
-        os.makedirs(svg_dir)
-    figure.savefig(
-        os.path.join(svg_dir, figure_file_string + ".svg"), bbox_inches="tight"
-    )
+def save_figures(figure, results_dir, figure_file_string, cfg):
+    """Save figures according to the export profile (by default pngs to results_dir
+    and svgs to a separate subfolder)"""
+    save_figure_files(figure, results_dir, figure_file_string, cfg)
 
 
 def generate_sc_latency_label(this_sc_idx, sampling_rate):
@@ -6,7 +6,14 @@ from autogaita.universal3D.universal3D_2_sc_extraction import (
 )
 from autogaita.universal3D.universal3D_3_analysis import analyse_and_export_stepcycles
 from autogaita.universal3D.universal3D_4_plots import plot_results
-from autogaita.resources.utils import print_finish, PlotPanel
+from autogaita.resources.utils import (
+    print_finish,
+    PlotPanel,
+)
+from autogaita.resources.profiling import (
+    profile_stages,
+    pipeline_stage,
+)
 import matplotlib
 import matplotlib.pyplot as plt
 
@@ -37,6 +44,7 @@ from autogaita.gui.gui_constants import UNIVERSAL3D_FG_COLOR, UNIVERSAL3D_HOVER_
 
 
 # .................................  main program  .....................................
+@profile_stages
 def universal3D(info, folderinfo, cfg):
     """Runs the main program for a given subject's run
 
@@ -46,7 +54,7 @@ def universal3D(info, folderinfo, cfg):
     2) step cycle extraction
     3) z-normalisation, y-flipping & feature computation for individual step cycles
     4) step cycle normalisaion, dataframe creation & XLS-exportation
-    5) plots
+    5) plots (skipped in compute-only mode)
     """
     # .............. initiate plot panel class and build loading screen ................
     # create class instance independently of "dont_show_plots" to not break the code
@@ -60,23 +68,34 @@ def universal3D(info, folderinfo, cfg):
         plot_panel_instance.build_plot_panel_loading_screen()
 
     # ...............................  preparation  ....................................
-    data, global_Y_max = some_prep(info, folderinfo, cfg)
+    with pipeline_stage("preparation"):
+        data, global_Y_max = some_prep(info, folderinfo, cfg)
     if (data is None) & (global_Y_max is None):
         return
 
     # ..........................  step-cycle extraction  ...............................
-    all_cycles = extract_stepcycles(data, info, folderinfo, cfg)
-    all_cycles = check_stepcycles(all_cycles, info)
+    with pipeline_stage("step-cycle extraction"):
+        all_cycles = extract_stepcycles(data, info, folderinfo, cfg)
+        all_cycles = check_stepcycles(all_cycles, info)
     if not all_cycles:  # only None if both leg's SCs were None
         if cfg["dont_show_plots"] is False:  # otherwise stuck at loading
             plot_panel_instance.destroy_plot_panel()
         return
 
     # ......  main analysis: y-flipping, features, df-creation & exports  ..............
-    results = analyse_and_export_stepcycles(data, all_cycles, global_Y_max, info, cfg)
+    with pipeline_stage("analysis & export"):
+        results = analyse_and_export_stepcycles(
+            data, all_cycles, global_Y_max, info, cfg
+        )
 
     # ..................................  plots  .......................................
-    plot_results(results, all_cycles, info, cfg, plot_panel_instance)
+    # => skipped in compute-only mode (figures can be rendered later from the results)
+    if "compute_only" in cfg.keys() and cfg["compute_only"]:
+        if cfg["dont_show_plots"] is False:  # otherwise stuck at loading
+            plot_panel_instance.destroy_plot_panel()
+    else:
+        with pipeline_stage("plots"):
+            plot_results(results, all_cycles, info, cfg, plot_panel_instance)
 
     # ..............................  print finish  ....................................
     print_finish(info)
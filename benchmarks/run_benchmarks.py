@@ -0,0 +1,411 @@
+# %% imports
+from autogaita.common2D import common2D_1_preparation as prep2D
+from autogaita.common2D import common2D_2_sc_extraction as sc2D
+from autogaita.common2D import common2D_3_analysis as analysis2D
+from autogaita.common2D import common2D_4_plots as plots2D
+from autogaita.universal3D import universal3D_1_preparation as prep3D
+from autogaita.universal3D import universal3D_2_sc_extraction as sc3D
+from autogaita.universal3D import universal3D_3_analysis as analysis3D
+from autogaita.universal3D import universal3D_4_plots as plots3D
+from autogaita.group import group_1_preparation as group_prep
+from autogaita.group import group_2_data_processing as group_processing
+from autogaita.group.group_3_PCA import PCA_main
+from autogaita.group import group_4_stats as group_stats
+import os
+import sys
+import copy
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import datetime
+import statistics
+import contextlib
+import subprocess
+import numpy as np
+import pandas as pd
+import matplotlib
+import matplotlib.pyplot as plt
+
+# allow running this as a script from anywhere (python benchmarks/run_benchmarks.py)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import synthetic_data  # noqa: E402
+
+# %% constants
+matplotlib.use("agg")
+plt.rcParams["figure.dpi"] = 300  # same resolution as in our main modules
+SCALES = {
+    "small": {
+        "frame_number": 1000,
+        "joint_number": 5,
+        "angle_number": 3,
+        "cycle_number": 8,
+        "id_number": 2,
+        "group_number": 2,
+        "permutation_number": 50,
+    },
+    "medium": {
+        "frame_number": 5000,
+        "joint_number": 8,
+        "angle_number": 6,
+        "cycle_number": 25,
+        "id_number": 4,
+        "group_number": 3,
+        "permutation_number": 200,
+    },
+    "large": {
+        "frame_number": 20000,
+        "joint_number": 12,
+        "angle_number": 10,
+        "cycle_number": 80,
+        "id_number": 8,
+        "group_number": 4,
+        "permutation_number": 1000,
+    },
+}
+SCENARIOS = ["DLC", "SLEAP", "Universal 3D", "Group"]
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+# %% ...................................  main  ........................................
+def main(argv=None):
+    """Run (some) benchmark scenarios, save their timings to a json file & optionally
+    compare them to those of a previous json file (e.g. of another commit)"""
+    args = parse_arguments(argv)
+    params = copy.deepcopy(SCALES[args.scale])
+    for key in params.keys():
+        if getattr(args, key) is not None:
+            params[key] = getattr(args, key)
+    work_dir = tempfile.mkdtemp(prefix="autogaita_benchmarks_")
+    results = []
+    try:
+        for scenario in args.scenarios:
+            print(f"\n{scenario} ...")
+            results.extend(run_scenario(scenario, params, work_dir, args.repeats))
+    finally:
+        if args.keep_data:
+            print(f"\nSynthetic data & results are in {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    benchmark_info = {
+        "commit": git_commit(),
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "scale": args.scale,
+        "params": params,
+        "repeats": args.repeats,
+        "environment": environment_info(),
+        "results": results,
+    }
+    output_path = args.output
+    if not output_path:
+        output_path = os.path.join(
+            OUTPUT_DIR, benchmark_info["commit"] + " - " + args.scale + ".json"
+        )
+    if os.path.dirname(output_path) and not os.path.exists(
+        os.path.dirname(output_path)
+    ):
+        os.makedirs(os.path.dirname(output_path))
+    with open(output_path, "w") as output_file:
+        json.dump(benchmark_info, output_file, indent=4)
+    print(f"\nSaved benchmark results to {output_path}")
+    if args.compare:
+        with open(args.compare, "r") as compare_file:
+            print_comparison(json.load(compare_file), benchmark_info)
+    return benchmark_info
+
+
+def parse_arguments(argv):
+    parser = argparse.ArgumentParser(
+        description="Time AutoGaitA's pipeline stages on synthetic data"
+    )
+    parser.add_argument("--scale", choices=list(SCALES.keys()), default="small")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", default="", help="json file to save timings to")
+    parser.add_argument("--compare", default="", help="json file to compare with")
+    parser.add_argument("--keep-data", action="store_true")
+    for key in SCALES["small"].keys():  # override a scale's parameters
+        parser.add_argument("--" + key.replace("_", "-"), type=int, default=None)
+    return parser.parse_args(argv)
+
+
+# %% ...............................  scenarios  .......................................
+def run_scenario(scenario, params, work_dir, repeats):
+    """Set up a scenario's data (untimed) & time each of its stages"""
+    scenario_dir = os.path.join(work_dir, scenario.replace(" ", ""))
+    with quiet():
+        if scenario in ["DLC", "SLEAP"]:
+            stages = common2D_stages(scenario, params, scenario_dir)
+        elif scenario == "Universal 3D":
+            stages = universal3D_stages(params, scenario_dir)
+        elif scenario == "Group":
+            stages = group_stages(params, scenario_dir)
+    results = []
+    for stage, function, make_args in stages:
+        wall_times = time_stage(function, make_args, repeats)
+        results.append(
+            {
+                "scenario": scenario,
+                "stage": stage,
+                "wall_time_s": wall_times,
+                "min_s": min(wall_times),
+                "median_s": statistics.median(wall_times),
+            }
+        )
+        print(f"  {stage:<40}{statistics.median(wall_times):>10.3f} s")
+    return results
+
+
+def time_stage(function, make_args, repeats):
+    """Time repeated calls of function - arguments are created outside of the timer
+    (most stages modify their inputs)"""
+    wall_times = []
+    for _ in range(repeats):
+        args = make_args()
+        with quiet():
+            start = time.perf_counter()
+            function(*args)
+            wall_times.append(time.perf_counter() - start)
+        plt.close("all")
+    return wall_times
+
+
+def common2D_stages(tracking_software, params, scenario_dir):
+    """Stages of DLC & SLEAP - inputs of later stages come from an untimed run"""
+    folderinfo, cfg, infos = synthetic_data.write_2D_dataset(
+        os.path.join(scenario_dir, "data"),
+        tracking_software=tracking_software,
+        **dataset_params(params),
+    )
+    info = infos[0]
+    info["results_dir"] = os.path.join(scenario_dir, "Results", info["name"])
+    prepared_cfg = copy.deepcopy(cfg)
+    data = prep2D.some_prep(tracking_software, info, folderinfo, prepared_cfg)
+    all_cycles = sc2D.extract_stepcycles(
+        tracking_software, data.copy(), info, folderinfo, prepared_cfg
+    )
+    results = analysis2D.analyse_and_export_stepcycles(
+        data.copy(), all_cycles, info, copy.deepcopy(prepared_cfg)
+    )
+    return [
+        (
+            "some_prep",
+            prep2D.some_prep,
+            lambda: (tracking_software, info, folderinfo, copy.deepcopy(cfg)),
+        ),
+        (
+            "extract_stepcycles",
+            sc2D.extract_stepcycles,
+            lambda: (
+                tracking_software,
+                data.copy(),
+                info,
+                folderinfo,
+                copy.deepcopy(prepared_cfg),
+            ),
+        ),
+        (
+            "analyse_and_export_stepcycles",
+            analysis2D.analyse_and_export_stepcycles,
+            lambda: (
+                data.copy(),
+                copy.deepcopy(all_cycles),
+                info,
+                copy.deepcopy(prepared_cfg),
+            ),
+        ),
+        (
+            "plot_results",
+            plots2D.plot_results,
+            lambda: (info, results, copy.deepcopy(prepared_cfg), None),
+        ),
+    ]
+
+
+def universal3D_stages(params, scenario_dir):
+    """Stages of Universal 3D - inputs of later stages come from an untimed run"""
+    folderinfo, cfg, infos = synthetic_data.write_universal3D_dataset(
+        os.path.join(scenario_dir, "data"), **dataset_params(params)
+    )
+    info = infos[0]
+    info["results_dir"] = os.path.join(scenario_dir, "Results", info["name"])
+    prepared_cfg = copy.deepcopy(cfg)
+    data, global_Y_max = prep3D.some_prep(info, folderinfo, prepared_cfg)
+    all_cycles = extract_and_check_3D_stepcycles(
+        data.copy(), info, folderinfo, prepared_cfg
+    )
+    results = analysis3D.analyse_and_export_stepcycles(
+        data.copy(), all_cycles, global_Y_max, info, copy.deepcopy(prepared_cfg)
+    )
+    return [
+        (
+            "some_prep",
+            prep3D.some_prep,
+            lambda: (info, folderinfo, copy.deepcopy(cfg)),
+        ),
+        (
+            "extract_stepcycles",
+            extract_and_check_3D_stepcycles,
+            lambda: (data.copy(), info, folderinfo, copy.deepcopy(prepared_cfg)),
+        ),
+        (
+            "analyse_and_export_stepcycles",
+            analysis3D.analyse_and_export_stepcycles,
+            lambda: (
+                data.copy(),
+                copy.deepcopy(all_cycles),
+                global_Y_max,
+                info,
+                copy.deepcopy(prepared_cfg),
+            ),
+        ),
+        (
+            "plot_results",
+            plots3D.plot_results,
+            lambda: (results, all_cycles, info, copy.deepcopy(prepared_cfg), None),
+        ),
+    ]
+
+
+def extract_and_check_3D_stepcycles(data, info, folderinfo, cfg):
+    all_cycles = sc3D.extract_stepcycles(data, info, folderinfo, cfg)
+    return sc3D.check_stepcycles(all_cycles, info)
+
+
+def group_stages(params, scenario_dir):
+    """Stages of group analyses - first-level Results are computed during setup"""
+    folderinfo, cfg = synthetic_data.write_group_results(
+        scenario_dir,
+        group_number=params["group_number"],
+        permutation_number=params["permutation_number"],
+        **dataset_params(params),
+    )
+    folderinfo, cfg = group_prep.some_prep(folderinfo, cfg)
+    dfs, raw_dfs, cfg = group_processing.import_data(folderinfo, copy.deepcopy(cfg))
+    avg_dfs, std_dfs = group_processing.avg_and_std(dfs, folderinfo, cfg)
+    g_avg_dfs, g_std_dfs = group_processing.grand_avg_and_std(avg_dfs, folderinfo, cfg)
+    stats_df = group_stats.create_stats_df(avg_dfs, folderinfo, cfg)
+    stats_var = cfg["stats_variables"][0]
+    ANOVA_results = group_stats.run_all_ANOVAs(stats_df, cfg["stats_variables"], cfg)
+    return [
+        (
+            "import_data",
+            group_processing.import_data,
+            lambda: (folderinfo, copy.deepcopy(cfg)),
+        ),
+        (
+            "PCA_main",
+            PCA_main,
+            lambda: (copy.deepcopy(avg_dfs), folderinfo, copy.deepcopy(cfg), None),
+        ),
+        (
+            "cluster_extent_test",
+            group_stats.cluster_extent_test,
+            lambda: (
+                stats_df.copy(),
+                g_avg_dfs,
+                g_std_dfs,
+                stats_var,
+                folderinfo,
+                copy.deepcopy(cfg),
+                None,
+            ),
+        ),
+        (
+            "run_all_ANOVAs",
+            group_stats.run_all_ANOVAs,
+            lambda: (stats_df.copy(), cfg["stats_variables"], copy.deepcopy(cfg)),
+        ),
+        (
+            "ANOVA_main",
+            group_stats.ANOVA_main,
+            lambda: (
+                stats_df.copy(),
+                g_avg_dfs,
+                g_std_dfs,
+                stats_var,
+                ANOVA_results[stats_var],
+                folderinfo,
+                copy.deepcopy(cfg),
+                None,
+            ),
+        ),
+    ]
+
+
+def dataset_params(params):
+    """Parameters that our dataset writers accept"""
+    return {
+        key: params[key]
+        for key in [
+            "frame_number",
+            "joint_number",
+            "angle_number",
+            "cycle_number",
+            "id_number",
+        ]
+    }
+
+
+# %% ...............................  comparison  ......................................
+def print_comparison(old_info, new_info):
+    """Print median times of two benchmark runs & their ratio (new / old)"""
+    print(
+        f"\nComparing {new_info['commit']} ({new_info['scale']}) to "
+        + f"{old_info['commit']} ({old_info['scale']})"
+    )
+    old_medians = {
+        (result["scenario"], result["stage"]): result["median_s"]
+        for result in old_info["results"]
+    }
+    print(f"{'stage':<50}{'old (s)':>10}{'new (s)':>10}{'ratio':>8}")
+    for result in new_info["results"]:
+        key = (result["scenario"], result["stage"])
+        label = " - ".join(key)
+        if key not in old_medians.keys():
+            print(f"{label:<50}{'':>10}{result['median_s']:>10.3f}{'':>8}")
+            continue
+        ratio = result["median_s"] / old_medians[key]
+        print(
+            f"{label:<50}{old_medians[key]:>10.3f}{result['median_s']:>10.3f}"
+            + f"{ratio:>8.2f}"
+        )
+
+
+# %% ...............................  local functions  .................................
+@contextlib.contextmanager
+def quiet():
+    """Silence AutoGaitA's prints while setting up & timing stages"""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def environment_info():
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "matplotlib": matplotlib.__version__,
+    }
+
+
+# %% ..................................  if we hit run  ................................
+if __name__ == "__main__":
+    main()
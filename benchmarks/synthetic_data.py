@@ -0,0 +1,398 @@
+# %% imports
+from autogaita.resources.utils import try_to_run_gaita
+import os
+import copy
+import numpy as np
+import pandas as pd
+import h5py
+
+# %% constants
+SAMPLING_RATE = 100
+LEAD_FRAMES = 20  # frames before the first & after the last step cycle
+SWING_FRACTION = 0.4  # of each step cycle
+DLC_SCORER = "DLC_synthetic"
+BEAM_Y = 500  # pixels - image y-axis points downwards
+STRIDE_2D = 40  # pixels per step cycle
+JOINT_DISTANCE_2D = 30  # pixels between joints along the limb
+STRIDE_3D = 0.6  # metres per step cycle
+JOINT_DISTANCE_3D = 0.15  # metres between joints along the leg
+PREMOUSE_STRING = "Mouse"
+POSTMOUSE_STRING = "Synth"
+PRERUN_STRING = "run"
+POSTRUN_STRING = "Gait"
+DATA_STRING = "Data"
+BEAM_STRING = "Beam"
+SCTABLE_FILENAME = "SC Table.xlsx"
+FORE_JOINTS = ["Wrist", "Elbow"]
+BEAM_COLS = ["BeamLeft", "BeamRight"]
+BEAM_HIND_JOINTADD = ["Tail base"]
+BEAM_FORE_JOINTADD = ["Nose"]
+LEGS = ["left", "right"]
+
+
+# %% ..........................  synthetic gait (2D & 3D)  .............................
+def simulate_limb(
+    frame_number, joint_number, cycle_number, amplitude, phase_shift, rng
+):
+    """Simulate the forward (x) & height (y) coordinates of a limb's joints
+
+    Note
+    ----
+    Joints are stacked from the paw/foot (joint 1) upwards & move forward with
+    constant speed. During the swing phase of each cycle they are lifted & swung
+    forward - the more distal a joint, the more it moves. Coordinates are in units of
+    one stride (x) & of the distance between two joints (y) & include a bit of noise.
+    Returns x & y (frame_number x joint_number arrays) and the cycles' frames.
+    """
+    cycle_frames = (frame_number - 2 * LEAD_FRAMES) // cycle_number
+    if cycle_frames < 10:
+        raise ValueError("Use more frames or fewer cycles - cycles need 10+ frames!")
+    swing_frames = int(cycle_frames * SWING_FRACTION)
+    frames = np.arange(frame_number)
+    # phase within the current cycle & swing masks (also before the first cycle)
+    cycle_phase = ((frames - LEAD_FRAMES - phase_shift) % cycle_frames) / cycle_frames
+    swing_phase = np.clip(cycle_phase / SWING_FRACTION, 0, 1)
+    in_swing = cycle_phase < SWING_FRACTION
+    distality = 1 - np.arange(joint_number) / joint_number  # 1 at the paw
+    x = frames[:, None] / cycle_frames + np.zeros((1, joint_number))
+    x += 0.25 * amplitude * np.sin(2 * np.pi * cycle_phase)[:, None] * distality
+    y = np.arange(joint_number)[None, :] + 0.5 + np.zeros((frame_number, 1))
+    lift = np.where(in_swing, np.sin(np.pi * swing_phase), 0)
+    y += 0.5 * amplitude * lift[:, None] * distality
+    x += rng.normal(0, 0.005, x.shape)
+    y += rng.normal(0, 0.005, y.shape)
+    cycles = []
+    for c in range(cycle_number):
+        start = LEAD_FRAMES + phase_shift + c * cycle_frames
+        end = start + cycle_frames - 1
+        if end < frame_number - 1:  # a phase_shift can push the last one out
+            cycles.append((start, start + swing_frames, end))
+    return x, y, cycles
+
+
+def joint_names(joint_number):
+    return [f"Joint {j + 1}" for j in range(joint_number)]
+
+
+def angle_dict(angle_number, joints):
+    """Angles of consecutive joints (the middle joint gives the name)"""
+    if angle_number > len(joints) - 2:
+        raise ValueError("We can compute at most joint_number - 2 angles!")
+    return {
+        "name": [joints[a + 1] for a in range(angle_number)],
+        "lower_joint": [joints[a] for a in range(angle_number)],
+        "upper_joint": [joints[a + 2] for a in range(angle_number)],
+    }
+
+
+def annotation_rows(cycles, sampling_rate):
+    """Swing (ti), Swing (te) & Stance (te) values (in seconds) of a list of cycles"""
+    row = []
+    for start, swing_end, end in cycles:
+        row.extend(
+            [start / sampling_rate, swing_end / sampling_rate, end / sampling_rate]
+        )
+    return row
+
+
+def annotation_columns(cycle_number):
+    return ["Swing (ti)", "Swing (te)", "Stance (te)"] * cycle_number
+
+
+# %% ..........................  DLC & SLEAP datasets  .................................
+def write_2D_dataset(
+    root_dir,
+    tracking_software="DLC",
+    frame_number=2000,
+    joint_number=5,
+    angle_number=3,
+    cycle_number=10,
+    id_number=2,
+    run_number=1,
+    amplitude=1.0,
+    seed=0,
+):
+    """Write DLC csv or SLEAP h5 files (data & beam) of synthetic IDs/runs together with
+    their annotation table to root_dir
+
+    Note
+    ----
+    Returns folderinfo, cfg & a list of info dicts (without results_dir) that can be
+    passed to autogaita.dlc or autogaita.sleap.
+    """
+    if not os.path.exists(root_dir):
+        os.makedirs(root_dir)
+    rng = np.random.default_rng(seed)
+    hind_joints = joint_names(joint_number)
+    bodyparts = hind_joints + FORE_JOINTS + BEAM_HIND_JOINTADD + BEAM_FORE_JOINTADD
+    file_type = ".csv" if tracking_software == "DLC" else ".h5"
+    infos = []
+    table_rows = []
+    for mouse_num in range(1, id_number + 1):
+        for run_num in range(1, run_number + 1):
+            x, y, cycles = simulate_limb(
+                frame_number, joint_number, cycle_number, amplitude, 0, rng
+            )
+            # fore limb, tail & nose move along without any swing
+            extra_number = len(bodyparts) - joint_number
+            extra_x = x[:, :1] + 1 + np.arange(extra_number)[None, :] * 0.1
+            extra_y = np.full((frame_number, extra_number), joint_number + 0.5)
+            x = 100 + STRIDE_2D * np.concatenate([x, extra_x], axis=1)
+            y = BEAM_Y - JOINT_DISTANCE_2D * np.concatenate([y, extra_y], axis=1)
+            beam_x = np.tile([[0.0, STRIDE_2D * frame_number]], (frame_number, 1))
+            beam_y = BEAM_Y + rng.normal(0, 0.1, (frame_number, 2))
+            filename_start = (
+                f"{PREMOUSE_STRING}{mouse_num}_{POSTMOUSE_STRING}_"
+                + f"{PRERUN_STRING}{run_num}_{POSTRUN_STRING}_"
+            )
+            for file_string, xs, ys, names in [
+                (DATA_STRING, x, y, bodyparts),
+                (BEAM_STRING, beam_x, beam_y, BEAM_COLS),
+            ]:
+                filepath = os.path.join(root_dir, filename_start + file_string)
+                if tracking_software == "DLC":
+                    write_DLC_csv(filepath + file_type, xs, ys, names)
+                else:
+                    write_SLEAP_h5(filepath + file_type, xs, ys, names)
+            infos.append(
+                {
+                    "mouse_num": mouse_num,
+                    "run_num": run_num,
+                    "name": f"ID {mouse_num} - Run {run_num}",
+                }
+            )
+            table_rows.append(
+                [mouse_num if run_num == 1 else np.nan, run_num, len(cycles)]
+                + annotation_rows(cycles, SAMPLING_RATE)
+            )
+    table = pd.DataFrame(
+        table_rows,
+        columns=["ID", "Run", "SC Number"] + annotation_columns(cycle_number),
+    )
+    table.to_excel(os.path.join(root_dir, SCTABLE_FILENAME), index=False)
+    folderinfo = {
+        "root_dir": root_dir,
+        "sctable_filename": SCTABLE_FILENAME,
+        "data_string": DATA_STRING,
+        "beam_string": BEAM_STRING,
+        "premouse_string": PREMOUSE_STRING,
+        "postmouse_string": POSTMOUSE_STRING,
+        "prerun_string": PRERUN_STRING,
+        "postrun_string": POSTRUN_STRING,
+    }
+    return folderinfo, cfg_2D(hind_joints, angle_number), infos
+
+
+def write_DLC_csv(filepath, x, y, bodyparts):
+    """Write coordinates in the (3 header rows) format of DLC"""
+    columns = pd.MultiIndex.from_product(
+        [[DLC_SCORER], bodyparts, ["x", "y", "likelihood"]],
+        names=["scorer", "bodyparts", "coords"],
+    )
+    values = np.stack([x, y, np.full(x.shape, 0.99)], axis=2)
+    df = pd.DataFrame(values.reshape(len(x), -1), columns=columns)
+    df.to_csv(filepath)
+
+
+def write_SLEAP_h5(filepath, x, y, node_names):
+    """Write coordinates in the format of SLEAP's analysis h5 files (one track)"""
+    tracks = np.stack([x, y], axis=2)[
+        :, :, :, None
+    ].T  # tracks x coords x nodes x frames
+    with h5py.File(filepath, "w") as f:
+        f.create_dataset("tracks", data=tracks)
+        f.create_dataset("node_names", data=[n.encode() for n in node_names])
+
+
+def cfg_2D(hind_joints, angle_number):
+    """cfg of our synthetic DLC & SLEAP datasets (mirrors our approval tests)"""
+    return {
+        "sampling_rate": SAMPLING_RATE,
+        "subtract_beam": True,
+        "dont_show_plots": True,
+        "convert_to_mm": True,
+        "pixel_to_mm_ratio": 3.76,
+        "x_sc_broken_threshold": 200,
+        "y_sc_broken_threshold": 50,
+        "x_acceleration": True,
+        "angular_acceleration": True,
+        "save_to_xls": True,
+        "bin_num": 25,
+        "plot_SE": True,
+        "standardise_y_at_SC_level": False,
+        "standardise_y_to_a_joint": True,
+        "y_standardisation_joint": [hind_joints[0]],
+        "plot_joint_number": min(3, len(hind_joints)),
+        "color_palette": "viridis",
+        "legend_outside": True,
+        "invert_y_axis": True,
+        "flip_gait_direction": True,
+        "analyse_average_x": True,
+        "standardise_x_coordinates": True,
+        "x_standardisation_joint": [hind_joints[0]],
+        "coordinate_standardisation_xls": "",
+        "sc_times_in_frames": False,
+        "hind_joints": hind_joints,
+        "fore_joints": copy.deepcopy(FORE_JOINTS),
+        "beam_col_left": [BEAM_COLS[0]],
+        "beam_col_right": [BEAM_COLS[1]],
+        "beam_hind_jointadd": copy.deepcopy(BEAM_HIND_JOINTADD),
+        "beam_fore_jointadd": copy.deepcopy(BEAM_FORE_JOINTADD),
+        "angles": angle_dict(angle_number, hind_joints),
+    }
+
+
+# %% ............................  Universal 3D datasets  ..............................
+def write_universal3D_dataset(
+    root_dir,
+    frame_number=2000,
+    joint_number=5,
+    angle_number=3,
+    cycle_number=10,
+    id_number=2,
+    amplitude=1.0,
+    seed=0,
+):
+    """Write Universal 3D sheets of synthetic subjects (walking along y with both
+    legs) & their annotation table to root_dir
+
+    Note
+    ----
+    Returns folderinfo, cfg & a list of info dicts (without results_dir).
+    """
+    if not os.path.exists(root_dir):
+        os.makedirs(root_dir)
+    rng = np.random.default_rng(seed)
+    joints = joint_names(joint_number)
+    cycle_frames = (frame_number - 2 * LEAD_FRAMES) // cycle_number
+    infos = []
+    table_rows = []
+    for subject_num in range(1, id_number + 1):
+        name = f"Subject{subject_num}"
+        data = pd.DataFrame({"Time": np.arange(frame_number) / SAMPLING_RATE})
+        table_rows.append([name, np.nan, np.nan, np.nan])
+        for l, leg in enumerate(LEGS):
+            y, z, cycles = simulate_limb(
+                frame_number,
+                joint_number,
+                cycle_number,
+                amplitude,
+                l * cycle_frames // 2,  # legs alternate
+                rng,
+            )
+            lateral = (-1) ** l * 0.1
+            for j, joint in enumerate(joints):
+                data[f"{joint}, {leg} X"] = lateral + rng.normal(0, 0.005, frame_number)
+                data[f"{joint}, {leg} Y"] = STRIDE_3D * y[:, j]
+                data[f"{joint}, {leg} Z"] = JOINT_DISTANCE_3D * z[:, j]
+            table_rows.append(
+                [np.nan, leg, 1, len(cycles)] + annotation_rows(cycles, SAMPLING_RATE)
+            )
+            table_rows.append([np.nan, np.nan, np.nan, np.nan])  # empty row after legs
+        data.to_excel(os.path.join(root_dir, name + ".xlsx"), index=False)
+        infos.append({"name": name})
+    columns = ["Subject", "Leg", "Runs", "SC Number"] + annotation_columns(cycle_number)
+    table_rows = [row + [np.nan] * (len(columns) - len(row)) for row in table_rows]
+    table = pd.DataFrame(table_rows, columns=columns)
+    table.to_excel(os.path.join(root_dir, SCTABLE_FILENAME), index=False)
+    folderinfo = {
+        "root_dir": root_dir,
+        "sctable_filename": SCTABLE_FILENAME,
+        "postname_string": "",
+    }
+    cfg = {
+        "sampling_rate": SAMPLING_RATE,
+        "dont_show_plots": True,
+        "y_acceleration": True,
+        "angular_acceleration": True,
+        "bin_num": 25,
+        "plot_SE": True,
+        "standardise_z_at_SC_level": True,
+        "standardise_z_to_a_joint": False,
+        "z_standardisation_joint": [joints[0] + ", left"],
+        "plot_joint_number": min(3, joint_number),
+        "legend_outside": True,
+        "flip_gait_direction": True,
+        "color_palette": "viridis",
+        "analyse_average_y": False,
+        "standardise_y_coordinates": True,
+        "y_standardisation_joint": [joints[0] + ", left"],
+        "coordinate_standardisation_xls": "",
+        "sc_times_in_frames": False,
+        "joints": joints,
+        "angles": angle_dict(angle_number, joints),
+    }
+    return folderinfo, cfg, infos
+
+
+# %% ...............................  group Results  ...................................
+def write_group_results(
+    root_dir,
+    group_number=3,
+    frame_number=2000,
+    joint_number=5,
+    angle_number=3,
+    cycle_number=10,
+    id_number=4,
+    permutation_number=100,
+    seed=0,
+):
+    """Write synthetic DLC datasets for some groups & analyse them (compute-only) to
+    create the Results folders that group analyses import
+
+    Note
+    ----
+    Groups differ in their swing amplitude. All groups have the same IDs, so RM ANOVAs
+    work. Returns folderinfo & cfg of a group analysis (results_dir is in root_dir).
+    """
+    group_names = [f"Group {g + 1}" for g in range(group_number)]
+    group_dirs = []
+    for g, group_name in enumerate(group_names):
+        group_root_dir = os.path.join(root_dir, group_name)
+        folderinfo, cfg, infos = write_2D_dataset(
+            group_root_dir,
+            frame_number=frame_number,
+            joint_number=joint_number,
+            angle_number=angle_number,
+            cycle_number=cycle_number,
+            id_number=id_number,
+            amplitude=1 + 0.25 * g,
+            seed=seed + g,
+        )
+        cfg["compute_only"] = True
+        cfg["save_to_xls"] = False  # csv is much faster to write & read
+        group_dir = os.path.join(group_root_dir, "Results")
+        for info in infos:
+            info["results_dir"] = os.path.join(group_dir, info["name"])
+            try_to_run_gaita("DLC", info, folderinfo, copy.deepcopy(cfg), True)
+        group_dirs.append(group_dir)
+    hind_joints = joint_names(joint_number)
+    angles = angle_dict(angle_number, hind_joints)
+    features = [joint + " y" for joint in hind_joints[:3]] + [
+        angle + " Angle" for angle in angles["name"]
+    ]
+    group_folderinfo = {
+        "group_names": group_names,
+        "group_dirs": group_dirs,
+        "results_dir": os.path.join(root_dir, "Group Results"),
+        "load_dir": "",
+    }
+    group_cfg = {
+        "do_permtest": True,
+        "do_anova": True,
+        "permutation_number": permutation_number,
+        "PCA_n_components": min(3, len(features) - 1),
+        "PCA_custom_scatter_PCs": "",
+        "PCA_save_3D_video": False,
+        "PCA_bins": "",
+        "stats_threshold": 0.05,
+        "plot_SE": False,
+        "color_palette": "viridis",
+        "dont_show_plots": True,
+        "legend_outside": True,
+        "which_leg": "left",
+        "anova_design": "RM ANOVA",
+        "PCA_variables": features,
+        "stats_variables": features,
+    }
+    return group_folderinfo, group_cfg
@@ -3,13 +3,22 @@ from autogaita.common2D.common2D_1_preparation import (
     check_and_expand_cfg,
     check_and_fix_cfg_strings,
     flip_mouse_body,
+    tracking_df_to_array,
+    array_to_tracking_df,
+    rolling_window_means,
+    fan_out_multi_animal_recordings,
+    h5_to_df,
     some_prep,  # note that first input of some_prep is set to "DLC" when not mattering!
 )
+from autogaita.common2D.common2D_2_sc_extraction import extract_stepcycles
 from autogaita.common2D.common2D_utils import extract_info
 import os
 import copy
 import math
+import shutil
+import h5py
 import numpy as np
+import pandas as pd
 import pandas.testing as pdt
 from hypothesis import given, strategies as st, settings, HealthCheck
 import pytest
@@ -338,3 +347,237 @@ def test_flip_mouse_body(
         function_flipped_series = function_flipped_series.astype(float)
         manually_flipped_series = global_x_max - test_data[col]
         pdt.assert_series_equal(function_flipped_series, manually_flipped_series)
+
+
+def test_tracking_df_array_round_trip(
+    fixture_extract_info, fixture_extract_folderinfo, fixture_extract_cfg
+):
+    data = some_prep(
+        "DLC", fixture_extract_info, fixture_extract_folderinfo, fixture_extract_cfg
+    )
+    coords, joint_index = tracking_df_to_array(data)
+    x_cols = [col for col in data.columns if col.endswith(" x")]
+    assert coords.shape == (len(data), len(x_cols), 2)
+    # joints are indexed like cfg names them & coords match their columns
+    for joint in fixture_extract_cfg["hind_joints"]:
+        joint_idx = joint_index.get_loc(joint)
+        np.testing.assert_array_equal(coords[:, joint_idx, 0], data[joint + "x"])
+        np.testing.assert_array_equal(coords[:, joint_idx, 1], data[joint + "y"])
+    # writing back only changes coordinate columns
+    coords[:, :, 1] *= -1
+    round_trip_data = array_to_tracking_df(data.copy(), coords, joint_index)
+    for col in data.columns:
+        if col.endswith(" y"):
+            pdt.assert_series_equal(round_trip_data[col], data[col] * -1)
+        else:
+            pdt.assert_series_equal(round_trip_data[col], data[col])
+
+
+def test_rolling_window_means():
+    values = np.random.default_rng(0).random(50)
+    window_means = rolling_window_means(values, 5)
+    assert len(window_means) == len(values) - 4
+    for i in range(len(window_means)):
+        assert window_means[i] == np.mean(values[i : i + 5])
+    # too few values for a single window
+    assert len(rolling_window_means(values[:4], 5)) == 0
+    # NaNs are skipped (like pandas' mean) & windows of only NaNs are NaN
+    values_with_nans = np.array([1, 1, np.nan, 1, 1, np.nan, np.nan, np.nan])
+    np.testing.assert_array_equal(
+        rolling_window_means(values_with_nans, 5), [1, 1, 1, 1]
+    )
+    np.testing.assert_array_equal(
+        rolling_window_means(values_with_nans, 3), [1, 1, 1, 1, 1, np.nan]
+    )
+
+
+def test_windowed_loading_matches_full_loading(
+    fixture_extract_info, fixture_extract_folderinfo, fixture_extract_cfg
+):
+    fixture_extract_cfg["save_to_xls"] = False
+    full_cfg = copy.deepcopy(fixture_extract_cfg)  # expanded by some_prep
+    full_data = some_prep(
+        "DLC", fixture_extract_info, fixture_extract_folderinfo, full_cfg
+    )
+    full_cycles = extract_stepcycles(
+        "DLC", full_data, fixture_extract_info, fixture_extract_folderinfo, full_cfg
+    )
+    fixture_extract_cfg["windowed_loading"] = True
+    windowed_cfg = copy.deepcopy(fixture_extract_cfg)
+    windowed_data = some_prep(
+        "DLC", fixture_extract_info, fixture_extract_folderinfo, windowed_cfg
+    )
+    # only a subset of frames is loaded but these match full loading exactly
+    assert len(windowed_data) < len(full_data)
+    pdt.assert_frame_equal(windowed_data, full_data.loc[windowed_data.index])
+    # SCs are extracted (& validated) on windowed data like on fully loaded data
+    windowed_cycles = extract_stepcycles(
+        "DLC",
+        windowed_data,
+        fixture_extract_info,
+        fixture_extract_folderinfo,
+        windowed_cfg,
+    )
+    assert full_cycles
+    assert windowed_cycles == full_cycles
+
+
+def test_multi_animal_DLC_fan_out(
+    tmp_path, fixture_extract_info, fixture_extract_folderinfo, fixture_extract_cfg
+):
+    fixture_extract_cfg["save_to_xls"] = False
+    fixture_extract_cfg["results_dir"] = os.path.join(tmp_path, "Results")
+    single_animal_data = some_prep(
+        "DLC",
+        fixture_extract_info,
+        fixture_extract_folderinfo,
+        copy.deepcopy(fixture_extract_cfg),
+    )
+    # a maDLC file of two animals (named 15 & mus2) that both have the test data
+    root_dir = os.path.join(tmp_path, "root")
+    os.makedirs(root_dir)
+    for filename in os.listdir(fixture_extract_folderinfo["root_dir"]):
+        filepath = os.path.join(fixture_extract_folderinfo["root_dir"], filename)
+        if not os.path.isfile(filepath):
+            continue
+        if fixture_extract_folderinfo["data_string"] in filename:
+            raw = pd.read_csv(filepath, header=None, dtype=str, keep_default_na=False)
+            individuals = pd.DataFrame(
+                [["individuals"] + ["15"] * (raw.shape[1] - 1)], columns=raw.columns
+            )
+            single_header_raw = pd.concat([raw.iloc[:1], individuals, raw.iloc[1:]])
+            multi_animal_raw = pd.concat(
+                [single_header_raw, single_header_raw.iloc[:, 1:]], axis=1
+            )
+            multi_animal_raw.iloc[1, raw.shape[1] :] = "mus2"
+            multi_animal_raw.to_csv(
+                os.path.join(root_dir, filename), header=False, index=False
+            )
+        else:
+            shutil.copy2(filepath, root_dir)
+    fixture_extract_folderinfo["root_dir"] = root_dir
+    info = extract_info("DLC", fixture_extract_folderinfo)
+    fixture_extract_cfg["multi_animal"] = True
+    animal_info = fan_out_multi_animal_recordings(
+        "DLC", info, fixture_extract_folderinfo, fixture_extract_cfg
+    )
+    recording_id = str(info["mouse_num"][0])
+    assert animal_info["mouse_num"] == [recording_id + "_15", recording_id + "_mus2"]
+    assert animal_info["name"] == [
+        "ID " + recording_id + "_15 - Run 3",
+        "ID " + recording_id + "_mus2 - Run 3",
+    ]
+    # each animal is prepared exactly like the single-animal file
+    for idx, name in enumerate(animal_info["name"]):
+        # like run_singlerun_in_multirun, only pass leading zeros if there are any
+        this_info = {
+            key: animal_info[key][idx]
+            for key in animal_info.keys()
+            if animal_info[key][idx] is not False
+        }
+        this_info["results_dir"] = os.path.join(tmp_path, "Results", name)
+        animal_data = some_prep(
+            "DLC",
+            this_info,
+            fixture_extract_folderinfo,
+            copy.deepcopy(fixture_extract_cfg),
+        )
+        pdt.assert_frame_equal(animal_data, single_animal_data)
+
+
+def test_multi_animal_SLEAP_fan_out(tmp_path):
+    rng = np.random.default_rng(0)
+    tracks = rng.random((2, 2, 3, 20))  # (tracks, coords, nodes, frames)
+    node_names = [b"Nose", b"Hip", b"Knee"]
+    with h5py.File(os.path.join(tmp_path, "Cage1_run2_Tracking.h5"), "w") as f:
+        f.create_dataset("tracks", data=tracks)
+        f.create_dataset("node_names", data=node_names)
+        f.create_dataset("track_names", data=[b"1", b"bob"])
+    folderinfo = {
+        "root_dir": str(tmp_path),
+        "data_string": "Tracking",
+        "beam_string": "Beam",
+        "premouse_string": "Cage",
+        "postmouse_string": "",
+        "prerun_string": "run",
+        "postrun_string": "",
+    }
+    cfg = {"subtract_beam": False, "results_dir": "", "multi_animal": True}
+    info = {
+        "name": ["ID 1 - Run 2"],
+        "mouse_num": [1],
+        "run_num": [2],
+        "leading_mouse_num_zeros": [False],
+        "leading_run_num_zeros": [False],
+    }
+    animal_info = fan_out_multi_animal_recordings("SLEAP", info, folderinfo, cfg)
+    assert animal_info["name"] == ["ID 1_1 - Run 2", "ID 1_bob - Run 2"]
+    assert animal_info["mouse_num"] == ["1_1", "1_bob"]
+    # animal files are single-animal files of their track
+    for t, mouse_num in enumerate(animal_info["mouse_num"]):
+        animal_df = h5_to_df(
+            animal_info["data_dir"][t], f"Cage{mouse_num}_run2_Tracking.h5"
+        )
+        assert list(animal_df.columns) == [
+            "Nose x",
+            "Nose y",
+            "Hip x",
+            "Hip y",
+            "Knee x",
+            "Knee y",
+        ]
+        np.testing.assert_array_equal(animal_df.to_numpy(), tracks[t].T.reshape(20, -1))
+    # without cfg["multi_animal"], info is left as is
+    cfg["multi_animal"] = False
+    assert fan_out_multi_animal_recordings("SLEAP", info, folderinfo, cfg) is info
+
+
+def test_multi_animal_fan_out_of_recordings_with_same_track_names(tmp_path):
+    rng = np.random.default_rng(0)
+    tracks = {}
+    for cage in [1, 2]:
+        tracks[cage] = rng.random((2, 2, 3, 20))  # (tracks, coords, nodes, frames)
+        filename = "Cage" + str(cage) + "_run1_Tracking.h5"
+        with h5py.File(os.path.join(tmp_path, filename), "w") as f:
+            f.create_dataset("tracks", data=tracks[cage])
+            f.create_dataset("node_names", data=[b"Nose", b"Hip", b"Knee"])
+            f.create_dataset("track_names", data=[b"track_0", b"track 1"])
+    folderinfo = {
+        "root_dir": str(tmp_path),
+        "data_string": "Tracking",
+        "beam_string": "Beam",
+        "premouse_string": "Cage",
+        "postmouse_string": "",
+        "prerun_string": "run",
+        "postrun_string": "",
+    }
+    cfg = {"subtract_beam": False, "results_dir": "", "multi_animal": True}
+    info = {
+        "name": ["ID 1 - Run 1", "ID 2 - Run 1"],
+        "mouse_num": [1, 2],
+        "run_num": [1, 1],
+        "leading_mouse_num_zeros": [False, False],
+        "leading_run_num_zeros": [False, False],
+    }
+    animal_info = fan_out_multi_animal_recordings("SLEAP", info, folderinfo, cfg)
+    # every animal of both recordings is kept & IDs have no spaces
+    assert animal_info["mouse_num"] == [
+        "1_track_0",
+        "1_track_1",
+        "2_track_0",
+        "2_track_1",
+    ]
+    assert animal_info["name"] == [
+        "ID 1_track_0 - Run 1",
+        "ID 1_track_1 - Run 1",
+        "ID 2_track_0 - Run 1",
+        "ID 2_track_1 - Run 1",
+    ]
+    for idx, mouse_num in enumerate(animal_info["mouse_num"]):
+        cage, t = idx // 2 + 1, idx % 2
+        animal_df = h5_to_df(
+            animal_info["data_dir"][idx], f"Cage{mouse_num}_run1_Tracking.h5"
+        )
+        np.testing.assert_array_equal(
+            animal_df.to_numpy(), tracks[cage][t].T.reshape(20, -1)
+        )
@@ -15,6 +15,7 @@ from autogaita.common2D.common2D_constants import (
     SCXLS_SCCOLS,
     SWINGSTART_COL,
     STANCEEND_COL,
+    DETECTED_SCTABLE_FILENAME,
 )
 from hypothesis import given, strategies as st, settings, HealthCheck
 import os
@@ -458,6 +459,36 @@ def test_sc_times_in_frames_matches_sc_times_in_seconds(
     assert cycles_from_seconds == cycles_from_frames
 
 
+# %%..........................  automatic SC detection  ...............................
+
+
+def test_detected_stepcycles_match_annotation_table(
+    extract_info, extract_folderinfo, extract_cfg
+):
+    extract_cfg["detect_stepcycles"] = True
+    extract_cfg["sc_detection_joint"] = ["Hind paw tao"]
+    data = some_prep("DLC", extract_info, extract_folderinfo, extract_cfg)
+    detected_cycles = extract_stepcycles(
+        "DLC", data, extract_info, extract_folderinfo, extract_cfg
+    )
+    # all annotated SCs are detected (give or take a frame)
+    for annotated_cycle in [[284, 317], [318, 359], [413, 441]]:
+        assert any(
+            np.all(np.abs(np.array(cycle) - annotated_cycle) <= 1)
+            for cycle in detected_cycles
+        )
+    # the exported table is a valid annotation table of the detected SCs
+    extract_cfg["detect_stepcycles"] = False
+    extract_folderinfo["root_dir"] = extract_info["results_dir"]
+    extract_folderinfo["sctable_filename"] = (
+        extract_info["name"] + " - " + DETECTED_SCTABLE_FILENAME
+    )
+    assert (
+        extract_stepcycles("DLC", data, extract_info, extract_folderinfo, extract_cfg)
+        == detected_cycles
+    )
+
+
 # ...............................  helper functions  ...................................
 def flatten_all_cycles(all_cycles):
     if all_cycles:
@@ -1,7 +1,16 @@
 from autogaita.resources.utils import try_to_run_gaita
+from autogaita.resources.profiling import write_stage_timings_report
+from autogaita.common2D.common2D_render import render_results
+from autogaita.common2D.common2D_utils import (
+    write_multirun_cycle_validation,
+    write_multirun_detected_annotation_table,
+    write_multirun_stage_timings,
+)
+from autogaita.common2D import common2D_sweep
 import pandas as pd
 import pandas.testing as pdt
 import os
+import json
 import pytest
 
 # ............................  DLC APPROVAL TESTS STRUCTURE  ..........................
@@ -109,3 +118,271 @@ def test_dlc_approval_average_df(
                 os.path.join(extract_info["results_dir"], true_df_file)
             )
             pdt.assert_frame_equal(test_df, true_df)
+
+
+# windowed loading only loads the frames of annotated SCs but must not change results
+@pytest.mark.slow
+def test_dlc_approval_windowed_loading(
+    extract_true_dir, extract_info, extract_folderinfo, extract_cfg
+):
+    extract_cfg["windowed_loading"] = True
+    try_to_run_gaita("DLC", extract_info, extract_folderinfo, extract_cfg, False)
+    for true_df_file in os.listdir(extract_true_dir):
+        if true_df_file.endswith(".xlsx"):
+            true_df = pd.read_excel(os.path.join(extract_true_dir, true_df_file))
+            test_df = pd.read_excel(
+                os.path.join(extract_info["results_dir"], true_df_file)
+            )
+            pdt.assert_frame_equal(test_df, true_df)
+
+
+# reduced precision (float32) results must match the true (float64) results up to a
+# tolerance of 1e-3 - the largest deviations are ~4e-4 in accelerations (which are
+# second differences of coordinates & thus amplify float32 rounding errors)
+@pytest.mark.slow
+def test_dlc_approval_reduced_precision(
+    extract_true_dir, extract_info, extract_folderinfo, extract_cfg
+):
+    extract_cfg["reduced_precision"] = True
+    try_to_run_gaita("DLC", extract_info, extract_folderinfo, extract_cfg, False)
+    for true_df_file in os.listdir(extract_true_dir):
+        if true_df_file.endswith(".xlsx"):
+            true_df = pd.read_excel(os.path.join(extract_true_dir, true_df_file))
+            test_df = pd.read_excel(
+                os.path.join(extract_info["results_dir"], true_df_file)
+            )
+            pdt.assert_frame_equal(test_df, true_df, rtol=1e-3, atol=1e-3)
+
+
+@pytest.mark.slow
+def test_dlc_compute_only_and_render_results(
+    extract_info, extract_folderinfo, extract_cfg
+):
+    # compute-only runs export sheets but no figures
+    extract_cfg["compute_only"] = True
+    try_to_run_gaita("DLC", extract_info, extract_folderinfo, extract_cfg, False)
+    results_dir = os.path.dirname(extract_info["results_dir"])
+    name = extract_info["name"]
+    assert not any(
+        file.endswith(".png") for file in os.listdir(extract_info["results_dir"])
+    )
+    # render them from the Results folder with this run's plot-cfg
+    render_cfg = {"plot_joint_number": extract_cfg["plot_joint_number"]}
+    figure_paths = render_results(results_dir, render_cfg)
+    assert len(figure_paths) > 0
+    assert all(os.path.exists(path) for path in figure_paths)
+    assert all(os.path.basename(path).startswith(name) for path in figure_paths)
+    png_paths = [path for path in figure_paths if path.endswith(".png")]
+    assert len(png_paths) == len(figure_paths) // 2  # png & svg for each figure
+    # ... identical to plotting in the run itself
+    extract_cfg["compute_only"] = False
+    try_to_run_gaita("DLC", extract_info, extract_folderinfo, extract_cfg, False)
+    assert sorted(
+        file
+        for file in os.listdir(extract_info["results_dir"])
+        if file.endswith(".png")
+    ) == sorted(os.path.basename(path) for path in png_paths)
+
+
+def test_profile_stages(extract_info, extract_folderinfo, extract_cfg):
+    extract_cfg["compute_only"] = True
+    extract_cfg["profile_stages"] = True
+    try_to_run_gaita("DLC", extract_info, extract_folderinfo, extract_cfg, False)
+    with open(os.path.join(extract_info["results_dir"], "timings.json"), "r") as f:
+        timings = json.load(f)
+    assert [record["stage"] for record in timings["stages"]] == [
+        "preparation",
+        "step-cycle extraction",
+        "analysis & export",
+    ]
+    assert all(record["wall_time_s"] > 0 for record in timings["stages"])
+    assert timings["total"]["peak_memory_mb"] > 0
+    # multirun report aggregates the timings of all runs
+    results_dir = os.path.dirname(extract_info["results_dir"])
+    missing_run_dir = os.path.join(results_dir, "ID 1 - Run 1")
+    write_stage_timings_report(
+        [extract_info["results_dir"], missing_run_dir], results_dir, extract_cfg
+    )
+    with open(os.path.join(results_dir, "timings report.json"), "r") as f:
+        report = json.load(f)
+    assert list(report["runs"].keys()) == [extract_info["name"]]
+    assert report["runs_without_timings"] == ["ID 1 - Run 1"]
+    assert report["summary"]["preparation"]["calls"] == 1
+
+
+@pytest.mark.parametrize("dry_run", [True, 1])  # any truthy value (e.g. from json)
+def test_dlc_dry_run(dry_run, extract_info, extract_folderinfo, extract_cfg):
+    # the first SC has an x-jump of 27.06 pixels, the second one of 26.15 pixels
+    extract_cfg["dry_run"] = dry_run
+    extract_cfg["x_sc_broken_threshold"] = 26.6
+    try_to_run_gaita("DLC", extract_info, extract_folderinfo, extract_cfg, False)
+    name = extract_info["name"]
+    # dry runs don't analyse, export or plot anything
+    assert not any(
+        file.endswith((".xlsx", ".png"))
+        for file in os.listdir(extract_info["results_dir"])
+    )
+    cycle_validation = pd.read_csv(
+        os.path.join(extract_info["results_dir"], name + " - Cycle Validation.csv"),
+        keep_default_na=False,
+    )
+    assert cycle_validation.values.tolist() == [
+        [name, 549, 596, "excluded", "x/y threshold"],
+        [name, 748, 793, "kept", ""],
+    ]
+    # multiruns combine the tables of their runs
+    extract_cfg["results_dir"] = os.path.dirname(extract_info["results_dir"])
+    multirun_info = {"name": [name, "ID 1 - Run 1"]}  # 2nd run failed (no table)
+    pdt.assert_frame_equal(
+        write_multirun_cycle_validation(multirun_info, extract_folderinfo, extract_cfg)[
+            0
+        ],
+        cycle_validation,
+    )
+    assert os.path.exists(
+        os.path.join(extract_cfg["results_dir"], "Cycle Validation.csv")
+    )
+
+
+def test_dlc_dry_run_sweep_multirun_tables(
+    extract_info, extract_folderinfo, extract_cfg
+):
+    # multirun tables & timing reports are written to each variant's folder
+    extract_cfg["dry_run"] = True
+    extract_cfg["profile_stages"] = True
+    extract_cfg["sweep"] = {"x_sc_broken_threshold": [26.6, 200]}
+    try_to_run_gaita("DLC", extract_info, extract_folderinfo, extract_cfg, False)
+    results_dir = os.path.dirname(extract_info["results_dir"])
+    extract_cfg["results_dir"] = results_dir
+    multirun_info = {"name": [extract_info["name"]]}
+    cycle_validations = write_multirun_cycle_validation(
+        multirun_info, extract_folderinfo, extract_cfg
+    )
+    write_multirun_stage_timings(multirun_info, extract_folderinfo, extract_cfg)
+    assert [
+        cycle_validation["Status"].tolist() for cycle_validation in cycle_validations
+    ] == [["excluded", "kept"], ["kept", "kept"]]
+    for x_sc_broken_threshold in [26.6, 200]:
+        variant_dir = os.path.join(
+            results_dir, f"Sweep - x_sc_broken_threshold {x_sc_broken_threshold}"
+        )
+        assert os.path.exists(os.path.join(variant_dir, "Cycle Validation.csv"))
+        with open(os.path.join(variant_dir, "timings report.json"), "r") as f:
+            report = json.load(f)
+        assert list(report["runs"].keys()) == [extract_info["name"]]
+    # the main run's results_dir is not used by sweeps
+    assert not os.path.exists(os.path.join(results_dir, "Cycle Validation.csv"))
+
+
+def test_dlc_sweep_detected_annotation_tables(
+    extract_info, extract_folderinfo, extract_cfg, monkeypatch
+):
+    # variants that reuse detected SCs export their annotation table, too
+    extraction_calls = []
+
+    def counted_extraction(*args, extract=common2D_sweep.extract_stepcycles):
+        extraction_calls.append(args)
+        return extract(*args)
+
+    monkeypatch.setattr(common2D_sweep, "extract_stepcycles", counted_extraction)
+    extract_cfg["dry_run"] = True
+    extract_cfg["detect_stepcycles"] = True
+    extract_cfg["sc_detection_joint"] = ["Hind paw tao"]
+    extract_cfg["sweep"] = {"bin_num": [10, 25]}
+    try_to_run_gaita("DLC", extract_info, extract_folderinfo, extract_cfg, False)
+    assert len(extraction_calls) == 1
+    results_dir = os.path.dirname(extract_info["results_dir"])
+    extract_cfg["results_dir"] = results_dir
+    name = extract_info["name"]
+    write_multirun_detected_annotation_table(
+        {"name": [name]}, extract_folderinfo, extract_cfg
+    )
+    variant_tables = []
+    for bin_num in [10, 25]:
+        variant_dir = os.path.join(results_dir, f"Sweep - bin_num {bin_num}")
+        run_table = pd.read_excel(
+            os.path.join(variant_dir, name, name + " - Detected Annotation Table.xlsx")
+        )
+        pdt.assert_frame_equal(
+            pd.read_excel(os.path.join(variant_dir, "Detected Annotation Table.xlsx")),
+            run_table,
+        )
+        variant_tables.append(run_table)
+    pdt.assert_frame_equal(variant_tables[0], variant_tables[1])
+
+
+@pytest.mark.slow
+def test_dlc_parameter_sweep(
+    extract_true_dir, extract_info, extract_folderinfo, extract_cfg, monkeypatch
+):
+    # count how often stages run (loading & preparation should only run once)
+    stage_calls = {"read_tracking_data": 0, "some_prep": 0, "extract_stepcycles": 0}
+    for stage in stage_calls:
+
+        def counted_stage(
+            *args, stage=stage, stage_function=getattr(common2D_sweep, stage)
+        ):
+            stage_calls[stage] += 1
+            return stage_function(*args)
+
+        monkeypatch.setattr(common2D_sweep, stage, counted_stage)
+    extract_cfg["compute_only"] = True
+    extract_cfg["sweep"] = {"bin_num": [10, 25], "x_sc_broken_threshold": [26.6, 200]}
+    try_to_run_gaita("DLC", extract_info, extract_folderinfo, extract_cfg, False)
+    assert stage_calls == {
+        "read_tracking_data": 1,
+        "some_prep": 1,
+        "extract_stepcycles": 2,
+    }
+    # each variant is stored in its own group directory
+    results_dir = os.path.dirname(extract_info["results_dir"])
+    name = extract_info["name"]
+    for bin_num in [10, 25]:
+        for x_sc_broken_threshold in [26.6, 200]:
+            variant_dir = os.path.join(
+                results_dir,
+                f"Sweep - bin_num {bin_num} - "
+                + f"x_sc_broken_threshold {x_sc_broken_threshold}",
+            )
+            with open(os.path.join(variant_dir, "config.json")) as config_json_file:
+                config_json = json.load(config_json_file)
+            assert config_json["bin_num"] == bin_num
+            assert config_json["x_sc_broken_threshold"] == x_sc_broken_threshold
+            average_df = pd.read_excel(
+                os.path.join(variant_dir, name, name + " - Average Stepcycle.xlsx")
+            )
+            assert len(average_df) == bin_num
+            # each variant folder is a complete run - incl. files & issues of stages
+            # that were reused from an earlier variant
+            run_files = os.listdir(os.path.join(variant_dir, name))
+            assert any(
+                file.endswith(".csv") and extract_folderinfo["data_string"] in file
+                for file in run_files
+            )
+            with open(os.path.join(variant_dir, name, "Issues.txt")) as issues_file:
+                issues = issues_file.read()
+            assert issues.count("No Beamvideo") == 1
+            assert "gait direction" in issues
+            assert ("x/y threshold" in issues) == (x_sc_broken_threshold == 26.6)
+    # the variant with the cfg of our approval tests matches its true results
+    variant_dir = os.path.join(
+        results_dir, "Sweep - bin_num 25 - x_sc_broken_threshold 200", name
+    )
+    for true_df_file in os.listdir(extract_true_dir):
+        if true_df_file.endswith(".xlsx"):
+            true_df = pd.read_excel(os.path.join(extract_true_dir, true_df_file))
+            test_df = pd.read_excel(os.path.join(variant_dir, true_df_file))
+            pdt.assert_frame_equal(test_df, true_df)
+    # one of the two SCs is excluded with a threshold of 26.6 pixels
+    variant_dfs = [
+        pd.read_excel(
+            os.path.join(
+                results_dir,
+                f"Sweep - bin_num 25 - x_sc_broken_threshold {x_sc_broken_threshold}",
+                name,
+                name + " - Average Stepcycle.xlsx",
+            )
+        )
+        for x_sc_broken_threshold in [26.6, 200]
+    ]
+    assert not variant_dfs[0].equals(variant_dfs[1])
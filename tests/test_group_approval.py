@@ -158,3 +158,27 @@ def test_group_approval(extract_true_dir, extract_folderinfo, extract_cfg):
         shallow,
     )
     assert match == [CONFIG_JSON_FILENAME]
+
+
+# reduced precision (float32) group dfs & PCA results must match the true (float64)
+# results up to a tolerance of 1e-4 (the largest deviations are ~3e-5)
+# => not testing ID-ordered files (see above) & stats files since the last digit of
+#    their rounded statistics (e.g. confidence interval strings) can change
+@pytest.mark.filterwarnings("ignore:Epsilon values")
+@pytest.mark.slow
+def test_group_approval_reduced_precision(
+    extract_true_dir, extract_folderinfo, extract_cfg
+):
+    extract_cfg["reduced_precision"] = True
+    group(extract_folderinfo, extract_cfg)
+    for filename in [
+        "25 mm - Grand Average Group Stepcycles.xlsx",
+        "25 mm - Grand Standard Deviation Group Stepcycles.xlsx",
+        "PCA Feature Summary.xlsx",
+        "PCA Info.xlsx",
+    ]:
+        true_df = pd.read_excel(os.path.join(extract_true_dir, filename))
+        test_df = pd.read_excel(
+            os.path.join(extract_folderinfo["results_dir"], filename)
+        )
+        pdt.assert_frame_equal(test_df, true_df, rtol=1e-4, atol=1e-4)
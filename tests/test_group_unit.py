@@ -10,15 +10,24 @@ from autogaita.group.group_2_data_processing import (
     load_previous_runs_dataframes,
     check_PCA_and_stats_variables,
 )
+from autogaita.group import group_3_PCA
 from autogaita.group.group_3_PCA import (
     run_PCA,
     run_PCA_PERMANOVA,
+    render_PCA_3D_frames,
+    save_PCA_3D_video,
     convert_PCA_bins_to_list,
+    create_PCA_df,
+)
+from autogaita.group.group_4_stats import (
+    run_ANOVA,
+    run_balanced_ANOVAs,
+    multcompare_SC_Percentages,
 )
-from autogaita.group.group_4_stats import run_ANOVA, multcompare_SC_Percentages
 from autogaita.resources.utils import bin_num_to_percentages
 import os
 import math
+import shutil
 import pytest
 from sklearn import datasets
 import pandas as pd
@@ -106,6 +115,24 @@ def test_some_preps_cfg_files(extract_folderinfo, extract_cfg):
         assert loaded_cfg_2[key] != loaded_cfg[key]
 
 
+def test_some_prep_removes_previous_runs_files(extract_folderinfo, extract_cfg):
+    """timings.json & Issues files of a previous run in results_dir must not remain"""
+    extract_folderinfo["group_names"] = ["5 mm", "12 mm", "25 mm"]
+    extract_folderinfo["group_dirs"] = [
+        "example data/5mm/Results/",
+        "example data/12mm/Results/",
+        "example data/25mm/Results/",
+    ]
+    for filename in ["Issues.txt", "issues.jsonl", "timings.json"]:
+        with open(os.path.join(extract_folderinfo["results_dir"], filename), "w") as f:
+            f.write("previous run")
+    some_prep(extract_folderinfo, extract_cfg)
+    for filename in ["Issues.txt", "issues.jsonl", "timings.json"]:
+        assert not os.path.exists(
+            os.path.join(extract_folderinfo["results_dir"], filename)
+        )
+
+
 # %%............................  2. data processing  ..................................
 def test_check_PCA_and_stats_variables(extract_folderinfo, extract_cfg):
     """Test this sanity check does not have the necessary columns"""
@@ -203,6 +230,42 @@ def test_load_previous_runs_dataframes(extract_folderinfo, extract_cfg):
                 )
 
 
+@pytest.mark.parametrize("track_name_ID", [True, False])
+def test_import_data_ID_types(track_name_ID, extract_folderinfo, extract_cfg):
+    """IDs must be of one type - strings if any ID is a (multi-animal) track name"""
+    names = [["ID 1 - Run 1"], ["ID 2 - Run 1"]]
+    if track_name_ID:
+        names[1].append("ID mouseA - Run 1")
+    extract_folderinfo["group_dirs"] = []
+    for g, group_name in enumerate(extract_folderinfo["group_names"]):
+        group_dir = os.path.join(extract_folderinfo["results_dir"], group_name)
+        extract_folderinfo["group_dirs"].append(group_dir)
+        for name in names[g]:
+            os.makedirs(os.path.join(group_dir, name))
+            # two SCs of 3 bins each, separated by a row of NaNs
+            sheet = pd.DataFrame(
+                {
+                    "Time": [0.1, 0.2, 0.3, np.nan, 0.5, 0.6, 0.7],
+                    "Flipped": [False] * 3 + [np.nan] + [False] * 3,
+                    "Knee y": [1.0, 2.0, 3.0, np.nan, 4.0, 5.0, 6.0],
+                }
+            )
+            for sheet_name in ["Original Stepcycles", "Normalised Stepcycles"]:
+                sheet.to_csv(
+                    os.path.join(group_dir, name, name + " - " + sheet_name + ".csv"),
+                    index=False,
+                )
+    extract_cfg["save_to_xls"] = [False, False]
+    extract_cfg["tracking_software"] = "DLC"
+    dfs, _, _ = import_data(extract_folderinfo, extract_cfg)
+    IDs = [ID for df in dfs for ID in df["ID"].dropna()]
+    if track_name_ID:
+        assert all(isinstance(ID, str) for ID in IDs)
+        assert "mouseA" in IDs
+    else:  # numbers (floats due to the NaN rows between SCs)
+        assert not any(isinstance(ID, str) for ID in IDs)
+
+
 # %%..............................  4. statistics  .....................................
 
 
@@ -254,6 +317,39 @@ def test_Mixed_ANOVA(extract_cfg):
     assert math.isclose(result["p-unc"][2], stats_df["p(AxB)"][0], abs_tol=1e-05)
 
 
+@pytest.mark.filterwarnings("ignore:Epsilon values")
+def test_balanced_ANOVAs_match_pingouin(extract_folderinfo, extract_cfg):
+    """Closed-form balanced ANOVAs must give the same tables as pingouin"""
+    # 1) RM ANOVA with the repo's example group data (all stats vars in one go)
+    extract_folderinfo["group_names"] = ["5 mm", "12 mm", "25 mm"]
+    extract_folderinfo["load_dir"] = "example data/group"
+    extract_cfg["stats_variables"] = ["Knee y", "Ankle y", "Ankle Angle", "Hip Angle"]
+    extract_cfg["anova_design"] = "RM ANOVA"
+    avg_dfs, _, _, extract_cfg = load_repos_group_data(extract_folderinfo, extract_cfg)
+    stats_df = create_stats_df(avg_dfs, extract_folderinfo, extract_cfg)
+    balanced_results = run_balanced_ANOVAs(
+        stats_df, extract_cfg["stats_variables"], extract_cfg
+    )
+    for stats_var in extract_cfg["stats_variables"]:
+        pdt.assert_frame_equal(
+            balanced_results[stats_var],
+            run_ANOVA(stats_df, stats_var, extract_cfg),
+            check_exact=False,
+        )
+    # 2) Mixed ANOVA with real-statistics' example data
+    extract_cfg["anova_design"] = "Mixed ANOVA"
+    stats_df = pd.read_excel("tests/test_data/group_data/Mixed ANOVA Example Data.xlsx")
+    balanced_results = run_balanced_ANOVAs(stats_df, ["Value"], extract_cfg)
+    pdt.assert_frame_equal(
+        balanced_results["Value"],
+        run_ANOVA(stats_df, "Value", extract_cfg),
+        check_exact=False,
+    )
+    # 3) unbalanced designs (duplicate rows) are left to pingouin
+    stats_df = pd.concat([stats_df, stats_df.iloc[:1]])
+    assert run_balanced_ANOVAs(stats_df, ["Value"], extract_cfg) is None
+
+
 def test_multcomp_df_with_scipy_example(extract_folderinfo, extract_cfg):
     # Adopted example from https://docs.scipy.org/doc/scipy/reference/generated/scipy.stats.tukey_hsd.html
     extract_folderinfo["group_names"] = ["group0", "group1", "group2"]
@@ -309,6 +405,36 @@ def test_multcomp_df_with_scipy_example(extract_folderinfo, extract_cfg):
 
 
 # %%..................................  PCA  ...........................................
+def test_create_PCA_df(extract_folderinfo, extract_cfg):
+    """PCA_df must be ID x (variable, bin) with each ID's average values"""
+    extract_folderinfo["group_names"] = ["5 mm", "12 mm", "25 mm"]
+    extract_folderinfo["load_dir"] = "example data/group"
+    extract_cfg["PCA_variables"] = ["Knee y", "Hip Angle"]
+    avg_dfs, _, _, extract_cfg = load_repos_group_data(extract_folderinfo, extract_cfg)
+    extract_cfg["PCA_bins"] = np.array([8, 52, 100])
+    PCA_df, features = create_PCA_df(avg_dfs, extract_folderinfo, extract_cfg)
+    assert features == [
+        "Knee y 8",
+        "Knee y 52",
+        "Knee y 100",
+        "Hip Angle 8",
+        "Hip Angle 52",
+        "Hip Angle 100",
+    ]
+    assert list(PCA_df.columns) == ["Group", "ID"] + features
+    assert len(PCA_df) == sum([avg_df["ID"].nunique() for avg_df in avg_dfs])
+    assert (PCA_df[features].dtypes == float).all()
+    # compare the row of the last group's first ID with its average df
+    ID = avg_dfs[2]["ID"].iloc[0]
+    ID_avg_df = avg_dfs[2][avg_dfs[2]["ID"] == ID]
+    ID_avg_df = ID_avg_df[ID_avg_df["SC Percentage"].isin(extract_cfg["PCA_bins"])]
+    PCA_row = PCA_df[(PCA_df["Group"] == "25 mm") & (PCA_df["ID"] == ID)]
+    assert np.array_equal(
+        PCA_row[features].to_numpy().ravel(),
+        ID_avg_df[["Knee y", "Hip Angle"]].to_numpy().T.ravel(),
+    )
+
+
 def test_run_PCA(extract_folderinfo, extract_cfg):
     # Replicate the example found in https://www.kdnuggets.com/2023/05/
     # principal-component-analysis-pca-scikitlearn.html using our PCA df and PCA_info
@@ -339,6 +465,90 @@ def test_run_PCA(extract_folderinfo, extract_cfg):
     )
 
 
+@pytest.mark.parametrize("PCA_solver", ["randomized", "incremental"])
+def test_run_PCA_solvers(PCA_solver, extract_folderinfo, extract_cfg):
+    # the approximate solvers have to agree with the exact one on the wine data
+    wine_df = datasets.load_wine(as_frame=True).data
+    features = wine_df.columns
+    _, full_PCA_info = run_PCA(wine_df, features, extract_folderinfo, extract_cfg)
+    extract_cfg["PCA_solver"] = PCA_solver
+    _, PCA_info = run_PCA(wine_df, features, extract_folderinfo, extract_cfg)
+    assert PCA_info["solver"] == PCA_solver
+    assert PCA_info["fit_time"] >= 0
+    assert np.allclose(
+        PCA_info["explained_vars"], full_PCA_info["explained_vars"], atol=1e-03
+    )
+    for i in range(3):
+        assert np.allclose(
+            np.absolute(PCA_info["eigenvectors"][i]),
+            np.absolute(full_PCA_info["eigenvectors"][i]),
+            atol=1e-02,
+        )
+
+
+def test_incremental_PCA_streams_batches(extract_folderinfo, extract_cfg, monkeypatch):
+    # with small batches & all PCs, the streamed scaler & PCA are exact
+    monkeypatch.setattr(group_3_PCA, "PCA_INCREMENTAL_BATCH_SIZE", 20)
+    wine_df = datasets.load_wine(as_frame=True).data
+    features = wine_df.columns
+    extract_cfg["PCA_n_components"] = len(features)
+    full_PCA_df, full_PCA_info = run_PCA(
+        wine_df.copy(), features, extract_folderinfo, extract_cfg
+    )
+    extract_cfg["PCA_solver"] = "incremental"
+    PCA_df, PCA_info = run_PCA(
+        wine_df.copy(), features, extract_folderinfo, extract_cfg
+    )
+    assert np.allclose(PCA_info["explained_vars"], full_PCA_info["explained_vars"])
+    for i in range(3):
+        assert np.allclose(
+            np.absolute(PCA_df["PC " + str(i + 1)]),
+            np.absolute(full_PCA_df["PC " + str(i + 1)]),
+        )
+
+
+def test_render_PCA_3D_frames():
+    # frames must be raw RGB of exactly the requested size & differ across azimuths
+    rng = np.random.default_rng(0)
+    scatter_data = [
+        (rng.normal(size=10), rng.normal(size=10), rng.normal(size=10), "red", "a"),
+        (rng.normal(size=10), rng.normal(size=10), rng.normal(size=10), "blue", "b"),
+    ]
+    width, height = 320, 240
+    frames = render_PCA_3D_frames(
+        [0, 90], scatter_data, ("PC 1", "PC 2", "PC 3"), "Test", True, width, height
+    )
+    assert len(frames) == 2 * width * height * 3
+    frames = np.frombuffer(frames, dtype=np.uint8).reshape(2, height, width, 3)
+    assert not np.array_equal(frames[0], frames[1])
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg is not installed")
+def test_save_PCA_3D_video(extract_folderinfo, extract_cfg):
+    # render a tiny video end-to-end
+    rng = np.random.default_rng(0)
+    scatter_data = [
+        (rng.normal(size=10), rng.normal(size=10), rng.normal(size=10), "red", "a"),
+        (rng.normal(size=10), rng.normal(size=10), rng.normal(size=10), "blue", "b"),
+    ]
+    axis_labels = ("PC 1", "PC 2", "PC 3")
+    extract_cfg["legend_outside"] = True
+    extract_cfg["PCA_video_frame_number"] = 4
+    extract_cfg["PCA_video_resolution"] = "160x120"
+    results_dir = extract_folderinfo["results_dir"]
+    save_PCA_3D_video(
+        scatter_data, axis_labels, "Test", extract_folderinfo, extract_cfg
+    )
+    assert os.path.getsize(os.path.join(results_dir, "Test.mp4")) > 0
+    assert not os.path.exists(os.path.join(results_dir, "Issues.txt"))
+    # if ffmpeg fails (here it can't write to a folder that doesn't exist) we say so
+    save_PCA_3D_video(
+        scatter_data, axis_labels, "missing/Test", extract_folderinfo, extract_cfg
+    )
+    with open(os.path.join(results_dir, "Issues.txt")) as issues_file:
+        assert "ffmpeg failed" in issues_file.read()
+
+
 cases = (
     (
         "1-30,50,70-100",
@@ -387,6 +597,71 @@ def test_PERMANOVA_exampledata(extract_folderinfo, extract_cfg):
     assert math.isclose(p_val, 0.031, abs_tol=1e-02)
 
 
+def test_PERMANOVA_pairwise_tests(extract_folderinfo, extract_cfg):
+    # Pairwise pseudo-Fs must equal those of a global test on the pair's data only
+    extract_folderinfo["contrasts"] = ["A & B", "A & C", "B & C"]
+    rng = np.random.default_rng(42)
+    example_data = pd.DataFrame(
+        {
+            "ID": np.arange(12),
+            "Group": np.repeat(["A", "B", "C"], 4),
+            "PC 1": rng.normal(size=12) + np.repeat([0, 1, 5], 4),
+            "PC 2": rng.normal(size=12),
+        }
+    )
+    run_PCA_PERMANOVA(example_data, extract_folderinfo, extract_cfg)
+    with open(
+        os.path.join(extract_folderinfo["results_dir"], PCA_PERMANOVA_TXT_FILENAME), "r"
+    ) as f:
+        content = f.read()
+    for contrast in extract_folderinfo["contrasts"]:
+        group1, group2 = contrast.split(" & ")
+        pairwise_F = float(
+            content.split(f"{group1} vs {group2} - F = ")[1].split(",")[0]
+        )
+        pair_data = example_data[example_data["Group"].isin([group1, group2])]
+        pair_folderinfo = {
+            "contrasts": [contrast],
+            "results_dir": os.path.join(extract_folderinfo["results_dir"], contrast),
+        }
+        os.makedirs(pair_folderinfo["results_dir"])
+        run_PCA_PERMANOVA(pair_data, pair_folderinfo, extract_cfg)
+        with open(
+            os.path.join(pair_folderinfo["results_dir"], PCA_PERMANOVA_TXT_FILENAME)
+        ) as f:
+            global_F = float(f.read().split("Global test - F = ")[1].split(",")[0])
+        assert math.isclose(pairwise_F, global_F, abs_tol=1e-04)
+
+
+def test_PERMANOVA_is_seeded(extract_folderinfo, extract_cfg):
+    # the same seed must give the same p values (& the seed is stored with results)
+    extract_folderinfo["contrasts"] = ["A & B"]
+    rng = np.random.default_rng(0)
+    example_data = pd.DataFrame(
+        {
+            "ID": np.arange(10),
+            "Group": np.repeat(["A", "B"], 5),
+            "PC 1": rng.normal(size=10) + np.repeat([0, 0.5], 5),
+            "PC 2": rng.normal(size=10),
+        }
+    )
+    extract_cfg["PCA_PERMANOVA_seed"] = 7
+    contents = []
+    for run in ["run 1", "run 2"]:
+        run_folderinfo = {
+            "contrasts": extract_folderinfo["contrasts"],
+            "results_dir": os.path.join(extract_folderinfo["results_dir"], run),
+        }
+        os.makedirs(run_folderinfo["results_dir"])
+        run_PCA_PERMANOVA(example_data, run_folderinfo, extract_cfg)
+        with open(
+            os.path.join(run_folderinfo["results_dir"], PCA_PERMANOVA_TXT_FILENAME)
+        ) as f:
+            contents.append(f.read())
+    assert contents[0] == contents[1]
+    assert "seed = 7" in contents[0]
+
+
 def load_repos_group_data(extract_folderinfo, extract_cfg):
     """Use load_previous_runs_dataframes to load example data from the repo"""
     extract_cfg["sampling_rate"] = 100
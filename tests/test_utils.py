@@ -1,21 +1,44 @@
 from autogaita.resources.utils import (
+    add_gradient_features,
     standardise_primary_joint_coordinates,
     compute_angle,
     define_bins,
     write_angle_warning,
+    write_issues_to_textfile,
+    collect_issues,
     coerce_to_float,
+    render_plot_jobs,
+    FigureCollector,
+    PlotPanel,
+    extract_export_profile,
+    cast_to_float_dtype,
+    normalise_one_steps_data,
 )
+from autogaita.resources.watchdog import (
+    try_to_run_gaita_with_watchdog,
+    write_watchdog_summary,
+)
+from autogaita.resources.progress import (
+    ProgressTracker,
+    print_progress_bar,
+    subscribe_to_progress,
+    unsubscribe_from_progress,
+)
+from autogaita.resources.profiling import pipeline_stage
+from autogaita.group.group_utils import save_figures
 from autogaita.common2D.common2D_1_preparation import some_prep as some_prep_2D
 from autogaita.universal3D.universal3D_1_preparation import some_prep as some_prep_3D
 from autogaita.common2D.common2D_2_sc_extraction import extract_stepcycles
 from autogaita.common2D.common2D_3_analysis import analyse_and_export_stepcycles
 import os
+import json
 import math
 import numpy as np
 import pandas as pd
 import pandas.testing as pdt
 import pytest
 import tempfile
+import matplotlib.pyplot as plt
 
 
 from autogaita.universal3D.universal3D_constants import SWINGSTART_COL, STANCEEND_COL
@@ -146,6 +169,29 @@ def extract_3D_cfg():
 # %% .................................  tests  .........................................
 
 
+def test_add_gradient_features():
+    step = pd.DataFrame(
+        {"A x": [0.0, 1.0, 4.0, 9.0], "B x": [3, 2, 1, 0], "B Velocity": [0.0] * 4}
+    )
+    step = add_gradient_features(
+        step,
+        ["A x", "B x"],
+        ["A Velocity", "B Velocity"],
+        ["A Acceleration", None],
+    )
+    # existing columns are overwritten in place, new ones are appended in order
+    assert list(step.columns) == [
+        "A x",
+        "B x",
+        "B Velocity",
+        "A Velocity",
+        "A Acceleration",
+    ]
+    assert list(step["A Velocity"]) == [1.0, 2.0, 4.0, 5.0]
+    assert list(step["A Acceleration"]) == [1.0, 1.5, 1.5, 1.0]
+    assert list(step["B Velocity"]) == [-1.0] * 4
+
+
 def test_compute_angle():
     # Test case 1: Basic case
     joint1 = [0, 0]
@@ -202,6 +248,75 @@ def test_write_angle_warning(extract_2D_cfg, extract_2D_info):
     assert "Leg: left" in issues
 
 
+def test_collect_issues(extract_2D_cfg, tmp_path):
+    info = {"results_dir": os.path.join(tmp_path, "ID 1")}  # not created yet
+    issues_path = os.path.join(info["results_dir"], "Issues.txt")
+    step = pd.DataFrame({"Time": [0.1, 0.2, 0.3], "dummy_coord": [1, 2, 3]})
+    angles = extract_2D_cfg["angles"]
+    with collect_issues(info) as collector:
+        for _ in range(3):
+            write_angle_warning(step, 0, angles, [0, 2], info)
+        write_issues_to_textfile("\n***********\n! WARNING !\n***********\n", info)
+        assert not os.path.exists(issues_path)  # buffered until the run finished
+        assert collector.count() == {"broken angle": 3, "warning": 1}
+    with open(issues_path, "r") as f:
+        issues = f.read()
+    assert issues.count("arc cosine to -1") == 1  # header written just once
+    assert issues.count("Cycle-time: 0.1-0.3s") == 3
+    assert "broken angle: 3" in issues and "warning: 1" in issues
+    with open(os.path.join(info["results_dir"], "issues.jsonl"), "r") as f:
+        jsonl_issues = [json.loads(line) for line in f]
+    assert [issue["category"] for issue in jsonl_issues] == ["broken angle"] * 3 + [
+        "warning"
+    ]
+
+
+def test_progress_events(capsys):
+    events = []
+    subscribe_to_progress(events.append)
+    try:
+        with pipeline_stage("preparation", "ID 1"):
+            pass
+        tracker = ProgressTracker("Permuting", 250, redraw=True)
+        for _ in range(250):
+            tracker.advance()
+        tracker.finish()
+    finally:
+        unsubscribe_from_progress(events.append)
+    assert [(e["kind"], e["task"]) for e in events[:2]] == [
+        ("started", "preparation"),
+        ("finished", "preparation"),
+    ]
+    assert events[1]["detail"] == "ID 1" and events[1]["elapsed_s"] >= 0
+    advanced = [e for e in events if e["kind"] == "advanced"]
+    assert len(advanced) == 84  # one per batch of 3 permutations & the last one
+    assert advanced[-1]["done"] == advanced[-1]["total"] == 250
+    assert advanced[-1]["eta_s"] == 0 and advanced[-1]["throughput_per_s"] > 0
+    assert events[-1]["kind"] == "finished"
+    capsys.readouterr()
+    print_progress_bar(events[-1])
+    printed = capsys.readouterr().out
+    assert printed.startswith("\rPermuting [" + "#" * 30 + "] 250/250")
+    assert printed.endswith(" s\n")
+
+
+def test_watchdog_terminates_slow_runs(
+    extract_2D_info, extract_2D_folderinfo, extract_2D_cfg, tmp_path
+):
+    extract_2D_cfg["run_timeout"] = 0.01  # starting the child alone takes longer
+    terminated_run = try_to_run_gaita_with_watchdog(
+        "DLC", extract_2D_info, extract_2D_folderinfo, extract_2D_cfg
+    )
+    assert terminated_run == "ID 15 - Run 3 exceeded its time limit of 0.01 s"
+    with open(os.path.join(extract_2D_info["results_dir"], "Issues.txt"), "r") as f:
+        assert "was terminated by our watchdog" in f.read()
+    write_watchdog_summary([terminated_run], tmp_path)
+    with open(os.path.join(tmp_path, "Issues.txt"), "r") as f:
+        issues = f.read()
+    assert "1 run(s) of this batch were terminated" in issues
+    assert terminated_run in issues
+
+
 def test_correct_coordinate_standardisation(
     extract_2D_info,
     extract_2D_folderinfo,
@@ -569,3 +684,102 @@ def test_integer_values():
     SCdf = _make_sc_df([100, 200], [150, 250])
     SCdf = _apply_coercion(SCdf)
     assert SCdf[SWINGSTART_COL].iloc[0] == 100.0
+
+
+# %%...............................  figure rendering  .................................
+def plot_line(slope, results_dir, cfg, plot_panel_instance):
+    """Minimal plot function with the signature of our plot functions"""
+    f, ax = plt.subplots(1, 1)
+    ax.plot([0, 1], [0, slope])
+    save_figures(f, results_dir, "Slope " + str(slope), cfg)
+    if cfg["dont_show_plots"] is False:
+        plot_panel_instance.add_figure(f)
+
+
+@pytest.mark.parametrize("plot_workers", [0, 2])
+def test_render_plot_jobs(plot_workers, tmp_path):
+    cfg = {"dont_show_plots": False, "plot_workers": plot_workers}
+    plot_jobs = [(plot_line, (slope, tmp_path)) for slope in [1, 2, 3]]
+    figure_collector = FigureCollector()
+    figure_paths = render_plot_jobs(plot_jobs, cfg, figure_collector)
+    expected_paths = []
+    for slope in [1, 2, 3]:
+        expected_paths.append(os.path.join(tmp_path, "Slope " + str(slope) + ".png"))
+        expected_paths.append(
+            os.path.join(tmp_path, "SVG Figures", "Slope " + str(slope) + ".svg")
+        )
+    assert figure_paths == expected_paths
+    assert all(os.path.exists(path) for path in figure_paths)
+    # figures are handed back in the order of plot_jobs
+    assert len(figure_collector.figures) == 3
+    for slope, figure in zip([1, 2, 3], figure_collector.figures):
+        assert figure.axes[0].lines[0].get_ydata()[-1] == slope
+
+
+def test_plot_panel_figure_storage(tmp_path):
+    cfg = {"dont_show_plots": False, "plot_workers": 2}
+    plot_jobs = [(plot_line, (slope, tmp_path)) for slope in [1, 2]]
+    plot_panel = PlotPanel("#000000", "#000000")
+    render_plot_jobs(plot_jobs, cfg, plot_panel)  # pickled by workers
+    plot_line(3, tmp_path, cfg, plot_panel)  # pickled here
+    # figures are closed & only kept as bytes until they are shown
+    assert plt.get_fignums() == []
+    assert all(isinstance(figure, bytes) for figure in plot_panel.figures)
+    for fig_index, slope in enumerate([1, 2, 3]):
+        figure = plot_panel.load_figure(fig_index)
+        assert figure.axes[0].lines[0].get_ydata()[-1] == slope
+        assert figure.get_dpi() == 100
+    assert plt.get_fignums() == []  # loaded figures are not restored to pyplot
+
+
+cases = (
+    ({}, ["Slope 1.png", os.path.join("SVG Figures", "Slope 1.svg")]),
+    ({"export_profile": "preview"}, ["Slope 1.png"]),
+    ({"export_profile": "none"}, []),
+    (
+        {"export_profile": {"formats": ["pdf", "png"], "dpi": 50}},
+        [os.path.join("PDF Figures", "Slope 1.pdf"), "Slope 1.png"],
+    ),
+)  # fmt: skip
+@pytest.mark.parametrize("profile_cfg, expected_files", cases)
+def test_export_profiles(profile_cfg, expected_files, tmp_path):
+    cfg = {"dont_show_plots": True, **profile_cfg}
+    figure_paths = render_plot_jobs([(plot_line, (1, tmp_path))], cfg, None)
+    assert figure_paths == [os.path.join(tmp_path, file) for file in expected_files]
+    assert all(os.path.exists(path) for path in figure_paths)
+
+
+@pytest.mark.parametrize(
+    "export_profile",
+    ["fancy", {"formats": ["jpg"]}, {"dpi": -1}, {"bbox_inches": "loose"}, {"x": 1}],
+)
+def test_invalid_export_profiles(export_profile):
+    assert extract_export_profile({"export_profile": export_profile}) is None
+
+
+def test_reduced_precision_dtypes():
+    step = pd.DataFrame(
+        {
+            "Time": np.arange(30) / 100,
+            "Flipped": False,
+            "Knee x": np.linspace(0, 10, 30),
+            "Knee y": np.linspace(5, 2, 30),
+        }
+    )
+    # default: nothing is cast & features/normalisation stay float64
+    assert cast_to_float_dtype(step, {}) is step
+    step = add_gradient_features(step, ["Knee x"], ["Knee Velocity"], [None])
+    assert step["Knee Velocity"].dtype == np.float64
+    # reduced precision: float columns except Time are float32 & stay float32
+    reduced_step = cast_to_float_dtype(step, {"reduced_precision": True})
+    assert reduced_step["Time"].dtype == np.float64
+    assert reduced_step["Flipped"].dtype == bool
+    assert (reduced_step[["Knee x", "Knee y"]].dtypes == np.float32).all()
+    reduced_step = add_gradient_features(
+        reduced_step, ["Knee x"], ["Knee Velocity"], ["Knee Acceleration"]
+    )
+    assert reduced_step["Knee Velocity"].dtype == np.float32
+    assert reduced_step["Knee Acceleration"].dtype == np.float32
+    normalised_step = normalise_one_steps_data(reduced_step, 25)
+    assert normalised_step["Knee y"].dtype == np.float32
+    assert normalised_step["Time"].dtype == np.float64